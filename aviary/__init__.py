@@ -2,8 +2,11 @@ __version__ = '0.1.0'
 
 from ._utils.types import (
     BoundingBox,
+    DataLayout,
     Device,
     DType,
+    GDALConfig,
+    GDALConfigPreset,
     GeospatialFilterMode,
     InterpolationMode,
     ProcessArea,
@@ -15,8 +18,11 @@ from ._utils.types import (
 __all__ = [
     '__version__',
     'BoundingBox',
+    'DataLayout',
     'Device',
     'DType',
+    'GDALConfig',
+    'GDALConfigPreset',
     'GeospatialFilterMode',
     'InterpolationMode',
     'ProcessArea',
@@ -1,23 +1,74 @@
-from math import ceil, floor
+import atexit
+import hashlib
+import json
+import os
+import threading
+import warnings
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Executor, ThreadPoolExecutor, wait
+from contextlib import AbstractContextManager, nullcontext
+from enum import Enum
+from math import ceil, floor, isclose
 from pathlib import Path
+from typing import Any
+from xml.etree import ElementTree
 
+import geopandas as gpd
 import numpy as np
 import numpy.typing as npt
 import rasterio as rio
+import rasterio.warp
 import rasterio.windows
+from rasterio.enums import MaskFlags
+from rasterio.transform import Affine
+from rasterio.vrt import WarpedVRT
+import requests
+from requests.adapters import HTTPAdapter
+from shapely import STRtree
+from shapely.geometry import Polygon, box
+from urllib3.util import Retry
+
+# noinspection PyProtectedMember
+from aviary._utils.exceptions import AviaryUserError
+
+# noinspection PyProtectedMember
+from aviary._utils.response_cache import ResponseCache
+
+# noinspection PyProtectedMember
+from aviary._utils.shared_memory import SharedMemoryCache
 
 # noinspection PyProtectedMember
 from aviary._utils.types import (
     BoundingBox,
     BufferSize,
     Coordinate,
+    CoordinatesSet,
     DataFetcherInfo,
+    DataLayout,
     DType,
+    EPSGCode,
+    GDALConfig,
     GroundSamplingDistance,
     InterpolationMode,
     TileSize,
 )
 
+_srcs: dict[tuple[int, int, Path, Any], rio.io.DatasetReader | WarpedVRT] = {}
+_srcs_lock = threading.Lock()
+_sessions: dict[tuple[int, int, int], requests.Session] = {}
+_sessions_lock = threading.Lock()
+_MAX_NUM_SRCS = 64
+_MEMMAP_DATA_NAME = 'data.npy'
+_MEMMAP_INFO_NAME = 'info.json'
+_FOOTPRINT_INDEX_KEY_NAME = 'source_key'
+_GDAL_DATA_TYPES = {
+    np.dtype(np.float32): 'Float32',
+    np.dtype(np.int16): 'Int16',
+    np.dtype(np.uint8): 'Byte',
+    np.dtype(np.uint16): 'UInt16',
+}
+
 
 def vrt_data_fetcher(
     x_min: Coordinate,
@@ -29,9 +80,31 @@ def vrt_data_fetcher(
     buffer_size: BufferSize = 0,
     drop_channels: list[int] = None,
     fill_value: int = 0,
+    gdal_config: GDALConfig | None = None,
+    native_resolution: bool = False,
+    snap_to_grid: bool = False,
+    overview_level: int | None = None,
+    indexes: list[int] | None = None,
+    shared_cache: SharedMemoryCache | None = None,
+    layout: DataLayout = DataLayout.CHANNELS_LAST,
+    out: npt.NDArray | None = None,
 ) -> npt.NDArray:
     """Fetches data from the virtual raster given a minimum x and y coordinate.
 
+    If a shared cache is specified, the data is assembled from chunks of the size of a tile that are aligned
+    to multiples of the tile size.
+    The chunks are cached, so that overlapping tiles (e.g., due to the buffer) reuse the data of each other,
+    even across the workers of the dataloader.
+    If the coordinates, the tile size or the buffer size are not multiples of the ground sampling distance,
+    the shared cache is not used.
+
+    If `native_resolution` is True and the data is aligned to the pixel grid of the virtual raster,
+    the data is read with an integer window and without resampling.
+
+    If the layout is `CHANNELS_FIRST`, the data is returned as read (contiguous and without a transpose).
+    If an output array is specified, the data is read into it (e.g., to reuse a preallocated buffer
+    or to convert the data type while reading).
+
     Parameters:
         x_min: minimum x coordinate
         y_min: minimum y coordinate
@@ -40,8 +113,21 @@ def vrt_data_fetcher(
         ground_sampling_distance: ground sampling distance in meters
         interpolation_mode: interpolation mode (`BILINEAR` or `NEAREST`)
         buffer_size: buffer size in meters (specifies the area around the tile that is additionally fetched)
-        drop_channels: channel indices to drop (supports negative indexing)
+        drop_channels: channel indices to drop (supports negative indexing) (the channels are dropped
+            after reading, use `indexes` to skip reading them)
         fill_value: fill value of nodata pixels
+        gdal_config: configuration of the GDAL environment
+        native_resolution: if True, the ground sampling distance equals the ground sampling distance
+            of the virtual raster or its overview level (pixel-aligned data is read without resampling)
+        snap_to_grid: if True and `native_resolution` is True, the data is snapped to the pixel grid
+            of the virtual raster
+        overview_level: overview level of the virtual raster (if None, the full resolution is read)
+        indexes: band indices to read (1-based) (if None, all bands are read)
+        shared_cache: shared cache of the chunks (the shape of each slot is (channels, chunk size in pixels,
+            chunk size in pixels))
+        layout: layout of the data (`CHANNELS_FIRST` or `CHANNELS_LAST`)
+        out: output array of shape (channels, height, width) the data is read into (if None, the data is read
+            into a new array)
 
     Returns:
         data
@@ -62,7 +148,314 @@ def vrt_data_fetcher(
         ground_sampling_distance=ground_sampling_distance,
     )
 
-    with rio.open(path) as src:
+    if shared_cache is not None and _is_cacheable(
+        x_min=x_min,
+        y_min=y_min,
+        tile_size=tile_size,
+        ground_sampling_distance=ground_sampling_distance,
+        buffer_size=buffer_size,
+    ):
+        data = _read_cached(
+            bounding_box=bounding_box,
+            path=path,
+            tile_size=tile_size,
+            ground_sampling_distance=ground_sampling_distance,
+            interpolation_mode=interpolation_mode,
+            fill_value=fill_value,
+            gdal_config=gdal_config,
+            native_resolution=native_resolution,
+            snap_to_grid=snap_to_grid,
+            overview_level=overview_level,
+            indexes=indexes,
+            shared_cache=shared_cache,
+            out=out,
+        )
+    else:
+        data = _read(
+            bounding_box=bounding_box,
+            height_pixels=tile_size_pixels,
+            width_pixels=tile_size_pixels,
+            path=path,
+            interpolation_mode=interpolation_mode,
+            fill_value=fill_value,
+            gdal_config=gdal_config,
+            native_resolution=native_resolution,
+            snap_to_grid=snap_to_grid,
+            overview_level=overview_level,
+            indexes=indexes,
+            out=out,
+        )
+
+    if layout == DataLayout.CHANNELS_LAST:
+        data = _permute_data(
+            data=data,
+        )
+
+    data = _drop_channels(
+        data=data,
+        drop_channels=drop_channels,
+        layout=layout,
+    )
+    return data
+
+
+def vrt_batch_data_fetcher(
+    coordinates: CoordinatesSet,
+    path: Path,
+    tile_size: TileSize,
+    ground_sampling_distance: GroundSamplingDistance,
+    interpolation_mode: InterpolationMode = InterpolationMode.BILINEAR,
+    buffer_size: BufferSize = 0,
+    drop_channels: list[int] = None,
+    fill_value: int = 0,
+    gdal_config: GDALConfig | None = None,
+    native_resolution: bool = False,
+    snap_to_grid: bool = False,
+    overview_level: int | None = None,
+    indexes: list[int] | None = None,
+    layout: DataLayout = DataLayout.CHANNELS_LAST,
+) -> list[npt.NDArray]:
+    """Fetches data from the virtual raster given the coordinates of a batch of tiles.
+
+    Spatially adjacent tiles are grouped into rectangles and the enclosing window of each group is read at once
+    (see `_group_coordinates`), i.e., no pixels outside the tiles are read.
+    The data of each tile is sliced out of the data of its group
+    (if the layout is `CHANNELS_FIRST`, the data of each tile is copied to be contiguous).
+    If the tile size or the buffer size is not a multiple of the ground sampling distance,
+    the data of each tile is fetched separately.
+
+    Parameters:
+        coordinates: coordinates (x_min, y_min) of each tile
+        path: path to the virtual raster (.vrt file)
+        tile_size: tile size in meters
+        ground_sampling_distance: ground sampling distance in meters
+        interpolation_mode: interpolation mode (`BILINEAR` or `NEAREST`)
+        buffer_size: buffer size in meters (specifies the area around the tile that is additionally fetched)
+        drop_channels: channel indices to drop (supports negative indexing) (the channels are dropped
+            after reading, use `indexes` to skip reading them)
+        fill_value: fill value of nodata pixels
+        gdal_config: configuration of the GDAL environment
+        native_resolution: if True, the ground sampling distance equals the ground sampling distance
+            of the virtual raster or its overview level (pixel-aligned data is read without resampling)
+        snap_to_grid: if True and `native_resolution` is True, the data is snapped to the pixel grid
+            of the virtual raster
+        overview_level: overview level of the virtual raster (if None, the full resolution is read)
+        indexes: band indices to read (1-based) (if None, all bands are read)
+        layout: layout of the data (`CHANNELS_FIRST` or `CHANNELS_LAST`)
+
+    Returns:
+        data of each tile
+    """
+    is_pixel_aligned = (
+        _is_multiple(tile_size, ground_sampling_distance) and
+        _is_multiple(buffer_size, ground_sampling_distance)
+    )
+
+    if is_pixel_aligned:
+        groups = _group_coordinates(
+            coordinates=coordinates,
+            tile_size=tile_size,
+        )
+    else:
+        groups = [[index] for index in range(len(coordinates))]
+
+    batch = [None] * len(coordinates)
+
+    for group in groups:
+        if len(group) == 1:
+            index = group[0]
+            x_min, y_min = coordinates[index]
+            batch[index] = vrt_data_fetcher(
+                x_min=x_min,
+                y_min=y_min,
+                path=path,
+                tile_size=tile_size,
+                ground_sampling_distance=ground_sampling_distance,
+                interpolation_mode=interpolation_mode,
+                buffer_size=buffer_size,
+                drop_channels=drop_channels,
+                fill_value=fill_value,
+                gdal_config=gdal_config,
+                native_resolution=native_resolution,
+                snap_to_grid=snap_to_grid,
+                overview_level=overview_level,
+                indexes=indexes,
+                layout=layout,
+            )
+            continue
+
+        group_data = _fetch_group(
+            coordinates=coordinates[group],
+            path=path,
+            tile_size=tile_size,
+            ground_sampling_distance=ground_sampling_distance,
+            interpolation_mode=interpolation_mode,
+            buffer_size=buffer_size,
+            drop_channels=drop_channels,
+            fill_value=fill_value,
+            gdal_config=gdal_config,
+            native_resolution=native_resolution,
+            snap_to_grid=snap_to_grid,
+            overview_level=overview_level,
+            indexes=indexes,
+            layout=layout,
+        )
+
+        for index, data in zip(group, group_data):
+            batch[index] = data
+
+    return batch
+
+
+def _fetch_group(
+    coordinates: CoordinatesSet,
+    path: Path,
+    tile_size: TileSize,
+    ground_sampling_distance: GroundSamplingDistance,
+    interpolation_mode: InterpolationMode = InterpolationMode.BILINEAR,
+    buffer_size: BufferSize = 0,
+    drop_channels: list[int] = None,
+    fill_value: int = 0,
+    gdal_config: GDALConfig | None = None,
+    native_resolution: bool = False,
+    snap_to_grid: bool = False,
+    overview_level: int | None = None,
+    indexes: list[int] | None = None,
+    layout: DataLayout = DataLayout.CHANNELS_LAST,
+) -> list[npt.NDArray]:
+    """Fetches data from the virtual raster given the coordinates of a group of spatially adjacent tiles.
+
+    Parameters:
+        coordinates: coordinates (x_min, y_min) of each tile
+        path: path to the virtual raster (.vrt file)
+        tile_size: tile size in meters
+        ground_sampling_distance: ground sampling distance in meters
+        interpolation_mode: interpolation mode (`BILINEAR` or `NEAREST`)
+        buffer_size: buffer size in meters (specifies the area around the tile that is additionally fetched)
+        drop_channels: channel indices to drop (supports negative indexing) (the channels are dropped
+            after reading, use `indexes` to skip reading them)
+        fill_value: fill value of nodata pixels
+        gdal_config: configuration of the GDAL environment
+        native_resolution: if True, the ground sampling distance equals the ground sampling distance
+            of the virtual raster or its overview level (pixel-aligned data is read without resampling)
+        snap_to_grid: if True and `native_resolution` is True, the data is snapped to the pixel grid
+            of the virtual raster
+        overview_level: overview level of the virtual raster (if None, the full resolution is read)
+        indexes: band indices to read (1-based) (if None, all bands are read)
+        layout: layout of the data (`CHANNELS_FIRST` or `CHANNELS_LAST`)
+
+    Returns:
+        data of each tile
+    """
+    x_min, y_min = coordinates.min(axis=0)
+    x_max, y_max = coordinates.max(axis=0) + tile_size
+    bounding_box = BoundingBox(
+        x_min=int(x_min),
+        y_min=int(y_min),
+        x_max=int(x_max),
+        y_max=int(y_max),
+    )
+    bounding_box = bounding_box.buffer(
+        buffer_size=buffer_size,
+        inplace=False,
+    )
+    width_pixels = round((bounding_box.x_max - bounding_box.x_min) / ground_sampling_distance)
+    height_pixels = round((bounding_box.y_max - bounding_box.y_min) / ground_sampling_distance)
+    tile_size_pixels = _compute_tile_size_pixels(
+        tile_size=tile_size,
+        buffer_size=buffer_size,
+        ground_sampling_distance=ground_sampling_distance,
+    )
+
+    group_data = _read(
+        bounding_box=bounding_box,
+        height_pixels=height_pixels,
+        width_pixels=width_pixels,
+        path=path,
+        interpolation_mode=interpolation_mode,
+        fill_value=fill_value,
+        gdal_config=gdal_config,
+        native_resolution=native_resolution,
+        snap_to_grid=snap_to_grid,
+        overview_level=overview_level,
+        indexes=indexes,
+    )
+
+    batch = []
+
+    for x_min_, y_min_ in coordinates:
+        row = round((y_max - y_min_ - tile_size) / ground_sampling_distance)
+        column = round((x_min_ - x_min) / ground_sampling_distance)
+        data = group_data[:, row:row + tile_size_pixels, column:column + tile_size_pixels]
+
+        if layout == DataLayout.CHANNELS_LAST:
+            data = _permute_data(
+                data=data,
+            )
+        else:
+            data = np.ascontiguousarray(data)
+
+        data = _drop_channels(
+            data=data,
+            drop_channels=drop_channels,
+            layout=layout,
+        )
+        batch.append(data)
+
+    return batch
+
+
+def _read(
+    bounding_box: BoundingBox,
+    height_pixels: int,
+    width_pixels: int,
+    path: Path,
+    interpolation_mode: InterpolationMode = InterpolationMode.BILINEAR,
+    fill_value: int = 0,
+    gdal_config: GDALConfig | None = None,
+    native_resolution: bool = False,
+    snap_to_grid: bool = False,
+    overview_level: int | None = None,
+    indexes: list[int] | None = None,
+    out: npt.NDArray | None = None,
+) -> npt.NDArray:
+    """Reads the data within the bounding box from the virtual raster.
+
+    The data is read into the output array (if the output array is not specified, it is allocated once
+    with the data type of the virtual raster).
+
+    Parameters:
+        bounding_box: bounding box
+        height_pixels: height of the data in pixels
+        width_pixels: width of the data in pixels
+        path: path to the virtual raster (.vrt file)
+        interpolation_mode: interpolation mode (`BILINEAR` or `NEAREST`)
+        fill_value: fill value of nodata pixels
+        gdal_config: configuration of the GDAL environment
+        native_resolution: if True, the ground sampling distance equals the ground sampling distance
+            of the virtual raster or its overview level (pixel-aligned data is read without resampling)
+        snap_to_grid: if True and `native_resolution` is True, the data is snapped to the pixel grid
+            of the virtual raster
+        overview_level: overview level of the virtual raster (if None, the full resolution is read)
+        indexes: band indices to read (1-based) (if None, all bands are read)
+        out: output array of shape (channels, height, width) the data is read into
+
+    Returns:
+        data (channels-first)
+    """
+    with _get_env(gdal_config):
+        src = _get_src(
+            path=path,
+            overview_level=overview_level,
+        )
+
+        if out is None:
+            indexes_ = src.indexes if indexes is None else indexes
+            out = np.empty(
+                shape=(len(indexes_), height_pixels, width_pixels),
+                dtype=src.dtypes[indexes_[0] - 1],
+            )
+
         window = rio.windows.from_bounds(
             left=bounding_box.x_min,
             bottom=bounding_box.y_min,
@@ -70,24 +463,437 @@ def vrt_data_fetcher(
             top=bounding_box.y_max,
             transform=src.transform,
         )
-        data = src.read(
+
+        if native_resolution:
+            pixel_window = _to_pixel_window(
+                window=window,
+                height_pixels=height_pixels,
+                width_pixels=width_pixels,
+                snap_to_grid=snap_to_grid,
+            )
+
+            if pixel_window is not None:
+                is_within = (
+                    pixel_window.col_off >= 0 and
+                    pixel_window.row_off >= 0 and
+                    pixel_window.col_off + pixel_window.width <= src.width and
+                    pixel_window.row_off + pixel_window.height <= src.height
+                )
+                return src.read(
+                    indexes=indexes,
+                    out=out,
+                    window=pixel_window,
+                    boundless=not is_within,
+                    fill_value=fill_value,
+                )
+
+        return src.read(
+            indexes=indexes,
+            out=out,
             window=window,
-            out_shape=(src.count, tile_size_pixels, tile_size_pixels),
             boundless=True,
             resampling=interpolation_mode.to_rio(),
             fill_value=fill_value,
         )
 
-    data = _permute_data(
-        data=data,
+
+def _to_pixel_window(
+    window: rio.windows.Window,
+    height_pixels: int,
+    width_pixels: int,
+    snap_to_grid: bool = False,
+) -> rio.windows.Window | None:
+    """Converts the window to a window with integer offsets and lengths.
+
+    Parameters:
+        window: window
+        height_pixels: height of the data in pixels
+        width_pixels: width of the data in pixels
+        snap_to_grid: if True, the offsets are rounded to the nearest pixel
+
+    Returns:
+        window with integer offsets and lengths or None if the window is not pixel-aligned
+        or its lengths differ from the height and the width of the data
+    """
+    if not snap_to_grid and not (
+        _is_multiple(window.col_off, 1) and
+        _is_multiple(window.row_off, 1)
+    ):
+        return None
+
+    if not (
+        isclose(window.height, height_pixels, abs_tol=1e-6) and
+        isclose(window.width, width_pixels, abs_tol=1e-6)
+    ):
+        return None
+
+    return rio.windows.Window(
+        col_off=round(window.col_off),
+        row_off=round(window.row_off),
+        width=width_pixels,
+        height=height_pixels,
     )
-    data = _drop_channels(
-        data=data,
-        drop_channels=drop_channels,
+
+
+def _is_cacheable(
+    x_min: Coordinate,
+    y_min: Coordinate,
+    tile_size: TileSize,
+    ground_sampling_distance: GroundSamplingDistance,
+    buffer_size: BufferSize = 0,
+) -> bool:
+    """Checks if the tile can be assembled from cached chunks.
+
+    Parameters:
+        x_min: minimum x coordinate
+        y_min: minimum y coordinate
+        tile_size: tile size in meters
+        ground_sampling_distance: ground sampling distance in meters
+        buffer_size: buffer size in meters
+
+    Returns:
+        True if the coordinates, the tile size and the buffer size are multiples of the ground sampling distance
+    """
+    return all(
+        _is_multiple(value, ground_sampling_distance)
+        for value in (x_min, y_min, tile_size, buffer_size)
     )
+
+
+def _read_cached(
+    bounding_box: BoundingBox,
+    path: Path,
+    tile_size: TileSize,
+    ground_sampling_distance: GroundSamplingDistance,
+    interpolation_mode: InterpolationMode = InterpolationMode.BILINEAR,
+    fill_value: int = 0,
+    gdal_config: GDALConfig | None = None,
+    native_resolution: bool = False,
+    snap_to_grid: bool = False,
+    overview_level: int | None = None,
+    indexes: list[int] | None = None,
+    shared_cache: SharedMemoryCache = None,
+    out: npt.NDArray | None = None,
+) -> npt.NDArray:
+    """Assembles the data within the bounding box from cached chunks.
+
+    Chunks that are not cached are read from the virtual raster and cached.
+
+    Parameters:
+        bounding_box: bounding box
+        path: path to the virtual raster (.vrt file)
+        tile_size: tile size in meters (i.e., the chunk size)
+        ground_sampling_distance: ground sampling distance in meters
+        interpolation_mode: interpolation mode (`BILINEAR` or `NEAREST`)
+        fill_value: fill value of nodata pixels
+        gdal_config: configuration of the GDAL environment
+        native_resolution: if True, the ground sampling distance equals the ground sampling distance
+            of the virtual raster or its overview level (pixel-aligned data is read without resampling)
+        snap_to_grid: if True and `native_resolution` is True, the data is snapped to the pixel grid
+            of the virtual raster
+        overview_level: overview level of the virtual raster (if None, the full resolution is read)
+        indexes: band indices to read (1-based) (if None, all bands are read)
+        shared_cache: shared cache of the chunks
+        out: output array of shape (channels, height, width) the data is assembled in (if None, the data is
+            assembled in a new array)
+
+    Returns:
+        data (channels-first)
+    """
+    height_pixels = round((bounding_box.y_max - bounding_box.y_min) / ground_sampling_distance)
+    width_pixels = round((bounding_box.x_max - bounding_box.x_min) / ground_sampling_distance)
+    chunk_size_pixels = round(tile_size / ground_sampling_distance)
+
+    if out is None:
+        data = np.empty(
+            shape=(shared_cache.shape[0], height_pixels, width_pixels),
+            dtype=shared_cache.dtype,
+        )
+    else:
+        data = out
+
+    for chunk_y_min in range(
+        floor(bounding_box.y_min / tile_size) * tile_size,
+        bounding_box.y_max,
+        tile_size,
+    ):
+        for chunk_x_min in range(
+            floor(bounding_box.x_min / tile_size) * tile_size,
+            bounding_box.x_max,
+            tile_size,
+        ):
+            x_min = max(bounding_box.x_min, chunk_x_min)
+            y_min = max(bounding_box.y_min, chunk_y_min)
+            x_max = min(bounding_box.x_max, chunk_x_min + tile_size)
+            y_max = min(bounding_box.y_max, chunk_y_min + tile_size)
+            chunk_index = (
+                slice(None),
+                slice(
+                    round((chunk_y_min + tile_size - y_max) / ground_sampling_distance),
+                    round((chunk_y_min + tile_size - y_min) / ground_sampling_distance),
+                ),
+                slice(
+                    round((x_min - chunk_x_min) / ground_sampling_distance),
+                    round((x_max - chunk_x_min) / ground_sampling_distance),
+                ),
+            )
+            data_index = (
+                slice(None),
+                slice(
+                    round((bounding_box.y_max - y_max) / ground_sampling_distance),
+                    round((bounding_box.y_max - y_min) / ground_sampling_distance),
+                ),
+                slice(
+                    round((x_min - bounding_box.x_min) / ground_sampling_distance),
+                    round((x_max - bounding_box.x_min) / ground_sampling_distance),
+                ),
+            )
+            key = (chunk_x_min, chunk_y_min)
+            is_cached = shared_cache.get(
+                key=key,
+                out=data[data_index],
+                index=chunk_index,
+            )
+
+            if is_cached:
+                continue
+
+            chunk = _read(
+                bounding_box=BoundingBox(
+                    x_min=chunk_x_min,
+                    y_min=chunk_y_min,
+                    x_max=chunk_x_min + tile_size,
+                    y_max=chunk_y_min + tile_size,
+                ),
+                height_pixels=chunk_size_pixels,
+                width_pixels=chunk_size_pixels,
+                path=path,
+                interpolation_mode=interpolation_mode,
+                fill_value=fill_value,
+                gdal_config=gdal_config,
+                native_resolution=native_resolution,
+                snap_to_grid=snap_to_grid,
+                overview_level=overview_level,
+                indexes=indexes,
+            )
+            shared_cache.put(
+                key=key,
+                data=chunk,
+            )
+            data[data_index] = chunk[chunk_index]
+
     return data
 
 
+def _group_coordinates(
+    coordinates: CoordinatesSet,
+    tile_size: TileSize,
+) -> list[list[int]]:
+    """Groups the coordinates of spatially adjacent tiles into rectangles.
+
+    The tiles are grouped greedily starting from the top left tile, i.e., each group is extended to the right
+    and then downwards as long as the tiles of the next row are in the coordinates, so that the enclosing
+    window of each group contains only its tiles (e.g., an L-shaped set of tiles is split into two groups).
+
+    Parameters:
+        coordinates: coordinates (x_min, y_min) of each tile
+        tile_size: tile size in meters
+
+    Returns:
+        indices of the coordinates of each group
+    """
+    indices = {}
+
+    for index, (x_min, y_min) in enumerate(coordinates):
+        indices.setdefault((int(x_min), int(y_min)), index)
+
+    sorted_indices = sorted(
+        range(len(coordinates)),
+        key=lambda index_: (-int(coordinates[index_][1]), int(coordinates[index_][0])),
+    )
+    grouped = set()
+    groups = []
+
+    for index in sorted_indices:
+        if index in grouped:
+            continue
+
+        x_min, y_min = (int(coordinate) for coordinate in coordinates[index])
+
+        if indices[(x_min, y_min)] != index:
+            grouped.add(index)
+            groups.append([index])
+            continue
+
+        group = [index]
+
+        while True:
+            neighbor_index = indices.get((x_min + len(group) * tile_size, y_min))
+
+            if neighbor_index is None or neighbor_index in grouped:
+                break
+
+            group.append(neighbor_index)
+
+        num_columns = len(group)
+        y_min_ = y_min - tile_size
+
+        while True:
+            row = [
+                indices.get((x_min + column * tile_size, y_min_))
+                for column in range(num_columns)
+            ]
+
+            if any(index_ is None or index_ in grouped for index_ in row):
+                break
+
+            group.extend(row)
+            y_min_ -= tile_size
+
+        grouped.update(group)
+        groups.append(sorted(group))
+
+    return sorted(groups)
+
+
+def _is_multiple(
+    value: float,
+    base: float,
+) -> bool:
+    """Checks if the value is an integer multiple of the base.
+
+    Parameters:
+        value: value
+        base: base
+
+    Returns:
+        True if the value is an integer multiple of the base
+    """
+    quotient = value / base
+    return isclose(quotient, round(quotient), abs_tol=1e-6)
+
+
+def _get_env(
+    gdal_config: GDALConfig | None,
+) -> AbstractContextManager:
+    """Returns the GDAL environment.
+
+    Parameters:
+        gdal_config: configuration of the GDAL environment
+
+    Returns:
+        GDAL environment
+    """
+    if gdal_config is None:
+        return nullcontext()
+
+    return rio.Env(**gdal_config.to_rio())
+
+
+def _get_src(
+    path: Path,
+    overview_level: int | None = None,
+) -> rio.io.DatasetReader:
+    """Returns the dataset handle of the virtual raster.
+
+    The dataset handle is opened lazily and reused across calls.
+    Each process (e.g., each worker of the dataloader) and each thread has its own dataset handle,
+    since dataset handles must not be shared between processes or threads.
+    Each thread keeps at most `_MAX_NUM_SRCS` dataset handles open (the oldest dataset handle is closed first).
+
+    Parameters:
+        path: path to the virtual raster (.vrt file) or the raster
+        overview_level: overview level of the virtual raster (if None, the full resolution is opened)
+
+    Returns:
+        dataset handle
+    """
+    pid = os.getpid()
+    thread_id = threading.get_ident()
+    key = (pid, thread_id, path, overview_level)
+    src = _srcs.get(key)
+
+    if src is None or src.closed:
+        if overview_level is None:
+            src = rio.open(path)
+        else:
+            src = rio.open(
+                path,
+                overview_level=overview_level,
+            )
+
+        _put_src(
+            key=key,
+            src=src,
+        )
+
+    return src
+
+
+def _put_src(
+    key: tuple,
+    src: rio.DatasetReader | WarpedVRT,
+) -> None:
+    """Stores the dataset handle in the pool of the current thread.
+
+    If the pool of the current thread exceeds `_MAX_NUM_SRCS` dataset handles, the oldest dataset handles are closed.
+
+    Parameters:
+        key: key of the dataset handle (process id, thread id, path, ...)
+        src: dataset handle
+    """
+    pid, thread_id = key[:2]
+
+    with _srcs_lock:
+        _srcs.pop(key, None)
+        _srcs[key] = src
+        thread_keys = [
+            key_
+            for key_ in _srcs
+            if key_[0] == pid and key_[1] == thread_id
+        ]
+
+        for key_ in thread_keys[:-_MAX_NUM_SRCS]:
+            _srcs.pop(key_).close()
+
+
+def close_srcs(
+    path: Path | set[Path] | None = None,
+) -> None:
+    """Closes the dataset handles of the current process.
+
+    Parameters:
+        path: path or paths to the virtual raster (.vrt file) or the raster (if None, all dataset handles
+            are closed)
+    """
+    pid = os.getpid()
+    paths = {path} if isinstance(path, Path) else path
+
+    with _srcs_lock:
+        keys = [
+            key
+            for key in _srcs
+            if key[0] == pid and (paths is None or key[2] in paths)
+        ]
+
+        for key in keys:
+            _srcs.pop(key).close()
+
+
+def _reset_srcs() -> None:
+    """Resets the dataset handles in a forked child process.
+
+    The dataset handles of the parent process are discarded without closing them.
+    """
+    global _srcs_lock
+    _srcs.clear()
+    _srcs_lock = threading.Lock()
+
+
+atexit.register(close_srcs)
+os.register_at_fork(after_in_child=_reset_srcs)
+
+
 def _compute_tile_size_pixels(
     tile_size: TileSize,
     buffer_size: BufferSize,
@@ -111,12 +917,14 @@ def _compute_tile_size_pixels(
 def _drop_channels(
     data: npt.NDArray,
     drop_channels: list[int] | None,
+    layout: DataLayout = DataLayout.CHANNELS_LAST,
 ) -> npt.NDArray:
     """Drops the specified channels from the data.
 
     Parameters:
         data: data
         drop_channels: channel indices to drop (supports negative indexing)
+        layout: layout of the data (`CHANNELS_FIRST` or `CHANNELS_LAST`)
 
     Returns:
         data
@@ -124,6 +932,11 @@ def _drop_channels(
     if drop_channels is None:
         return data
 
+    if layout == DataLayout.CHANNELS_FIRST:
+        channels = np.arange(data.shape[0])
+        retain_channels = np.delete(channels, drop_channels)
+        return data[retain_channels]
+
     channels = np.arange(data.shape[-1])
     retain_channels = np.delete(channels, drop_channels)
     return data[..., retain_channels]
@@ -143,16 +956,324 @@ def _permute_data(
     return np.transpose(data, (1, 2, 0))
 
 
-def vrt_data_fetcher_info(
-    path: Path,
-) -> DataFetcherInfo:
-    """Returns information about the data fetcher.
+def compute_upcoming_indices(
+    index: int,
+    num_coordinates: int,
+    prefetch_depth: int,
+    batch_size: int = 1,
+    num_workers: int = 1,
+) -> list[int]:
+    """Computes the indices of the tiles that are fetched next by the same worker.
+
+    The dataloader assigns the batches to its workers in a round-robin fashion,
+    i.e., each worker fetches `batch_size` consecutive tiles and skips the tiles of the other workers.
 
     Parameters:
-        path: path to the virtual raster (.vrt file)
+        index: index of the current tile
+        num_coordinates: number of tiles
+        prefetch_depth: number of upcoming tiles
+        batch_size: batch size of the dataloader
+        num_workers: number of workers of the dataloader
 
     Returns:
-        data fetcher information
+        indices of the upcoming tiles
+    """
+    num_workers = max(num_workers, 1)
+    upcoming_indices = []
+
+    while len(upcoming_indices) < prefetch_depth:
+        index += 1
+
+        if index % batch_size == 0:
+            index += (num_workers - 1) * batch_size
+
+        if index >= num_coordinates:
+            break
+
+        upcoming_indices.append(index)
+
+    return upcoming_indices
+
+
+def compute_cache_key(
+    params: dict[str, Any],
+) -> str:
+    """Computes the cache key given the parameters of the data fetcher.
+
+    If a parameter is a path to an existing file or directory, its modification time is part of the cache key,
+    so that the cache is invalidated when the file or the directory changes (see `compute_mtime`).
+
+    Parameters:
+        params: parameters of the data fetcher
+
+    Returns:
+        cache key
+    """
+    params_ = {}
+
+    for key, value in sorted(params.items()):
+        if isinstance(value, Path):
+            params_[f'{key}_mtime'] = compute_mtime(
+                path=value,
+            )
+            value = str(value.resolve())
+        elif isinstance(value, Enum):
+            value = value.value
+
+        params_[key] = value
+
+    params_string = json.dumps(params_, sort_keys=True, default=str)
+    return hashlib.sha256(params_string.encode()).hexdigest()[:16]
+
+
+def compute_mtime(
+    path: Path,
+) -> int | None:
+    """Computes the modification time of the file or the directory.
+
+    The modification time of a directory is the latest modification time of the directory and the files
+    and directories in it (recursively), so that it changes when a file is added, removed or modified.
+
+    Parameters:
+        path: path to the file or the directory
+
+    Returns:
+        modification time in nanoseconds or None if the path does not exist
+    """
+    if path.is_file():
+        return path.stat().st_mtime_ns
+
+    if path.is_dir():
+        return max(path_.stat().st_mtime_ns for path_ in [path, *path.rglob('*')])
+
+    return None
+
+
+def read_cached_data(
+    path: Path,
+) -> npt.NDArray | None:
+    """Reads the cached data as a memory-mapped array.
+
+    The modification time of the file is updated, so that the least recently used data is evicted first.
+
+    Parameters:
+        path: path to the cached data (.npy file)
+
+    Returns:
+        cached data (memory-mapped, read-only) or None if the data is not cached
+    """
+    try:
+        data = np.load(path, mmap_mode='r')
+        os.utime(path)
+    except (FileNotFoundError, ValueError):
+        return None
+
+    return data
+
+
+def write_cached_data(
+    path: Path,
+    data: npt.NDArray,
+) -> int:
+    """Writes the data to the cache.
+
+    The data is written to a temporary file first, so that concurrent readers never see a partial file.
+    If the cached data cannot be replaced (e.g., on Windows, if it is memory-mapped by another reader),
+    the data is not written, since another process has already cached it.
+
+    Parameters:
+        path: path to the cached data (.npy file)
+        data: data
+
+    Returns:
+        size of the cached data in bytes
+    """
+    temp_path = path.with_name(f'.{path.stem}_{os.getpid()}_{threading.get_ident()}.npy')
+    np.save(temp_path, np.ascontiguousarray(data))
+
+    try:
+        os.replace(temp_path, path)
+    except PermissionError:
+        os.remove(temp_path)
+
+    return path.stat().st_size
+
+
+def evict_cached_data(
+    path: Path,
+    max_size: int,
+) -> int:
+    """Evicts the least recently used data until the size of the cache is less than 90% of the maximum size.
+
+    Data that cannot be removed (e.g., on Windows, if it is memory-mapped by another reader) is skipped.
+
+    Parameters:
+        path: path to the cache directory
+        max_size: maximum size of the cache in bytes
+
+    Returns:
+        size of the cache in bytes
+    """
+    entries = []
+
+    for root, _, file_names in os.walk(path):
+        for file_name in file_names:
+            if not file_name.endswith('.npy') or file_name.startswith('.'):
+                continue
+
+            try:
+                stat = os.stat(os.path.join(root, file_name))
+            except FileNotFoundError:
+                continue
+
+            entries.append((stat.st_mtime_ns, stat.st_size, os.path.join(root, file_name)))
+
+    size = sum(entry[1] for entry in entries)
+
+    if size <= max_size:
+        return size
+
+    entries.sort()
+
+    for _, entry_size, entry_path in entries:
+        if size <= .9 * max_size:
+            break
+
+        try:
+            os.remove(entry_path)
+        except FileNotFoundError:
+            pass
+        except PermissionError:
+            continue
+
+        size -= entry_size
+
+    return size
+
+
+def compute_overview_level(
+    overview_factors: tuple[int, ...],
+    ground_sampling_distance: GroundSamplingDistance,
+    src_ground_sampling_distance: GroundSamplingDistance,
+) -> int | None:
+    """Computes the overview level closest to the ground sampling distance.
+
+    The overview level is not coarser than the ground sampling distance.
+
+    Parameters:
+        overview_factors: decimation factor of each overview level
+        ground_sampling_distance: ground sampling distance in meters
+        src_ground_sampling_distance: ground sampling distance of the virtual raster in meters
+
+    Returns:
+        overview level (if None, the full resolution is closest to the ground sampling distance)
+    """
+    overview_level = None
+    max_overview_factor = 1
+
+    for overview_level_, overview_factor in enumerate(overview_factors):
+        overview_ground_sampling_distance = src_ground_sampling_distance * overview_factor
+        is_coarser = (
+            overview_ground_sampling_distance > ground_sampling_distance and
+            not isclose(overview_ground_sampling_distance, ground_sampling_distance, rel_tol=1e-6)
+        )
+
+        if not is_coarser and overview_factor > max_overview_factor:
+            overview_level = overview_level_
+            max_overview_factor = overview_factor
+
+    return overview_level
+
+
+def compute_indexes(
+    num_channels: int,
+    drop_channels: list[int] | None,
+) -> list[int] | None:
+    """Computes the band indices to read.
+
+    Parameters:
+        num_channels: number of channels
+        drop_channels: channel indices to drop (supports negative indexing)
+
+    Returns:
+        band indices to read (1-based) (if None, all bands are read)
+    """
+    if drop_channels is None:
+        return None
+
+    channels = np.arange(num_channels)
+    retain_channels = np.delete(channels, drop_channels)
+    return [int(channel) + 1 for channel in retain_channels]
+
+
+def vrt_data_fetcher_info(
+    path: Path,
+    ground_sampling_distance: GroundSamplingDistance | None = None,
+    drop_channels: list[int] | None = None,
+    cache_path: Path | None = None,
+) -> DataFetcherInfo:
+    """Returns information about the data fetcher.
+
+    The overview levels of the virtual raster are detected (external overviews (.ovr file) or implicit overviews
+    of its sources).
+    If `cache_path` is specified, the metadata of the virtual raster is cached as a JSON file in the cache
+    directory, so that the virtual raster is not opened again as long as it (and its .ovr file) is not modified.
+
+    Parameters:
+        path: path to the virtual raster (.vrt file)
+        ground_sampling_distance: ground sampling distance in meters (if None, no overview level is chosen)
+        drop_channels: channel indices to drop (supports negative indexing)
+        cache_path: path to the cache directory of the metadata (if None, the metadata is not cached)
+
+    Returns:
+        data fetcher information
+    """
+    data_fetcher_info = None
+
+    if cache_path is not None:
+        info_path = compute_info_path(
+            path=path,
+            cache_path=cache_path,
+        )
+        data_fetcher_info = read_cached_info(
+            path=info_path,
+        )
+
+    if data_fetcher_info is None:
+        data_fetcher_info = _read_info(
+            path=path,
+        )
+
+        if cache_path is not None:
+            write_cached_info(
+                path=info_path,
+                data_fetcher_info=data_fetcher_info,
+            )
+
+    if ground_sampling_distance is not None:
+        data_fetcher_info.overview_level = compute_overview_level(
+            overview_factors=data_fetcher_info.overview_factors,
+            ground_sampling_distance=ground_sampling_distance,
+            src_ground_sampling_distance=data_fetcher_info.ground_sampling_distance,
+        )
+
+    data_fetcher_info.indexes = compute_indexes(
+        num_channels=data_fetcher_info.num_channels,
+        drop_channels=drop_channels,
+    )
+    return data_fetcher_info
+
+
+def _read_info(
+    path: Path,
+) -> DataFetcherInfo:
+    """Reads the metadata of the virtual raster.
+
+    Parameters:
+        path: path to the virtual raster (.vrt file)
+
+    Returns:
+        data fetcher information (without the overview level and the band indices)
     """
     with rio.open(path) as src:
         bounding_box = BoundingBox(
@@ -163,13 +1284,1671 @@ def vrt_data_fetcher_info(
         )
         dtype = [DType.from_rio(dtype) for dtype in src.dtypes]
         epsg_code = src.crs.to_epsg()
-        ground_sampling_distance, _ = src.res
+        src_ground_sampling_distance, _ = src.res
         num_channels = src.count
+        overview_factors = tuple(src.overviews(1))
+        block_shape = tuple(src.block_shapes[0])
 
     return DataFetcherInfo(
         bounding_box=bounding_box,
         dtype=dtype,
         epsg_code=epsg_code,
-        ground_sampling_distance=ground_sampling_distance,
+        ground_sampling_distance=src_ground_sampling_distance,
         num_channels=num_channels,
+        overview_factors=overview_factors,
+        block_shape=block_shape,
+    )
+
+
+def get_default_cache_path() -> Path:
+    """Returns the path to the default cache directory of the metadata.
+
+    The default cache directory is located in the user cache directory (`XDG_CACHE_HOME` or `~/.cache`).
+
+    Returns:
+        path to the default cache directory
+    """
+    user_cache_path = os.environ.get('XDG_CACHE_HOME')
+    user_cache_path = Path(user_cache_path) if user_cache_path else Path.home() / '.cache'
+    return user_cache_path / 'aviary' / 'data_fetcher_info'
+
+
+def compute_info_path(
+    path: Path,
+    cache_path: Path,
+) -> Path:
+    """Computes the path to the cached metadata of the virtual raster.
+
+    The file name is computed from the path to the virtual raster and the modification times of the virtual raster
+    and its .ovr file, so that the cached metadata is invalidated when one of them changes.
+
+    Parameters:
+        path: path to the virtual raster (.vrt file)
+        cache_path: path to the cache directory of the metadata
+
+    Returns:
+        path to the cached metadata (.json file)
+    """
+    cache_key = compute_cache_key(
+        params={
+            'path': path,
+            'overviews_path': path.with_name(f'{path.name}.ovr'),
+        },
+    )
+    return cache_path / f'{cache_key}.json'
+
+
+def read_cached_info(
+    path: Path,
+) -> DataFetcherInfo | None:
+    """Reads the cached metadata of the virtual raster (or the memory-mapped array).
+
+    Parameters:
+        path: path to the cached metadata (.json file)
+
+    Returns:
+        data fetcher information (without the overview level and the band indices) or None if the metadata
+        is not cached
+    """
+    try:
+        with open(path, 'r') as file:
+            info = json.load(file)
+    except (FileNotFoundError, ValueError):
+        return None
+
+    return DataFetcherInfo(
+        bounding_box=BoundingBox(*info['bounding_box']),
+        dtype=[DType[dtype] for dtype in info['dtype']],
+        epsg_code=info['epsg_code'],
+        ground_sampling_distance=info['ground_sampling_distance'],
+        num_channels=info['num_channels'],
+        overview_factors=tuple(info['overview_factors']),
+        block_shape=tuple(info['block_shape']) if info['block_shape'] is not None else None,
+    )
+
+
+def write_cached_info(
+    path: Path,
+    data_fetcher_info: DataFetcherInfo,
+) -> None:
+    """Writes the metadata of the virtual raster (or the memory-mapped array) to the cache.
+
+    The metadata is written to a temporary file first, so that concurrent readers never see a partial file.
+    If the cache directory is not writable, the metadata is not cached.
+
+    Parameters:
+        path: path to the cached metadata (.json file)
+        data_fetcher_info: data fetcher information
+    """
+    info = {
+        'bounding_box': list(data_fetcher_info.bounding_box),
+        'dtype': [dtype.name for dtype in data_fetcher_info.dtype],
+        'epsg_code': data_fetcher_info.epsg_code,
+        'ground_sampling_distance': data_fetcher_info.ground_sampling_distance,
+        'num_channels': data_fetcher_info.num_channels,
+        'overview_factors': list(data_fetcher_info.overview_factors),
+        'block_shape': list(data_fetcher_info.block_shape) if data_fetcher_info.block_shape is not None else None,
+    }
+    temp_path = path.with_name(f'.{path.stem}_{os.getpid()}_{threading.get_ident()}.json')
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        with open(temp_path, 'w') as file:
+            json.dump(info, file)
+
+        os.replace(temp_path, path)
+    except OSError:
+        return
+
+
+def indexed_geotiff_data_fetcher(
+    x_min: Coordinate,
+    y_min: Coordinate,
+    paths: list[str],
+    footprints: STRtree,
+    tile_size: TileSize,
+    ground_sampling_distance: GroundSamplingDistance,
+    num_channels: int,
+    dtype: npt.DTypeLike,
+    interpolation_mode: InterpolationMode = InterpolationMode.BILINEAR,
+    buffer_size: BufferSize = 0,
+    fill_value: int = 0,
+    gdal_config: GDALConfig | None = None,
+    indexes: list[int] | None = None,
+    layout: DataLayout = DataLayout.CHANNELS_LAST,
+    out: npt.NDArray | None = None,
+) -> npt.NDArray:
+    """Fetches data from the GeoTIFFs that intersect the tile given a minimum x and y coordinate.
+
+    The GeoTIFFs that intersect the tile are queried from the spatial index of their footprints.
+    Only these GeoTIFFs are opened and read, and their data is mosaicked in the order of the paths
+    (i.e., the valid data of a later GeoTIFF overwrites the data of an earlier GeoTIFF, as in a virtual raster,
+    and its nodata or masked pixels do not).
+
+    Parameters:
+        x_min: minimum x coordinate
+        y_min: minimum y coordinate
+        paths: path to each GeoTIFF
+        footprints: spatial index of the footprint of each GeoTIFF
+        tile_size: tile size in meters
+        ground_sampling_distance: ground sampling distance in meters
+        num_channels: number of channels that are read
+        dtype: data type
+        interpolation_mode: interpolation mode (`BILINEAR` or `NEAREST`)
+        buffer_size: buffer size in meters (specifies the area around the tile that is additionally fetched)
+        fill_value: fill value of nodata pixels
+        gdal_config: configuration of the GDAL environment
+        indexes: band indices to read (1-based) (if None, all bands are read)
+        layout: layout of the data (`CHANNELS_FIRST` or `CHANNELS_LAST`)
+        out: output array of shape (channels, height, width) the data is mosaicked in (if None, the data is
+            mosaicked in a new array)
+
+    Returns:
+        data
+    """
+    bounding_box = BoundingBox(
+        x_min=x_min,
+        y_min=y_min,
+        x_max=x_min + tile_size,
+        y_max=y_min + tile_size,
+    )
+    bounding_box = bounding_box.buffer(
+        buffer_size=buffer_size,
+        inplace=False,
+    )
+    tile_size_pixels = _compute_tile_size_pixels(
+        tile_size=tile_size,
+        buffer_size=buffer_size,
+        ground_sampling_distance=ground_sampling_distance,
+    )
+
+    if out is None:
+        out = np.empty(
+            shape=(num_channels, tile_size_pixels, tile_size_pixels),
+            dtype=dtype,
+        )
+
+    out[...] = fill_value
+
+    geometry = box(
+        bounding_box.x_min,
+        bounding_box.y_min,
+        bounding_box.x_max,
+        bounding_box.y_max,
+    )
+    source_indices = np.sort(footprints.query(geometry, predicate='intersects'))
+
+    with _get_env(gdal_config):
+        for source_index in source_indices:
+            src = _get_src(
+                path=Path(paths[source_index]),
+            )
+            _read_source(
+                src=src,
+                bounding_box=bounding_box,
+                interpolation_mode=interpolation_mode,
+                fill_value=fill_value,
+                indexes=indexes,
+                out=out,
+            )
+
+    data = out
+
+    if layout == DataLayout.CHANNELS_LAST:
+        data = _permute_data(
+            data=data,
+        )
+
+    return data
+
+
+def _read_source(
+    src: rio.io.DatasetReader,
+    bounding_box: BoundingBox,
+    interpolation_mode: InterpolationMode = InterpolationMode.BILINEAR,
+    fill_value: int = 0,
+    indexes: list[int] | None = None,
+    out: npt.NDArray = None,
+) -> None:
+    """Reads the data of the GeoTIFF that intersects the bounding box into the output array.
+
+    The intersection is snapped to the pixel grid of the output array (i.e., each pixel whose center lies
+    within the GeoTIFF is read).
+    Only the valid pixels of the GeoTIFF are copied into the output array (i.e., its nodata or masked pixels
+    and the pixels outside of it do not overwrite the data of an earlier GeoTIFF, as in a virtual raster).
+
+    Parameters:
+        src: dataset handle of the GeoTIFF
+        bounding_box: bounding box of the output array
+        interpolation_mode: interpolation mode (`BILINEAR` or `NEAREST`)
+        fill_value: fill value of nodata pixels
+        indexes: band indices to read (1-based) (if None, all bands are read)
+        out: output array of shape (channels, height, width)
+    """
+    height_pixels, width_pixels = out.shape[1:]
+    x_res = (bounding_box.x_max - bounding_box.x_min) / width_pixels
+    y_res = (bounding_box.y_max - bounding_box.y_min) / height_pixels
+    column_min = _to_pixel_index(
+        value=(src.bounds.left - bounding_box.x_min) / x_res,
+        max_value=width_pixels,
+    )
+    column_max = _to_pixel_index(
+        value=(src.bounds.right - bounding_box.x_min) / x_res,
+        max_value=width_pixels,
+    )
+    row_min = _to_pixel_index(
+        value=(bounding_box.y_max - src.bounds.top) / y_res,
+        max_value=height_pixels,
+    )
+    row_max = _to_pixel_index(
+        value=(bounding_box.y_max - src.bounds.bottom) / y_res,
+        max_value=height_pixels,
+    )
+
+    if column_min >= column_max or row_min >= row_max:
+        return
+
+    window = rio.windows.from_bounds(
+        left=bounding_box.x_min + column_min * x_res,
+        bottom=bounding_box.y_max - row_max * y_res,
+        right=bounding_box.x_min + column_max * x_res,
+        top=bounding_box.y_max - row_min * y_res,
+        transform=src.transform,
+    )
+    eps = 1e-6
+    is_within = (
+        window.col_off > -eps and
+        window.row_off > -eps and
+        window.col_off + window.width < src.width + eps and
+        window.row_off + window.height < src.height + eps
+    )
+    out = out[:, row_min:row_max, column_min:column_max]
+    mask_flags = (
+        src.mask_flag_enums
+        if indexes is None
+        else [src.mask_flag_enums[index - 1] for index in indexes]
+    )
+    is_valid = all(MaskFlags.all_valid in band_mask_flags for band_mask_flags in mask_flags)
+
+    if is_valid and is_within:
+        src.read(
+            indexes=indexes,
+            out=out,
+            window=window,
+            resampling=interpolation_mode.to_rio(),
+        )
+        return
+
+    data = src.read(
+        indexes=indexes,
+        out_shape=out.shape,
+        window=window,
+        boundless=not is_within,
+        resampling=interpolation_mode.to_rio(),
+        fill_value=fill_value,
+        masked=True,
     )
+    np.copyto(out, data.data, where=~np.ma.getmaskarray(data))
+
+
+def _to_pixel_index(
+    value: float,
+    max_value: int,
+) -> int:
+    """Converts the coordinate in pixels to the index of the first pixel whose center is not less than it.
+
+    Parameters:
+        value: coordinate in pixels
+        max_value: maximum index
+
+    Returns:
+        pixel index (clipped to [0, max_value])
+    """
+    pixel_index = ceil(value - .5 - 1e-6)
+    return min(max(pixel_index, 0), max_value)
+
+
+def compute_footprint_index_key(
+    path: Path,
+) -> str:
+    """Computes the key of the sources of the footprint index.
+
+    The key is computed from the name and the modification time of the virtual raster
+    or of each GeoTIFF (.tif or .tiff file) of the directory, so that it changes when the virtual raster
+    is modified or GeoTIFFs are added to, removed from or modified in the directory.
+
+    Parameters:
+        path: path to the virtual raster (.vrt file) or the directory of the GeoTIFFs
+
+    Returns:
+        key
+    """
+    if path.is_dir():
+        source_paths = sorted([*path.glob('*.tif'), *path.glob('*.tiff')])
+    else:
+        source_paths = [path]
+
+    sources = [
+        [source_path.name, source_path.stat().st_mtime_ns]
+        for source_path in source_paths
+        if source_path.exists()
+    ]
+    sources_string = json.dumps(sources)
+    return hashlib.sha256(sources_string.encode()).hexdigest()[:16]
+
+
+def build_footprint_index(
+    path: Path,
+) -> gpd.GeoDataFrame:
+    """Builds the footprint index of the GeoTIFFs of the virtual raster or the directory.
+
+    The footprints of the sources of a virtual raster are parsed from its XML (the sources are not opened).
+    The footprints of the GeoTIFFs of a directory are read from each GeoTIFF (.tif or .tiff file).
+
+    Parameters:
+        path: path to the virtual raster (.vrt file) or the directory of the GeoTIFFs
+
+    Returns:
+        footprint index (a path column and the footprint of each GeoTIFF as geometry)
+
+    Raises:
+        AviaryUserError: Invalid path (the virtual raster or the directory contains no GeoTIFFs)
+    """
+    if path.is_dir():
+        paths, footprints, epsg_code = _parse_directory(
+            path=path,
+        )
+    else:
+        paths, footprints, epsg_code = _parse_vrt(
+            path=path,
+        )
+
+    if not paths:
+        message = (
+            'Invalid path! '
+            f'The virtual raster or the directory {path} contains no GeoTIFFs.'
+        )
+        raise AviaryUserError(message)
+
+    return gpd.GeoDataFrame(
+        {'path': paths},
+        geometry=footprints,
+        crs=f'EPSG:{epsg_code}' if epsg_code is not None else None,
+    )
+
+
+def _parse_vrt(
+    path: Path,
+) -> tuple[list[str], list[Polygon], EPSGCode | None]:
+    """Parses the paths and footprints of the sources of the virtual raster.
+
+    The footprint of each source is computed from its destination rectangle (`DstRect`) and the geotransform
+    of the virtual raster (the sources of the first band are parsed).
+
+    Parameters:
+        path: path to the virtual raster (.vrt file)
+
+    Returns:
+        path and footprint of each source and EPSG code
+    """
+    root = ElementTree.parse(path).getroot()
+    x_origin, x_res, _, y_origin, _, y_res = (
+        float(value)
+        for value in root.findtext('GeoTransform').split(',')
+    )
+    srs = root.findtext('SRS')
+    epsg_code = rio.crs.CRS.from_user_input(srs).to_epsg() if srs else None
+    band = root.find('VRTRasterBand')
+    paths = []
+    footprints = []
+
+    for source in band:
+        source_filename = source.find('SourceFilename')
+        dst_rect = source.find('DstRect')
+
+        if source_filename is None or dst_rect is None:
+            continue
+
+        source_path = Path(source_filename.text)
+
+        if source_filename.get('relativeToVRT') == '1':
+            source_path = path.parent / source_path
+
+        source_path = source_path.resolve()
+
+        x_off = float(dst_rect.get('xOff'))
+        y_off = float(dst_rect.get('yOff'))
+        x_size = float(dst_rect.get('xSize'))
+        y_size = float(dst_rect.get('ySize'))
+        footprint = box(
+            x_origin + x_off * x_res,
+            y_origin + (y_off + y_size) * y_res,
+            x_origin + (x_off + x_size) * x_res,
+            y_origin + y_off * y_res,
+        )
+        paths.append(str(source_path))
+        footprints.append(footprint)
+
+    return paths, footprints, epsg_code
+
+
+def _parse_directory(
+    path: Path,
+) -> tuple[list[str], list[Polygon], EPSGCode | None]:
+    """Parses the paths and footprints of the GeoTIFFs of the directory.
+
+    Parameters:
+        path: path to the directory of the GeoTIFFs
+
+    Returns:
+        path and footprint of each GeoTIFF and EPSG code
+    """
+    source_paths = sorted([*path.glob('*.tif'), *path.glob('*.tiff')])
+    paths = []
+    footprints = []
+    epsg_code = None
+
+    for source_path in source_paths:
+        source_path = source_path.resolve()
+
+        with rio.open(source_path) as src:
+            footprint = box(*src.bounds)
+            epsg_code = src.crs.to_epsg() if src.crs is not None else None
+
+        paths.append(str(source_path))
+        footprints.append(footprint)
+
+    return paths, footprints, epsg_code
+
+
+def load_footprint_index(
+    path: Path,
+    index_path: Path,
+) -> gpd.GeoDataFrame:
+    """Loads the footprint index from disk or builds it and writes it to disk.
+
+    The key of the sources (see `compute_footprint_index_key`) is stored in the footprint index,
+    so that the footprint index is rebuilt when the virtual raster is modified or GeoTIFFs are added to,
+    removed from or modified in the directory.
+
+    Parameters:
+        path: path to the virtual raster (.vrt file) or the directory of the GeoTIFFs
+        index_path: path to the footprint index (.feather file)
+
+    Returns:
+        footprint index (a path column and the footprint of each GeoTIFF as geometry)
+    """
+    key = compute_footprint_index_key(
+        path=path,
+    )
+
+    if index_path.exists():
+        footprint_index = gpd.read_feather(index_path)
+
+        if _FOOTPRINT_INDEX_KEY_NAME in footprint_index and (
+            footprint_index[_FOOTPRINT_INDEX_KEY_NAME] == key
+        ).all():
+            return footprint_index.drop(columns=_FOOTPRINT_INDEX_KEY_NAME)
+
+    footprint_index = build_footprint_index(
+        path=path,
+    )
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    footprint_index.assign(**{_FOOTPRINT_INDEX_KEY_NAME: key}).to_feather(index_path)
+    return footprint_index
+
+
+def indexed_geotiff_data_fetcher_info(
+    footprint_index: gpd.GeoDataFrame,
+    drop_channels: list[int] | None = None,
+) -> DataFetcherInfo:
+    """Returns information about the data fetcher.
+
+    The data type, the ground sampling distance and the number of channels are read from the first GeoTIFF
+    (i.e., all GeoTIFFs are assumed to share them).
+
+    Parameters:
+        footprint_index: footprint index (a path column and the footprint of each GeoTIFF as geometry)
+        drop_channels: channel indices to drop (supports negative indexing)
+
+    Returns:
+        data fetcher information
+    """
+    x_min, y_min, x_max, y_max = footprint_index.total_bounds
+    bounding_box = BoundingBox(
+        x_min=floor(x_min),
+        y_min=floor(y_min),
+        x_max=ceil(x_max),
+        y_max=ceil(y_max),
+    )
+
+    with rio.open(footprint_index['path'].iloc[0]) as src:
+        dtype = [DType.from_rio(dtype) for dtype in src.dtypes]
+        epsg_code = src.crs.to_epsg()
+        ground_sampling_distance, _ = src.res
+        num_channels = src.count
+
+    indexes = compute_indexes(
+        num_channels=num_channels,
+        drop_channels=drop_channels,
+    )
+    return DataFetcherInfo(
+        bounding_box=bounding_box,
+        dtype=dtype,
+        epsg_code=epsg_code,
+        ground_sampling_distance=ground_sampling_distance,
+        num_channels=num_channels,
+        indexes=indexes,
+    )
+
+
+def stacked_data_fetcher(
+    x_min: Coordinate,
+    y_min: Coordinate,
+    data_fetchers: list[Callable[..., npt.NDArray]],
+    num_channels: list[int],
+    tile_size: TileSize,
+    ground_sampling_distance: GroundSamplingDistance,
+    dtype: npt.DTypeLike,
+    buffer_size: BufferSize = 0,
+    executor: Executor | None = None,
+    layout: DataLayout = DataLayout.CHANNELS_LAST,
+    out: npt.NDArray | None = None,
+) -> npt.NDArray:
+    """Fetches data from the data fetchers given a minimum x and y coordinate and stacks it along the channels.
+
+    The data of each data fetcher is read into its channels of the output array (i.e., without concatenating
+    the data afterward), so the data fetchers must accept an output array of shape (channels, height, width).
+    If an executor is specified, the data fetchers are called concurrently (the first data fetcher is called
+    in the calling thread).
+
+    Parameters:
+        x_min: minimum x coordinate
+        y_min: minimum y coordinate
+        data_fetchers: data fetchers
+        num_channels: number of channels of each data fetcher
+        tile_size: tile size in meters
+        ground_sampling_distance: ground sampling distance in meters
+        dtype: data type
+        buffer_size: buffer size in meters (specifies the area around the tile that is additionally fetched)
+        executor: executor (if None, the data fetchers are called sequentially)
+        layout: layout of the data (`CHANNELS_FIRST` or `CHANNELS_LAST`)
+        out: output array of shape (channels, height, width) the data is stacked in (if None, the data is
+            stacked in a new array)
+
+    Returns:
+        data
+    """
+    if out is None:
+        tile_size_pixels = _compute_tile_size_pixels(
+            tile_size=tile_size,
+            buffer_size=buffer_size,
+            ground_sampling_distance=ground_sampling_distance,
+        )
+        out = np.empty(
+            shape=(sum(num_channels), tile_size_pixels, tile_size_pixels),
+            dtype=dtype,
+        )
+
+    channel_indices = np.cumsum([0, *num_channels]).tolist()
+    outs = [
+        out[channel_index_min:channel_index_max]
+        for channel_index_min, channel_index_max in zip(channel_indices[:-1], channel_indices[1:])
+    ]
+    futures = []
+
+    if executor is not None:
+        futures = [
+            executor.submit(
+                data_fetcher,
+                x_min=x_min,
+                y_min=y_min,
+                out=out_,
+            )
+            for data_fetcher, out_ in zip(data_fetchers[1:], outs[1:])
+        ]
+        data_fetchers = data_fetchers[:1]
+        outs = outs[:1]
+
+    try:
+        for data_fetcher, out_ in zip(data_fetchers, outs):
+            data_fetcher(
+                x_min=x_min,
+                y_min=y_min,
+                out=out_,
+            )
+    finally:
+        wait(futures)
+
+    for future in futures:
+        future.result()
+
+    data = out
+
+    if layout == DataLayout.CHANNELS_LAST:
+        data = _permute_data(
+            data=data,
+        )
+
+    return data
+
+
+def stacked_data_fetcher_info(
+    data_fetcher_infos: list[DataFetcherInfo],
+) -> DataFetcherInfo:
+    """Returns information about the data fetcher.
+
+    The information of the data fetchers is merged, i.e., the bounding box is the intersection
+    of the bounding boxes, the data type of each channel is the data type of each channel that is read,
+    the ground sampling distance is the finest ground sampling distance and the number of channels is
+    the number of channels that are read.
+
+    Parameters:
+        data_fetcher_infos: data fetcher information of each data fetcher
+
+    Returns:
+        data fetcher information
+
+    Raises:
+        AviaryUserError: Invalid data fetchers (the EPSG codes of the data fetchers are not equal
+            or the bounding boxes of the data fetchers do not intersect)
+    """
+    epsg_codes = {data_fetcher_info.epsg_code for data_fetcher_info in data_fetcher_infos}
+
+    if len(epsg_codes) > 1:
+        message = (
+            'Invalid data_fetchers! '
+            'The EPSG codes of the data fetchers must be equal.'
+        )
+        raise AviaryUserError(message)
+
+    x_min = max(data_fetcher_info.bounding_box.x_min for data_fetcher_info in data_fetcher_infos)
+    y_min = max(data_fetcher_info.bounding_box.y_min for data_fetcher_info in data_fetcher_infos)
+    x_max = min(data_fetcher_info.bounding_box.x_max for data_fetcher_info in data_fetcher_infos)
+    y_max = min(data_fetcher_info.bounding_box.y_max for data_fetcher_info in data_fetcher_infos)
+
+    if x_min >= x_max or y_min >= y_max:
+        message = (
+            'Invalid data_fetchers! '
+            'The bounding boxes of the data fetchers must intersect.'
+        )
+        raise AviaryUserError(message)
+
+    bounding_box = BoundingBox(
+        x_min=x_min,
+        y_min=y_min,
+        x_max=x_max,
+        y_max=y_max,
+    )
+    dtype = []
+
+    for data_fetcher_info in data_fetcher_infos:
+        if data_fetcher_info.indexes is None:
+            dtype.extend(data_fetcher_info.dtype)
+        else:
+            dtype.extend(data_fetcher_info.dtype[index - 1] for index in data_fetcher_info.indexes)
+
+    ground_sampling_distance = min(
+        data_fetcher_info.ground_sampling_distance
+        for data_fetcher_info in data_fetcher_infos
+    )
+    return DataFetcherInfo(
+        bounding_box=bounding_box,
+        dtype=dtype,
+        epsg_code=epsg_codes.pop(),
+        ground_sampling_distance=ground_sampling_distance,
+        num_channels=len(dtype),
+    )
+
+
+def memmap_data_fetcher(
+    x_min: Coordinate,
+    y_min: Coordinate,
+    data: npt.NDArray,
+    bounding_box: BoundingBox,
+    tile_size: TileSize,
+    ground_sampling_distance: GroundSamplingDistance,
+    buffer_size: BufferSize = 0,
+    channels: slice | list[int] | None = None,
+    fill_value: int = 0,
+    layout: DataLayout = DataLayout.CHANNELS_LAST,
+) -> npt.NDArray:
+    """Fetches data from the memory-mapped array given a minimum x and y coordinate.
+
+    The data of the tile is sliced out of the memory-mapped array (i.e., without decoding and without copying).
+    Only if the tile exceeds the bounding box of the memory-mapped array or the channels are not a slice,
+    the data is copied.
+    The coordinates are snapped to the pixel grid of the memory-mapped array.
+
+    Parameters:
+        x_min: minimum x coordinate
+        y_min: minimum y coordinate
+        data: memory-mapped array of shape (channels, height, width)
+        bounding_box: bounding box of the memory-mapped array
+        tile_size: tile size in meters
+        ground_sampling_distance: ground sampling distance in meters
+        buffer_size: buffer size in meters (specifies the area around the tile that is additionally fetched)
+        channels: channels to read (if None, all channels are read)
+        fill_value: fill value of the pixels outside the bounding box
+        layout: layout of the data (`CHANNELS_FIRST` or `CHANNELS_LAST`)
+
+    Returns:
+        data
+    """
+    tile_size_pixels = _compute_tile_size_pixels(
+        tile_size=tile_size,
+        buffer_size=buffer_size,
+        ground_sampling_distance=ground_sampling_distance,
+    )
+    column_min = round((x_min - buffer_size - bounding_box.x_min) / ground_sampling_distance)
+    row_min = round((bounding_box.y_max - (y_min + tile_size + buffer_size)) / ground_sampling_distance)
+    column_max = column_min + tile_size_pixels
+    row_max = row_min + tile_size_pixels
+    height_pixels, width_pixels = data.shape[1:]
+
+    if channels is None:
+        channels = slice(None)
+
+    is_within = (
+        column_min >= 0 and
+        row_min >= 0 and
+        column_max <= width_pixels and
+        row_max <= height_pixels
+    )
+
+    if is_within:
+        data = data[channels, row_min:row_max, column_min:column_max]
+    else:
+        data_ = data[channels, max(row_min, 0):max(row_max, 0), max(column_min, 0):max(column_max, 0)]
+        out = np.full(
+            shape=(data_.shape[0], tile_size_pixels, tile_size_pixels),
+            fill_value=fill_value,
+            dtype=data.dtype,
+        )
+        out_row_min = max(-row_min, 0)
+        out_column_min = max(-column_min, 0)
+        out[
+            :,
+            out_row_min:out_row_min + data_.shape[1],
+            out_column_min:out_column_min + data_.shape[2],
+        ] = data_
+        data = out
+
+    if layout == DataLayout.CHANNELS_LAST:
+        data = _permute_data(
+            data=data,
+        )
+
+    return data
+
+
+def compute_channels(
+    num_channels: int,
+    drop_channels: list[int] | None = None,
+) -> slice | list[int] | None:
+    """Computes the channels to read.
+
+    If the channels to read are consecutive, they are returned as a slice, so that slicing the data
+    does not copy it.
+
+    Parameters:
+        num_channels: number of channels
+        drop_channels: channel indices to drop (supports negative indexing)
+
+    Returns:
+        channels to read (if None, all channels are read)
+    """
+    if drop_channels is None:
+        return None
+
+    channels = np.delete(np.arange(num_channels), drop_channels).tolist()
+
+    if channels and channels == list(range(channels[0], channels[-1] + 1)):
+        return slice(channels[0], channels[-1] + 1)
+
+    return channels
+
+
+def build_memmap(
+    path: Path,
+    data_fetcher: Callable[..., npt.NDArray],
+    coordinates: CoordinatesSet,
+    tile_size: TileSize,
+    ground_sampling_distance: GroundSamplingDistance,
+    num_channels: int,
+    dtype: list[DType],
+    epsg_code: EPSGCode,
+    buffer_size: BufferSize = 0,
+    num_threads: int = 8,
+) -> DataFetcherInfo:
+    """Builds the memory-mapped array from the data fetcher.
+
+    The memory-mapped array covers the tiles and their buffers, and it is aligned to the tile grid.
+    The data of the tiles and of the adjacent tiles within the buffer size is fetched concurrently
+    by `num_threads` threads and written into the memory-mapped array (the pixels outside these tiles
+    are filled with 0).
+    The memory-mapped array (data.npy) and its metadata (info.json) are written to the directory.
+
+    Parameters:
+        path: path to the directory of the memory-mapped array
+        data_fetcher: data fetcher (it must accept an output array of shape (channels, height, width)
+            and must not fetch a buffer)
+        coordinates: coordinates (x_min, y_min) of each tile
+        tile_size: tile size in meters
+        ground_sampling_distance: ground sampling distance in meters
+        num_channels: number of channels that are fetched
+        dtype: data type of each channel that is fetched
+        epsg_code: EPSG code
+        buffer_size: buffer size in meters (specifies the area around each tile that is additionally written)
+        num_threads: number of threads
+
+    Returns:
+        data fetcher information of the memory-mapped array
+
+    Raises:
+        AviaryUserError: Invalid coordinates (`coordinates` is empty)
+    """
+    if len(coordinates) == 0:
+        message = (
+            'Invalid coordinates! '
+            'coordinates must contain at least one coordinate.'
+        )
+        raise AviaryUserError(message)
+
+    num_adjacent_tiles = ceil(buffer_size / tile_size)
+    offsets = np.arange(-num_adjacent_tiles, num_adjacent_tiles + 1) * tile_size
+    offsets = np.stack(np.meshgrid(offsets, offsets), axis=-1).reshape(-1, 2)
+    coordinates = np.unique((coordinates[:, np.newaxis] + offsets[np.newaxis]).reshape(-1, 2), axis=0)
+
+    x_min, y_min = coordinates.min(axis=0)
+    x_max, y_max = coordinates.max(axis=0) + tile_size
+    bounding_box = BoundingBox(
+        x_min=int(x_min),
+        y_min=int(y_min),
+        x_max=int(x_max),
+        y_max=int(y_max),
+    )
+    tile_size_pixels = _compute_tile_size_pixels(
+        tile_size=tile_size,
+        buffer_size=0,
+        ground_sampling_distance=ground_sampling_distance,
+    )
+    dtype = np.dtype(np.result_type(*[dtype_.value for dtype_ in dtype]))
+    shape = (
+        num_channels,
+        round((bounding_box.y_max - bounding_box.y_min) / ground_sampling_distance),
+        round((bounding_box.x_max - bounding_box.x_min) / ground_sampling_distance),
+    )
+    path.mkdir(parents=True, exist_ok=True)
+    data = np.lib.format.open_memmap(
+        path / _MEMMAP_DATA_NAME,
+        mode='w+',
+        dtype=dtype,
+        shape=shape,
+    )
+
+    def fetch(
+        x_min_: Coordinate,
+        y_min_: Coordinate,
+    ) -> None:
+        column_min = round((x_min_ - bounding_box.x_min) / ground_sampling_distance)
+        row_min = round((bounding_box.y_max - (y_min_ + tile_size)) / ground_sampling_distance)
+        data_fetcher(
+            x_min=x_min_,
+            y_min=y_min_,
+            out=data[:, row_min:row_min + tile_size_pixels, column_min:column_min + tile_size_pixels],
+        )
+
+    with ThreadPoolExecutor(max_workers=num_threads) as executor:
+        futures = [
+            executor.submit(
+                fetch,
+                x_min_=x_min_,
+                y_min_=y_min_,
+            )
+            for x_min_, y_min_ in coordinates.tolist()
+        ]
+
+        for future in futures:
+            future.result()
+
+    data.flush()
+
+    memmap_info = DataFetcherInfo(
+        bounding_box=bounding_box,
+        dtype=[DType(dtype.type)] * num_channels,
+        epsg_code=epsg_code,
+        ground_sampling_distance=ground_sampling_distance,
+        num_channels=num_channels,
+    )
+    write_cached_info(
+        path=path / _MEMMAP_INFO_NAME,
+        data_fetcher_info=memmap_info,
+    )
+    return memmap_info
+
+
+def load_memmap(
+    path: Path,
+) -> tuple[np.memmap, DataFetcherInfo]:
+    """Loads the memory-mapped array and its metadata.
+
+    Parameters:
+        path: path to the directory of the memory-mapped array
+
+    Returns:
+        memory-mapped array of shape (channels, height, width) (read-only) and its data fetcher information
+
+    Raises:
+        AviaryUserError: Invalid path (the directory does not contain a memory-mapped array)
+    """
+    memmap_info = read_cached_info(
+        path=path / _MEMMAP_INFO_NAME,
+    )
+    data_path = path / _MEMMAP_DATA_NAME
+
+    if memmap_info is None or not data_path.is_file():
+        message = (
+            'Invalid path! '
+            f'{path} must contain a memory-mapped array (see MemmapDataFetcher.build).'
+        )
+        raise AviaryUserError(message)
+
+    data = np.load(
+        data_path,
+        mmap_mode='r',
+    )
+    return data, memmap_info
+
+
+def compute_mem_path(
+    data: npt.NDArray,
+    transform: Affine,
+    epsg_code: EPSGCode,
+) -> str:
+    """Computes the path to the in-memory dataset of the array.
+
+    The in-memory dataset (GDAL's MEM driver) references the memory of the array, i.e., the array is not copied.
+    The path depends on the address of the memory, so it must be computed in each process.
+
+    Parameters:
+        data: data of shape (channels, height, width) (C-contiguous)
+        transform: affine transform of the data
+        epsg_code: EPSG code
+
+    Returns:
+        path to the in-memory dataset
+
+    Raises:
+        AviaryUserError: Invalid data (`data` is not C-contiguous, is not of shape (channels, height, width)
+            or its data type is not supported)
+    """
+    if data.ndim != 3:
+        message = (
+            'Invalid data! '
+            'data must be of shape (channels, height, width).'
+        )
+        raise AviaryUserError(message)
+
+    if not data.flags.c_contiguous:
+        message = (
+            'Invalid data! '
+            'data must be C-contiguous.'
+        )
+        raise AviaryUserError(message)
+
+    data_type = _GDAL_DATA_TYPES.get(data.dtype)
+
+    if data_type is None:
+        message = (
+            'Invalid data! '
+            f'The data type of data must be one of {", ".join(str(dtype) for dtype in _GDAL_DATA_TYPES)}.'
+        )
+        raise AviaryUserError(message)
+
+    num_channels, height, width = data.shape
+    geotransform = '/'.join(repr(float(value)) for value in transform.to_gdal())
+    return (
+        'MEM:::'
+        f'DATAPOINTER={data.ctypes.data},'
+        f'PIXELS={width},'
+        f'LINES={height},'
+        f'BANDS={num_channels},'
+        f'DATATYPE={data_type},'
+        f'PIXELOFFSET={data.itemsize},'
+        f'LINEOFFSET={width * data.itemsize},'
+        f'BANDOFFSET={height * width * data.itemsize},'
+        f'GEOTRANSFORM={geotransform},'
+        f'SPATIALREFERENCE=EPSG:{epsg_code}'
+    )
+
+
+def array_data_fetcher(
+    x_min: Coordinate,
+    y_min: Coordinate,
+    path: str,
+    tile_size: TileSize,
+    ground_sampling_distance: GroundSamplingDistance,
+    interpolation_mode: InterpolationMode = InterpolationMode.BILINEAR,
+    buffer_size: BufferSize = 0,
+    fill_value: int = 0,
+    native_resolution: bool = False,
+    indexes: list[int] | None = None,
+    layout: DataLayout = DataLayout.CHANNELS_LAST,
+    out: npt.NDArray | None = None,
+) -> npt.NDArray:
+    """Fetches data from the in-memory dataset of the array given a minimum x and y coordinate.
+
+    The data is read with the same buffering and resampling as the data of a virtual raster
+    (see `vrt_data_fetcher`).
+
+    Parameters:
+        x_min: minimum x coordinate
+        y_min: minimum y coordinate
+        path: path to the in-memory dataset (see `compute_mem_path`)
+        tile_size: tile size in meters
+        ground_sampling_distance: ground sampling distance in meters
+        interpolation_mode: interpolation mode (`BILINEAR` or `NEAREST`)
+        buffer_size: buffer size in meters (specifies the area around the tile that is additionally fetched)
+        fill_value: fill value of the pixels outside the array
+        native_resolution: if True, the ground sampling distance equals the ground sampling distance
+            of the array (pixel-aligned data is read without resampling)
+        indexes: band indices to read (1-based) (if None, all bands are read)
+        layout: layout of the data (`CHANNELS_FIRST` or `CHANNELS_LAST`)
+        out: output array of shape (channels, height, width) the data is read into (if None, the data is read
+            into a new array)
+
+    Returns:
+        data
+    """
+    with rio.Env(GDAL_MEM_ENABLE_OPEN='YES'):
+        return vrt_data_fetcher(
+            x_min=x_min,
+            y_min=y_min,
+            path=path,
+            tile_size=tile_size,
+            ground_sampling_distance=ground_sampling_distance,
+            interpolation_mode=interpolation_mode,
+            buffer_size=buffer_size,
+            fill_value=fill_value,
+            native_resolution=native_resolution,
+            indexes=indexes,
+            layout=layout,
+            out=out,
+        )
+
+
+def array_data_fetcher_info(
+    data: npt.NDArray,
+    transform: Affine,
+    epsg_code: EPSGCode,
+    drop_channels: list[int] | None = None,
+) -> DataFetcherInfo:
+    """Returns information about the data fetcher.
+
+    Parameters:
+        data: data of shape (channels, height, width)
+        transform: affine transform of the data
+        epsg_code: EPSG code
+        drop_channels: channel indices to drop (supports negative indexing)
+
+    Returns:
+        data fetcher information
+
+    Raises:
+        AviaryUserError: Invalid transform (`transform` is not north-up)
+    """
+    if transform.b != 0 or transform.d != 0 or transform.e >= 0:
+        message = (
+            'Invalid transform! '
+            'transform must be north-up.'
+        )
+        raise AviaryUserError(message)
+
+    num_channels, height, width = data.shape
+    bounding_box = BoundingBox(
+        x_min=floor(transform.c),
+        y_min=floor(transform.f + transform.e * height),
+        x_max=ceil(transform.c + transform.a * width),
+        y_max=ceil(transform.f),
+    )
+    indexes = compute_indexes(
+        num_channels=num_channels,
+        drop_channels=drop_channels,
+    )
+    return DataFetcherInfo(
+        bounding_box=bounding_box,
+        dtype=[DType(data.dtype.type)] * num_channels,
+        epsg_code=epsg_code,
+        ground_sampling_distance=transform.a,
+        num_channels=num_channels,
+        indexes=indexes,
+    )
+
+
+def warped_vrt_data_fetcher(
+    x_min: Coordinate,
+    y_min: Coordinate,
+    path: Path,
+    epsg_code: EPSGCode,
+    tile_size: TileSize,
+    ground_sampling_distance: GroundSamplingDistance,
+    interpolation_mode: InterpolationMode = InterpolationMode.BILINEAR,
+    buffer_size: BufferSize = 0,
+    fill_value: int = 0,
+    gdal_config: GDALConfig | None = None,
+    num_threads: int | str = 1,
+    indexes: list[int] | None = None,
+    layout: DataLayout = DataLayout.CHANNELS_LAST,
+    out: npt.NDArray | None = None,
+) -> npt.NDArray:
+    """Fetches data from the virtual raster reprojected on the fly given a minimum x and y coordinate.
+
+    The virtual raster is warped into the coordinate reference system of the EPSG code and the pixel grid
+    of the ground sampling distance (see `compute_warped_transform`).
+    Only the window of the tile is warped, i.e., the virtual raster is not reprojected as a whole.
+    The warper is opened once per thread and reused across tiles.
+
+    The window is snapped to the pixel grid of the warped virtual raster, so that the data is resampled
+    only once (by the warper).
+
+    Parameters:
+        x_min: minimum x coordinate
+        y_min: minimum y coordinate
+        path: path to the virtual raster (.vrt file)
+        epsg_code: EPSG code of the data
+        tile_size: tile size in meters
+        ground_sampling_distance: ground sampling distance in meters
+        interpolation_mode: interpolation mode (`BILINEAR` or `NEAREST`)
+        buffer_size: buffer size in meters (specifies the area around the tile that is additionally fetched)
+        fill_value: fill value of nodata pixels
+        gdal_config: configuration of the GDAL environment
+        num_threads: number of threads of the warper (or 'ALL_CPUS')
+        indexes: band indices to read (1-based) (if None, all bands are read)
+        layout: layout of the data (`CHANNELS_FIRST` or `CHANNELS_LAST`)
+        out: output array of shape (channels, height, width) the data is read into (if None, the data is read
+            into a new array)
+
+    Returns:
+        data
+    """
+    bounding_box = BoundingBox(
+        x_min=x_min,
+        y_min=y_min,
+        x_max=x_min + tile_size,
+        y_max=y_min + tile_size,
+    )
+    bounding_box = bounding_box.buffer(
+        buffer_size=buffer_size,
+        inplace=False,
+    )
+    tile_size_pixels = _compute_tile_size_pixels(
+        tile_size=tile_size,
+        buffer_size=buffer_size,
+        ground_sampling_distance=ground_sampling_distance,
+    )
+
+    with _get_env(gdal_config):
+        src = _get_warped_src(
+            path=path,
+            epsg_code=epsg_code,
+            ground_sampling_distance=ground_sampling_distance,
+            interpolation_mode=interpolation_mode,
+            num_threads=num_threads,
+        )
+        indexes_ = src.indexes if indexes is None else indexes
+
+        if out is None:
+            out = np.empty(
+                shape=(len(indexes_), tile_size_pixels, tile_size_pixels),
+                dtype=src.dtypes[indexes_[0] - 1],
+            )
+
+        col_off = round((bounding_box.x_min - src.transform.c) / ground_sampling_distance)
+        row_off = round((src.transform.f - bounding_box.y_max) / ground_sampling_distance)
+        col_min = max(col_off, 0)
+        row_min = max(row_off, 0)
+        col_max = min(col_off + tile_size_pixels, src.width)
+        row_max = min(row_off + tile_size_pixels, src.height)
+        is_within = (
+            col_min == col_off and
+            row_min == row_off and
+            col_max == col_off + tile_size_pixels and
+            row_max == row_off + tile_size_pixels
+        )
+
+        if not is_within:
+            out[...] = fill_value
+
+        if col_min < col_max and row_min < row_max:
+            src.read(
+                indexes=indexes_,
+                out=out[:, row_min - row_off:row_max - row_off, col_min - col_off:col_max - col_off],
+                window=rio.windows.Window(
+                    col_off=col_min,
+                    row_off=row_min,
+                    width=col_max - col_min,
+                    height=row_max - row_min,
+                ),
+            )
+
+    data = out
+
+    if layout == DataLayout.CHANNELS_LAST:
+        data = _permute_data(
+            data=data,
+        )
+
+    return data
+
+
+class _WarpedVRT(WarpedVRT):
+    """Warped dataset handle that closes the dataset handle of the virtual raster when it is closed
+
+    `WarpedVRT.close` does not close its source dataset, i.e., the dataset handle of the virtual raster
+    would remain open after the warped dataset handle is closed (e.g., by `_put_src` or `close_srcs`).
+    """
+
+    def close(self) -> None:
+        """Closes the warped dataset handle and the dataset handle of the virtual raster."""
+        super().close()
+        self.src_dataset.close()
+
+
+def _get_warped_src(
+    path: Path,
+    epsg_code: EPSGCode,
+    ground_sampling_distance: GroundSamplingDistance,
+    interpolation_mode: InterpolationMode = InterpolationMode.BILINEAR,
+    num_threads: int | str = 1,
+) -> WarpedVRT:
+    """Returns the warped dataset handle of the current thread (the warped dataset handle is opened once
+    and reused across calls).
+
+    Parameters:
+        path: path to the virtual raster (.vrt file)
+        epsg_code: EPSG code of the warped virtual raster
+        ground_sampling_distance: ground sampling distance in meters of the warped virtual raster
+        interpolation_mode: interpolation mode (`BILINEAR` or `NEAREST`)
+        num_threads: number of threads of the warper (or 'ALL_CPUS')
+
+    Returns:
+        warped dataset handle
+    """
+    pid = os.getpid()
+    thread_id = threading.get_ident()
+    key = (pid, thread_id, path, ('warped', epsg_code, ground_sampling_distance, interpolation_mode, num_threads))
+    src = _srcs.get(key)
+
+    if src is None or src.closed:
+        base_src = rio.open(path)
+
+        try:
+            transform, width, height = compute_warped_transform(
+                src_crs=base_src.crs,
+                src_bounds=tuple(base_src.bounds),
+                epsg_code=epsg_code,
+                ground_sampling_distance=ground_sampling_distance,
+            )
+            src = _WarpedVRT(
+                base_src,
+                crs=rio.crs.CRS.from_epsg(epsg_code),
+                transform=transform,
+                width=width,
+                height=height,
+                resampling=interpolation_mode.to_rio(),
+                warp_extras={
+                    'NUM_THREADS': num_threads,
+                },
+            )
+        except Exception:
+            base_src.close()
+            raise
+
+        _put_src(
+            key=key,
+            src=src,
+        )
+
+    return src
+
+
+def compute_warped_transform(
+    src_crs: rio.crs.CRS,
+    src_bounds: tuple[float, float, float, float],
+    epsg_code: EPSGCode,
+    ground_sampling_distance: GroundSamplingDistance,
+) -> tuple[Affine, int, int]:
+    """Computes the affine transform and the shape of the warped virtual raster.
+
+    The bounds are transformed into the coordinate reference system of the EPSG code and snapped outwards
+    to multiples of the ground sampling distance, so that tiles at multiples of the ground sampling distance
+    are aligned to the pixel grid of the warped virtual raster.
+
+    Parameters:
+        src_crs: coordinate reference system of the virtual raster
+        src_bounds: bounds (left, bottom, right, top) of the virtual raster
+        epsg_code: EPSG code of the warped virtual raster
+        ground_sampling_distance: ground sampling distance in meters of the warped virtual raster
+
+    Returns:
+        affine transform, width and height of the warped virtual raster
+    """
+    left, bottom, right, top = rio.warp.transform_bounds(
+        src_crs,
+        rio.crs.CRS.from_epsg(epsg_code),
+        *src_bounds,
+    )
+    x_min = floor(round(left / ground_sampling_distance, 6)) * ground_sampling_distance
+    y_max = ceil(round(top / ground_sampling_distance, 6)) * ground_sampling_distance
+    width = ceil(round((right - x_min) / ground_sampling_distance, 6))
+    height = ceil(round((y_max - bottom) / ground_sampling_distance, 6))
+    transform = rio.transform.from_origin(
+        west=x_min,
+        north=y_max,
+        xsize=ground_sampling_distance,
+        ysize=ground_sampling_distance,
+    )
+    return transform, width, height
+
+
+def warped_vrt_data_fetcher_info(
+    path: Path,
+    epsg_code: EPSGCode,
+    ground_sampling_distance: GroundSamplingDistance,
+    drop_channels: list[int] | None = None,
+) -> DataFetcherInfo:
+    """Returns information about the data fetcher.
+
+    Parameters:
+        path: path to the virtual raster (.vrt file)
+        epsg_code: EPSG code of the warped virtual raster
+        ground_sampling_distance: ground sampling distance in meters of the warped virtual raster
+        drop_channels: channel indices to drop (supports negative indexing)
+
+    Returns:
+        data fetcher information
+    """
+    with rio.open(path) as src:
+        transform, width, height = compute_warped_transform(
+            src_crs=src.crs,
+            src_bounds=tuple(src.bounds),
+            epsg_code=epsg_code,
+            ground_sampling_distance=ground_sampling_distance,
+        )
+        dtype = [DType.from_rio(dtype) for dtype in src.dtypes]
+        num_channels = src.count
+
+    bounding_box = BoundingBox(
+        x_min=floor(transform.c),
+        y_min=floor(transform.f - ground_sampling_distance * height),
+        x_max=ceil(transform.c + ground_sampling_distance * width),
+        y_max=ceil(transform.f),
+    )
+    indexes = compute_indexes(
+        num_channels=num_channels,
+        drop_channels=drop_channels,
+    )
+    return DataFetcherInfo(
+        bounding_box=bounding_box,
+        dtype=dtype,
+        epsg_code=epsg_code,
+        ground_sampling_distance=ground_sampling_distance,
+        num_channels=num_channels,
+        indexes=indexes,
+    )
+
+
+def wms_data_fetcher(
+    x_min: Coordinate,
+    y_min: Coordinate,
+    url: str,
+    layer: str,
+    epsg_code: EPSGCode,
+    tile_size: TileSize,
+    ground_sampling_distance: GroundSamplingDistance,
+    version: str = '1.3.0',
+    response_format: str = 'image/png',
+    style: str = '',
+    buffer_size: BufferSize = 0,
+    drop_channels: list[int] | None = None,
+    layout: DataLayout = DataLayout.CHANNELS_LAST,
+    num_connections: int = 8,
+    max_retries: int = 3,
+    timeout: float = 30.,
+    response_cache: ResponseCache | None = None,
+) -> npt.NDArray:
+    """Fetches data from the web map service given a minimum x and y coordinate.
+
+    The GetMap request is sent with the pooled HTTP session of the current process (i.e., the TCP connections
+    are kept alive and reused across tiles) and the response is decoded into an array.
+
+    Parameters:
+        x_min: minimum x coordinate
+        y_min: minimum y coordinate
+        url: url of the web map service
+        layer: name of the layer
+        epsg_code: EPSG code
+        tile_size: tile size in meters
+        ground_sampling_distance: ground sampling distance in meters
+        version: version of the web map service ('1.1.1' or '1.3.0')
+        response_format: format of the response (e.g., 'image/png' or 'image/jpeg')
+        style: name of the style
+        buffer_size: buffer size in meters (specifies the area around the tile that is additionally fetched)
+        drop_channels: channel indices to drop (supports negative indexing)
+        layout: layout of the data (`CHANNELS_FIRST` or `CHANNELS_LAST`)
+        num_connections: maximum number of pooled connections of the HTTP session
+        max_retries: maximum number of retries of a failed request
+        timeout: timeout of a request in seconds
+        response_cache: cache of the responses (if None, the responses are not cached)
+
+    Returns:
+        data
+
+    Raises:
+        AviaryUserError: Invalid response (the web map service returned no image)
+    """
+    bounding_box = BoundingBox(
+        x_min=x_min,
+        y_min=y_min,
+        x_max=x_min + tile_size,
+        y_max=y_min + tile_size,
+    )
+    bounding_box = bounding_box.buffer(
+        buffer_size=buffer_size,
+        inplace=False,
+    )
+    tile_size_pixels = _compute_tile_size_pixels(
+        tile_size=tile_size,
+        buffer_size=buffer_size,
+        ground_sampling_distance=ground_sampling_distance,
+    )
+    params = compute_wms_params(
+        bounding_box=bounding_box,
+        width_pixels=tile_size_pixels,
+        height_pixels=tile_size_pixels,
+        layer=layer,
+        epsg_code=epsg_code,
+        version=version,
+        response_format=response_format,
+        style=style,
+    )
+    content = None
+
+    if response_cache is not None:
+        content = response_cache.get(tuple(params.items()))
+
+    if content is None:
+        session = _get_session(
+            num_connections=num_connections,
+            max_retries=max_retries,
+        )
+        response = session.get(
+            url,
+            params=params,
+            timeout=timeout,
+        )
+        response.raise_for_status()
+
+        if not response.headers.get('Content-Type', '').startswith('image/'):
+            message = (
+                'Invalid response! '
+                f'The web map service returned no image: {response.text[:200]}'
+            )
+            raise AviaryUserError(message)
+
+        content = response.content
+
+        if response_cache is not None:
+            response_cache.put(tuple(params.items()), content)
+
+    data = _decode_image(
+        content=content,
+    )
+    data = _drop_channels(
+        data=data,
+        drop_channels=drop_channels,
+        layout=DataLayout.CHANNELS_FIRST,
+    )
+
+    if layout == DataLayout.CHANNELS_LAST:
+        data = _permute_data(
+            data=data,
+        )
+
+    return data
+
+
+def compute_wms_params(
+    bounding_box: BoundingBox,
+    width_pixels: int,
+    height_pixels: int,
+    layer: str,
+    epsg_code: EPSGCode,
+    version: str = '1.3.0',
+    response_format: str = 'image/png',
+    style: str = '',
+) -> dict[str, str]:
+    """Computes the query parameters of the GetMap request.
+
+    The bounding box is sent in the axis order (x, y), i.e., the coordinate reference system must be projected
+    (e.g., UTM), since version 1.3.0 uses the axis order of the EPSG definition.
+
+    Parameters:
+        bounding_box: bounding box
+        width_pixels: width in pixels
+        height_pixels: height in pixels
+        layer: name of the layer
+        epsg_code: EPSG code
+        version: version of the web map service ('1.1.1' or '1.3.0')
+        response_format: format of the response (e.g., 'image/png' or 'image/jpeg')
+        style: name of the style
+
+    Returns:
+        query parameters
+    """
+    crs_key = 'CRS' if version == '1.3.0' else 'SRS'
+    return {
+        'SERVICE': 'WMS',
+        'REQUEST': 'GetMap',
+        'VERSION': version,
+        'LAYERS': layer,
+        'STYLES': style,
+        crs_key: f'EPSG:{epsg_code}',
+        'BBOX': ','.join(str(coordinate) for coordinate in bounding_box),
+        'WIDTH': str(width_pixels),
+        'HEIGHT': str(height_pixels),
+        'FORMAT': response_format,
+    }
+
+
+def _decode_image(
+    content: bytes,
+) -> npt.NDArray:
+    """Decodes the image (e.g., PNG or JPEG) into an array in memory.
+
+    Parameters:
+        content: content of the image
+
+    Returns:
+        data of shape (channels, height, width)
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', category=rio.errors.NotGeoreferencedWarning)
+
+        with rio.MemoryFile(content) as memory_file, memory_file.open() as src:
+            return src.read()
+
+
+def _get_session(
+    num_connections: int = 8,
+    max_retries: int = 3,
+) -> requests.Session:
+    """Returns the HTTP session of the current process.
+
+    The HTTP session is created lazily and reused across calls, so that the TCP connections are kept alive
+    and pooled instead of opening a new connection for each tile.
+    Each process (e.g., each worker of the dataloader) has its own HTTP session, which is shared by its threads.
+    Failed requests (connection errors and status codes 429, 500, 502, 503 and 504) are retried
+    with exponential backoff.
+
+    Parameters:
+        num_connections: maximum number of pooled connections
+        max_retries: maximum number of retries of a failed request
+
+    Returns:
+        HTTP session
+    """
+    key = (os.getpid(), num_connections, max_retries)
+
+    with _sessions_lock:
+        session = _sessions.get(key)
+
+        if session is None:
+            retry = Retry(
+                total=max_retries,
+                backoff_factor=.5,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=('GET',),
+            )
+            adapter = HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=num_connections,
+                max_retries=retry,
+            )
+            session = requests.Session()
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            _sessions[key] = session
+
+    return session
+
+
+def close_sessions() -> None:
+    """Closes the HTTP sessions of the current process."""
+    pid = os.getpid()
+
+    with _sessions_lock:
+        keys = [
+            key
+            for key in _sessions
+            if key[0] == pid
+        ]
+
+        for key in keys:
+            _sessions.pop(key).close()
+
+
+def _reset_sessions() -> None:
+    """Resets the HTTP sessions in a forked child process.
+
+    The HTTP sessions of the parent process are discarded without closing them.
+    """
+    global _sessions_lock
+    _sessions.clear()
+    _sessions_lock = threading.Lock()
+
+
+atexit.register(close_sessions)
+os.register_at_fork(after_in_child=_reset_sessions)
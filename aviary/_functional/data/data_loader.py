@@ -0,0 +1,415 @@
+from __future__ import annotations
+
+import inspect
+import multiprocessing
+import queue
+from collections.abc import Iterator
+from typing import TYPE_CHECKING
+
+import numpy.typing as npt
+import torch
+
+# noinspection PyProtectedMember
+from aviary._utils.shared_memory import SharedArray
+
+# noinspection PyProtectedMember
+from aviary._utils.types import (
+    CoordinatesSet,
+    DataLayout,
+)
+
+if TYPE_CHECKING:
+    from aviary.data.data_fetcher import DataFetcher
+    from aviary.data.data_preprocessor import DataPreprocessor
+
+
+def compute_num_batches(
+    coordinates: CoordinatesSet,
+    batch_size: int,
+) -> int:
+    """Computes the number of batches (the last batch may be smaller than `batch_size`).
+
+    Parameters:
+        coordinates: coordinates (x_min, y_min) of each tile
+        batch_size: batch size
+
+    Returns:
+        number of batches
+    """
+    return -(-len(coordinates) // batch_size)
+
+
+def get_batch_slice(
+    coordinates: CoordinatesSet,
+    batch_size: int,
+    batch_index: int,
+) -> slice:
+    """Computes the slice of the coordinates of the batch.
+
+    Parameters:
+        coordinates: coordinates (x_min, y_min) of each tile
+        batch_size: batch size
+        batch_index: index of the batch
+
+    Returns:
+        slice of the coordinates of the batch
+    """
+    start = batch_index * batch_size
+    stop = min(start + batch_size, len(coordinates))
+    return slice(start, stop)
+
+
+def supports_out(
+    data_fetcher: DataFetcher,
+) -> bool:
+    """Checks if the data fetcher can read the data of a tile into an output array of the buffer.
+
+    The output array of the data fetchers is channels-first, i.e., the data is read into the buffer
+    only if the layout of the data fetcher is `CHANNELS_FIRST`.
+
+    Parameters:
+        data_fetcher: data fetcher
+
+    Returns:
+        True if the data fetcher can read the data of a tile into the buffer
+    """
+    if getattr(data_fetcher, 'layout', None) != DataLayout.CHANNELS_FIRST:
+        return False
+
+    try:
+        parameters = inspect.signature(data_fetcher).parameters
+    except (TypeError, ValueError):
+        return False
+
+    return 'out' in parameters
+
+
+def fetch_batch_into(
+    data_fetcher: DataFetcher,
+    coordinates: CoordinatesSet,
+    out: npt.NDArray,
+) -> None:
+    """Fetches the data of a batch of tiles into the output array.
+
+    If the data fetcher supports an output array (see `supports_out`), the data of each tile is read
+    into its slot of the output array, otherwise the data of each tile is copied into its slot.
+    If the data fetcher provides a `fetch_batch` method, the data of the batch is fetched at once.
+
+    Parameters:
+        data_fetcher: data fetcher
+        coordinates: coordinates (x_min, y_min) of each tile of the batch
+        out: output array of shape (n, ...) the data of each tile is written into
+    """
+    if hasattr(data_fetcher, 'fetch_batch'):
+        batch = data_fetcher.fetch_batch(
+            coordinates=coordinates,
+        )
+
+        for slot, data in zip(out, batch):
+            slot[...] = data
+
+        return
+
+    use_out = supports_out(
+        data_fetcher=data_fetcher,
+    )
+
+    for slot, (x_min, y_min) in zip(out, coordinates):
+        if use_out:
+            data = data_fetcher(
+                x_min=x_min,
+                y_min=y_min,
+                out=slot,
+            )
+        else:
+            data = data_fetcher(
+                x_min=x_min,
+                y_min=y_min,
+            )
+
+        if data is not slot:
+            slot[...] = data
+
+
+def run_worker(
+    data_fetcher: DataFetcher,
+    coordinates: CoordinatesSet,
+    batch_size: int,
+    buffers: SharedArray,
+    task_queue: multiprocessing.Queue,
+    result_queue: multiprocessing.Queue,
+) -> None:
+    """Fetches the data of each batch that is assigned to the worker into its buffer.
+
+    Each task is a tuple of the index of the batch and the index of the buffer.
+    Each result is a tuple of the index of the batch, the index of the buffer and the exception
+    (None if the data of the batch was fetched successfully).
+    The worker exits if it receives None.
+
+    Parameters:
+        data_fetcher: data fetcher
+        coordinates: coordinates (x_min, y_min) of each tile
+        batch_size: batch size
+        buffers: buffers in shared memory of shape (num_buffers, batch_size, ...)
+        task_queue: queue of the tasks
+        result_queue: queue of the results
+    """
+    torch.set_num_threads(1)
+
+    while (task := task_queue.get()) is not None:
+        batch_index, buffer_index = task
+        batch_slice = get_batch_slice(
+            coordinates=coordinates,
+            batch_size=batch_size,
+            batch_index=batch_index,
+        )
+        batch_coordinates = coordinates[batch_slice]
+
+        try:
+            fetch_batch_into(
+                data_fetcher=data_fetcher,
+                coordinates=batch_coordinates,
+                out=buffers.array[buffer_index, :len(batch_coordinates)],
+            )
+        except Exception as exception:
+            result_queue.put((batch_index, buffer_index, exception))
+            continue
+
+        result_queue.put((batch_index, buffer_index, None))
+
+    buffers.close()
+
+
+def iter_batches(
+    data_fetcher: DataFetcher,
+    data_preprocessor: DataPreprocessor | None,
+    coordinates: CoordinatesSet,
+    batch_size: int,
+    num_workers: int,
+    num_buffers: int,
+) -> Iterator[tuple[npt.NDArray | torch.Tensor, npt.NDArray, npt.NDArray]]:
+    """Fetches the data of each batch into a ring of buffers in shared memory and preprocesses each batch.
+
+    The data of the first tile is fetched in the main process to determine the shape and the data type
+    of the buffers.
+    Each worker fetches the data of its batches straight into the assigned buffer, and the batches are yielded
+    in order as views of the buffers (i.e., without collation and without pickling the data).
+    A buffer is reused once the next batch is requested.
+
+    Parameters:
+        data_fetcher: data fetcher
+        data_preprocessor: data preprocessor (if None, the data is not preprocessed)
+        coordinates: coordinates (x_min, y_min) of each tile
+        batch_size: batch size
+        num_workers: number of workers (if 0, the data is fetched in the main process)
+        num_buffers: number of buffers
+
+    Yields:
+        data and coordinates (x_min, y_min) of each tile of the batch
+    """
+    if len(coordinates) == 0:
+        return
+
+    x_min, y_min = coordinates[0]
+    data = data_fetcher(
+        x_min=x_min,
+        y_min=y_min,
+    )
+    num_batches = compute_num_batches(
+        coordinates=coordinates,
+        batch_size=batch_size,
+    )
+
+    if num_workers == 0:
+        num_buffers = 1
+
+    num_buffers = min(num_buffers, num_batches)
+    buffers = SharedArray.empty(
+        shape=(num_buffers, batch_size, *data.shape),
+        dtype=data.dtype,
+    )
+
+    if num_workers == 0:
+        results = _iter_results_sync(
+            data_fetcher=data_fetcher,
+            coordinates=coordinates,
+            batch_size=batch_size,
+            buffers=buffers,
+            num_batches=num_batches,
+        )
+    else:
+        results = _iter_results(
+            data_fetcher=data_fetcher,
+            coordinates=coordinates,
+            batch_size=batch_size,
+            buffers=buffers,
+            num_workers=num_workers,
+            num_batches=num_batches,
+            num_buffers=num_buffers,
+        )
+
+    try:
+        for batch_index, buffer_index in results:
+            batch_slice = get_batch_slice(
+                coordinates=coordinates,
+                batch_size=batch_size,
+                batch_index=batch_index,
+            )
+            batch_coordinates = coordinates[batch_slice]
+            data = buffers.array[buffer_index, :len(batch_coordinates)]
+
+            if data_preprocessor is not None:
+                data = data_preprocessor(
+                    data=data,
+                )
+
+            yield data, batch_coordinates[:, 0], batch_coordinates[:, 1]
+    finally:
+        results.close()
+        buffers.close()
+
+
+def _iter_results_sync(
+    data_fetcher: DataFetcher,
+    coordinates: CoordinatesSet,
+    batch_size: int,
+    buffers: SharedArray,
+    num_batches: int,
+) -> Iterator[tuple[int, int]]:
+    """Fetches the data of each batch into the first buffer in the main process.
+
+    Parameters:
+        data_fetcher: data fetcher
+        coordinates: coordinates (x_min, y_min) of each tile
+        batch_size: batch size
+        buffers: buffers in shared memory of shape (num_buffers, batch_size, ...)
+        num_batches: number of batches
+
+    Yields:
+        index of the batch and index of the buffer
+    """
+    for batch_index in range(num_batches):
+        batch_slice = get_batch_slice(
+            coordinates=coordinates,
+            batch_size=batch_size,
+            batch_index=batch_index,
+        )
+        batch_coordinates = coordinates[batch_slice]
+        fetch_batch_into(
+            data_fetcher=data_fetcher,
+            coordinates=batch_coordinates,
+            out=buffers.array[0, :len(batch_coordinates)],
+        )
+        yield batch_index, 0
+
+
+def _iter_results(
+    data_fetcher: DataFetcher,
+    coordinates: CoordinatesSet,
+    batch_size: int,
+    buffers: SharedArray,
+    num_workers: int,
+    num_batches: int,
+    num_buffers: int,
+) -> Iterator[tuple[int, int]]:
+    """Starts the workers, assigns the batches to the buffers and yields the fetched batches in order.
+
+    The buffer of a yielded batch is assigned to the next batch once the next batch is requested.
+    The workers are stopped if the iterator is exhausted or closed.
+
+    Parameters:
+        data_fetcher: data fetcher
+        coordinates: coordinates (x_min, y_min) of each tile
+        batch_size: batch size
+        buffers: buffers in shared memory of shape (num_buffers, batch_size, ...)
+        num_workers: number of workers
+        num_batches: number of batches
+        num_buffers: number of buffers
+
+    Yields:
+        index of the batch and index of the buffer
+    """
+    context = multiprocessing.get_context()
+    task_queue = context.Queue()
+    result_queue = context.Queue()
+    processes = [
+        context.Process(
+            target=run_worker,
+            kwargs={
+                'data_fetcher': data_fetcher,
+                'coordinates': coordinates,
+                'batch_size': batch_size,
+                'buffers': buffers,
+                'task_queue': task_queue,
+                'result_queue': result_queue,
+            },
+            daemon=True,
+        )
+        for _ in range(num_workers)
+    ]
+
+    for process in processes:
+        process.start()
+
+    try:
+        for buffer_index in range(num_buffers):
+            task_queue.put((buffer_index, buffer_index))
+
+        next_batch_index = num_buffers
+        completed = {}
+
+        for batch_index in range(num_batches):
+            while batch_index not in completed:
+                completed_batch_index, buffer_index = _get_result(
+                    result_queue=result_queue,
+                    processes=processes,
+                )
+                completed[completed_batch_index] = buffer_index
+
+            buffer_index = completed.pop(batch_index)
+            yield batch_index, buffer_index
+
+            if next_batch_index < num_batches:
+                task_queue.put((next_batch_index, buffer_index))
+                next_batch_index += 1
+    finally:
+        for _ in processes:
+            task_queue.put(None)
+
+        for process in processes:
+            process.join(timeout=5)
+
+            if process.is_alive():
+                process.terminate()
+
+
+def _get_result(
+    result_queue: multiprocessing.Queue,
+    processes: list[multiprocessing.Process],
+) -> tuple[int, int]:
+    """Waits for the next fetched batch of any worker.
+
+    Parameters:
+        result_queue: queue of the results
+        processes: workers
+
+    Returns:
+        index of the batch and index of the buffer
+
+    Raises:
+        RuntimeError: A worker exited unexpectedly
+    """
+    while True:
+        try:
+            batch_index, buffer_index, exception = result_queue.get(timeout=1)
+        except queue.Empty:
+            if not all(process.is_alive() for process in processes):
+                message = 'A worker of the data loader exited unexpectedly.'
+                raise RuntimeError(message) from None
+
+            continue
+
+        if exception is not None:
+            raise exception
+
+        return batch_index, buffer_index
@@ -6,6 +6,9 @@ import numpy as np
 import numpy.typing as npt
 import torch
 
+# noinspection PyProtectedMember
+from aviary._utils.types import DataLayout
+
 if TYPE_CHECKING:
     from aviary.data.data_preprocessor import DataPreprocessor
 
@@ -28,10 +31,157 @@ def composite_preprocessor(
     return data
 
 
+def affine_preprocessor(
+    data: npt.NDArray,
+    scale: npt.NDArray[np.float32],
+    offset: npt.NDArray[np.float32],
+) -> npt.NDArray[np.float32]:
+    """Preprocesses the data by applying an affine transformation (per channel), i.e., `data * scale + offset`.
+
+    The data is preprocessed in a single output array (the transformation is applied in place
+    after the multiplication).
+    If the layout is `CHANNELS_LAST`, the data is contiguous and the scale and the offset have a value
+    for each channel, the scale and the offset are repeated along the flattened width and channel axes,
+    so that the transformation does not broadcast along the short channel axis.
+
+    Parameters:
+        data: data
+        scale: scale (per channel) that broadcasts along the channel axis of the data (see `fuse_affine_params`)
+        offset: offset (per channel) that broadcasts along the channel axis of the data
+            (see `fuse_affine_params`)
+
+    Returns:
+        preprocessed data
+    """
+    if (
+        data.ndim >= 2
+        and data.flags.c_contiguous
+        and scale.shape == (data.shape[-1],)
+        and offset.shape == (data.shape[-1],)
+    ):
+        width = data.shape[-2]
+        out = np.multiply(data.reshape(*data.shape[:-2], -1), np.tile(scale, width), dtype=np.float32)
+        out += np.tile(offset, width)
+        return out.reshape(data.shape)
+
+    out = np.multiply(data, scale, dtype=np.float32)
+    out += offset
+    return out
+
+
+def fuse_affine_params(
+    affine_params: list[tuple[list[float], list[float]]],
+    layout: DataLayout = DataLayout.CHANNELS_LAST,
+) -> tuple[npt.NDArray[np.float32], npt.NDArray[np.float32]]:
+    """Fuses consecutive affine transformations (per channel) into a single affine transformation.
+
+    The scale and the offset are composed in double precision and converted to single precision once.
+
+    Parameters:
+        affine_params: scale and offset (per channel) of each affine transformation (in the order
+            of application)
+        layout: layout of the data (`CHANNELS_FIRST` or `CHANNELS_LAST`)
+
+    Returns:
+        scale and offset (per channel) that broadcast along the channel axis of the data
+    """
+    scale = np.ones(1)
+    offset = np.zeros(1)
+
+    for scale_, offset_ in affine_params:
+        scale_ = np.array(scale_, dtype=np.float64)
+        offset_ = np.array(offset_, dtype=np.float64)
+        scale = scale * scale_
+        offset = offset * scale_ + offset_
+
+    scale = _to_channel_array(
+        values=scale,
+        layout=layout,
+    )
+    offset = _to_channel_array(
+        values=offset,
+        layout=layout,
+    )
+    return scale, offset
+
+
+def compute_lut(
+    data_preprocessors: list[DataPreprocessor],
+    num_channels: int,
+    dtype: npt.DTypeLike,
+    layout: DataLayout = DataLayout.CHANNELS_LAST,
+) -> npt.NDArray[np.float32]:
+    """Computes the lookup table of the data preprocessors by preprocessing each value of the data type
+    (per channel).
+
+    The data preprocessors must preprocess each value independently (e.g., `NormalizePreprocessor`
+    or `StandardizePreprocessor`), so that the lookup table is identical to preprocessing the data.
+
+    Parameters:
+        data_preprocessors: data preprocessors
+        num_channels: number of channels
+        dtype: data type of the data (`uint8` or `uint16`)
+        layout: layout of the data (`CHANNELS_FIRST` or `CHANNELS_LAST`)
+
+    Returns:
+        lookup table of shape (channels, values)
+    """
+    values = np.arange(np.iinfo(dtype).max + 1, dtype=dtype)
+    num_values = len(values)
+
+    if layout == DataLayout.CHANNELS_FIRST:
+        data = np.broadcast_to(values, (num_channels, 1, num_values))
+    else:
+        data = np.broadcast_to(values[:, np.newaxis], (1, num_values, num_channels))
+
+    lut = composite_preprocessor(
+        data=np.ascontiguousarray(data),
+        data_preprocessors=data_preprocessors,
+    )
+    lut = np.asarray(lut, dtype=np.float32)
+
+    if layout == DataLayout.CHANNELS_FIRST:
+        return lut.reshape(num_channels, num_values)
+
+    return np.ascontiguousarray(lut.reshape(num_values, num_channels).T)
+
+
+def lut_preprocessor(
+    data: npt.NDArray[np.uint8] | npt.NDArray[np.uint16],
+    lut: npt.NDArray[np.float32],
+    layout: DataLayout = DataLayout.CHANNELS_LAST,
+) -> npt.NDArray[np.float32]:
+    """Preprocesses the data by looking up the preprocessed value of each value of the data (per channel).
+
+    The values of each channel are gathered from the lookup table of the channel directly
+    into the output array (the data is not converted to an index array).
+
+    Parameters:
+        data: data
+        lut: lookup table of shape (channels, values) (see `compute_lut`)
+        layout: layout of the data (`CHANNELS_FIRST` or `CHANNELS_LAST`)
+
+    Returns:
+        preprocessed data
+    """
+    out = np.empty(data.shape, dtype=np.float32)
+
+    for channel, channel_lut in enumerate(lut):
+        if layout == DataLayout.CHANNELS_FIRST:
+            index = (..., channel, slice(None), slice(None))
+        else:
+            index = (..., channel)
+
+        np.take(channel_lut, data[index], out=out[index], mode='clip')
+
+    return out
+
+
 def normalize_preprocessor(
     data: npt.NDArray,
     min_values: list[float],
     max_values: list[float],
+    layout: DataLayout = DataLayout.CHANNELS_LAST,
 ) -> npt.NDArray[np.float32]:
     """Preprocesses the data by applying min-max normalization.
 
@@ -39,19 +189,29 @@ def normalize_preprocessor(
         data: data
         min_values: minimum values of the data (per channel)
         max_values: maximum values of the data (per channel)
+        layout: layout of the data (`CHANNELS_FIRST` or `CHANNELS_LAST`)
 
     Returns:
         preprocessed data
     """
-    min_values = np.array(min_values, dtype=np.float32)
-    max_values = np.array(max_values, dtype=np.float32)
-    return (data - min_values) / (max_values - min_values)
+    min_values = _to_channel_array(
+        values=min_values,
+        layout=layout,
+    )
+    max_values = _to_channel_array(
+        values=max_values,
+        layout=layout,
+    )
+    data = data - min_values
+    data /= max_values - min_values
+    return data
 
 
 def standardize_preprocessor(
     data: npt.NDArray,
     mean_values: list[float],
     std_values: list[float],
+    layout: DataLayout = DataLayout.CHANNELS_LAST,
 ) -> npt.NDArray[np.float32]:
     """Preprocesses the data by applying standardization.
 
@@ -59,24 +219,62 @@ def standardize_preprocessor(
         data: data
         mean_values: mean values of the data (per channel)
         std_values: standard deviation values of the data (per channel)
+        layout: layout of the data (`CHANNELS_FIRST` or `CHANNELS_LAST`)
 
     Returns:
         preprocessed data
     """
-    mean_values = np.array(mean_values, dtype=np.float32)
-    std_values = np.array(std_values, dtype=np.float32)
-    return (data - mean_values) / std_values
+    mean_values = _to_channel_array(
+        values=mean_values,
+        layout=layout,
+    )
+    std_values = _to_channel_array(
+        values=std_values,
+        layout=layout,
+    )
+    data = data - mean_values
+    data /= std_values
+    return data
+
+
+def _to_channel_array(
+    values: list[float] | npt.NDArray,
+    layout: DataLayout = DataLayout.CHANNELS_LAST,
+) -> npt.NDArray[np.float32]:
+    """Converts the values (per channel) to an array that broadcasts along the channel axis of the data.
+
+    Parameters:
+        values: values (per channel)
+        layout: layout of the data (`CHANNELS_FIRST` or `CHANNELS_LAST`)
+
+    Returns:
+        array of shape (channels, 1, 1) if the layout is `CHANNELS_FIRST` or (channels,) otherwise
+    """
+    values = np.array(values, dtype=np.float32)
+
+    if layout == DataLayout.CHANNELS_FIRST:
+        return values[:, np.newaxis, np.newaxis]
+
+    return values
 
 
 def to_tensor_preprocessor(
     data: npt.NDArray[np.float32],
+    layout: DataLayout = DataLayout.CHANNELS_LAST,
 ) -> torch.Tensor:
     """Converts the data to a tensor.
 
+    If the layout is `CHANNELS_FIRST`, the data is not permuted (i.e., the tensor is contiguous
+    if the data is contiguous).
+
     Parameters:
-        data: data
+        data: data of a tile or a batch of tiles
+        layout: layout of the data (`CHANNELS_FIRST` or `CHANNELS_LAST`)
 
     Returns:
-        tensor
+        tensor (channels-first)
     """
-    return torch.from_numpy(data).permute(2, 0, 1)
+    if layout == DataLayout.CHANNELS_FIRST:
+        return torch.from_numpy(data)
+
+    return torch.from_numpy(data).movedim(-1, -3)
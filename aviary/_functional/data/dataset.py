@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+import asyncio
+import threading
+from collections import deque
+from collections.abc import Iterator
 from typing import TYPE_CHECKING
 
+import numpy as np
 import numpy.typing as npt
 import torch
 
@@ -12,13 +17,16 @@ from aviary._utils.types import (
 )
 
 if TYPE_CHECKING:
-    from aviary.data.data_fetcher import DataFetcher
+    from aviary.data.data_fetcher import (
+        AsyncDataFetcher,
+        DataFetcher,
+    )
     from aviary.data.data_preprocessor import DataPreprocessor
 
 
 def get_item(
     data_fetcher: DataFetcher,
-    data_preprocessor: DataPreprocessor,
+    data_preprocessor: DataPreprocessor | None,
     coordinates: CoordinatesSet,
     index: int,
 ) -> tuple[npt.NDArray | torch.Tensor, Coordinate, Coordinate]:
@@ -26,7 +34,7 @@ def get_item(
 
     Parameters:
         data_fetcher: data fetcher
-        data_preprocessor: data preprocessor
+        data_preprocessor: data preprocessor (if None, the data is not preprocessed)
         coordinates: coordinates (x_min, y_min) of each tile
         index: index of the tile
 
@@ -38,12 +46,90 @@ def get_item(
         x_min=x_min,
         y_min=y_min,
     )
-    data = data_preprocessor(
-        data=data,
-    )
+
+    if data_preprocessor is not None:
+        data = data_preprocessor(
+            data=data,
+        )
+
     return data, x_min, y_min
 
 
+def get_items(
+    data_fetcher: DataFetcher,
+    data_preprocessor: DataPreprocessor | None,
+    coordinates: CoordinatesSet,
+    indices: list[int],
+) -> list[tuple[npt.NDArray | torch.Tensor, Coordinate, Coordinate]]:
+    """Fetches and preprocesses data given the indices of a batch of tiles.
+
+    If the data fetcher provides a `fetch_batch` method, the data of the batch is fetched at once.
+
+    Parameters:
+        data_fetcher: data fetcher
+        data_preprocessor: data preprocessor (if None, the data is not preprocessed)
+        coordinates: coordinates (x_min, y_min) of each tile
+        indices: indices of the tiles
+
+    Returns:
+        data and coordinates (x_min, y_min) of each tile
+    """
+    if not hasattr(data_fetcher, 'fetch_batch'):
+        return [
+            get_item(
+                data_fetcher=data_fetcher,
+                data_preprocessor=data_preprocessor,
+                coordinates=coordinates,
+                index=index,
+            )
+            for index in indices
+        ]
+
+    batch_coordinates = coordinates[indices]
+    batch = data_fetcher.fetch_batch(
+        coordinates=batch_coordinates,
+    )
+
+    if data_preprocessor is None:
+        return [
+            (data, x_min, y_min)
+            for data, (x_min, y_min) in zip(batch, batch_coordinates)
+        ]
+
+    return [
+        (
+            data_preprocessor(
+                data=data,
+            ),
+            x_min,
+            y_min,
+        )
+        for data, (x_min, y_min) in zip(batch, batch_coordinates)
+    ]
+
+
+def compute_transport_info(
+    data: npt.NDArray | torch.Tensor,
+) -> tuple[str, int]:
+    """Computes the data type and the size of the batch that is transferred from the workers
+    of the dataloader to the main process.
+
+    Parameters:
+        data: data of the collated batch
+
+    Returns:
+        data type and size of the batch in bytes
+    """
+    if isinstance(data, torch.Tensor):
+        dtype = str(data.dtype).removeprefix('torch.')
+        num_bytes = data.element_size() * data.nelement()
+    else:
+        dtype = data.dtype.name
+        num_bytes = data.nbytes
+
+    return dtype, num_bytes
+
+
 def get_length(
     coordinates: CoordinatesSet,
 ) -> int:
@@ -56,3 +142,91 @@ def get_length(
         number of tiles
     """
     return len(coordinates)
+
+
+def iter_items_async(
+    data_fetcher: AsyncDataFetcher,
+    data_preprocessor: DataPreprocessor | None,
+    coordinates: CoordinatesSet,
+    max_concurrency: int = 64,
+) -> Iterator[tuple[npt.NDArray | torch.Tensor, Coordinate, Coordinate]]:
+    """Fetches and preprocesses data of each tile with concurrent fetches on an event loop.
+
+    The event loop runs in a background thread and keeps up to `max_concurrency` fetches in flight,
+    while the data is preprocessed and yielded in the order of the coordinates.
+
+    Parameters:
+        data_fetcher: async data fetcher
+        data_preprocessor: data preprocessor (if None, the data is not preprocessed)
+        coordinates: coordinates (x_min, y_min) of each tile
+        max_concurrency: maximum number of fetches in flight
+
+    Yields:
+        data and coordinates (x_min, y_min) of each tile
+    """
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(
+        target=loop.run_forever,
+        daemon=True,
+    )
+    thread.start()
+    coordinates_iterator = iter(coordinates)
+    futures = deque()
+
+    def submit() -> None:
+        """Submits the fetch of the next tile."""
+        next_coordinates = next(coordinates_iterator, None)
+
+        if next_coordinates is None:
+            return
+
+        x_min, y_min = next_coordinates
+        future = asyncio.run_coroutine_threadsafe(
+            data_fetcher(
+                x_min=x_min,
+                y_min=y_min,
+            ),
+            loop,
+        )
+        futures.append((future, x_min, y_min))
+
+    try:
+        for _ in range(max_concurrency):
+            submit()
+
+        while futures:
+            future, x_min, y_min = futures.popleft()
+            data = future.result()
+            submit()
+
+            if data_preprocessor is not None:
+                data = data_preprocessor(
+                    data=data,
+                )
+
+            yield data, x_min, y_min
+    finally:
+        for future, _, _ in futures:
+            future.cancel()
+
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+def split_coordinates(
+    coordinates: CoordinatesSet,
+    worker_id: int,
+    num_workers: int,
+) -> CoordinatesSet:
+    """Splits the coordinates into contiguous chunks and returns the chunk of the worker.
+
+    Parameters:
+        coordinates: coordinates (x_min, y_min) of each tile
+        worker_id: id of the worker
+        num_workers: number of workers
+
+    Returns:
+        coordinates (x_min, y_min) of each tile of the worker
+    """
+    return np.array_split(coordinates, num_workers)[worker_id]
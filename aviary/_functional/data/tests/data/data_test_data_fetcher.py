@@ -1,4 +1,13 @@
 import numpy as np
+from rasterio.windows import Window
+
+# noinspection PyProtectedMember
+from aviary._utils.types import (
+    BoundingBox,
+    DataFetcherInfo,
+    DataLayout,
+    DType,
+)
 
 data_test__compute_tile_size_pixels = [
     # test case 1: buffer_size is 0
@@ -15,23 +24,61 @@ data = np.array(
     dtype=np.uint8,
 )
 
+data_test_compute_indexes = [
+    # test case 1: drop_channels is None
+    (3, None, None),
+    # test case 2: drop_channels contains one channel
+    (3, [0], [2, 3]),
+    # test case 3: drop_channels contains multiple channels
+    (4, [0, 2], [2, 4]),
+    # test case 4: drop_channels contains negative indices
+    (3, [-1], [1, 2]),
+]
+
+data_test_compute_overview_level = [
+    # test case 1: no overviews
+    ((), 1., .2, None),
+    # test case 2: ground sampling distance equals the ground sampling distance of an overview level
+    ((2, 4, 8), .8, .2, 1),
+    # test case 3: ground sampling distance is between the ground sampling distances of two overview levels
+    ((2, 4, 8), 1., .2, 1),
+    # test case 4: ground sampling distance is finer than the ground sampling distance of each overview level
+    ((2, 4, 8), .3, .2, None),
+    # test case 5: ground sampling distance is coarser than the ground sampling distance of each overview level
+    ((2, 4, 8), 10., .2, 2),
+]
+
+data_test_compute_upcoming_indices = [
+    # test case 1: num_workers is 1
+    (2, 8, 3, 2, 1, [3, 4, 5]),
+    # test case 2: num_workers is not 1
+    (2, 16, 3, 2, 2, [3, 6, 7]),
+    # test case 3: upcoming indices exceed the number of tiles
+    (6, 8, 3, 2, 1, [7]),
+    # test case 4: prefetch_depth is 0
+    (2, 8, 0, 2, 1, []),
+]
+
 data_test__drop_channels = [
     # test case 1: drop_channels is None
     (
         data,
         None,
+        DataLayout.CHANNELS_LAST,
         data,
     ),
     # test case 2: drop_channels is empty
     (
         data,
         [],
+        DataLayout.CHANNELS_LAST,
         data,
     ),
     # test case 3: drop_channels is not empty
     (
         data,
         [0, 2],
+        DataLayout.CHANNELS_LAST,
         np.array(
             [
                 [[127], [0]],
@@ -44,6 +91,7 @@ data_test__drop_channels = [
     (
         data,
         [0, -1],
+        DataLayout.CHANNELS_LAST,
         np.array(
             [
                 [[127], [0]],
@@ -52,6 +100,18 @@ data_test__drop_channels = [
             dtype=np.uint8,
         ),
     ),
+    # test case 5: layout is CHANNELS_FIRST
+    (
+        np.ascontiguousarray(data.transpose(2, 0, 1)),
+        [0, 2],
+        DataLayout.CHANNELS_FIRST,
+        np.array(
+            [
+                [[127, 0], [255, 127]],
+            ],
+            dtype=np.uint8,
+        ),
+    ),
 ]
 
 data_test__permute_data = [
@@ -64,3 +124,218 @@ data_test__permute_data = [
         data,
     ),
 ]
+
+data_test__group_coordinates = [
+    # test case 1: coordinates are adjacent
+    (
+        np.array([[-128, -128], [0, -128], [-128, 0], [0, 0]], dtype=np.int32),
+        128,
+        [[0, 1, 2, 3]],
+    ),
+    # test case 2: coordinates are not adjacent
+    (
+        np.array([[-128, -128], [128, -128], [-128, 128]], dtype=np.int32),
+        128,
+        [[0], [1], [2]],
+    ),
+    # test case 3: coordinates are adjacent only diagonally
+    (
+        np.array([[-128, -128], [0, 0]], dtype=np.int32),
+        128,
+        [[0], [1]],
+    ),
+    # test case 4: coordinates form multiple groups
+    (
+        np.array([[-128, -128], [256, 0], [0, -128], [256, 128]], dtype=np.int32),
+        128,
+        [[0, 2], [1, 3]],
+    ),
+    # test case 5: coordinates contain duplicates
+    (
+        np.array([[-128, -128], [-128, -128]], dtype=np.int32),
+        128,
+        [[0], [1]],
+    ),
+    # test case 6: coordinates form an L-shaped group
+    (
+        np.array([[0, 0], [128, 0], [0, -128]], dtype=np.int32),
+        128,
+        [[0, 1], [2]],
+    ),
+    # test case 7: coordinates form a staircase
+    (
+        np.array([[0, 0], [128, 0], [128, -128], [256, -128]], dtype=np.int32),
+        128,
+        [[0, 1], [2, 3]],
+    ),
+    # test case 8: coordinates form a rectangle and a single tile below it
+    (
+        np.array([[0, -256], [0, 0], [128, 0], [0, -128], [128, -128]], dtype=np.int32),
+        128,
+        [[0], [1, 2, 3, 4]],
+    ),
+]
+
+data_test__is_cacheable = [
+    # test case 1: coordinates, tile size and buffer size are multiples of the ground sampling distance
+    (-128, -128, 128, .2, 32, True),
+    # test case 2: coordinates are not multiples of the ground sampling distance
+    (-128.1, -128, 128, .2, 32, False),
+    # test case 3: tile size is not a multiple of the ground sampling distance
+    (-128, -128, 128.1, .2, 32, False),
+    # test case 4: buffer size is not a multiple of the ground sampling distance
+    (-128, -128, 128, .2, 32.1, False),
+]
+
+data_test__to_pixel_index = [
+    # test case 1: value is an integer
+    (64., 256, 64),
+    # test case 2: value is less than the center of the pixel
+    (64.4, 256, 64),
+    # test case 3: value is greater than the center of the pixel
+    (64.6, 256, 65),
+    # test case 4: value is negative
+    (-64., 256, 0),
+    # test case 5: value exceeds max_value
+    (512., 256, 256),
+]
+
+data_test__is_multiple = [
+    # test case 1: value is a multiple of base
+    (128, .2, True),
+    # test case 2: value is not a multiple of base
+    (128, .3, False),
+    # test case 3: value is 0
+    (0, .2, True),
+]
+
+data_test__to_pixel_window = [
+    # test case 1: window is pixel-aligned
+    (Window(col_off=64, row_off=128, width=256, height=256), 256, 256, False,
+     Window(col_off=64, row_off=128, width=256, height=256)),
+    # test case 2: window is not pixel-aligned
+    (Window(col_off=64.5, row_off=128, width=256, height=256), 256, 256, False, None),
+    # test case 3: window is not pixel-aligned and snap_to_grid is True
+    (Window(col_off=64.4, row_off=127.6, width=256, height=256), 256, 256, True,
+     Window(col_off=64, row_off=128, width=256, height=256)),
+    # test case 4: lengths of the window differ from the height and the width of the data
+    (Window(col_off=64, row_off=128, width=512, height=512), 256, 256, False, None),
+]
+
+data_test_stacked_data_fetcher_info = [
+    # test case 1: one data fetcher
+    (
+        [
+            DataFetcherInfo(
+                bounding_box=BoundingBox(x_min=-128, y_min=-128, x_max=128, y_max=128),
+                dtype=[DType.UINT8, DType.UINT8, DType.UINT8],
+                epsg_code=25832,
+                ground_sampling_distance=.2,
+                num_channels=3,
+            ),
+        ],
+        DataFetcherInfo(
+            bounding_box=BoundingBox(x_min=-128, y_min=-128, x_max=128, y_max=128),
+            dtype=[DType.UINT8, DType.UINT8, DType.UINT8],
+            epsg_code=25832,
+            ground_sampling_distance=.2,
+            num_channels=3,
+        ),
+    ),
+    # test case 2: multiple data fetchers
+    (
+        [
+            DataFetcherInfo(
+                bounding_box=BoundingBox(x_min=-128, y_min=-128, x_max=128, y_max=128),
+                dtype=[DType.UINT8, DType.UINT8, DType.UINT8],
+                epsg_code=25832,
+                ground_sampling_distance=.2,
+                num_channels=3,
+            ),
+            DataFetcherInfo(
+                bounding_box=BoundingBox(x_min=-64, y_min=-256, x_max=256, y_max=64),
+                dtype=[DType.FLOAT32],
+                epsg_code=25832,
+                ground_sampling_distance=.5,
+                num_channels=1,
+            ),
+        ],
+        DataFetcherInfo(
+            bounding_box=BoundingBox(x_min=-64, y_min=-128, x_max=128, y_max=64),
+            dtype=[DType.UINT8, DType.UINT8, DType.UINT8, DType.FLOAT32],
+            epsg_code=25832,
+            ground_sampling_distance=.2,
+            num_channels=4,
+        ),
+    ),
+    # test case 3: data fetchers drop channels
+    (
+        [
+            DataFetcherInfo(
+                bounding_box=BoundingBox(x_min=-128, y_min=-128, x_max=128, y_max=128),
+                dtype=[DType.UINT8, DType.UINT8, DType.UINT8, DType.UINT8],
+                epsg_code=25832,
+                ground_sampling_distance=.2,
+                num_channels=4,
+                overview_factors=(2, 4),
+                overview_level=0,
+                indexes=[1, 2, 3],
+            ),
+            DataFetcherInfo(
+                bounding_box=BoundingBox(x_min=-128, y_min=-128, x_max=128, y_max=128),
+                dtype=[DType.UINT8, DType.FLOAT32],
+                epsg_code=25832,
+                ground_sampling_distance=.2,
+                num_channels=2,
+                indexes=[2],
+            ),
+        ],
+        DataFetcherInfo(
+            bounding_box=BoundingBox(x_min=-128, y_min=-128, x_max=128, y_max=128),
+            dtype=[DType.UINT8, DType.UINT8, DType.UINT8, DType.FLOAT32],
+            epsg_code=25832,
+            ground_sampling_distance=.2,
+            num_channels=4,
+        ),
+    ),
+]
+
+data_test_compute_channels = [
+    # test case 1: drop_channels is None
+    (4, None, None),
+    # test case 2: channels are consecutive
+    (4, [0], slice(1, 4)),
+    # test case 3: channels are consecutive (negative indexing)
+    (4, [-1, -2], slice(0, 2)),
+    # test case 4: channels are not consecutive
+    (4, [1], [0, 2, 3]),
+]
+
+data_test_memmap_data_fetcher = [
+    # test case 1: tile is within the memory-mapped array
+    (0, 0, 0, None, DataLayout.CHANNELS_FIRST, True, np.array([[[14, 15], [20, 21]], [[50, 51], [56, 57]]])),
+    # test case 2: tile and buffer are within the memory-mapped array
+    (0, 0, 1, None, DataLayout.CHANNELS_FIRST, True,
+     np.array([
+         [[7, 8, 9, 10], [13, 14, 15, 16], [19, 20, 21, 22], [25, 26, 27, 28]],
+         [[43, 44, 45, 46], [49, 50, 51, 52], [55, 56, 57, 58], [61, 62, 63, 64]],
+     ])),
+    # test case 3: tile exceeds the memory-mapped array
+    (3, 3, 0, None, DataLayout.CHANNELS_FIRST, False, np.array([[[0, 0], [5, 0]], [[0, 0], [41, 0]]])),
+    # test case 4: channels are specified
+    (0, 0, 0, slice(1, 2), DataLayout.CHANNELS_FIRST, True, np.array([[[50, 51], [56, 57]]])),
+    # test case 5: channels are not consecutive
+    (0, 0, 0, [1, 0], DataLayout.CHANNELS_FIRST, False, np.array([[[50, 51], [56, 57]], [[14, 15], [20, 21]]])),
+    # test case 6: layout is channels-last
+    (0, 0, 0, None, DataLayout.CHANNELS_LAST, True, np.array([[[14, 50], [15, 51]], [[20, 56], [21, 57]]])),
+    # test case 7: tile is left of the memory-mapped array
+    (-6, 0, 0, None, DataLayout.CHANNELS_FIRST, False, np.zeros(shape=(2, 2, 2), dtype=np.int64)),
+    # test case 8: tile is above the memory-mapped array
+    (0, 6, 0, None, DataLayout.CHANNELS_FIRST, False, np.zeros(shape=(2, 2, 2), dtype=np.int64)),
+    # test case 9: tile is right of the memory-mapped array
+    (6, 0, 0, None, DataLayout.CHANNELS_FIRST, False, np.zeros(shape=(2, 2, 2), dtype=np.int64)),
+    # test case 10: tile is below the memory-mapped array
+    (0, -6, 0, None, DataLayout.CHANNELS_FIRST, False, np.zeros(shape=(2, 2, 2), dtype=np.int64)),
+    # test case 11: tile is left of and above the memory-mapped array
+    (-6, 6, 0, None, DataLayout.CHANNELS_FIRST, False, np.zeros(shape=(2, 2, 2), dtype=np.int64)),
+]
@@ -0,0 +1,39 @@
+import numpy as np
+
+data_test_compute_num_batches = [
+    # test case 1: number of coordinates is a multiple of batch_size
+    (
+        np.array([[-128, -128], [0, -128], [-128, 0], [0, 0]], dtype=np.int32),
+        2,
+        2,
+    ),
+    # test case 2: number of coordinates is not a multiple of batch_size
+    (
+        np.array([[-128, -128], [0, -128], [-128, 0], [0, 0]], dtype=np.int32),
+        3,
+        2,
+    ),
+    # test case 3: batch_size exceeds the number of coordinates
+    (
+        np.array([[-128, -128], [0, -128], [-128, 0], [0, 0]], dtype=np.int32),
+        8,
+        1,
+    ),
+]
+
+data_test_get_batch_slice = [
+    # test case 1: batch is not the last batch
+    (
+        np.array([[-128, -128], [0, -128], [-128, 0], [0, 0]], dtype=np.int32),
+        3,
+        0,
+        slice(0, 3),
+    ),
+    # test case 2: batch is the last batch and smaller than batch_size
+    (
+        np.array([[-128, -128], [0, -128], [-128, 0], [0, 0]], dtype=np.int32),
+        3,
+        1,
+        slice(3, 4),
+    ),
+]
@@ -1,6 +1,9 @@
 import numpy as np
 import torch
 
+# noinspection PyProtectedMember
+from aviary._utils.types import DataLayout
+
 data = np.array(
     [
         [[0, 127, 255], [255, 0, 127]],
@@ -9,11 +12,122 @@ data = np.array(
     dtype=np.uint8,
 )
 
+data_test_affine_preprocessor = [
+    (
+        data,
+        np.array([1 / 255] * 3, dtype=np.float32),
+        np.array([0.] * 3, dtype=np.float32),
+        np.array(
+            [
+                [[0, .49803922, 1], [1, 0, .49803922]],
+                [[.49803922, 1, 0], [0, .49803922, 1]],
+            ],
+            dtype=np.float32,
+        ),
+    ),
+    (
+        np.ascontiguousarray(data.transpose(2, 0, 1)),
+        np.array([1., 2., 4.], dtype=np.float32)[:, np.newaxis, np.newaxis],
+        np.array([0., -1., -2.], dtype=np.float32)[:, np.newaxis, np.newaxis],
+        np.array(
+            [
+                [[0, 255], [127, 0]],
+                [[253, -1], [509, 253]],
+                [[1018, 506], [-2, 1018]],
+            ],
+            dtype=np.float32,
+        ),
+    ),
+    (
+        data,
+        np.array([1 / 255], dtype=np.float32),
+        np.array([0.], dtype=np.float32),
+        np.array(
+            [
+                [[0, .49803922, 1], [1, 0, .49803922]],
+                [[.49803922, 1, 0], [0, .49803922, 1]],
+            ],
+            dtype=np.float32,
+        ),
+    ),
+    (
+        data,
+        np.array([1.], dtype=np.float32),
+        np.array([0., -1., -2.], dtype=np.float32),
+        np.array(
+            [
+                [[0, 126, 253], [255, -1, 125]],
+                [[127, 254, -2], [0, 126, 253]],
+            ],
+            dtype=np.float32,
+        ),
+    ),
+]
+
+data_test_fuse_affine_params = [
+    # test case 1: no affine transformations
+    (
+        [],
+        DataLayout.CHANNELS_LAST,
+        np.array([1.], dtype=np.float32),
+        np.array([0.], dtype=np.float32),
+    ),
+    # test case 2: one affine transformation
+    (
+        [([.5, .25], [1., 2.])],
+        DataLayout.CHANNELS_LAST,
+        np.array([.5, .25], dtype=np.float32),
+        np.array([1., 2.], dtype=np.float32),
+    ),
+    # test case 3: two affine transformations
+    (
+        [([.5, .25], [1., 2.]), ([2., 4.], [-1., -2.])],
+        DataLayout.CHANNELS_LAST,
+        np.array([1., 1.], dtype=np.float32),
+        np.array([1., 6.], dtype=np.float32),
+    ),
+    # test case 4: two affine transformations (channels-first)
+    (
+        [([.5, .25], [1., 2.]), ([2., 4.], [-1., -2.])],
+        DataLayout.CHANNELS_FIRST,
+        np.array([[[1.]], [[1.]]], dtype=np.float32),
+        np.array([[[1.]], [[6.]]], dtype=np.float32),
+    ),
+]
+
 data_test_normalize_preprocessor = [
     (
         data,
         [0.] * 3,
         [255.] * 3,
+        DataLayout.CHANNELS_LAST,
+        np.array(
+            [
+                [[0, .49803922, 1], [1, 0, .49803922]],
+                [[.49803922, 1, 0], [0, .49803922, 1]],
+            ],
+            dtype=np.float32,
+        ),
+    ),
+    (
+        np.ascontiguousarray(data.transpose(2, 0, 1)),
+        [0.] * 3,
+        [255.] * 3,
+        DataLayout.CHANNELS_FIRST,
+        np.array(
+            [
+                [[0, 1], [.49803922, 0]],
+                [[.49803922, 0], [1, .49803922]],
+                [[1, .49803922], [0, 1]],
+            ],
+            dtype=np.float32,
+        ),
+    ),
+    (
+        data.astype(np.uint16) * 257,
+        [0.] * 3,
+        [65535.] * 3,
+        DataLayout.CHANNELS_LAST,
         np.array(
             [
                 [[0, .49803922, 1], [1, 0, .49803922]],
@@ -22,6 +136,25 @@ data_test_normalize_preprocessor = [
             dtype=np.float32,
         ),
     ),
+    (
+        np.stack([data, data[::-1]]),
+        [0.] * 3,
+        [255.] * 3,
+        DataLayout.CHANNELS_LAST,
+        np.array(
+            [
+                [
+                    [[0, .49803922, 1], [1, 0, .49803922]],
+                    [[.49803922, 1, 0], [0, .49803922, 1]],
+                ],
+                [
+                    [[.49803922, 1, 0], [0, .49803922, 1]],
+                    [[0, .49803922, 1], [1, 0, .49803922]],
+                ],
+            ],
+            dtype=np.float32,
+        ),
+    ),
 ]
 
 data_test_standardize_preprocessor = [
@@ -29,6 +162,47 @@ data_test_standardize_preprocessor = [
         data,
         [127.] * 3,
         [127.] * 3,
+        DataLayout.CHANNELS_LAST,
+        np.array(
+            [
+                [[-1, 0, 1.007874], [1.007874, -1, 0]],
+                [[0, 1.007874, -1], [-1, 0, 1.007874]],
+            ],
+            dtype=np.float32,
+        ),
+    ),
+    (
+        np.ascontiguousarray(data.transpose(2, 0, 1)),
+        [0., 127., 255.],
+        [1.] * 3,
+        DataLayout.CHANNELS_FIRST,
+        np.array(
+            [
+                [[0, 255], [127, 0]],
+                [[0, -127], [128, 0]],
+                [[0, -128], [-255, 0]],
+            ],
+            dtype=np.float32,
+        ),
+    ),
+    (
+        data.astype(np.int16) - 127,
+        [0.] * 3,
+        [127.] * 3,
+        DataLayout.CHANNELS_LAST,
+        np.array(
+            [
+                [[-1, 0, 1.007874], [1.007874, -1, 0]],
+                [[0, 1.007874, -1], [-1, 0, 1.007874]],
+            ],
+            dtype=np.float32,
+        ),
+    ),
+    (
+        data.astype(np.float16),
+        [127.] * 3,
+        [127.] * 3,
+        DataLayout.CHANNELS_LAST,
         np.array(
             [
                 [[-1, 0, 1.007874], [1.007874, -1, 0]],
@@ -42,6 +216,7 @@ data_test_standardize_preprocessor = [
 data_test_to_tensor_preprocessor = [
     (
         data.astype(np.float32),
+        DataLayout.CHANNELS_LAST,
         torch.tensor(
             [
                 [[0, 255], [127, 0]],
@@ -51,4 +226,35 @@ data_test_to_tensor_preprocessor = [
             dtype=torch.float32,
         ),
     ),
+    (
+        np.ascontiguousarray(data.transpose(2, 0, 1)).astype(np.float32),
+        DataLayout.CHANNELS_FIRST,
+        torch.tensor(
+            [
+                [[0, 255], [127, 0]],
+                [[127, 0], [255, 127]],
+                [[255, 127], [0, 255]],
+            ],
+            dtype=torch.float32,
+        ),
+    ),
+    (
+        np.stack([data, data[::-1]]).astype(np.float32),
+        DataLayout.CHANNELS_LAST,
+        torch.tensor(
+            [
+                [
+                    [[0, 255], [127, 0]],
+                    [[127, 0], [255, 127]],
+                    [[255, 127], [0, 255]],
+                ],
+                [
+                    [[127, 0], [0, 255]],
+                    [[255, 127], [127, 0]],
+                    [[0, 255], [255, 127]],
+                ],
+            ],
+            dtype=torch.float32,
+        ),
+    ),
 ]
@@ -6,3 +6,34 @@ data_test_get_length = [
         4,
     ),
 ]
+
+data_test_split_coordinates = [
+    # test case 1: num_workers is 1
+    (
+        np.array([[-128, -128], [0, -128], [-128, 0], [0, 0]], dtype=np.int32),
+        0,
+        1,
+        np.array([[-128, -128], [0, -128], [-128, 0], [0, 0]], dtype=np.int32),
+    ),
+    # test case 2: num_workers is not 1
+    (
+        np.array([[-128, -128], [0, -128], [-128, 0], [0, 0]], dtype=np.int32),
+        1,
+        2,
+        np.array([[-128, 0], [0, 0]], dtype=np.int32),
+    ),
+    # test case 3: number of coordinates is not a multiple of num_workers
+    (
+        np.array([[-128, -128], [0, -128], [-128, 0]], dtype=np.int32),
+        1,
+        2,
+        np.array([[-128, 0]], dtype=np.int32),
+    ),
+    # test case 4: num_workers exceeds the number of coordinates
+    (
+        np.array([[-128, -128]], dtype=np.int32),
+        1,
+        2,
+        np.empty(shape=(0, 2), dtype=np.int32),
+    ),
+]
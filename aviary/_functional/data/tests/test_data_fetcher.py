@@ -1,29 +1,105 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import warnings
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
+from urllib.parse import parse_qs, urlparse
 from unittest.mock import MagicMock, patch
 
+import geopandas as gpd
 import numpy as np
 import numpy.typing as npt
 import pytest
+import rasterio as rio
+from rasterio.transform import Affine, from_origin
+from rasterio.windows import Window
+from shapely import STRtree
+from shapely.geometry import box
 
 from aviary._functional.data.data_fetcher import (
     _compute_tile_size_pixels,
     _drop_channels,
+    _get_src,
+    _get_warped_src,
+    _group_coordinates,
+    _is_cacheable,
+    _is_multiple,
     _permute_data,
+    _read,
+    _to_pixel_index,
+    _to_pixel_window,
+    array_data_fetcher,
+    array_data_fetcher_info,
+    build_footprint_index,
+    build_memmap,
+    close_sessions,
+    close_srcs,
+    compute_cache_key,
+    compute_channels,
+    compute_footprint_index_key,
+    compute_indexes,
+    compute_mem_path,
+    compute_mtime,
+    compute_overview_level,
+    compute_upcoming_indices,
+    compute_warped_transform,
+    compute_wms_params,
+    evict_cached_data,
+    get_default_cache_path,
+    indexed_geotiff_data_fetcher,
+    indexed_geotiff_data_fetcher_info,
+    load_footprint_index,
+    load_memmap,
+    memmap_data_fetcher,
+    read_cached_data,
+    read_cached_info,
+    stacked_data_fetcher,
+    stacked_data_fetcher_info,
+    vrt_batch_data_fetcher,
+    vrt_data_fetcher,
     vrt_data_fetcher_info,
+    warped_vrt_data_fetcher,
+    warped_vrt_data_fetcher_info,
+    wms_data_fetcher,
+    write_cached_data,
+    write_cached_info,
 )
 from aviary._functional.data.tests.data.data_test_data_fetcher import (
+    data_test_compute_channels,
+    data_test_compute_indexes,
+    data_test_compute_overview_level,
+    data_test_compute_upcoming_indices,
     data_test__compute_tile_size_pixels,
     data_test__drop_channels,
+    data_test__group_coordinates,
+    data_test__is_cacheable,
+    data_test__is_multiple,
     data_test__permute_data,
+    data_test__to_pixel_index,
+    data_test__to_pixel_window,
+    data_test_memmap_data_fetcher,
+    data_test_stacked_data_fetcher_info,
 )
 
+# noinspection PyProtectedMember
+from aviary._utils.exceptions import AviaryUserError
+
+# noinspection PyProtectedMember
+from aviary._utils.response_cache import ResponseCache
+
 # noinspection PyProtectedMember
 from aviary._utils.types import (
     BoundingBox,
     BufferSize,
+    Coordinate,
+    CoordinatesSet,
     DataFetcherInfo,
+    DataLayout,
     DType,
     GroundSamplingDistance,
+    InterpolationMode,
     TileSize,
 )
 
@@ -33,6 +109,265 @@ def test_vrt_data_fetcher() -> None:
     pass
 
 
+@pytest.fixture
+def vrt_path(
+    tmp_path: Path,
+) -> Path:
+    data = np.random.default_rng(0).integers(0, 256, size=(3, 64, 64), dtype=np.uint8)
+
+    with rio.open(
+        tmp_path / 'test.tif',
+        mode='w',
+        driver='GTiff',
+        width=64,
+        height=64,
+        count=3,
+        dtype='uint8',
+        crs='EPSG:25832',
+        transform=from_origin(0, 64, 1., 1.),
+    ) as dst:
+        dst.write(data)
+
+    bands = ''.join(
+        f'''
+  <VRTRasterBand dataType="Byte" band="{band}">
+    <SimpleSource>
+      <SourceFilename relativeToVRT="1">test.tif</SourceFilename>
+      <SourceBand>{band}</SourceBand>
+      <SrcRect xOff="0" yOff="0" xSize="64" ySize="64" />
+      <DstRect xOff="0" yOff="0" xSize="64" ySize="64" />
+    </SimpleSource>
+  </VRTRasterBand>'''
+        for band in range(1, 4)
+    )
+    path = tmp_path / 'test.vrt'
+    path.write_text(
+        f'''<VRTDataset rasterXSize="64" rasterYSize="64">
+  <SRS>EPSG:25832</SRS>
+  <GeoTransform>0, 1, 0, 64, 0, -1</GeoTransform>{bands}
+</VRTDataset>''',
+    )
+    return path
+
+
+@pytest.mark.parametrize('native_resolution', [False, True])
+@pytest.mark.parametrize('layout', [DataLayout.CHANNELS_FIRST, DataLayout.CHANNELS_LAST])
+def test_vrt_batch_data_fetcher(
+    vrt_path: Path,
+    native_resolution: bool,
+    layout: DataLayout,
+) -> None:
+    coordinates = np.array(
+        [
+            [0, 0],
+            [8, 0],
+            [0, 8],
+            [32, 32],
+            [-4, 60],
+            [56, 56],
+            [64, 56],
+        ],
+        dtype=np.int32,
+    )
+    kwargs = {
+        'path': vrt_path,
+        'tile_size': 8,
+        'ground_sampling_distance': 1.,
+        'interpolation_mode': InterpolationMode.NEAREST,
+        'buffer_size': 2,
+        'drop_channels': [1],
+        'native_resolution': native_resolution,
+        'layout': layout,
+    }
+    batch = vrt_batch_data_fetcher(
+        coordinates=coordinates,
+        **kwargs,
+    )
+
+    assert len(batch) == len(coordinates)
+
+    for data, (x_min, y_min) in zip(batch, coordinates):
+        expected = vrt_data_fetcher(
+            x_min=x_min,
+            y_min=y_min,
+            **kwargs,
+        )
+
+        assert data.shape == expected.shape
+        np.testing.assert_array_equal(data, expected)
+
+    close_srcs(
+        path=vrt_path,
+    )
+
+
+def test_vrt_batch_data_fetcher_non_rectangular_group(
+    vrt_path: Path,
+) -> None:
+    coordinates = np.array(
+        [
+            [0, 0],
+            [8, 0],
+            [16, 0],
+            [0, 8],
+            [0, 16],
+        ],
+        dtype=np.int32,
+    )
+    kwargs = {
+        'path': vrt_path,
+        'tile_size': 8,
+        'ground_sampling_distance': 1.,
+        'interpolation_mode': InterpolationMode.NEAREST,
+    }
+
+    with patch('aviary._functional.data.data_fetcher._read', wraps=_read) as mocked_read:
+        batch = vrt_batch_data_fetcher(
+            coordinates=coordinates,
+            **kwargs,
+        )
+
+    num_pixels = sum(
+        call.kwargs['height_pixels'] * call.kwargs['width_pixels']
+        for call in mocked_read.call_args_list
+    )
+
+    assert mocked_read.call_count == 2
+    assert num_pixels == len(coordinates) * 8 * 8
+
+    for data, (x_min, y_min) in zip(batch, coordinates):
+        expected = vrt_data_fetcher(
+            x_min=x_min,
+            y_min=y_min,
+            **kwargs,
+        )
+
+        np.testing.assert_array_equal(data, expected)
+
+    close_srcs(
+        path=vrt_path,
+    )
+
+
+@pytest.mark.parametrize('coordinates, tile_size, expected', data_test__group_coordinates)
+def test__group_coordinates(
+    coordinates: CoordinatesSet,
+    tile_size: TileSize,
+    expected: list[list[int]],
+) -> None:
+    groups = _group_coordinates(
+        coordinates=coordinates,
+        tile_size=tile_size,
+    )
+
+    assert groups == expected
+
+
+@pytest.mark.parametrize(
+    'x_min, y_min, tile_size, ground_sampling_distance, buffer_size, expected',
+    data_test__is_cacheable,
+)
+def test__is_cacheable(
+    x_min: Coordinate,
+    y_min: Coordinate,
+    tile_size: TileSize,
+    ground_sampling_distance: GroundSamplingDistance,
+    buffer_size: BufferSize,
+    expected: bool,
+) -> None:
+    is_cacheable = _is_cacheable(
+        x_min=x_min,
+        y_min=y_min,
+        tile_size=tile_size,
+        ground_sampling_distance=ground_sampling_distance,
+        buffer_size=buffer_size,
+    )
+
+    assert is_cacheable == expected
+
+
+@pytest.mark.parametrize('value, base, expected', data_test__is_multiple)
+def test__is_multiple(
+    value: float,
+    base: float,
+    expected: bool,
+) -> None:
+    is_multiple = _is_multiple(
+        value=value,
+        base=base,
+    )
+
+    assert is_multiple == expected
+
+
+@patch('aviary._functional.data.data_fetcher.rio.open')
+def test__get_src(
+    mocked_rio_open,
+) -> None:
+    path = Path('test/test_get_src.vrt')
+    mocked_rio_open.side_effect = lambda *_, **__: MagicMock(closed=False)
+    src = _get_src(
+        path=path,
+    )
+    src_ = _get_src(
+        path=path,
+    )
+
+    assert src is src_
+    mocked_rio_open.assert_called_once_with(path)
+
+    srcs = []
+    thread = threading.Thread(target=lambda: srcs.append(_get_src(path=path)))
+    thread.start()
+    thread.join()
+
+    assert srcs[0] is not src
+    assert mocked_rio_open.call_count == 2
+
+    close_srcs(
+        path=path,
+    )
+
+    src.close.assert_called_once_with()
+    srcs[0].close.assert_called_once_with()
+
+    src_ = _get_src(
+        path=path,
+    )
+
+    assert src_ is not src
+    assert mocked_rio_open.call_count == 3
+
+    src_ = _get_src(
+        path=path,
+        overview_level=0,
+    )
+
+    assert src_ is not src
+    mocked_rio_open.assert_called_with(path, overview_level=0)
+
+    close_srcs(
+        path=path,
+    )
+
+    with patch('aviary._functional.data.data_fetcher._MAX_NUM_SRCS', 1):
+        src = _get_src(
+            path=path,
+        )
+        src_ = _get_src(
+            path=Path('test/test_get_src_.tif'),
+        )
+
+    src.close.assert_called_once_with()
+    src_.close.assert_not_called()
+
+    close_srcs(
+        path={path, Path('test/test_get_src_.tif')},
+    )
+
+    src_.close.assert_called_once_with()
+
+
 @pytest.mark.parametrize(
     'tile_size, buffer_size, ground_sampling_distance, expected',
     data_test__compute_tile_size_pixels,
@@ -52,15 +387,17 @@ def test__compute_tile_size_pixels(
     assert tile_size_pixels == expected
 
 
-@pytest.mark.parametrize('data, drop_channels, expected', data_test__drop_channels)
+@pytest.mark.parametrize('data, drop_channels, layout, expected', data_test__drop_channels)
 def test__drop_channels(
     data: npt.NDArray,
     drop_channels: list[int] | None,
+    layout: DataLayout,
     expected: npt.NDArray,
 ) -> None:
     data = _drop_channels(
         data=data,
         drop_channels=drop_channels,
+        layout=layout,
     )
 
     np.testing.assert_array_equal(data, expected)
@@ -78,6 +415,220 @@ def test__permute_data(
     np.testing.assert_array_equal(data, expected)
 
 
+@pytest.mark.parametrize(
+    'window, height_pixels, width_pixels, snap_to_grid, expected',
+    data_test__to_pixel_window,
+)
+def test__to_pixel_window(
+    window: Window,
+    height_pixels: int,
+    width_pixels: int,
+    snap_to_grid: bool,
+    expected: Window | None,
+) -> None:
+    pixel_window = _to_pixel_window(
+        window=window,
+        height_pixels=height_pixels,
+        width_pixels=width_pixels,
+        snap_to_grid=snap_to_grid,
+    )
+
+    assert pixel_window == expected
+
+
+@pytest.mark.parametrize('value, max_value, expected', data_test__to_pixel_index)
+def test__to_pixel_index(
+    value: float,
+    max_value: int,
+    expected: int,
+) -> None:
+    pixel_index = _to_pixel_index(
+        value=value,
+        max_value=max_value,
+    )
+
+    assert pixel_index == expected
+
+
+@pytest.mark.parametrize('num_channels, drop_channels, expected', data_test_compute_indexes)
+def test_compute_indexes(
+    num_channels: int,
+    drop_channels: list[int] | None,
+    expected: list[int] | None,
+) -> None:
+    indexes = compute_indexes(
+        num_channels=num_channels,
+        drop_channels=drop_channels,
+    )
+
+    assert indexes == expected
+
+
+@pytest.mark.parametrize(
+    'overview_factors, ground_sampling_distance, src_ground_sampling_distance, expected',
+    data_test_compute_overview_level,
+)
+def test_compute_overview_level(
+    overview_factors: tuple[int, ...],
+    ground_sampling_distance: GroundSamplingDistance,
+    src_ground_sampling_distance: GroundSamplingDistance,
+    expected: int | None,
+) -> None:
+    overview_level = compute_overview_level(
+        overview_factors=overview_factors,
+        ground_sampling_distance=ground_sampling_distance,
+        src_ground_sampling_distance=src_ground_sampling_distance,
+    )
+
+    assert overview_level == expected
+
+
+@pytest.mark.parametrize(
+    'index, num_coordinates, prefetch_depth, batch_size, num_workers, expected',
+    data_test_compute_upcoming_indices,
+)
+def test_compute_upcoming_indices(
+    index: int,
+    num_coordinates: int,
+    prefetch_depth: int,
+    batch_size: int,
+    num_workers: int,
+    expected: list[int],
+) -> None:
+    upcoming_indices = compute_upcoming_indices(
+        index=index,
+        num_coordinates=num_coordinates,
+        prefetch_depth=prefetch_depth,
+        batch_size=batch_size,
+        num_workers=num_workers,
+    )
+
+    assert upcoming_indices == expected
+
+
+def test_compute_cache_key(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / 'test.vrt'
+    path.write_text('test')
+    params = {
+        'path': path,
+        'tile_size': 128,
+        'interpolation_mode': InterpolationMode.BILINEAR,
+        'drop_channels': None,
+    }
+    cache_key = compute_cache_key(
+        params=params,
+    )
+
+    assert cache_key == compute_cache_key(params=dict(params))
+    assert cache_key != compute_cache_key(params={**params, 'tile_size': 64})
+
+    mtime_ns = path.stat().st_mtime_ns + 1_000_000_000
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+    assert cache_key != compute_cache_key(params=params)
+
+
+def test_compute_mtime(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / 'test'
+    path.mkdir()
+    (path / 'test.npy').write_text('test')
+
+    assert compute_mtime(path=tmp_path / 'missing') is None
+    assert compute_mtime(path=path / 'test.npy') == (path / 'test.npy').stat().st_mtime_ns
+
+    mtime = compute_mtime(
+        path=path,
+    )
+    mtime_ns = mtime + 1_000_000_000
+    os.utime(path / 'test.npy', ns=(mtime_ns, mtime_ns))
+
+    assert compute_mtime(path=path) == mtime_ns
+
+
+def test_read_write_cached_data(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / '0_0.npy'
+    data = np.arange(12, dtype=np.uint8).reshape(2, 2, 3)
+
+    assert read_cached_data(path=path) is None
+
+    size = write_cached_data(
+        path=path,
+        data=data,
+    )
+    cached_data = read_cached_data(
+        path=path,
+    )
+
+    assert size == path.stat().st_size
+    assert isinstance(cached_data, np.memmap)
+    np.testing.assert_array_equal(cached_data, data)
+
+
+def test_evict_cached_data(
+    tmp_path: Path,
+) -> None:
+    data = np.zeros((16, 16, 3), dtype=np.uint8)
+
+    for index in range(4):
+        path = tmp_path / f'{index}_0.npy'
+        size = write_cached_data(
+            path=path,
+            data=data,
+        )
+        os.utime(path, ns=(index, index))
+
+    size_ = evict_cached_data(
+        path=tmp_path,
+        max_size=4 * size,
+    )
+
+    assert size_ == 4 * size
+
+    size_ = evict_cached_data(
+        path=tmp_path,
+        max_size=3 * size,
+    )
+
+    assert size_ == 2 * size
+    assert sorted(path.name for path in tmp_path.iterdir()) == ['2_0.npy', '3_0.npy']
+
+
+def test_evict_cached_data_permission_error(
+    tmp_path: Path,
+) -> None:
+    data = np.zeros((16, 16, 3), dtype=np.uint8)
+
+    for index in range(4):
+        path = tmp_path / f'{index}_0.npy'
+        size = write_cached_data(
+            path=path,
+            data=data,
+        )
+        os.utime(path, ns=(index, index))
+
+    remove = os.remove
+
+    def _remove(path: str) -> None:
+        if path.endswith('0_0.npy'):
+            raise PermissionError
+        remove(path)
+
+    with patch('aviary._functional.data.data_fetcher.os.remove', side_effect=_remove):
+        size_ = evict_cached_data(
+            path=tmp_path,
+            max_size=3 * size,
+        )
+
+    assert size_ == 2 * size
+    assert sorted(path.name for path in tmp_path.iterdir()) == ['0_0.npy', '3_0.npy']
+
+
 @patch('aviary._functional.data.data_fetcher.rio.open')
 def test_vrt_data_fetcher_info(
     mocked_rio_open,
@@ -92,6 +643,8 @@ def test_vrt_data_fetcher_info(
     mocked_src.crs.to_epsg.return_value = 25832
     mocked_src.res = (.5, .5)
     mocked_src.count = 3
+    mocked_src.overviews.return_value = [2, 4]
+    mocked_src.block_shapes = [(128, 128)] * 3
     mocked_rio_open.return_value.__enter__.return_value = mocked_src
     expected_bounding_box = BoundingBox(
         x_min=-128,
@@ -109,9 +662,1149 @@ def test_vrt_data_fetcher_info(
         epsg_code=expected_epsg_code,
         ground_sampling_distance=expected_ground_sampling_distance,
         num_channels=expected_num_channels,
+        overview_factors=(2, 4),
+        block_shape=(128, 128),
     )
     vrt_data_fetcher_info_ = vrt_data_fetcher_info(
         path=path,
     )
 
     assert vrt_data_fetcher_info_ == expected
+
+    assert vrt_data_fetcher_info_.num_effective_channels == expected_num_channels
+
+    expected.overview_level = 0
+    expected.indexes = [1, 2]
+    vrt_data_fetcher_info_ = vrt_data_fetcher_info(
+        path=path,
+        ground_sampling_distance=1.,
+        drop_channels=[-1],
+    )
+
+    assert vrt_data_fetcher_info_ == expected
+    assert vrt_data_fetcher_info_.num_effective_channels == 2
+
+
+@patch('aviary._functional.data.data_fetcher.rio.open')
+def test_vrt_data_fetcher_info_cache(
+    mocked_rio_open,
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / 'test.vrt'
+    path.write_text('test')
+    cache_path = tmp_path / 'cache'
+    mocked_src = MagicMock()
+    mocked_src.bounds.left = -128
+    mocked_src.bounds.bottom = -128
+    mocked_src.bounds.right = 128
+    mocked_src.bounds.top = 128
+    mocked_src.dtypes = ['uint8', 'uint8', 'uint8']
+    mocked_src.crs.to_epsg.return_value = 25832
+    mocked_src.res = (.5, .5)
+    mocked_src.count = 3
+    mocked_src.overviews.return_value = [2, 4]
+    mocked_src.block_shapes = [(128, 128)] * 3
+    mocked_rio_open.return_value.__enter__.return_value = mocked_src
+    vrt_data_fetcher_info_ = vrt_data_fetcher_info(
+        path=path,
+        cache_path=cache_path,
+    )
+    cached_vrt_data_fetcher_info = vrt_data_fetcher_info(
+        path=path,
+        ground_sampling_distance=1.,
+        drop_channels=[-1],
+        cache_path=cache_path,
+    )
+
+    assert mocked_rio_open.call_count == 1
+    assert len(list(cache_path.glob('*.json'))) == 1
+    assert cached_vrt_data_fetcher_info.bounding_box == vrt_data_fetcher_info_.bounding_box
+    assert cached_vrt_data_fetcher_info.dtype == vrt_data_fetcher_info_.dtype
+    assert cached_vrt_data_fetcher_info.overview_factors == (2, 4)
+    assert cached_vrt_data_fetcher_info.block_shape == (128, 128)
+    assert cached_vrt_data_fetcher_info.overview_level == 0
+    assert cached_vrt_data_fetcher_info.indexes == [1, 2]
+
+    mtime_ns = path.stat().st_mtime_ns + 1_000_000_000
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+    vrt_data_fetcher_info(
+        path=path,
+        cache_path=cache_path,
+    )
+
+    assert mocked_rio_open.call_count == 2
+
+    path.with_name('test.vrt.ovr').write_text('test')
+    vrt_data_fetcher_info(
+        path=path,
+        cache_path=cache_path,
+    )
+
+    assert mocked_rio_open.call_count == 3
+
+
+def test_read_write_cached_info(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / 'cache' / 'test.json'
+    data_fetcher_info = DataFetcherInfo(
+        bounding_box=BoundingBox(
+            x_min=-128,
+            y_min=-128,
+            x_max=128,
+            y_max=128,
+        ),
+        dtype=[DType.UINT8, DType.UINT8, DType.UINT8],
+        epsg_code=25832,
+        ground_sampling_distance=.2,
+        num_channels=3,
+        overview_factors=(2, 4),
+        block_shape=(128, 128),
+    )
+
+    assert read_cached_info(path=path) is None
+
+    write_cached_info(
+        path=path,
+        data_fetcher_info=data_fetcher_info,
+    )
+    cached_data_fetcher_info = read_cached_info(
+        path=path,
+    )
+
+    assert cached_data_fetcher_info == data_fetcher_info
+
+    path.write_text('test')
+
+    assert read_cached_info(path=path) is None
+
+
+def test_get_default_cache_path(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv('XDG_CACHE_HOME', '/test')
+
+    assert get_default_cache_path() == Path('/test/aviary/data_fetcher_info')
+
+    monkeypatch.delenv('XDG_CACHE_HOME')
+
+    assert get_default_cache_path() == Path.home() / '.cache' / 'aviary' / 'data_fetcher_info'
+
+
+def _write_geotiffs(
+    path: Path,
+) -> list[Path]:
+    paths = []
+
+    for index, x_min in enumerate([-128, 0]):
+        geotiff_path = path / f'test_{index}.tif'
+        data = np.full((2, 256, 128), fill_value=index + 1, dtype=np.uint8)
+        data[1] += 10
+
+        with rio.open(
+            geotiff_path,
+            mode='w',
+            driver='GTiff',
+            width=128,
+            height=256,
+            count=2,
+            dtype='uint8',
+            crs='EPSG:25832',
+            transform=from_origin(x_min, 128, 1., 1.),
+        ) as dst:
+            dst.write(data)
+
+        paths.append(geotiff_path)
+
+    return paths
+
+
+def test_build_footprint_index(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / 'test.vrt'
+    path.write_text(
+        '''<VRTDataset rasterXSize="256" rasterYSize="256">
+  <SRS>EPSG:25832</SRS>
+  <GeoTransform>-128, 1, 0, 128, 0, -1</GeoTransform>
+  <VRTRasterBand dataType="Byte" band="1">
+    <SimpleSource>
+      <SourceFilename relativeToVRT="1">test_0.tif</SourceFilename>
+      <DstRect xOff="0" yOff="0" xSize="128" ySize="256" />
+    </SimpleSource>
+    <ComplexSource>
+      <SourceFilename relativeToVRT="0">/test/test_1.tif</SourceFilename>
+      <DstRect xOff="128" yOff="128" xSize="128" ySize="128" />
+    </ComplexSource>
+  </VRTRasterBand>
+</VRTDataset>''',
+    )
+    footprint_index = build_footprint_index(
+        path=path,
+    )
+
+    assert footprint_index['path'].tolist() == [str((tmp_path / 'test_0.tif').resolve()), '/test/test_1.tif']
+    assert footprint_index.geometry.iloc[0].equals(box(-128, -128, 0, 128))
+    assert footprint_index.geometry.iloc[1].equals(box(0, -128, 128, 0))
+    assert footprint_index.crs.to_epsg() == 25832
+
+    paths = _write_geotiffs(
+        path=tmp_path,
+    )
+    footprint_index = build_footprint_index(
+        path=tmp_path,
+    )
+
+    assert footprint_index['path'].tolist() == [str(path.resolve()) for path in paths]
+    assert footprint_index.geometry.iloc[1].equals(box(0, -128, 128, 128))
+
+
+def test_build_footprint_index_exceptions(
+    tmp_path: Path,
+) -> None:
+    message = 'Invalid path!'
+
+    with pytest.raises(AviaryUserError, match=message):
+        build_footprint_index(
+            path=tmp_path,
+        )
+
+
+@patch('aviary._functional.data.data_fetcher.build_footprint_index')
+def test_load_footprint_index(
+    mocked_build_footprint_index,
+    tmp_path: Path,
+) -> None:
+    index_path = tmp_path / 'index' / 'test.feather'
+    paths = _write_geotiffs(
+        path=tmp_path,
+    )
+    footprint_index = gpd.GeoDataFrame(
+        {'path': [str(path) for path in paths]},
+        geometry=[box(-128, -128, 0, 128), box(0, -128, 128, 128)],
+        crs='EPSG:25832',
+    )
+    mocked_build_footprint_index.return_value = footprint_index
+    footprint_index_ = load_footprint_index(
+        path=tmp_path,
+        index_path=index_path,
+    )
+
+    assert index_path.exists()
+    assert footprint_index_.equals(footprint_index)
+
+    footprint_index_ = load_footprint_index(
+        path=tmp_path,
+        index_path=index_path,
+    )
+
+    mocked_build_footprint_index.assert_called_once_with(
+        path=tmp_path,
+    )
+    assert footprint_index_.equals(footprint_index)
+
+    os.utime(paths[0], ns=(0, 0))
+    footprint_index_ = load_footprint_index(
+        path=tmp_path,
+        index_path=index_path,
+    )
+
+    assert mocked_build_footprint_index.call_count == 2
+    assert footprint_index_.equals(footprint_index)
+
+    paths[1].unlink()
+    footprint_index = footprint_index.iloc[:1]
+    mocked_build_footprint_index.return_value = footprint_index
+    footprint_index_ = load_footprint_index(
+        path=tmp_path,
+        index_path=index_path,
+    )
+
+    assert mocked_build_footprint_index.call_count == 3
+    assert footprint_index_.equals(footprint_index)
+
+    footprint_index_ = load_footprint_index(
+        path=tmp_path,
+        index_path=index_path,
+    )
+
+    assert mocked_build_footprint_index.call_count == 3
+    assert footprint_index_.equals(footprint_index)
+
+
+def test_compute_footprint_index_key(
+    tmp_path: Path,
+) -> None:
+    paths = _write_geotiffs(
+        path=tmp_path,
+    )
+    key = compute_footprint_index_key(
+        path=tmp_path,
+    )
+
+    assert key == compute_footprint_index_key(
+        path=tmp_path,
+    )
+
+    (tmp_path / 'test.feather').touch()
+
+    assert key == compute_footprint_index_key(
+        path=tmp_path,
+    )
+
+    os.utime(paths[0], ns=(0, 0))
+
+    assert key != compute_footprint_index_key(
+        path=tmp_path,
+    )
+
+
+@pytest.mark.parametrize('layout', [DataLayout.CHANNELS_FIRST, DataLayout.CHANNELS_LAST])
+def test_indexed_geotiff_data_fetcher(
+    layout: DataLayout,
+    tmp_path: Path,
+) -> None:
+    paths = _write_geotiffs(
+        path=tmp_path,
+    )
+    footprint_index = build_footprint_index(
+        path=tmp_path,
+    )
+    footprints = STRtree(footprint_index.geometry.values)
+    data = indexed_geotiff_data_fetcher(
+        x_min=-32,
+        y_min=100,
+        paths=footprint_index['path'].tolist(),
+        footprints=footprints,
+        tile_size=64,
+        ground_sampling_distance=2.,
+        num_channels=1,
+        dtype=np.uint8,
+        interpolation_mode=InterpolationMode.NEAREST,
+        indexes=[2],
+        layout=layout,
+    )
+    expected = np.zeros((1, 32, 32), dtype=np.uint8)
+    expected[:, 18:, :16] = 11
+    expected[:, 18:, 16:] = 12
+
+    if layout == DataLayout.CHANNELS_LAST:
+        expected = expected.transpose(1, 2, 0)
+
+    np.testing.assert_array_equal(data, expected)
+
+    close_srcs(
+        path=set(paths),
+    )
+
+
+@pytest.mark.parametrize('interpolation_mode', [InterpolationMode.BILINEAR, InterpolationMode.NEAREST])
+def test_indexed_geotiff_data_fetcher_nodata(
+    interpolation_mode: InterpolationMode,
+    tmp_path: Path,
+) -> None:
+    paths = [tmp_path / 'test_0.tif', tmp_path / 'test_1.tif']
+    data_ = np.full((1, 32, 32), fill_value=2, dtype=np.uint8)
+    data_[:, :, :16] = 0
+
+    for path, data__, nodata in zip(paths, [np.ones((1, 32, 32), dtype=np.uint8), data_], [None, 0]):
+        with rio.open(
+            path,
+            mode='w',
+            driver='GTiff',
+            width=32,
+            height=32,
+            count=1,
+            dtype='uint8',
+            crs='EPSG:25832',
+            transform=from_origin(0, 32, 1., 1.),
+            nodata=nodata,
+        ) as dst:
+            dst.write(data__)
+
+    footprints = STRtree([box(0, 0, 32, 32)] * 2)
+    data = indexed_geotiff_data_fetcher(
+        x_min=0,
+        y_min=0,
+        paths=[str(path) for path in paths],
+        footprints=footprints,
+        tile_size=32,
+        ground_sampling_distance=1.,
+        num_channels=1,
+        dtype=np.uint8,
+        interpolation_mode=interpolation_mode,
+        layout=DataLayout.CHANNELS_FIRST,
+    )
+    expected = np.full((1, 32, 32), fill_value=2, dtype=np.uint8)
+    expected[:, :, :16] = 1
+
+    np.testing.assert_array_equal(data, expected)
+
+    close_srcs(
+        path=set(paths),
+    )
+
+
+def test_indexed_geotiff_data_fetcher_info(
+    tmp_path: Path,
+) -> None:
+    _write_geotiffs(
+        path=tmp_path,
+    )
+    footprint_index = build_footprint_index(
+        path=tmp_path,
+    )
+    expected = DataFetcherInfo(
+        bounding_box=BoundingBox(
+            x_min=-128,
+            y_min=-128,
+            x_max=128,
+            y_max=128,
+        ),
+        dtype=[DType.UINT8, DType.UINT8],
+        epsg_code=25832,
+        ground_sampling_distance=1.,
+        num_channels=2,
+        indexes=[2],
+    )
+    indexed_geotiff_data_fetcher_info_ = indexed_geotiff_data_fetcher_info(
+        footprint_index=footprint_index,
+        drop_channels=[0],
+    )
+
+    assert indexed_geotiff_data_fetcher_info_ == expected
+
+
+def _get_data_fetcher(
+    value: int,
+) -> MagicMock:
+    def data_fetcher(
+        x_min: Coordinate,
+        y_min: Coordinate,
+        out: npt.NDArray,
+    ) -> npt.NDArray:
+        out[...] = value + x_min + y_min
+        return out
+
+    return MagicMock(side_effect=data_fetcher)
+
+
+@pytest.mark.parametrize('layout', [DataLayout.CHANNELS_FIRST, DataLayout.CHANNELS_LAST])
+@pytest.mark.parametrize('num_threads', [0, 2])
+def test_stacked_data_fetcher(
+    num_threads: int,
+    layout: DataLayout,
+) -> None:
+    data_fetchers = [
+        _get_data_fetcher(value=1),
+        _get_data_fetcher(value=2),
+        _get_data_fetcher(value=3),
+    ]
+    executor = ThreadPoolExecutor(max_workers=num_threads) if num_threads > 0 else None
+    data = stacked_data_fetcher(
+        x_min=1,
+        y_min=2,
+        data_fetchers=data_fetchers,
+        num_channels=[3, 1, 2],
+        tile_size=64,
+        ground_sampling_distance=2.,
+        dtype=np.float32,
+        buffer_size=16,
+        executor=executor,
+        layout=layout,
+    )
+    expected = np.concatenate(
+        [
+            np.full((3, 48, 48), fill_value=4, dtype=np.float32),
+            np.full((1, 48, 48), fill_value=5, dtype=np.float32),
+            np.full((2, 48, 48), fill_value=6, dtype=np.float32),
+        ],
+    )
+
+    if layout == DataLayout.CHANNELS_LAST:
+        expected = expected.transpose(1, 2, 0)
+
+    np.testing.assert_array_equal(data, expected)
+
+    for data_fetcher in data_fetchers:
+        data_fetcher.assert_called_once()
+
+    if executor is not None:
+        executor.shutdown()
+
+
+def test_stacked_data_fetcher_out() -> None:
+    out = np.zeros((3, 32, 32), dtype=np.uint8)
+    data = stacked_data_fetcher(
+        x_min=0,
+        y_min=0,
+        data_fetchers=[_get_data_fetcher(value=1), _get_data_fetcher(value=2)],
+        num_channels=[2, 1],
+        tile_size=64,
+        ground_sampling_distance=2.,
+        dtype=np.uint8,
+        layout=DataLayout.CHANNELS_FIRST,
+        out=out,
+    )
+
+    assert data is out
+    np.testing.assert_array_equal(out[:, 0, 0], [1, 1, 2])
+
+
+def test_stacked_data_fetcher_exceptions() -> None:
+    data_fetcher = MagicMock(side_effect=RuntimeError('test'))
+    executor = ThreadPoolExecutor(max_workers=1)
+
+    with pytest.raises(RuntimeError, match='test'):
+        _ = stacked_data_fetcher(
+            x_min=0,
+            y_min=0,
+            data_fetchers=[_get_data_fetcher(value=1), data_fetcher],
+            num_channels=[1, 1],
+            tile_size=64,
+            ground_sampling_distance=2.,
+            dtype=np.uint8,
+            executor=executor,
+        )
+
+    executor.shutdown()
+
+
+@pytest.mark.parametrize(
+    ('data_fetcher_infos', 'expected'),
+    data_test_stacked_data_fetcher_info,
+)
+def test_stacked_data_fetcher_info(
+    data_fetcher_infos: list[DataFetcherInfo],
+    expected: DataFetcherInfo,
+) -> None:
+    stacked_data_fetcher_info_ = stacked_data_fetcher_info(
+        data_fetcher_infos=data_fetcher_infos,
+    )
+
+    assert stacked_data_fetcher_info_ == expected
+
+
+def test_stacked_data_fetcher_info_exceptions() -> None:
+    data_fetcher_info = DataFetcherInfo(
+        bounding_box=BoundingBox(
+            x_min=-128,
+            y_min=-128,
+            x_max=128,
+            y_max=128,
+        ),
+        dtype=[DType.UINT8],
+        epsg_code=25832,
+        ground_sampling_distance=.2,
+        num_channels=1,
+    )
+    message = 'Invalid data_fetchers!'
+
+    with pytest.raises(AviaryUserError, match=message):
+        _ = stacked_data_fetcher_info(
+            data_fetcher_infos=[
+                data_fetcher_info,
+                DataFetcherInfo(
+                    bounding_box=data_fetcher_info.bounding_box,
+                    dtype=[DType.UINT8],
+                    epsg_code=25833,
+                    ground_sampling_distance=.2,
+                    num_channels=1,
+                ),
+            ],
+        )
+
+    with pytest.raises(AviaryUserError, match=message):
+        _ = stacked_data_fetcher_info(
+            data_fetcher_infos=[
+                data_fetcher_info,
+                DataFetcherInfo(
+                    bounding_box=BoundingBox(
+                        x_min=128,
+                        y_min=-128,
+                        x_max=256,
+                        y_max=128,
+                    ),
+                    dtype=[DType.UINT8],
+                    epsg_code=25832,
+                    ground_sampling_distance=.2,
+                    num_channels=1,
+                ),
+            ],
+        )
+
+
+@pytest.mark.parametrize(
+    ('x_min', 'y_min', 'buffer_size', 'channels', 'layout', 'expected_is_view', 'expected'),
+    data_test_memmap_data_fetcher,
+)
+def test_memmap_data_fetcher(
+    x_min: Coordinate,
+    y_min: Coordinate,
+    buffer_size: BufferSize,
+    channels: slice | list[int] | None,
+    layout: DataLayout,
+    expected_is_view: bool,
+    expected: npt.NDArray,
+) -> None:
+    data = np.arange(72).reshape(2, 6, 6)
+    bounding_box = BoundingBox(
+        x_min=-2,
+        y_min=-2,
+        x_max=4,
+        y_max=4,
+    )
+    data_ = memmap_data_fetcher(
+        x_min=x_min,
+        y_min=y_min,
+        data=data,
+        bounding_box=bounding_box,
+        tile_size=2,
+        ground_sampling_distance=1.,
+        buffer_size=buffer_size,
+        channels=channels,
+        layout=layout,
+    )
+
+    np.testing.assert_array_equal(data_, expected)
+    assert np.shares_memory(data_, data) == expected_is_view
+
+
+@pytest.mark.parametrize(('num_channels', 'drop_channels', 'expected'), data_test_compute_channels)
+def test_compute_channels(
+    num_channels: int,
+    drop_channels: list[int] | None,
+    expected: slice | list[int] | None,
+) -> None:
+    channels = compute_channels(
+        num_channels=num_channels,
+        drop_channels=drop_channels,
+    )
+
+    assert channels == expected
+
+
+def test_build_memmap(
+    tmp_path: Path,
+) -> None:
+    def data_fetcher(
+        x_min: Coordinate,
+        y_min: Coordinate,
+        out: npt.NDArray,
+    ) -> npt.NDArray:
+        out[0] = x_min
+        out[1] = y_min
+        return out
+
+    coordinates = np.array([[0, 0], [4, 0]], dtype=np.int32)
+    memmap_info = build_memmap(
+        path=tmp_path / 'memmap',
+        data_fetcher=data_fetcher,
+        coordinates=coordinates,
+        tile_size=4,
+        ground_sampling_distance=2.,
+        num_channels=2,
+        dtype=[DType.UINT8, DType.FLOAT32],
+        epsg_code=25832,
+        buffer_size=2,
+        num_threads=2,
+    )
+    expected_info = DataFetcherInfo(
+        bounding_box=BoundingBox(
+            x_min=-4,
+            y_min=-4,
+            x_max=12,
+            y_max=8,
+        ),
+        dtype=[DType.FLOAT32, DType.FLOAT32],
+        epsg_code=25832,
+        ground_sampling_distance=2.,
+        num_channels=2,
+    )
+
+    assert memmap_info == expected_info
+
+    data, memmap_info = load_memmap(
+        path=tmp_path / 'memmap',
+    )
+    expected = np.stack(
+        [
+            np.tile(np.repeat([-4, 0, 4, 8], 2).astype(np.float32), (6, 1)),
+            np.repeat([4, 0, -4], 2).astype(np.float32)[:, np.newaxis].repeat(8, axis=1),
+        ],
+    )
+
+    assert isinstance(data, np.memmap)
+    assert not data.flags.writeable
+    assert memmap_info == expected_info
+    np.testing.assert_array_equal(data, expected)
+
+
+def test_build_memmap_exceptions(
+    tmp_path: Path,
+) -> None:
+    message = 'Invalid coordinates!'
+
+    with pytest.raises(AviaryUserError, match=message):
+        _ = build_memmap(
+            path=tmp_path,
+            data_fetcher=MagicMock(),
+            coordinates=np.empty(shape=(0, 2), dtype=np.int32),
+            tile_size=4,
+            ground_sampling_distance=2.,
+            num_channels=1,
+            dtype=[DType.UINT8],
+            epsg_code=25832,
+        )
+
+
+def test_load_memmap_exceptions(
+    tmp_path: Path,
+) -> None:
+    message = 'Invalid path!'
+
+    with pytest.raises(AviaryUserError, match=message):
+        _ = load_memmap(
+            path=tmp_path,
+        )
+
+
+def test_compute_mem_path() -> None:
+    data = np.zeros((3, 4, 8), dtype=np.float32)
+    transform = from_origin(-128, 128, .5, .5)
+    path = compute_mem_path(
+        data=data,
+        transform=transform,
+        epsg_code=25832,
+    )
+    expected = (
+        'MEM:::'
+        f'DATAPOINTER={data.ctypes.data},'
+        'PIXELS=8,'
+        'LINES=4,'
+        'BANDS=3,'
+        'DATATYPE=Float32,'
+        'PIXELOFFSET=4,'
+        'LINEOFFSET=32,'
+        'BANDOFFSET=128,'
+        'GEOTRANSFORM=-128.0/0.5/0.0/128.0/0.0/-0.5,'
+        'SPATIALREFERENCE=EPSG:25832'
+    )
+
+    assert path == expected
+
+
+def test_compute_mem_path_exceptions() -> None:
+    transform = from_origin(-128, 128, .5, .5)
+    message = 'Invalid data!'
+
+    with pytest.raises(AviaryUserError, match=message):
+        _ = compute_mem_path(
+            data=np.zeros((4, 8), dtype=np.uint8),
+            transform=transform,
+            epsg_code=25832,
+        )
+
+    with pytest.raises(AviaryUserError, match=message):
+        _ = compute_mem_path(
+            data=np.zeros((8, 4, 3), dtype=np.uint8).transpose(2, 1, 0),
+            transform=transform,
+            epsg_code=25832,
+        )
+
+    with pytest.raises(AviaryUserError, match=message):
+        _ = compute_mem_path(
+            data=np.zeros((3, 4, 8), dtype=np.int64),
+            transform=transform,
+            epsg_code=25832,
+        )
+
+
+@pytest.mark.parametrize('dtype', [np.int16, np.uint8, np.uint16])
+@pytest.mark.parametrize('layout', [DataLayout.CHANNELS_FIRST, DataLayout.CHANNELS_LAST])
+def test_array_data_fetcher(
+    dtype: npt.DTypeLike,
+    layout: DataLayout,
+) -> None:
+    data = np.arange(2 * 16 * 16, dtype=dtype).reshape(2, 16, 16)
+    transform = from_origin(-8, 8, 1., 1.)
+    path = compute_mem_path(
+        data=data,
+        transform=transform,
+        epsg_code=25832,
+    )
+    data_ = array_data_fetcher(
+        x_min=4,
+        y_min=0,
+        path=path,
+        tile_size=4,
+        ground_sampling_distance=1.,
+        interpolation_mode=InterpolationMode.NEAREST,
+        buffer_size=2,
+        native_resolution=True,
+        indexes=[2],
+        layout=layout,
+    )
+    expected = np.zeros((1, 8, 8), dtype=dtype)
+    expected[:, :, :6] = data[1:, 2:10, 10:]
+
+    if layout == DataLayout.CHANNELS_LAST:
+        expected = expected.transpose(1, 2, 0)
+
+    np.testing.assert_array_equal(data_, expected)
+
+    close_srcs(
+        path={path},
+    )
+
+
+def test_array_data_fetcher_info() -> None:
+    data = np.zeros((3, 16, 32), dtype=np.uint8)
+    transform = from_origin(-8, 8, .5, .5)
+    expected = DataFetcherInfo(
+        bounding_box=BoundingBox(
+            x_min=-8,
+            y_min=0,
+            x_max=8,
+            y_max=8,
+        ),
+        dtype=[DType.UINT8, DType.UINT8, DType.UINT8],
+        epsg_code=25832,
+        ground_sampling_distance=.5,
+        num_channels=3,
+        indexes=[1, 3],
+    )
+    array_data_fetcher_info_ = array_data_fetcher_info(
+        data=data,
+        transform=transform,
+        epsg_code=25832,
+        drop_channels=[1],
+    )
+
+    assert array_data_fetcher_info_ == expected
+
+
+def test_array_data_fetcher_info_exceptions() -> None:
+    message = 'Invalid transform!'
+
+    with pytest.raises(AviaryUserError, match=message):
+        _ = array_data_fetcher_info(
+            data=np.zeros((3, 16, 32), dtype=np.uint8),
+            transform=Affine(.5, 0., -8., 0., .5, 8.),
+            epsg_code=25832,
+        )
+
+
+@pytest.fixture
+def geotiff_path(
+    tmp_path: Path,
+) -> Path:
+    path = tmp_path / 'test.tif'
+    data = np.arange(2 * 64 * 64, dtype=np.uint16).reshape(2, 64, 64) % 251 + 1
+
+    with rio.open(
+        path,
+        mode='w',
+        driver='GTiff',
+        width=64,
+        height=64,
+        count=2,
+        dtype='uint8',
+        crs='EPSG:25832',
+        transform=from_origin(500_000, 5_000_064, 1., 1.),
+    ) as dst:
+        dst.write(data.astype(np.uint8))
+
+    return path
+
+
+def test_compute_warped_transform() -> None:
+    transform, width, height = compute_warped_transform(
+        src_crs=rio.crs.CRS.from_epsg(25832),
+        src_bounds=(-8.3, -4., 7.9, 8.1),
+        epsg_code=25832,
+        ground_sampling_distance=.5,
+    )
+
+    assert transform == from_origin(-8.5, 8.5, .5, .5)
+    assert width == 33
+    assert height == 25
+
+
+@pytest.mark.parametrize('layout', [DataLayout.CHANNELS_FIRST, DataLayout.CHANNELS_LAST])
+def test_warped_vrt_data_fetcher(
+    geotiff_path: Path,
+    layout: DataLayout,
+) -> None:
+    data = warped_vrt_data_fetcher(
+        x_min=499_996,
+        y_min=5_000_056,
+        path=geotiff_path,
+        epsg_code=25832,
+        tile_size=8,
+        ground_sampling_distance=1.,
+        interpolation_mode=InterpolationMode.NEAREST,
+        buffer_size=2,
+        indexes=[2],
+        layout=layout,
+    )
+
+    with rio.open(geotiff_path) as src:
+        expected = np.zeros((1, 12, 12), dtype=np.uint8)
+        expected[:, 2:, 6:] = src.read(indexes=[2], window=Window(0, 0, 6, 10))
+
+    if layout == DataLayout.CHANNELS_LAST:
+        expected = expected.transpose(1, 2, 0)
+
+    np.testing.assert_array_equal(data, expected)
+
+    close_srcs(
+        path={geotiff_path},
+    )
+
+
+def test_warped_vrt_data_fetcher_reprojection(
+    geotiff_path: Path,
+) -> None:
+    info = warped_vrt_data_fetcher_info(
+        path=geotiff_path,
+        epsg_code=25833,
+        ground_sampling_distance=.5,
+    )
+    out = np.empty((2, 32, 32), dtype=np.uint8)
+    data = warped_vrt_data_fetcher(
+        x_min=info.bounding_box.x_min + 16,
+        y_min=info.bounding_box.y_min + 16,
+        path=geotiff_path,
+        epsg_code=25833,
+        tile_size=16,
+        ground_sampling_distance=.5,
+        interpolation_mode=InterpolationMode.NEAREST,
+        num_threads=2,
+        layout=DataLayout.CHANNELS_FIRST,
+        out=out,
+    )
+    expected = np.zeros((2, 32, 32), dtype=np.uint8)
+
+    with rio.open(geotiff_path) as src:
+        rio.warp.reproject(
+            source=rio.band(src, [1, 2]),
+            destination=expected,
+            dst_transform=from_origin(info.bounding_box.x_min + 16, info.bounding_box.y_min + 32, .5, .5),
+            dst_crs='EPSG:25833',
+            resampling=rio.enums.Resampling.nearest,
+        )
+
+    assert data is out
+    assert np.count_nonzero(data) > 0
+    np.testing.assert_array_equal(data, expected)
+
+    close_srcs(
+        path={geotiff_path},
+    )
+
+
+def test__get_warped_src(
+    geotiff_path: Path,
+) -> None:
+    src = _get_warped_src(
+        path=geotiff_path,
+        epsg_code=25832,
+        ground_sampling_distance=1.,
+    )
+    base_src = src.src_dataset
+
+    assert src is _get_warped_src(
+        path=geotiff_path,
+        epsg_code=25832,
+        ground_sampling_distance=1.,
+    )
+    assert not base_src.closed
+
+    close_srcs(
+        path={geotiff_path},
+    )
+
+    assert src.closed
+    assert base_src.closed
+
+
+def test_warped_vrt_data_fetcher_info(
+    geotiff_path: Path,
+) -> None:
+    expected = DataFetcherInfo(
+        bounding_box=BoundingBox(
+            x_min=500_000,
+            y_min=5_000_000,
+            x_max=500_064,
+            y_max=5_000_064,
+        ),
+        dtype=[DType.UINT8, DType.UINT8],
+        epsg_code=25832,
+        ground_sampling_distance=.5,
+        num_channels=2,
+        indexes=[2],
+    )
+    warped_vrt_data_fetcher_info_ = warped_vrt_data_fetcher_info(
+        path=geotiff_path,
+        epsg_code=25832,
+        ground_sampling_distance=.5,
+        drop_channels=[0],
+    )
+
+    assert warped_vrt_data_fetcher_info_ == expected
+
+
+def _encode_image(
+    data: npt.NDArray,
+) -> bytes:
+    with warnings.catch_warnings(), rio.MemoryFile() as memory_file:
+        warnings.simplefilter('ignore', category=rio.errors.NotGeoreferencedWarning)
+
+        with memory_file.open(
+            driver='PNG',
+            width=data.shape[2],
+            height=data.shape[1],
+            count=data.shape[0],
+            dtype=data.dtype,
+        ) as dst:
+            dst.write(data)
+
+        return memory_file.read()
+
+
+class _WMSRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self) -> None:
+        params = {key: values[0] for key, values in parse_qs(urlparse(self.path).query).items()}
+        self.server.requests.append(params)
+        self.server.client_ports.add(self.client_address[1])
+
+        if params.get('LAYERS') != 'test':
+            content = b'<ServiceExceptionReport>Layer not defined</ServiceExceptionReport>'
+            content_type = 'text/xml'
+        else:
+            width = int(params['WIDTH'])
+            height = int(params['HEIGHT'])
+            data = np.stack([np.full((height, width), fill_value=value, dtype=np.uint8) for value in (1, 2, 3, 255)])
+            content = _encode_image(data)
+            content_type = 'image/png'
+
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *_) -> None:
+        pass
+
+
+@pytest.fixture
+def wms_url() -> Iterator[tuple[str, ThreadingHTTPServer]]:
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _WMSRequestHandler)
+    server.requests = []
+    server.client_ports = set()
+    thread = threading.Thread(target=server.serve_forever, kwargs={'poll_interval': .01}, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_port}/wms', server
+    close_sessions()
+    server.shutdown()
+    server.server_close()
+
+
+def test_compute_wms_params() -> None:
+    bounding_box = BoundingBox(
+        x_min=-128,
+        y_min=-128,
+        x_max=128,
+        y_max=128,
+    )
+    params = compute_wms_params(
+        bounding_box=bounding_box,
+        width_pixels=512,
+        height_pixels=512,
+        layer='test',
+        epsg_code=25832,
+    )
+    expected = {
+        'SERVICE': 'WMS',
+        'REQUEST': 'GetMap',
+        'VERSION': '1.3.0',
+        'LAYERS': 'test',
+        'STYLES': '',
+        'CRS': 'EPSG:25832',
+        'BBOX': '-128,-128,128,128',
+        'WIDTH': '512',
+        'HEIGHT': '512',
+        'FORMAT': 'image/png',
+    }
+
+    assert params == expected
+
+    params = compute_wms_params(
+        bounding_box=bounding_box,
+        width_pixels=512,
+        height_pixels=512,
+        layer='test',
+        epsg_code=25832,
+        version='1.1.1',
+    )
+
+    assert 'CRS' not in params
+    assert params['SRS'] == 'EPSG:25832'
+
+
+@pytest.mark.parametrize('layout', [DataLayout.CHANNELS_FIRST, DataLayout.CHANNELS_LAST])
+def test_wms_data_fetcher(
+    layout: DataLayout,
+    wms_url: tuple[str, ThreadingHTTPServer],
+) -> None:
+    url, server = wms_url
+    response_cache = ResponseCache(
+        size=1_000_000,
+    )
+
+    for x_min, y_min in [(-128, -128), (0, -128), (-128, 0), (-128, -128)]:
+        data = wms_data_fetcher(
+            x_min=x_min,
+            y_min=y_min,
+            url=url,
+            layer='test',
+            epsg_code=25832,
+            tile_size=128,
+            ground_sampling_distance=.5,
+            buffer_size=32,
+            drop_channels=[-1],
+            layout=layout,
+            response_cache=response_cache,
+        )
+        expected = np.stack([np.full((384, 384), fill_value=value, dtype=np.uint8) for value in (1, 2, 3)])
+
+        if layout == DataLayout.CHANNELS_LAST:
+            expected = expected.transpose(1, 2, 0)
+
+        np.testing.assert_array_equal(data, expected)
+
+    assert len(server.requests) == 3
+    assert server.requests[0]['BBOX'] == '-160,-160,32,32'
+    assert len(server.client_ports) == 1
+
+
+def test_wms_data_fetcher_exceptions(
+    wms_url: tuple[str, ThreadingHTTPServer],
+) -> None:
+    url, _ = wms_url
+    message = 'Invalid response!'
+
+    with pytest.raises(AviaryUserError, match=message):
+        wms_data_fetcher(
+            x_min=-128,
+            y_min=-128,
+            url=url,
+            layer='invalid',
+            epsg_code=25832,
+            tile_size=128,
+            ground_sampling_distance=.5,
+        )
@@ -0,0 +1,249 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+import numpy.typing as npt
+import pytest
+
+from aviary._functional.data.data_loader import (
+    compute_num_batches,
+    fetch_batch_into,
+    get_batch_slice,
+    iter_batches,
+    supports_out,
+)
+from aviary._functional.data.tests.data.data_test_data_loader import (
+    data_test_compute_num_batches,
+    data_test_get_batch_slice,
+)
+
+# noinspection PyProtectedMember
+from aviary._utils.types import (
+    Coordinate,
+    CoordinatesSet,
+    DataLayout,
+)
+from aviary.data.data_fetcher import DataFetcher
+from aviary.data.data_preprocessor import DataPreprocessor
+
+
+class _DataFetcher:
+
+    def __init__(
+        self,
+        layout: DataLayout,
+    ) -> None:
+        self.layout = layout
+
+    def __call__(
+        self,
+        x_min: Coordinate,
+        y_min: Coordinate,
+        out: npt.NDArray | None = None,
+    ) -> npt.NDArray:
+        if x_min == 128:
+            message = 'Invalid x_min!'
+            raise ValueError(message)
+
+        if out is None:
+            out = np.empty(shape=(2, 4, 4), dtype=np.int32)
+
+        out[0] = x_min
+        out[1] = y_min
+        return out if self.layout == DataLayout.CHANNELS_FIRST else out.transpose(1, 2, 0)
+
+
+@pytest.mark.parametrize(('coordinates', 'batch_size', 'expected'), data_test_compute_num_batches)
+def test_compute_num_batches(
+    coordinates: CoordinatesSet,
+    batch_size: int,
+    expected: int,
+) -> None:
+    num_batches = compute_num_batches(
+        coordinates=coordinates,
+        batch_size=batch_size,
+    )
+
+    assert num_batches == expected
+
+
+@pytest.mark.parametrize(('coordinates', 'batch_size', 'batch_index', 'expected'), data_test_get_batch_slice)
+def test_get_batch_slice(
+    coordinates: CoordinatesSet,
+    batch_size: int,
+    batch_index: int,
+    expected: slice,
+) -> None:
+    batch_slice = get_batch_slice(
+        coordinates=coordinates,
+        batch_size=batch_size,
+        batch_index=batch_index,
+    )
+
+    assert batch_slice == expected
+
+
+def test_supports_out() -> None:
+    assert supports_out(data_fetcher=_DataFetcher(layout=DataLayout.CHANNELS_FIRST))
+    assert not supports_out(data_fetcher=_DataFetcher(layout=DataLayout.CHANNELS_LAST))
+
+    data_fetcher = MagicMock(spec=DataFetcher)
+    data_fetcher.layout = DataLayout.CHANNELS_FIRST
+
+    assert not supports_out(data_fetcher=data_fetcher)
+
+
+@pytest.mark.parametrize('layout', [DataLayout.CHANNELS_FIRST, DataLayout.CHANNELS_LAST])
+def test_fetch_batch_into(
+    layout: DataLayout,
+) -> None:
+    data_fetcher = _DataFetcher(layout=layout)
+    coordinates = np.array([[-128, -128], [0, -128]], dtype=np.int32)
+    shape = (2, 4, 4) if layout == DataLayout.CHANNELS_FIRST else (4, 4, 2)
+    out = np.zeros(shape=(2, *shape), dtype=np.int32)
+    fetch_batch_into(
+        data_fetcher=data_fetcher,
+        coordinates=coordinates,
+        out=out,
+    )
+
+    for data, (x_min, y_min) in zip(out, coordinates):
+        np.testing.assert_array_equal(data, data_fetcher(x_min=x_min, y_min=y_min))
+
+
+def test_fetch_batch_into_fetch_batch() -> None:
+    data_fetcher = MagicMock(spec=DataFetcher)
+    data_fetcher.fetch_batch = MagicMock()
+    data_fetcher.fetch_batch.return_value = [
+        np.full(shape=(4, 4, 2), fill_value=1, dtype=np.int32),
+        np.full(shape=(4, 4, 2), fill_value=2, dtype=np.int32),
+    ]
+    coordinates = np.array([[-128, -128], [0, -128]], dtype=np.int32)
+    out = np.zeros(shape=(2, 4, 4, 2), dtype=np.int32)
+    fetch_batch_into(
+        data_fetcher=data_fetcher,
+        coordinates=coordinates,
+        out=out,
+    )
+
+    data_fetcher.fetch_batch.assert_called_once_with(
+        coordinates=coordinates,
+    )
+    data_fetcher.assert_not_called()
+    np.testing.assert_array_equal(out[0], 1)
+    np.testing.assert_array_equal(out[1], 2)
+
+
+@pytest.mark.parametrize('num_workers', [0, 2])
+@pytest.mark.parametrize('layout', [DataLayout.CHANNELS_FIRST, DataLayout.CHANNELS_LAST])
+def test_iter_batches(
+    num_workers: int,
+    layout: DataLayout,
+) -> None:
+    data_fetcher = _DataFetcher(layout=layout)
+    coordinates = np.array([[-128, -128], [0, -128], [-128, 0], [0, 0], [-128, 64]], dtype=np.int32)
+    batches = [
+        (data.copy(), x_min, y_min)
+        for data, x_min, y_min in iter_batches(
+            data_fetcher=data_fetcher,
+            data_preprocessor=None,
+            coordinates=coordinates,
+            batch_size=2,
+            num_workers=num_workers,
+            num_buffers=2,
+        )
+    ]
+
+    assert len(batches) == 3
+    assert [len(data) for data, _, _ in batches] == [2, 2, 1]
+
+    for (data, x_min, y_min), indices in zip(batches, [[0, 1], [2, 3], [4]]):
+        expected = np.stack([data_fetcher(x_min=x, y_min=y) for x, y in coordinates[indices]])
+
+        np.testing.assert_array_equal(data, expected)
+        np.testing.assert_array_equal(x_min, coordinates[indices, 0])
+        np.testing.assert_array_equal(y_min, coordinates[indices, 1])
+
+
+@pytest.mark.parametrize('num_workers', [0, 2])
+def test_iter_batches_keep_batches(
+    num_workers: int,
+) -> None:
+    data_fetcher = _DataFetcher(layout=DataLayout.CHANNELS_FIRST)
+    coordinates = np.array([[-128, -128], [0, -128], [-128, 0]], dtype=np.int32)
+    batches = [
+        data
+        for data, _, _ in iter_batches(
+            data_fetcher=data_fetcher,
+            data_preprocessor=None,
+            coordinates=coordinates,
+            batch_size=2,
+            num_workers=num_workers,
+            num_buffers=2,
+        )
+    ]
+    expected = data_fetcher(x_min=-128, y_min=0)[np.newaxis]
+
+    np.testing.assert_array_equal(batches[-1], expected)
+    assert batches[-1].sum() == expected.sum()
+
+
+def test_iter_batches_data_preprocessor() -> None:
+    data_fetcher = _DataFetcher(layout=DataLayout.CHANNELS_FIRST)
+    data_preprocessor = MagicMock(spec=DataPreprocessor)
+    data_preprocessor.side_effect = lambda data: data * 2
+    coordinates = np.array([[-128, -128], [0, -128], [-128, 0]], dtype=np.int32)
+    batches = list(
+        iter_batches(
+            data_fetcher=data_fetcher,
+            data_preprocessor=data_preprocessor,
+            coordinates=coordinates,
+            batch_size=2,
+            num_workers=0,
+            num_buffers=1,
+        ),
+    )
+
+    assert data_preprocessor.call_count == 2
+
+    for (data, _, _), indices in zip(batches, [[0, 1], [2]]):
+        expected = np.stack([data_fetcher(x_min=x, y_min=y) for x, y in coordinates[indices]]) * 2
+
+        np.testing.assert_array_equal(data, expected)
+
+
+def test_iter_batches_empty_coordinates() -> None:
+    data_fetcher = MagicMock(spec=DataFetcher)
+    batches = list(
+        iter_batches(
+            data_fetcher=data_fetcher,
+            data_preprocessor=None,
+            coordinates=np.empty(shape=(0, 2), dtype=np.int32),
+            batch_size=2,
+            num_workers=0,
+            num_buffers=1,
+        ),
+    )
+
+    assert batches == []
+    data_fetcher.assert_not_called()
+
+
+@pytest.mark.parametrize('num_workers', [0, 2])
+def test_iter_batches_exceptions(
+    num_workers: int,
+) -> None:
+    data_fetcher = _DataFetcher(layout=DataLayout.CHANNELS_FIRST)
+    coordinates = np.array([[-128, -128], [0, -128], [128, 0], [0, 0]], dtype=np.int32)
+    message = 'Invalid x_min!'
+
+    with pytest.raises(ValueError, match=message):
+        _ = list(
+            iter_batches(
+                data_fetcher=data_fetcher,
+                data_preprocessor=None,
+                coordinates=coordinates,
+                batch_size=2,
+                num_workers=num_workers,
+                num_buffers=2,
+            ),
+        )
@@ -4,61 +4,185 @@ import pytest
 import torch
 
 from aviary._functional.data.data_preprocessor import (
+    affine_preprocessor,
+    compute_lut,
+    fuse_affine_params,
+    lut_preprocessor,
     normalize_preprocessor,
     standardize_preprocessor,
     to_tensor_preprocessor,
 )
 from aviary._functional.data.tests.data.data_test_data_preprocessor import (
+    data,
+    data_test_affine_preprocessor,
+    data_test_fuse_affine_params,
     data_test_normalize_preprocessor,
     data_test_standardize_preprocessor,
     data_test_to_tensor_preprocessor,
 )
 
+# noinspection PyProtectedMember
+from aviary._utils.types import DataLayout
+
 
 @pytest.mark.skip(reason='Not implemented')
 def test_composite_preprocessor() -> None:
     pass
 
 
-@pytest.mark.parametrize('data, min_values, max_values, expected', data_test_normalize_preprocessor)
+@pytest.mark.parametrize('data, scale, offset, expected', data_test_affine_preprocessor)
+def test_affine_preprocessor(
+    data: npt.NDArray,
+    scale: npt.NDArray[np.float32],
+    offset: npt.NDArray[np.float32],
+    expected: npt.NDArray[np.float32],
+) -> None:
+    preprocessed_data = affine_preprocessor(
+        data=data,
+        scale=scale,
+        offset=offset,
+    )
+
+    assert preprocessed_data.dtype == np.float32
+    np.testing.assert_allclose(preprocessed_data, expected, rtol=1e-6)
+
+
+@pytest.mark.parametrize('affine_params, layout, expected_scale, expected_offset', data_test_fuse_affine_params)
+def test_fuse_affine_params(
+    affine_params: list[tuple[list[float], list[float]]],
+    layout: DataLayout,
+    expected_scale: npt.NDArray[np.float32],
+    expected_offset: npt.NDArray[np.float32],
+) -> None:
+    scale, offset = fuse_affine_params(
+        affine_params=affine_params,
+        layout=layout,
+    )
+
+    np.testing.assert_array_equal(scale, expected_scale)
+    np.testing.assert_array_equal(offset, expected_offset)
+    assert scale.dtype == np.float32
+    assert offset.dtype == np.float32
+
+
+@pytest.mark.parametrize('dtype', [np.uint8, np.uint16])
+@pytest.mark.parametrize('layout', [DataLayout.CHANNELS_FIRST, DataLayout.CHANNELS_LAST])
+def test_compute_lut(
+    dtype: npt.DTypeLike,
+    layout: DataLayout,
+) -> None:
+    def data_preprocessor(
+        data_: npt.NDArray,
+    ) -> npt.NDArray[np.float32]:
+        return standardize_preprocessor(
+            data=data_,
+            mean_values=[0., 1., 2.],
+            std_values=[1., 2., 4.],
+            layout=layout,
+        )
+
+    lut = compute_lut(
+        data_preprocessors=[data_preprocessor],
+        num_channels=3,
+        dtype=dtype,
+        layout=layout,
+    )
+    num_values = np.iinfo(dtype).max + 1
+    expected = np.stack(
+        [
+            np.arange(num_values, dtype=np.float32),
+            (np.arange(num_values, dtype=np.float32) - 1) / 2,
+            (np.arange(num_values, dtype=np.float32) - 2) / 4,
+        ],
+    )
+
+    assert lut.dtype == np.float32
+    np.testing.assert_array_equal(lut, expected)
+
+
+@pytest.mark.parametrize('layout', [DataLayout.CHANNELS_FIRST, DataLayout.CHANNELS_LAST])
+def test_lut_preprocessor(
+    layout: DataLayout,
+) -> None:
+    lut = np.stack(
+        [
+            np.arange(256, dtype=np.float32),
+            np.arange(256, dtype=np.float32) * -1,
+            np.arange(256, dtype=np.float32) + .5,
+        ],
+    )
+    data_ = data
+
+    if layout == DataLayout.CHANNELS_FIRST:
+        data_ = np.ascontiguousarray(data.transpose(2, 0, 1))
+        expected = data_ * np.array([1., -1., 1.])[:, np.newaxis, np.newaxis]
+        expected += np.array([0., 0., .5])[:, np.newaxis, np.newaxis]
+    else:
+        expected = data_ * np.array([1., -1., 1.]) + np.array([0., 0., .5])
+
+    preprocessed_data = lut_preprocessor(
+        data=data_,
+        lut=lut,
+        layout=layout,
+    )
+
+    assert preprocessed_data.dtype == np.float32
+    np.testing.assert_array_equal(preprocessed_data, expected)
+
+    preprocessed_data = lut_preprocessor(
+        data=np.stack([data_, data_]),
+        lut=lut,
+        layout=layout,
+    )
+
+    np.testing.assert_array_equal(preprocessed_data, np.stack([expected, expected]))
+
+
+@pytest.mark.parametrize('data, min_values, max_values, layout, expected', data_test_normalize_preprocessor)
 def test_normalize_preprocessor(
     data: npt.NDArray,
     min_values: list[float],
     max_values: list[float],
+    layout: DataLayout,
     expected: npt.NDArray[np.float32],
 ) -> None:
     preprocessed_data = normalize_preprocessor(
         data=data,
         min_values=min_values,
         max_values=max_values,
+        layout=layout,
     )
 
     np.testing.assert_array_equal(preprocessed_data, expected)
 
 
-@pytest.mark.parametrize('data, mean_values, std_values, expected', data_test_standardize_preprocessor)
+@pytest.mark.parametrize('data, mean_values, std_values, layout, expected', data_test_standardize_preprocessor)
 def test_standardize_preprocessor(
     data: npt.NDArray,
     mean_values: list[float],
     std_values: list[float],
+    layout: DataLayout,
     expected: npt.NDArray[np.float32],
 ) -> None:
     preprocessed_data = standardize_preprocessor(
         data=data,
         mean_values=mean_values,
         std_values=std_values,
+        layout=layout,
     )
 
     np.testing.assert_array_equal(preprocessed_data, expected)
 
 
-@pytest.mark.parametrize('data, expected', data_test_to_tensor_preprocessor)
+@pytest.mark.parametrize('data, layout, expected', data_test_to_tensor_preprocessor)
 def test_to_tensor_preprocessor(
     data: npt.NDArray[np.float32],
+    layout: DataLayout,
     expected: torch.Tensor,
 ) -> None:
     preprocessed_data = to_tensor_preprocessor(
         data=data,
+        layout=layout,
     )
 
     assert torch.equal(preprocessed_data, expected)
@@ -1,13 +1,22 @@
+import asyncio
 from unittest.mock import MagicMock
 
 import numpy as np
 import pytest
+import torch
 
 from aviary._functional.data.dataset import (
+    compute_transport_info,
     get_item,
+    get_items,
     get_length,
+    iter_items_async,
+    split_coordinates,
+)
+from aviary._functional.data.tests.data.data_test_dataset import (
+    data_test_get_length,
+    data_test_split_coordinates,
 )
-from aviary._functional.data.tests.data.data_test_dataset import data_test_get_length
 
 # noinspection PyProtectedMember
 from aviary._utils.types import CoordinatesSet
@@ -41,6 +50,103 @@ def test_get_item() -> None:
     assert data == (expected_data_preprocessor, -128, -128)
 
 
+def test_get_item_without_data_preprocessor() -> None:
+    data_fetcher = MagicMock(spec=DataFetcher)
+    expected_data_fetcher = 'expected_data_fetcher'
+    data_fetcher.return_value = expected_data_fetcher
+    coordinates = np.array([[-128, -128], [0, -128], [-128, 0], [0, 0]], dtype=np.int32)
+    data = get_item(
+        data_fetcher=data_fetcher,
+        data_preprocessor=None,
+        coordinates=coordinates,
+        index=3,
+    )
+
+    assert data == (expected_data_fetcher, 0, 0)
+
+
+def test_get_items() -> None:
+    data_fetcher = MagicMock(spec=DataFetcher)
+    data_fetcher.return_value = 'expected_data_fetcher'
+    data_preprocessor = MagicMock(spec=DataPreprocessor)
+    data_preprocessor.return_value = 'expected_data_preprocessor'
+    coordinates = np.array([[-128, -128], [0, -128], [-128, 0], [0, 0]], dtype=np.int32)
+    indices = [0, 3]
+    data = get_items(
+        data_fetcher=data_fetcher,
+        data_preprocessor=data_preprocessor,
+        coordinates=coordinates,
+        indices=indices,
+    )
+
+    assert data_fetcher.call_count == 2
+    assert data == [
+        ('expected_data_preprocessor', -128, -128),
+        ('expected_data_preprocessor', 0, 0),
+    ]
+
+
+def test_get_items_fetch_batch() -> None:
+    data_fetcher = MagicMock()
+    data_fetcher.fetch_batch.return_value = ['expected_data_fetcher_0', 'expected_data_fetcher_1']
+    data_preprocessor = MagicMock(spec=DataPreprocessor)
+    data_preprocessor.side_effect = lambda data: data
+    coordinates = np.array([[-128, -128], [0, -128], [-128, 0], [0, 0]], dtype=np.int32)
+    indices = [0, 3]
+    data = get_items(
+        data_fetcher=data_fetcher,
+        data_preprocessor=data_preprocessor,
+        coordinates=coordinates,
+        indices=indices,
+    )
+
+    data_fetcher.assert_not_called()
+    data_fetcher.fetch_batch.assert_called_once()
+    np.testing.assert_array_equal(
+        data_fetcher.fetch_batch.call_args.kwargs['coordinates'],
+        coordinates[indices],
+    )
+    assert data == [
+        ('expected_data_fetcher_0', -128, -128),
+        ('expected_data_fetcher_1', 0, 0),
+    ]
+
+
+def test_get_items_fetch_batch_without_data_preprocessor() -> None:
+    data_fetcher = MagicMock()
+    data_fetcher.fetch_batch.return_value = ['expected_data_fetcher_0', 'expected_data_fetcher_1']
+    coordinates = np.array([[-128, -128], [0, -128], [-128, 0], [0, 0]], dtype=np.int32)
+    data = get_items(
+        data_fetcher=data_fetcher,
+        data_preprocessor=None,
+        coordinates=coordinates,
+        indices=[0, 3],
+    )
+
+    assert data == [
+        ('expected_data_fetcher_0', -128, -128),
+        ('expected_data_fetcher_1', 0, 0),
+    ]
+
+
+def test_compute_transport_info() -> None:
+    data = np.zeros((8, 640, 640, 4), dtype=np.uint8)
+    dtype, batch_size_bytes = compute_transport_info(
+        data=data,
+    )
+
+    assert dtype == 'uint8'
+    assert batch_size_bytes == 8 * 640 * 640 * 4
+
+    data = torch.zeros((8, 4, 640, 640), dtype=torch.float32)
+    dtype, batch_size_bytes = compute_transport_info(
+        data=data,
+    )
+
+    assert dtype == 'float32'
+    assert batch_size_bytes == 8 * 640 * 640 * 4 * 4
+
+
 @pytest.mark.parametrize('coordinates, expected', data_test_get_length)
 def test_get_length(
     coordinates: CoordinatesSet,
@@ -51,3 +157,64 @@ def test_get_length(
     )
 
     assert length == expected
+
+
+def test_iter_items_async() -> None:
+    num_in_flight = 0
+    max_num_in_flight = 0
+
+    async def data_fetcher(
+        x_min: int,
+        y_min: int,
+    ) -> tuple[int, int]:
+        nonlocal num_in_flight, max_num_in_flight
+        num_in_flight += 1
+        max_num_in_flight = max(max_num_in_flight, num_in_flight)
+        await asyncio.sleep(.01 if x_min < 0 else .001)
+        num_in_flight -= 1
+        return x_min, y_min
+
+    data_preprocessor = MagicMock(spec=DataPreprocessor)
+    data_preprocessor.side_effect = lambda data: data
+    coordinates = np.array([[-128, -128], [0, -128], [-128, 0], [0, 0]], dtype=np.int32)
+    items = list(
+        iter_items_async(
+            data_fetcher=data_fetcher,
+            data_preprocessor=data_preprocessor,
+            coordinates=coordinates,
+            max_concurrency=4,
+        ),
+    )
+
+    assert items == [((x_min, y_min), x_min, y_min) for x_min, y_min in coordinates]
+    assert data_preprocessor.call_count == 4
+    assert max_num_in_flight == 4
+
+    max_num_in_flight = 0
+    items = list(
+        iter_items_async(
+            data_fetcher=data_fetcher,
+            data_preprocessor=data_preprocessor,
+            coordinates=coordinates,
+            max_concurrency=2,
+        ),
+    )
+
+    assert items == [((x_min, y_min), x_min, y_min) for x_min, y_min in coordinates]
+    assert max_num_in_flight == 2
+
+
+@pytest.mark.parametrize('coordinates, worker_id, num_workers, expected', data_test_split_coordinates)
+def test_split_coordinates(
+    coordinates: CoordinatesSet,
+    worker_id: int,
+    num_workers: int,
+    expected: CoordinatesSet,
+) -> None:
+    coordinates = split_coordinates(
+        coordinates=coordinates,
+        worker_id=worker_id,
+        num_workers=num_workers,
+    )
+
+    np.testing.assert_array_equal(coordinates, expected)
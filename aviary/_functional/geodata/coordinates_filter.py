@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING
 
 import geopandas as gpd
 import numpy as np
+import shapely
 from numpy import typing as npt
 
 # noinspection PyProtectedMember
@@ -12,6 +13,7 @@ from aviary._utils.exceptions import AviaryUserError
 if TYPE_CHECKING:
     # noinspection PyProtectedMember
     from aviary._utils.types import (
+        BufferSize,
         CoordinatesSet,
         EPSGCode,
         GeospatialFilterMode,
@@ -40,6 +42,42 @@ def composite_filter(
     return coordinates
 
 
+def data_availability_filter(
+    coordinates: CoordinatesSet,
+    tile_size: TileSize,
+    footprints: gpd.GeoDataFrame,
+    buffer_size: BufferSize = 0,
+) -> CoordinatesSet:
+    """Filters the coordinates based on the footprints of the sources.
+
+    The coordinates of tiles whose buffered tile does not overlap any footprint are removed
+    (i.e., tiles that only touch a footprint are removed as well).
+
+    Parameters:
+        coordinates: coordinates (x_min, y_min) of each tile
+        tile_size: tile size in meters
+        footprints: footprints of the sources
+        buffer_size: buffer size in meters (specifies the area around the tile that is additionally fetched)
+
+    Returns:
+        filtered coordinates (x_min, y_min) of each tile
+    """
+    tiles = shapely.box(
+        coordinates[:, 0] - buffer_size,
+        coordinates[:, 1] - buffer_size,
+        coordinates[:, 0] + tile_size + buffer_size,
+        coordinates[:, 1] + tile_size + buffer_size,
+    )
+    tile_indices, footprint_indices = footprints.sindex.query(tiles, predicate='intersects')
+    is_touching = shapely.touches(
+        tiles[tile_indices],
+        footprints.geometry.values[footprint_indices],
+    )
+    mask = np.zeros(len(coordinates), dtype=np.bool_)
+    mask[tile_indices[~is_touching]] = True
+    return coordinates[mask]
+
+
 def duplicates_filter(
     coordinates: CoordinatesSet,
 ) -> CoordinatesSet:
@@ -4,6 +4,64 @@ from shapely.geometry import box
 
 coordinates = np.array([[-128, -128], [0, -128], [-128, 0], [0, 0]], dtype=np.int32)
 
+data_test_data_availability_filter = [
+    # test case 1: footprints contains no polygons
+    (
+        coordinates,
+        128,
+        gpd.GeoDataFrame(
+            geometry=[],
+            crs='EPSG:25832',
+        ),
+        0,
+        np.empty(shape=(0, 2), dtype=np.int32),
+    ),
+    # test case 2: footprints contains a polygon that overlaps a tile
+    (
+        coordinates,
+        128,
+        gpd.GeoDataFrame(
+            geometry=[box(-96, -96, -32, -32)],
+            crs='EPSG:25832',
+        ),
+        0,
+        np.array([[-128, -128]], dtype=np.int32),
+    ),
+    # test case 3: footprints contains a polygon that only touches tiles
+    (
+        coordinates,
+        128,
+        gpd.GeoDataFrame(
+            geometry=[box(-256, -256, -128, -128)],
+            crs='EPSG:25832',
+        ),
+        0,
+        np.empty(shape=(0, 2), dtype=np.int32),
+    ),
+    # test case 4: footprints contains a polygon that overlaps a buffered tile
+    (
+        coordinates,
+        128,
+        gpd.GeoDataFrame(
+            geometry=[box(-256, -256, -128, -128)],
+            crs='EPSG:25832',
+        ),
+        32,
+        np.array([[-128, -128]], dtype=np.int32),
+    ),
+    # test case 5: footprints contains polygons that overlap and touch tiles
+    (
+        coordinates,
+        128,
+        gpd.GeoDataFrame(
+            geometry=[box(-128, 0, 0, 128), box(0, -256, 128, -128), box(64, 64, 96, 96)],
+            crs='EPSG:25832',
+        ),
+        0,
+        np.array([[-128, 0], [0, 0]], dtype=np.int32),
+    ),
+]
+
 data_test_duplicates_filter = [
     # test case 1: coordinates contains no duplicates
     (
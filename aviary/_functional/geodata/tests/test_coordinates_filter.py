@@ -12,6 +12,7 @@ from aviary._functional.geodata.coordinates_filter import (
     _set_filter_difference,
     _set_filter_intersection,
     _set_filter_union,
+    data_availability_filter,
     duplicates_filter,
     mask_filter,
     set_filter,
@@ -22,6 +23,7 @@ from aviary._functional.geodata.tests.data.data_test_coordinates_filter import (
     data_test__set_filter_difference,
     data_test__set_filter_intersection,
     data_test__set_filter_union,
+    data_test_data_availability_filter,
     data_test_duplicates_filter,
     data_test_mask_filter,
 )
@@ -31,8 +33,10 @@ from aviary._utils.exceptions import AviaryUserError
 
 # noinspection PyProtectedMember
 from aviary._utils.types import (
+    BufferSize,
     CoordinatesSet,
     SetFilterMode,
+    TileSize,
 )
 
 
@@ -41,6 +45,27 @@ def test_composite_filter() -> None:
     pass
 
 
+@pytest.mark.parametrize(
+    'coordinates, tile_size, footprints, buffer_size, expected',
+    data_test_data_availability_filter,
+)
+def test_data_availability_filter(
+    coordinates: CoordinatesSet,
+    tile_size: TileSize,
+    footprints: gpd.GeoDataFrame,
+    buffer_size: BufferSize,
+    expected: CoordinatesSet,
+) -> None:
+    filtered_coordinates = data_availability_filter(
+        coordinates=coordinates,
+        tile_size=tile_size,
+        footprints=footprints,
+        buffer_size=buffer_size,
+    )
+
+    np.testing.assert_array_equal(filtered_coordinates, expected)
+
+
 @pytest.mark.parametrize('coordinates, expected', data_test_duplicates_filter)
 def test_duplicates_filter(
     coordinates: CoordinatesSet,
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+
+# noinspection PyProtectedMember
+from aviary._utils.exceptions import AviaryUserError
+
+
+class ResponseCache:
+    """Least recently used cache of responses in memory
+
+    The cache stores the content of each response by a hashable key (e.g., the query parameters of the request).
+    If the size of the cache exceeds `size`, the least recently used responses are evicted.
+
+    Notes:
+        - The cache is thread-safe
+        - Each process has its own cache (the responses are not pickled, i.e., each worker of the dataloader
+          starts with an empty cache)
+    """
+
+    def __init__(
+        self,
+        size: int,
+    ) -> None:
+        """
+        Parameters:
+            size: size of the cache in bytes
+
+        Raises:
+            AviaryUserError: Invalid size (`size` is not positive)
+        """
+        if size <= 0:
+            message = (
+                'Invalid size! '
+                'size must be positive.'
+            )
+            raise AviaryUserError(message)
+
+        self.size = size
+
+        self._responses = OrderedDict()
+        self._current_size = 0
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict:
+        """Returns the state without the responses and the lock.
+
+        Returns:
+            state
+        """
+        return {
+            'size': self.size,
+        }
+
+    def __setstate__(
+        self,
+        state: dict,
+    ) -> None:
+        """Restores the state with an empty cache.
+
+        Parameters:
+            state: state
+        """
+        self.__init__(
+            size=state['size'],
+        )
+
+    def __len__(self) -> int:
+        """Computes the number of responses.
+
+        Returns:
+            number of responses
+        """
+        return len(self._responses)
+
+    def get(
+        self,
+        key: Hashable,
+    ) -> bytes | None:
+        """Returns the content of the response.
+
+        Parameters:
+            key: key
+
+        Returns:
+            content of the response or None if the response is not cached
+        """
+        with self._lock:
+            content = self._responses.get(key)
+
+            if content is not None:
+                self._responses.move_to_end(key)
+
+            return content
+
+    def put(
+        self,
+        key: Hashable,
+        content: bytes,
+    ) -> None:
+        """Stores the content of the response.
+
+        The content is not stored if it exceeds the size of the cache.
+
+        Parameters:
+            key: key
+            content: content of the response
+        """
+        if len(content) > self.size:
+            return
+
+        with self._lock:
+            previous_content = self._responses.pop(key, None)
+
+            if previous_content is not None:
+                self._current_size -= len(previous_content)
+
+            self._responses[key] = content
+            self._current_size += len(content)
+
+            while self._current_size > self.size:
+                _, evicted_content = self._responses.popitem(last=False)
+                self._current_size -= len(evicted_content)
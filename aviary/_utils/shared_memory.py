@@ -0,0 +1,353 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+import numpy.typing as npt
+
+# noinspection PyProtectedMember
+from aviary._utils.exceptions import AviaryUserError
+
+
+class SharedMemoryCache:
+    """Least recently used cache of arrays in shared memory
+
+    The cache consists of a fixed number of slots of the same shape and data type that are stored
+    in a single block of shared memory, so that processes (e.g., the workers of the dataloader) can reuse
+    each other's entries.
+    Each slot is identified by a key of two integers.
+    If all slots are occupied, the least recently used slot is overwritten.
+
+    Notes:
+        - The cache must be created in the main process before the workers are started
+        - The cache is passed to the workers by pickling (the block of shared memory is attached, not copied)
+        - The process that created the cache must call `close` to release the block of shared memory
+    """
+
+    def __init__(
+        self,
+        size: int,
+        shape: tuple[int, ...],
+        dtype: npt.DTypeLike,
+    ) -> None:
+        """
+        Parameters:
+            size: size of the cache in bytes
+            shape: shape of each slot
+            dtype: data type of each slot
+
+        Raises:
+            AviaryUserError: Invalid size (`size` is less than the size of a slot)
+        """
+        self.size = size
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+
+        slot_size = int(np.prod(self.shape)) * self.dtype.itemsize
+        self.num_slots = self.size // slot_size
+
+        if self.num_slots < 1:
+            message = (
+                'Invalid size! '
+                f'size must be at least the size of a slot ({slot_size} bytes).'
+            )
+            raise AviaryUserError(message)
+
+        self._shared_memory = SharedMemory(
+            create=True,
+            size=self._compute_shared_memory_size(),
+        )
+        self._lock = multiprocessing.Lock()
+        self._owner_pid = os.getpid()
+        self._init_views()
+        self._valid[:] = False
+        self._ticks[:] = 0
+
+    def _compute_shared_memory_size(self) -> int:
+        """Computes the size of the block of shared memory.
+
+        Returns:
+            size of the block of shared memory in bytes
+        """
+        header_size = self.num_slots * (2 * 8 + 8 + 1) + 8
+        header_size += -header_size % self.dtype.itemsize
+        return header_size + self.num_slots * int(np.prod(self.shape)) * self.dtype.itemsize
+
+    def _init_views(self) -> None:
+        """Initializes the views of the block of shared memory."""
+        buffer = self._shared_memory.buf
+        offset = 0
+        self._keys = np.ndarray((self.num_slots, 2), dtype=np.int64, buffer=buffer, offset=offset)
+        offset += self._keys.nbytes
+        self._ticks = np.ndarray((self.num_slots,), dtype=np.int64, buffer=buffer, offset=offset)
+        offset += self._ticks.nbytes
+        self._tick = np.ndarray((1,), dtype=np.int64, buffer=buffer, offset=offset)
+        offset += self._tick.nbytes
+        self._valid = np.ndarray((self.num_slots,), dtype=np.bool_, buffer=buffer, offset=offset)
+        offset += self._valid.nbytes
+        offset += -offset % self.dtype.itemsize
+        self._slots = np.ndarray((self.num_slots, *self.shape), dtype=self.dtype, buffer=buffer, offset=offset)
+
+    def __getstate__(self) -> dict:
+        """Returns the state without the views of the block of shared memory.
+
+        Returns:
+            state
+        """
+        return {
+            'size': self.size,
+            'shape': self.shape,
+            'dtype': self.dtype,
+            'num_slots': self.num_slots,
+            'name': self._shared_memory.name,
+            'lock': self._lock,
+        }
+
+    def __setstate__(
+        self,
+        state: dict,
+    ) -> None:
+        """Attaches the block of shared memory.
+
+        Parameters:
+            state: state
+        """
+        self.size = state['size']
+        self.shape = state['shape']
+        self.dtype = state['dtype']
+        self.num_slots = state['num_slots']
+        self._shared_memory = SharedMemory(
+            name=state['name'],
+        )
+        self._lock = state['lock']
+        self._owner_pid = None
+        self._init_views()
+
+    def _find_slot(
+        self,
+        key: tuple[int, int],
+    ) -> int | None:
+        """Finds the slot of the key.
+
+        Parameters:
+            key: key
+
+        Returns:
+            index of the slot or None if the key is not cached
+        """
+        mask = self._valid & (self._keys[:, 0] == key[0]) & (self._keys[:, 1] == key[1])
+        indices = np.flatnonzero(mask)
+
+        if len(indices) == 0:
+            return None
+
+        return int(indices[0])
+
+    def get(
+        self,
+        key: tuple[int, int],
+        out: npt.NDArray,
+        index: tuple[slice, ...] = (),
+    ) -> bool:
+        """Copies the cached array (or a part of it) into the output array.
+
+        Parameters:
+            key: key
+            out: output array
+            index: index of the part of the cached array
+
+        Returns:
+            True if the key is cached
+        """
+        with self._lock:
+            slot = self._find_slot(key)
+
+            if slot is None:
+                return False
+
+            self._tick[0] += 1
+            self._ticks[slot] = self._tick[0]
+            out[...] = self._slots[slot][index]
+
+        return True
+
+    def put(
+        self,
+        key: tuple[int, int],
+        data: npt.NDArray,
+    ) -> None:
+        """Caches the array.
+
+        If all slots are occupied, the least recently used slot is overwritten.
+
+        Parameters:
+            key: key
+            data: array of the shape and data type of a slot
+        """
+        with self._lock:
+            slot = self._find_slot(key)
+
+            if slot is None:
+                invalid_slots = np.flatnonzero(~self._valid)
+                slot = int(invalid_slots[0]) if len(invalid_slots) else int(np.argmin(self._ticks))
+
+            self._valid[slot] = False
+            self._slots[slot] = data
+            self._keys[slot] = key
+            self._tick[0] += 1
+            self._ticks[slot] = self._tick[0]
+            self._valid[slot] = True
+
+    def close(self) -> None:
+        """Detaches the block of shared memory and releases it if the current process created the cache."""
+        self._keys = None
+        self._ticks = None
+        self._tick = None
+        self._valid = None
+        self._slots = None
+        self._shared_memory.close()
+
+        if self._owner_pid == os.getpid():
+            self._shared_memory.unlink()
+
+
+class SharedArray:
+    """Array in shared memory
+
+    The data is copied once into a block of shared memory, so that processes (e.g., the workers
+    of the dataloader) read the same data instead of a copy of it.
+
+    Notes:
+        - The shared array must be created in the main process before the workers are started
+        - The shared array is passed to the workers by pickling (the block of shared memory is attached,
+          not copied)
+        - The process that created the shared array must call `close` to release the block of shared memory
+        - The block of shared memory is mapped as long as the array or any view of it is referenced,
+          i.e., views of the array remain valid after `close`
+    """
+
+    def __init__(
+        self,
+        data: npt.NDArray,
+    ) -> None:
+        """
+        Parameters:
+            data: data
+        """
+        self.shape = data.shape
+        self.dtype = data.dtype
+
+        self._shared_memory = SharedMemory(
+            create=True,
+            size=max(data.nbytes, 1),
+        )
+        self._owner_pid = os.getpid()
+        self._init_view()
+        self.array[...] = data
+
+    @classmethod
+    def empty(
+        cls,
+        shape: tuple[int, ...],
+        dtype: npt.DTypeLike,
+    ) -> SharedArray:
+        """Creates a shared array without initializing its data (e.g., to preallocate buffers).
+
+        Parameters:
+            shape: shape
+            dtype: data type
+
+        Returns:
+            shared array
+        """
+        shared_array = cls.__new__(cls)
+        shared_array.shape = tuple(shape)
+        shared_array.dtype = np.dtype(dtype)
+        shared_array._shared_memory = SharedMemory(
+            create=True,
+            size=max(int(np.prod(shared_array.shape)) * shared_array.dtype.itemsize, 1),
+        )
+        shared_array._owner_pid = os.getpid()
+        shared_array._init_view()
+        return shared_array
+
+    def _init_view(self) -> None:
+        """Initializes the view of the block of shared memory."""
+        self.array = np.asarray(
+            _SharedMemoryView(
+                shared_memory=self._shared_memory,
+                shape=self.shape,
+                dtype=self.dtype,
+            ),
+        )
+
+    def __getstate__(self) -> dict:
+        """Returns the state without the view of the block of shared memory.
+
+        Returns:
+            state
+        """
+        return {
+            'shape': self.shape,
+            'dtype': self.dtype,
+            'name': self._shared_memory.name,
+        }
+
+    def __setstate__(
+        self,
+        state: dict,
+    ) -> None:
+        """Attaches the block of shared memory.
+
+        Parameters:
+            state: state
+        """
+        self.shape = state['shape']
+        self.dtype = state['dtype']
+        self._shared_memory = SharedMemory(
+            name=state['name'],
+        )
+        self._owner_pid = None
+        self._init_view()
+
+    def close(self) -> None:
+        """Detaches the block of shared memory and releases it if the current process created the shared array.
+
+        The block of shared memory is unmapped once the array and all views of it are garbage collected.
+        """
+        self.array = None
+
+        if self._owner_pid == os.getpid():
+            self._shared_memory.unlink()
+            self._owner_pid = None
+
+
+class _SharedMemoryView:
+    """View of a block of shared memory that keeps the block of shared memory mapped
+
+    Arrays created from the view reference it as their base, so the block of shared memory is not unmapped
+    (i.e., by garbage collection of the `SharedMemory` object) as long as an array references it.
+    """
+
+    def __init__(
+        self,
+        shared_memory: SharedMemory,
+        shape: tuple[int, ...],
+        dtype: np.dtype,
+    ) -> None:
+        """
+        Parameters:
+            shared_memory: block of shared memory
+            shape: shape
+            dtype: data type
+        """
+        self.shared_memory = shared_memory
+        address = np.frombuffer(shared_memory.buf, dtype=np.uint8).ctypes.data
+        self.__array_interface__ = {
+            'shape': tuple(shape),
+            'typestr': np.dtype(dtype).str,
+            'data': (address, False),
+            'version': 3,
+        }
@@ -0,0 +1,72 @@
+import pickle
+
+import pytest
+
+from aviary._utils.exceptions import AviaryUserError
+from aviary._utils.response_cache import ResponseCache
+
+
+def test_response_cache_init() -> None:
+    size = 1000
+    response_cache = ResponseCache(
+        size=size,
+    )
+
+    assert response_cache.size == size
+    assert len(response_cache) == 0
+
+
+def test_response_cache_init_exceptions() -> None:
+    message = 'Invalid size!'
+
+    with pytest.raises(AviaryUserError, match=message):
+        _ = ResponseCache(
+            size=0,
+        )
+
+
+def test_response_cache_get_put() -> None:
+    response_cache = ResponseCache(
+        size=1000,
+    )
+
+    assert response_cache.get(key=('test', 0)) is None
+
+    response_cache.put(key=('test', 0), content=b'test')
+
+    assert response_cache.get(key=('test', 0)) == b'test'
+
+    response_cache.put(key=('test', 1), content=bytes(1001))
+
+    assert response_cache.get(key=('test', 1)) is None
+    assert len(response_cache) == 1
+
+
+def test_response_cache_put_lru() -> None:
+    response_cache = ResponseCache(
+        size=8,
+    )
+    response_cache.put(key=0, content=b'test')
+    response_cache.put(key=1, content=b'test')
+    response_cache.get(key=0)
+    response_cache.put(key=2, content=b'test')
+
+    assert response_cache.get(key=0) == b'test'
+    assert response_cache.get(key=1) is None
+    assert response_cache.get(key=2) == b'test'
+
+    response_cache.put(key=2, content=b'tests')
+
+    assert response_cache.get(key=0) is None
+    assert response_cache.get(key=2) == b'tests'
+
+
+def test_response_cache_pickle() -> None:
+    response_cache = ResponseCache(
+        size=1000,
+    )
+    response_cache.put(key=0, content=b'test')
+    response_cache_ = pickle.loads(pickle.dumps(response_cache))
+
+    assert response_cache_.size == response_cache.size
+    assert len(response_cache_) == 0
@@ -0,0 +1,170 @@
+import numpy as np
+import pytest
+
+from aviary._utils.exceptions import AviaryUserError
+from aviary._utils.shared_memory import (
+    SharedArray,
+    SharedMemoryCache,
+)
+
+
+def test_shared_memory_cache_init() -> None:
+    size = 1000
+    shape = (3, 8, 8)
+    dtype = np.uint8
+    shared_memory_cache = SharedMemoryCache(
+        size=size,
+        shape=shape,
+        dtype=dtype,
+    )
+
+    assert shared_memory_cache.size == size
+    assert shared_memory_cache.shape == shape
+    assert shared_memory_cache.dtype == np.dtype(dtype)
+    assert shared_memory_cache.num_slots == 5
+
+    shared_memory_cache.close()
+
+
+def test_shared_memory_cache_init_exceptions() -> None:
+    message = 'Invalid size!'
+
+    with pytest.raises(AviaryUserError, match=message):
+        _ = SharedMemoryCache(
+            size=100,
+            shape=(3, 8, 8),
+            dtype=np.uint8,
+        )
+
+
+def test_shared_memory_cache_get_put() -> None:
+    shared_memory_cache = SharedMemoryCache(
+        size=3 * 8 * 8,
+        shape=(3, 8, 8),
+        dtype=np.uint8,
+    )
+    data = np.arange(3 * 8 * 8, dtype=np.uint8).reshape(3, 8, 8)
+    out = np.zeros((3, 4, 4), dtype=np.uint8)
+
+    assert not shared_memory_cache.get(key=(0, 0), out=out, index=(slice(None), slice(0, 4), slice(0, 4)))
+
+    shared_memory_cache.put(key=(0, 0), data=data)
+
+    assert shared_memory_cache.get(key=(0, 0), out=out, index=(slice(None), slice(0, 4), slice(0, 4)))
+    np.testing.assert_array_equal(out, data[:, :4, :4])
+
+    shared_memory_cache.close()
+
+
+def test_shared_memory_cache_put_lru() -> None:
+    shared_memory_cache = SharedMemoryCache(
+        size=2 * 3 * 8 * 8,
+        shape=(3, 8, 8),
+        dtype=np.uint8,
+    )
+    data = np.ones((3, 8, 8), dtype=np.uint8)
+    out = np.zeros((3, 8, 8), dtype=np.uint8)
+
+    shared_memory_cache.put(key=(0, 0), data=data)
+    shared_memory_cache.put(key=(0, 1), data=data * 2)
+    _ = shared_memory_cache.get(key=(0, 0), out=out)
+    shared_memory_cache.put(key=(1, 0), data=data * 3)
+
+    assert shared_memory_cache.get(key=(0, 0), out=out)
+    np.testing.assert_array_equal(out, data)
+    assert not shared_memory_cache.get(key=(0, 1), out=out)
+    assert shared_memory_cache.get(key=(1, 0), out=out)
+    np.testing.assert_array_equal(out, data * 3)
+
+    shared_memory_cache.close()
+
+
+def test_shared_memory_cache_getstate_setstate() -> None:
+    shared_memory_cache = SharedMemoryCache(
+        size=3 * 8 * 8,
+        shape=(3, 8, 8),
+        dtype=np.uint8,
+    )
+    data = np.ones((3, 8, 8), dtype=np.uint8)
+    out = np.zeros((3, 8, 8), dtype=np.uint8)
+    shared_memory_cache.put(key=(0, 0), data=data)
+
+    state = shared_memory_cache.__getstate__()
+    attached_shared_memory_cache = SharedMemoryCache.__new__(SharedMemoryCache)
+    attached_shared_memory_cache.__setstate__(state)
+
+    assert 'name' in state
+    assert attached_shared_memory_cache.get(key=(0, 0), out=out)
+    np.testing.assert_array_equal(out, data)
+
+    attached_shared_memory_cache.close()
+    shared_memory_cache.close()
+
+
+def test_shared_array_init() -> None:
+    data = np.arange(3 * 8 * 8, dtype=np.uint8).reshape(3, 8, 8)
+    shared_array = SharedArray(
+        data=data,
+    )
+
+    assert shared_array.shape == data.shape
+    assert shared_array.dtype == data.dtype
+    assert not np.shares_memory(shared_array.array, data)
+    np.testing.assert_array_equal(shared_array.array, data)
+
+    shared_array.close()
+
+    assert shared_array.array is None
+
+
+def test_shared_array_empty() -> None:
+    shape = (2, 3, 8, 8)
+    dtype = np.uint16
+    shared_array = SharedArray.empty(
+        shape=shape,
+        dtype=dtype,
+    )
+
+    assert shared_array.shape == shape
+    assert shared_array.dtype == np.dtype(dtype)
+    assert shared_array.array.shape == shape
+    assert shared_array.array.dtype == np.dtype(dtype)
+
+    shared_array.close()
+
+    assert shared_array.array is None
+
+
+def test_shared_array_close_views() -> None:
+    data = np.arange(3 * 8 * 8, dtype=np.uint8).reshape(3, 8, 8)
+    shared_array = SharedArray(
+        data=data,
+    )
+    view = shared_array.array[1:]
+
+    shared_array.close()
+    shared_array.close()
+
+    assert shared_array.array is None
+    np.testing.assert_array_equal(view, data[1:])
+
+
+def test_shared_array_getstate_setstate() -> None:
+    data = np.arange(3 * 8 * 8, dtype=np.uint8).reshape(3, 8, 8)
+    shared_array = SharedArray(
+        data=data,
+    )
+
+    state = shared_array.__getstate__()
+    attached_shared_array = SharedArray.__new__(SharedArray)
+    attached_shared_array.__setstate__(state)
+
+    assert 'name' in state
+    np.testing.assert_array_equal(attached_shared_array.array, data)
+
+    shared_array.array[0] = 0
+
+    np.testing.assert_array_equal(attached_shared_array.array[0], 0)
+
+    attached_shared_array.close()
+    shared_array.close()
@@ -1,3 +1,6 @@
+from pathlib import Path
+from unittest.mock import patch
+
 import geopandas as gpd
 import geopandas.testing
 import numpy as np
@@ -21,9 +24,13 @@ from aviary._utils.types import (
     BufferSize,
     Coordinate,
     CoordinatesSet,
+    DataFetcherInfo,
     DType,
+    GDALConfig,
+    GDALConfigPreset,
     InterpolationMode,
     ProcessArea,
+    ProcessAreaConfig,
 )
 
 
@@ -229,8 +236,45 @@ def test_bounding_box_to_gdf(
 
 def test_dtype_from_rio() -> None:
     assert DType.from_rio(rio.dtypes.bool_) == DType.BOOL
+    assert DType.from_rio('float16') == DType.FLOAT16
     assert DType.from_rio(rio.dtypes.float32) == DType.FLOAT32
+    assert DType.from_rio(rio.dtypes.int16) == DType.INT16
     assert DType.from_rio(rio.dtypes.uint8) == DType.UINT8
+    assert DType.from_rio(rio.dtypes.uint16) == DType.UINT16
+
+
+def test_dtype_from_rio_exceptions() -> None:
+    message = 'Invalid dtype!'
+
+    with pytest.raises(AviaryUserError, match=message):
+        _ = DType.from_rio(rio.dtypes.float64)
+
+
+def test_gdal_config_from_preset() -> None:
+    gdal_config = GDALConfig.from_preset(GDALConfigPreset.DEFAULT)
+
+    assert gdal_config == GDALConfig()
+
+    gdal_config = GDALConfig.from_preset(GDALConfigPreset.LARGE_VRT)
+
+    assert gdal_config.cache_max == 1024
+    assert gdal_config.disable_readdir_on_open == 'EMPTY_DIR'
+
+
+def test_gdal_config_to_rio() -> None:
+    gdal_config = GDALConfig(
+        cache_max=512,
+        vsi_cache=True,
+        num_threads='ALL_CPUS',
+    )
+    expected = {
+        'GDAL_CACHEMAX': 512,
+        'VSI_CACHE': True,
+        'GDAL_NUM_THREADS': 'ALL_CPUS',
+    }
+
+    assert gdal_config.to_rio() == expected
+    assert GDALConfig().to_rio() == {}
 
 
 def test_interpolation_mode_to_rio() -> None:
@@ -331,6 +375,74 @@ def test_process_area_from_gdf() -> None:
     np.testing.assert_array_equal(process_area.coordinates, expected)
 
 
+@patch('aviary._functional.data.data_fetcher.vrt_data_fetcher_info')
+def test_process_area_from_vrt(
+    mocked_vrt_data_fetcher_info,
+) -> None:
+    path = Path('test/test.vrt')
+    mocked_vrt_data_fetcher_info.return_value = DataFetcherInfo(
+        bounding_box=BoundingBox(
+            x_min=-128,
+            y_min=-128,
+            x_max=128,
+            y_max=128,
+        ),
+        dtype=[DType.UINT8, DType.UINT8, DType.UINT8],
+        epsg_code=25832,
+        ground_sampling_distance=.2,
+        num_channels=3,
+    )
+    tile_size = 128
+    quantize = True
+    process_area = ProcessArea.from_vrt(
+        path=path,
+        tile_size=tile_size,
+        quantize=quantize,
+        cache_info=False,
+    )
+    expected = np.array([[-128, -128], [0, -128], [-128, 0], [0, 0]], dtype=np.int32)
+
+    mocked_vrt_data_fetcher_info.assert_called_once_with(
+        path=path,
+        cache_path=None,
+    )
+    np.testing.assert_array_equal(process_area.coordinates, expected)
+
+
+@patch('aviary._functional.data.data_fetcher.vrt_data_fetcher_info')
+def test_process_area_from_config_vrt(
+    mocked_vrt_data_fetcher_info,
+    tmp_path: Path,
+) -> None:
+    path = Path('test/test.vrt')
+    mocked_vrt_data_fetcher_info.return_value = DataFetcherInfo(
+        bounding_box=BoundingBox(
+            x_min=-128,
+            y_min=-128,
+            x_max=128,
+            y_max=128,
+        ),
+        dtype=[DType.UINT8, DType.UINT8, DType.UINT8],
+        epsg_code=25832,
+        ground_sampling_distance=.2,
+        num_channels=3,
+    )
+    process_area_config = ProcessAreaConfig(
+        vrt=path,
+        tile_size=128,
+        cache_info=True,
+        info_cache_path=tmp_path,
+    )
+    process_area = ProcessArea.from_config(process_area_config)
+    expected = np.array([[-128, -128], [0, -128], [-128, 0], [0, 0]], dtype=np.int32)
+
+    mocked_vrt_data_fetcher_info.assert_called_once_with(
+        path=path,
+        cache_path=tmp_path,
+    )
+    np.testing.assert_array_equal(process_area.coordinates, expected)
+
+
 def test_process_area_from_json() -> None:
     json_string = '[[-128, -128], [0, -128], [-128, 0], [0, 0]]'
     process_area = ProcessArea.from_json(
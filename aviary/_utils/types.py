@@ -375,12 +375,41 @@ class DataFetcherInfo:
         epsg_code: EPSG code
         ground_sampling_distance: ground sampling distance in meters
         num_channels: number of channels
+        overview_factors: decimation factor of each overview level
+        overview_level: overview level that is read (if None, the full resolution is read)
+        indexes: band indices that are read (1-based) (if None, all bands are read)
+        block_shape: block shape (height, width) of the first band
     """
     bounding_box: BoundingBox
     dtype: list[DType]
     epsg_code: EPSGCode
     ground_sampling_distance: GroundSamplingDistance
     num_channels: int
+    overview_factors: tuple[int, ...] = ()
+    overview_level: int | None = None
+    indexes: list[int] | None = None
+    block_shape: tuple[int, int] | None = None
+
+    @property
+    def num_effective_channels(self) -> int:
+        """
+        Returns:
+            number of channels that are read
+        """
+        if self.indexes is None:
+            return self.num_channels
+
+        return len(self.indexes)
+
+
+class DataLayout(Enum):
+    """
+    Attributes:
+        CHANNELS_FIRST: channels-first layout (channels, height, width)
+        CHANNELS_LAST: channels-last layout (height, width, channels)
+    """
+    CHANNELS_FIRST = 'channels_first'
+    CHANNELS_LAST = 'channels_last'
 
 
 class Device(Enum):
@@ -397,12 +426,18 @@ class DType(Enum):
     """
     Attributes:
         BOOL: boolean data type
+        FLOAT16: 16-bit floating point data type
         FLOAT32: 32-bit floating point data type
+        INT16: 16-bit signed integer data type
         UINT8: 8-bit unsigned integer data type
+        UINT16: 16-bit unsigned integer data type
     """
     BOOL = np.bool_
+    FLOAT16 = np.float16
     FLOAT32 = np.float32
+    INT16 = np.int16
     UINT8 = np.uint8
+    UINT16 = np.uint16
 
     @classmethod
     def from_rio(
@@ -416,15 +451,116 @@ class DType(Enum):
 
         Returns:
             data type
+
+        Raises:
+            AviaryUserError: Invalid dtype (`dtype` is not supported)
         """
         mapping = {
             rio.dtypes.bool_: DType.BOOL,
+            'float16': DType.FLOAT16,
             rio.dtypes.float32: DType.FLOAT32,
+            rio.dtypes.int16: DType.INT16,
             rio.dtypes.uint8: DType.UINT8,
+            rio.dtypes.uint16: DType.UINT16,
         }
+
+        if dtype not in mapping:
+            message = (
+                'Invalid dtype! '
+                f'dtype must be one of {", ".join(mapping)}.'
+            )
+            raise AviaryUserError(message)
+
         return mapping[dtype]
 
 
+class GDALConfig(pydantic.BaseModel):
+    """Configuration of the GDAL environment
+
+    The options are applied with `rasterio.Env` around each read (i.e., inside each worker of the dataloader).
+    Options that are None are not set, i.e., GDAL's defaults are used.
+
+    Attributes:
+        cache_max: size of the block cache in megabytes (`GDAL_CACHEMAX`)
+        vsi_cache: if True, the cache of the virtual file system is enabled (`VSI_CACHE`)
+        vsi_cache_size: size of the cache of the virtual file system per file in bytes (`VSI_CACHE_SIZE`)
+        num_threads: number of threads for decompression ('ALL_CPUS' or number of threads) (`GDAL_NUM_THREADS`)
+        disable_readdir_on_open: directory listing on open ('EMPTY_DIR', 'TRUE' or 'FALSE')
+            (`GDAL_DISABLE_READDIR_ON_OPEN`)
+        max_dataset_pool_size: maximum number of sources of the virtual raster that are opened at once
+            (`GDAL_MAX_DATASET_POOL_SIZE`)
+    """
+    cache_max: int | None = None
+    vsi_cache: bool | None = None
+    vsi_cache_size: int | None = None
+    num_threads: int | str | None = None
+    disable_readdir_on_open: str | None = None
+    max_dataset_pool_size: int | None = None
+
+    @classmethod
+    def from_preset(
+        cls,
+        preset: GDALConfigPreset,
+    ) -> GDALConfig:
+        """Creates a GDAL configuration from the preset.
+
+        Parameters:
+            preset: GDAL configuration preset (`DEFAULT` or `LARGE_VRT`)
+
+        Returns:
+            GDAL configuration
+
+        Raises:
+            AviaryUserError: Invalid GDAL configuration preset
+        """
+        if preset == GDALConfigPreset.DEFAULT:
+            return cls()
+
+        if preset == GDALConfigPreset.LARGE_VRT:
+            return cls(
+                cache_max=1024,
+                vsi_cache=True,
+                vsi_cache_size=25_000_000,
+                num_threads='ALL_CPUS',
+                disable_readdir_on_open='EMPTY_DIR',
+                max_dataset_pool_size=1000,
+            )
+
+        message = 'Invalid GDAL configuration preset!'
+        raise AviaryUserError(message)
+
+    def to_rio(self) -> dict[str, bool | int | str]:
+        """Converts the GDAL configuration to the rasterio environment options.
+
+        Returns:
+            rasterio environment options
+        """
+        mapping = {
+            'GDAL_CACHEMAX': self.cache_max,
+            'VSI_CACHE': self.vsi_cache,
+            'VSI_CACHE_SIZE': self.vsi_cache_size,
+            'GDAL_NUM_THREADS': self.num_threads,
+            'GDAL_DISABLE_READDIR_ON_OPEN': self.disable_readdir_on_open,
+            'GDAL_MAX_DATASET_POOL_SIZE': self.max_dataset_pool_size,
+        }
+        return {
+            key: value
+            for key, value in mapping.items()
+            if value is not None
+        }
+
+
+class GDALConfigPreset(Enum):
+    """
+    Attributes:
+        DEFAULT: GDAL's defaults
+        LARGE_VRT: preset for large virtual rasters (large block cache, VSI cache, multithreaded decompression,
+            no directory listing on open and a large pool of opened sources)
+    """
+    DEFAULT = 'default'
+    LARGE_VRT = 'large_vrt'
+
+
 class GeospatialFilterMode(Enum):
     """
     Attributes:
@@ -609,6 +745,47 @@ class ProcessArea(Iterable[Coordinates]):
             coordinates=coordinates,
         )
 
+    @classmethod
+    def from_vrt(
+        cls,
+        path: Path,
+        tile_size: TileSize,
+        quantize: bool = True,
+        cache_info: bool = False,
+        info_cache_path: Path | None = None,
+    ) -> ProcessArea:
+        """Creates a process area from the bounding box of a virtual raster.
+
+        Parameters:
+            path: path to the virtual raster (.vrt file)
+            tile_size: tile size in meters
+            quantize: if True, the bounding box is quantized to `tile_size`
+            cache_info: if True, the metadata of the virtual raster is cached
+            info_cache_path: path to the cache directory of the metadata (if None, the user cache directory
+                is used)
+
+        Returns:
+            process area
+        """
+        # noinspection PyProtectedMember
+        from aviary._functional.data.data_fetcher import (
+            get_default_cache_path,
+            vrt_data_fetcher_info,
+        )
+
+        if cache_info and info_cache_path is None:
+            info_cache_path = get_default_cache_path()
+
+        data_fetcher_info = vrt_data_fetcher_info(
+            path=path,
+            cache_path=info_cache_path if cache_info else None,
+        )
+        return cls.from_bounding_box(
+            bounding_box=data_fetcher_info.bounding_box,
+            tile_size=tile_size,
+            quantize=quantize,
+        )
+
     @classmethod
     def from_config(
         cls,
@@ -641,6 +818,15 @@ class ProcessArea(Iterable[Coordinates]):
                 quantize=config.quantize,
             )
 
+        if config.vrt is not None:
+            return cls.from_vrt(
+                path=config.vrt,
+                tile_size=config.tile_size,
+                quantize=config.quantize,
+                cache_info=config.cache_info,
+                info_cache_path=config.info_cache_path,
+            )
+
     def __len__(self) -> int:
         """Computes the number of coordinates.
 
@@ -842,19 +1028,26 @@ class ProcessAreaConfig(pydantic.BaseModel):
         - `json_string`
         - `gdf` and `tile_size` (optional: `quantize`)
         - `bounding_box` and `tile_size` (optional: `quantize`)
+        - `vrt` and `tile_size` (optional: `quantize`, `cache_info` and `info_cache_path`)
 
     Attributes:
         bounding_box: bounding box
         gdf: path to the geodataframe
         json_string: path to the JSON file
+        vrt: path to the virtual raster (.vrt file)
         tile_size: tile size in meters
         quantize: if True, the bounding box is quantized to `tile_size`
+        cache_info: if True, the metadata of the virtual raster is cached
+        info_cache_path: path to the cache directory of the metadata (if None, the user cache directory is used)
     """
     bounding_box: list[Coordinate] | None = None
     gdf: Path | None = None
     json_string: Path | None = None
+    vrt: Path | None = None
     tile_size: TileSize | None = None
     quantize: bool = True
+    cache_info: bool = False
+    info_cache_path: Path | None = None
 
     # noinspection PyNestedDecorators
     @pydantic.field_validator('bounding_box')
@@ -906,13 +1099,15 @@ class ProcessAreaConfig(pydantic.BaseModel):
             self.json_string is not None,
             self.gdf is not None and self.tile_size is not None,
             self.bounding_box is not None and self.tile_size is not None,
+            self.vrt is not None and self.tile_size is not None,
         ]
 
         if any(conditions) is False:
             message = (
                 'Invalid configuration! '
                 'config must have one of the following field sets: '
-                'json_string, gdf and tile_size (optional: quantize), bounding_box and tile_size (optional: quantize)'
+                'json_string, gdf and tile_size (optional: quantize), bounding_box and tile_size (optional: quantize), '
+                'vrt and tile_size (optional: quantize, cache_info and info_cache_path)'
             )
             raise ValueError(message)
 
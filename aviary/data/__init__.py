@@ -1,8 +1,25 @@
 from .data_fetcher import (
+    ArrayDataFetcher,
+    AsyncDataFetcher,
+    CachedDataFetcher,
     DataFetcher,
+    DataFetcherConfig,
+    ExecutorDataFetcher,
+    IndexedGeoTIFFDataFetcher,
+    IndexedGeoTIFFDataFetcherConfig,
+    MemmapDataFetcher,
+    MemmapDataFetcherConfig,
+    PrefetchDataFetcher,
+    StackedDataFetcher,
+    StackedDataFetcherConfig,
     VRTDataFetcher,
     VRTDataFetcherConfig,
+    WarpedVRTDataFetcher,
+    WarpedVRTDataFetcherConfig,
+    WMSDataFetcher,
+    WMSDataFetcherConfig,
 )
+from .data_loader import SharedMemoryDataLoader
 from .data_preprocessor import (
     CompositePreprocessor,
     CompositePreprocessorConfig,
@@ -15,21 +32,42 @@ from .data_preprocessor import (
     ToTensorPreprocessor,
     ToTensorPreprocessorConfig,
 )
-from .dataset import Dataset
+from .dataset import (
+    AsyncDataset,
+    Dataset,
+)
 
 __all__ = [
+    'ArrayDataFetcher',
+    'AsyncDataFetcher',
+    'AsyncDataset',
+    'CachedDataFetcher',
     'CompositePreprocessor',
     'CompositePreprocessorConfig',
     'DataFetcher',
+    'DataFetcherConfig',
     'DataPreprocessor',
     'DataPreprocessorConfig',
     'Dataset',
+    'ExecutorDataFetcher',
+    'IndexedGeoTIFFDataFetcher',
+    'IndexedGeoTIFFDataFetcherConfig',
+    'MemmapDataFetcher',
+    'MemmapDataFetcherConfig',
     'NormalizePreprocessor',
     'NormalizePreprocessorConfig',
+    'PrefetchDataFetcher',
+    'SharedMemoryDataLoader',
+    'StackedDataFetcher',
+    'StackedDataFetcherConfig',
     'StandardizePreprocessor',
     'StandardizePreprocessorConfig',
     'ToTensorPreprocessor',
     'ToTensorPreprocessorConfig',
     'VRTDataFetcher',
     'VRTDataFetcherConfig',
+    'WarpedVRTDataFetcher',
+    'WarpedVRTDataFetcherConfig',
+    'WMSDataFetcher',
+    'WMSDataFetcherConfig',
 ]
@@ -1,27 +1,82 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from math import isclose
 from pathlib import Path
 from typing import Protocol
 
+import numpy as np
 import numpy.typing as npt
 import pydantic
+import torch.utils.data
+from rasterio.transform import Affine
+from shapely import STRtree
 
 # noinspection PyProtectedMember
 from aviary._functional.data.data_fetcher import (
+    array_data_fetcher,
+    array_data_fetcher_info,
+    close_sessions,
+    close_srcs,
+    compute_cache_key,
+    compute_upcoming_indices,
+    evict_cached_data,
+    get_default_cache_path,
+    indexed_geotiff_data_fetcher,
+    build_memmap,
+    compute_channels,
+    compute_mem_path,
+    indexed_geotiff_data_fetcher_info,
+    load_footprint_index,
+    load_memmap,
+    memmap_data_fetcher,
+    read_cached_data,
+    stacked_data_fetcher,
+    stacked_data_fetcher_info,
+    vrt_batch_data_fetcher,
     vrt_data_fetcher,
     vrt_data_fetcher_info,
+    warped_vrt_data_fetcher,
+    warped_vrt_data_fetcher_info,
+    wms_data_fetcher,
+    write_cached_data,
 )
 
+# noinspection PyProtectedMember
+from aviary._utils.exceptions import AviaryUserError
+
 # noinspection PyProtectedMember
 from aviary._utils.mixins import FromConfigMixin
 
+# noinspection PyProtectedMember
+from aviary._utils.response_cache import ResponseCache
+
+# noinspection PyProtectedMember
+from aviary._utils.shared_memory import (
+    SharedArray,
+    SharedMemoryCache,
+)
+
 # noinspection PyProtectedMember
 from aviary._utils.types import (
     BoundingBox,
     BufferSize,
     Coordinate,
+    CoordinatesSet,
+    DataFetcherInfo,
+    DataLayout,
     DType,
     EPSGCode,
+    GDALConfig,
+    GDALConfigPreset,
     GroundSamplingDistance,
     InterpolationMode,
+    ProcessArea,
     TileSize,
 )
 
@@ -34,11 +89,20 @@ class DataFetcher(Protocol):
     The data fetcher is used by the dataset to fetch data for each tile.
 
     Currently implemented data fetchers:
+        - ArrayDataFetcher: Fetches data from an array in memory
+        - CachedDataFetcher: Caches the data of another data fetcher on disk
+        - IndexedGeoTIFFDataFetcher: Fetches data from the GeoTIFFs of a mosaic that intersect the tile
+        - MemmapDataFetcher: Fetches data from a memory-mapped array of a mosaic
+        - PrefetchDataFetcher: Fetches data of upcoming tiles in the background
+        - StackedDataFetcher: Stacks the data of multiple data fetchers along the channels
         - VRTDataFetcher: Fetches data from a virtual raster
+        - WarpedVRTDataFetcher: Fetches data from a virtual raster that is reprojected on the fly
         - WMSDataFetcher: Fetches data from a web map service
 
     Notes:
         - Implementations must support concurrency (the data fetcher may be called concurrently by the dataloader)
+        - Implementations may additionally provide a `fetch_batch` method that fetches the data of a batch of tiles
+          (the dataset uses it instead of calling the data fetcher for each tile)
     """
 
     def __call__(
@@ -58,45 +122,178 @@ class DataFetcher(Protocol):
         ...
 
 
-class VRTDataFetcher(FromConfigMixin):
-    """Data fetcher for virtual rasters
+class AsyncDataFetcher(Protocol):
+    """Protocol for async data fetchers
+
+    Async data fetchers are coroutine functions that fetch data from a source given a minimum x and y coordinate.
+    These coordinates correspond to the bottom left corner of a tile.
+    The async data fetcher is used by the async dataset to fetch data for many tiles concurrently
+    on an event loop.
+
+    Currently implemented async data fetchers:
+        - ExecutorDataFetcher: Runs a data fetcher in a thread pool
+
+    Notes:
+        - Implementations must support concurrency (many fetches are in flight on the event loop)
+    """
+
+    async def __call__(
+        self,
+        x_min: Coordinate,
+        y_min: Coordinate,
+    ) -> npt.NDArray:
+        """Fetches data from the source given a minimum x and y coordinate.
+
+        Parameters:
+            x_min: minimum x coordinate
+            y_min: minimum y coordinate
+
+        Returns:
+            data
+        """
+        ...
+
+
+class ArrayDataFetcher:
+    """Data fetcher for arrays in memory
 
     Implements the `DataFetcher` protocol.
+
+    The array data fetcher wraps an array with its affine transform and EPSG code, e.g., to profile the model
+    and the exporter without I/O or to process imagery that is already in memory.
+    The data is read from an in-memory dataset (GDAL's MEM driver) that references the memory of the array,
+    so the data is buffered and resampled as in `VRTDataFetcher`.
+
+    Notes:
+        - The array must be of shape (channels, height, width), C-contiguous and north-up
+        - If `shared` is True, the array is copied once into shared memory and the workers of the dataloader
+          attach to it instead of receiving a pickled copy (the process that created the data fetcher
+          must call `close` to release the shared memory)
+        - The dataset handles of the in-memory dataset are opened lazily and reused across calls
+          (each worker of the dataloader and each thread has its own dataset handle); they are closed
+          by `close` or when the data fetcher is garbage collected, so that no dataset handle references
+          the memory of the array after it is released
+        - If the layout is `CHANNELS_FIRST`, the data is returned as read, i.e., without a transpose
+          (the data preprocessors must use the same layout)
+
+    Examples:
+        >>> array_data_fetcher = ArrayDataFetcher(
+        ...     data=data,
+        ...     transform=transform,
+        ...     epsg_code=25832,
+        ...     tile_size=128,
+        ...     ground_sampling_distance=.2,
+        ... )
     """
     _FILL_VALUE = 0
 
     def __init__(
         self,
-        path: Path,
+        data: npt.NDArray,
+        transform: Affine,
+        epsg_code: EPSGCode,
         tile_size: TileSize,
         ground_sampling_distance: GroundSamplingDistance,
         interpolation_mode: InterpolationMode = InterpolationMode.BILINEAR,
         buffer_size: BufferSize = 0,
-        drop_channels: list[int] = None,
+        drop_channels: list[int] | None = None,
+        layout: DataLayout = DataLayout.CHANNELS_LAST,
+        shared: bool = False,
     ) -> None:
         """
         Parameters:
-            path: path to the virtual raster (.vrt file)
+            data: data of shape (channels, height, width)
+            transform: affine transform of the data
+            epsg_code: EPSG code
             tile_size: tile size in meters
             ground_sampling_distance: ground sampling distance in meters
             interpolation_mode: interpolation mode (`BILINEAR` or `NEAREST`)
             buffer_size: buffer size in meters (specifies the area around the tile that is additionally fetched)
             drop_channels: channel indices to drop (supports negative indexing)
+            layout: layout of the data (`CHANNELS_FIRST` or `CHANNELS_LAST`)
+            shared: if True, the data is shared with the workers of the dataloader through shared memory
+
+        Raises:
+            AviaryUserError: Invalid data (`data` is not C-contiguous, is not of shape (channels, height, width)
+                or its data type is not supported) or invalid transform (`transform` is not north-up)
         """
-        self.path = path
+        self.transform = transform
+        self.epsg_code = epsg_code
         self.tile_size = tile_size
         self.ground_sampling_distance = ground_sampling_distance
         self.interpolation_mode = interpolation_mode
         self.buffer_size = buffer_size
         self.drop_channels = drop_channels
+        self.layout = layout
+        self.shared = shared
 
-        self._data_fetcher_info = vrt_data_fetcher_info(
-            path=self.path,
+        self._shared_array = None
+
+        if self.shared:
+            self._shared_array = SharedArray(
+                data=data,
+            )
+            data = self._shared_array.array
+
+        self.data = data
+        self._path = compute_mem_path(
+            data=self.data,
+            transform=self.transform,
+            epsg_code=self.epsg_code,
+        )
+        self._finalizer = weakref.finalize(self, close_srcs, path={self._path})
+        self._data_fetcher_info = array_data_fetcher_info(
+            data=self.data,
+            transform=self.transform,
+            epsg_code=self.epsg_code,
+            drop_channels=self.drop_channels,
+        )
+        self._native_resolution = isclose(
+            self.ground_sampling_distance,
+            self.src_ground_sampling_distance,
+            rel_tol=1e-6,
+        )
+
+    def __getstate__(self) -> dict:
+        """Returns the state without the data if the data is shared (the block of shared memory is attached
+        in each process).
+
+        Returns:
+            state
+        """
+        state = self.__dict__.copy()
+
+        if self._shared_array is not None:
+            state['data'] = None
+
+        state['_path'] = None
+        del state['_finalizer']
+        return state
+
+    def __setstate__(
+        self,
+        state: dict,
+    ) -> None:
+        """Restores the state and computes the path to the in-memory dataset of the current process.
+
+        Parameters:
+            state: state
+        """
+        self.__dict__.update(state)
+
+        if self._shared_array is not None:
+            self.data = self._shared_array.array
+
+        self._path = compute_mem_path(
+            data=self.data,
+            transform=self.transform,
+            epsg_code=self.epsg_code,
         )
+        self._finalizer = weakref.finalize(self, close_srcs, path={self._path})
 
     @property
     def src_bounding_box(self) -> BoundingBox:
-        """Bounding box of the virtual raster
+        """Bounding box of the array
 
         Returns:
             bounding box
@@ -105,7 +302,7 @@ class VRTDataFetcher(FromConfigMixin):
 
     @property
     def src_dtype(self) -> list[DType]:
-        """Data type of each channel of the virtual raster
+        """Data type of each channel of the array
 
         Returns:
             data type of each channel
@@ -114,7 +311,7 @@ class VRTDataFetcher(FromConfigMixin):
 
     @property
     def src_epsg_code(self) -> EPSGCode:
-        """EPSG code of the virtual raster
+        """EPSG code of the array
 
         Returns:
             EPSG code
@@ -123,7 +320,7 @@ class VRTDataFetcher(FromConfigMixin):
 
     @property
     def src_ground_sampling_distance(self) -> GroundSamplingDistance:
-        """Ground sampling distance of the virtual raster
+        """Ground sampling distance of the array
 
         Returns:
             ground sampling distance in meters
@@ -132,54 +329,2371 @@ class VRTDataFetcher(FromConfigMixin):
 
     @property
     def src_num_channels(self) -> int:
-        """Number of channels of the virtual raster
+        """Number of channels of the array
 
         Returns:
             number of channels
         """
         return self._data_fetcher_info.num_channels
 
+    @property
+    def num_channels(self) -> int:
+        """Number of channels that are read from the array (i.e., without the dropped channels)
+
+        Returns:
+            number of channels
+        """
+        return self._data_fetcher_info.num_effective_channels
+
+    def close(self) -> None:
+        """Closes the dataset handles of the in-memory dataset of the current process and the shared memory."""
+        self._finalizer.detach()
+        close_srcs(
+            path={self._path},
+        )
+
+        if self._shared_array is not None:
+            self._shared_array.close()
+            self._shared_array = None
+            self.data = None
+
     def __call__(
         self,
         x_min: Coordinate,
         y_min: Coordinate,
+        out: npt.NDArray | None = None,
     ) -> npt.NDArray:
-        """Fetches data from the virtual raster given a minimum x and y coordinate.
+        """Fetches data from the array given a minimum x and y coordinate.
 
         Parameters:
             x_min: minimum x coordinate
             y_min: minimum y coordinate
+            out: output array of shape (channels, height, width) the data is read into (if None, the data is read
+                into a new array)
 
         Returns:
             data
         """
-        return vrt_data_fetcher(
+        return array_data_fetcher(
             x_min=x_min,
             y_min=y_min,
-            path=self.path,
+            path=self._path,
             tile_size=self.tile_size,
             ground_sampling_distance=self.ground_sampling_distance,
             interpolation_mode=self.interpolation_mode,
             buffer_size=self.buffer_size,
-            drop_channels=self.drop_channels,
             fill_value=self._FILL_VALUE,
+            native_resolution=self._native_resolution,
+            indexes=self._data_fetcher_info.indexes,
+            layout=self.layout,
+            out=out,
         )
 
 
-class VRTDataFetcherConfig(pydantic.BaseModel):
-    """Configuration for the `from_config` classmethod of `VRTDataFetcher`
+class CachedDataFetcher:
+    """Data fetcher that caches the data of another data fetcher on disk
 
-    Attributes:
-        path: path to the virtual raster (.vrt file)
-        tile_size: tile size in meters
-        ground_sampling_distance: ground sampling distance in meters
-        interpolation_mode: interpolation mode ('bilinear' or 'nearest')
-        buffer_size: buffer size in meters (specifies the area around the tile that is additionally fetched)
-        drop_channels: channel indices to drop (supports negative indexing)
+    Implements the `DataFetcher` protocol.
+
+    The cached data fetcher stores the data of each tile as a raw array (.npy file) in a subdirectory
+    of the cache directory.
+    The subdirectory is named after a key that is computed from the parameters of the wrapped data fetcher
+    that affect the data (see `cache_params` of the data fetcher, e.g., the path and its modification time,
+    the tile size, the ground sampling distance or the layout), so that repeated runs with the same parameters
+    reuse the cached data.
+    Cached data is returned as a read-only memory-mapped array (i.e., without copying).
+    If the size of the cache exceeds `max_size`, the least recently used data is evicted.
+
+    Notes:
+        - The cache directory can be shared by multiple data fetchers and processes
+        - The wrapped data fetcher must provide `cache_params` (e.g., `VRTDataFetcher`
+          or `WMSDataFetcher`), data fetchers of data in memory (e.g., `ArrayDataFetcher`) are not supported
+
+    Examples:
+        >>> cached_data_fetcher = CachedDataFetcher(
+        ...     data_fetcher=vrt_data_fetcher,
+        ...     path=Path('cache'),
+        ...     max_size=10_000,
+        ... )
     """
-    path: Path
-    tile_size: TileSize
-    ground_sampling_distance: GroundSamplingDistance
-    interpolation_mode: InterpolationMode = InterpolationMode.BILINEAR
-    buffer_size: BufferSize = 0
-    drop_channels: list[int] | None = None
+    def __init__(
+        self,
+        data_fetcher: DataFetcher,
+        path: Path,
+        max_size: int | None = None,
+    ) -> None:
+        """
+        Parameters:
+            data_fetcher: data fetcher
+            path: path to the cache directory
+            max_size: maximum size of the cache in megabytes (if None, the size of the cache is not limited)
+
+        Raises:
+            AviaryUserError: Invalid data fetcher (the data fetcher does not provide `cache_params`)
+        """
+        self.data_fetcher = data_fetcher
+        self.path = path
+        self.max_size = max_size
+
+        self._cache_key = compute_cache_key(
+            params=self._compute_params(self.data_fetcher),
+        )
+        self._cache_path = self.path / self._cache_key
+        self._cache_path.mkdir(parents=True, exist_ok=True)
+        self._size = None
+
+    @classmethod
+    def _compute_params(
+        cls,
+        data_fetcher: DataFetcher,
+    ) -> dict:
+        """Computes the parameters of the data fetcher that the cache key is computed from.
+
+        If the data fetcher composes data fetchers (e.g., `StackedDataFetcher` or `PrefetchDataFetcher`),
+        the cache key of each data fetcher is part of the parameters.
+
+        Parameters:
+            data_fetcher: data fetcher
+
+        Returns:
+            parameters
+
+        Raises:
+            AviaryUserError: Invalid data fetcher (the data fetcher does not provide `cache_params`)
+        """
+        cache_params = getattr(data_fetcher, 'cache_params', None)
+
+        if not isinstance(cache_params, dict):
+            message = (
+                'Invalid data_fetcher! '
+                f'{type(data_fetcher).__name__} does not provide cache_params, i.e., its data cannot be cached.'
+            )
+            raise AviaryUserError(message)
+
+        params = dict(cache_params)
+        params['name'] = type(data_fetcher).__name__
+        data_fetchers = getattr(data_fetcher, 'data_fetchers', None)
+        data_fetcher_ = getattr(data_fetcher, 'data_fetcher', None)
+
+        if data_fetcher_ is not None:
+            params['data_fetcher'] = compute_cache_key(
+                params=cls._compute_params(data_fetcher_),
+            )
+
+        if data_fetchers is not None:
+            params['data_fetchers'] = [
+                compute_cache_key(
+                    params=cls._compute_params(data_fetcher_),
+                )
+                for data_fetcher_ in data_fetchers
+            ]
+
+        return params
+
+    def _get_data_path(
+        self,
+        x_min: Coordinate,
+        y_min: Coordinate,
+    ) -> Path:
+        """Returns the path to the cached data of the tile.
+
+        Parameters:
+            x_min: minimum x coordinate
+            y_min: minimum y coordinate
+
+        Returns:
+            path to the cached data (.npy file)
+        """
+        return self._cache_path / f'{x_min}_{y_min}.npy'
+
+    def _cache(
+        self,
+        x_min: Coordinate,
+        y_min: Coordinate,
+        data: npt.NDArray,
+    ) -> None:
+        """Caches the data of the tile and evicts the least recently used data if necessary.
+
+        Parameters:
+            x_min: minimum x coordinate
+            y_min: minimum y coordinate
+            data: data
+        """
+        size = write_cached_data(
+            path=self._get_data_path(
+                x_min=x_min,
+                y_min=y_min,
+            ),
+            data=data,
+        )
+
+        if self.max_size is None:
+            return
+
+        max_size = self.max_size * 1_000_000
+
+        if self._size is None:
+            self._size = evict_cached_data(
+                path=self.path,
+                max_size=max_size,
+            )
+            return
+
+        self._size += size
+
+        if self._size > max_size:
+            self._size = evict_cached_data(
+                path=self.path,
+                max_size=max_size,
+            )
+
+    def __call__(
+        self,
+        x_min: Coordinate,
+        y_min: Coordinate,
+    ) -> npt.NDArray:
+        """Fetches data from the cache or the wrapped data fetcher given a minimum x and y coordinate.
+
+        Parameters:
+            x_min: minimum x coordinate
+            y_min: minimum y coordinate
+
+        Returns:
+            data
+        """
+        data = read_cached_data(
+            path=self._get_data_path(
+                x_min=x_min,
+                y_min=y_min,
+            ),
+        )
+
+        if data is not None:
+            return data
+
+        data = self.data_fetcher(
+            x_min=x_min,
+            y_min=y_min,
+        )
+        self._cache(
+            x_min=x_min,
+            y_min=y_min,
+            data=data,
+        )
+        return data
+
+    def fetch_batch(
+        self,
+        coordinates: CoordinatesSet,
+    ) -> list[npt.NDArray]:
+        """Fetches data from the cache or the wrapped data fetcher given the coordinates of a batch of tiles.
+
+        The data of the tiles that are not cached is fetched at once if the wrapped data fetcher provides
+        a `fetch_batch` method.
+
+        Parameters:
+            coordinates: coordinates (x_min, y_min) of each tile
+
+        Returns:
+            data of each tile
+        """
+        batch = [
+            read_cached_data(
+                path=self._get_data_path(
+                    x_min=x_min,
+                    y_min=y_min,
+                ),
+            )
+            for x_min, y_min in coordinates
+        ]
+        missing_indices = [index for index, data in enumerate(batch) if data is None]
+
+        if not missing_indices:
+            return batch
+
+        missing_coordinates = coordinates[missing_indices]
+
+        if hasattr(self.data_fetcher, 'fetch_batch'):
+            missing_batch = self.data_fetcher.fetch_batch(
+                coordinates=missing_coordinates,
+            )
+        else:
+            missing_batch = [
+                self.data_fetcher(
+                    x_min=x_min,
+                    y_min=y_min,
+                )
+                for x_min, y_min in missing_coordinates
+            ]
+
+        for index, data, (x_min, y_min) in zip(missing_indices, missing_batch, missing_coordinates):
+            self._cache(
+                x_min=x_min,
+                y_min=y_min,
+                data=data,
+            )
+            batch[index] = data
+
+        return batch
+
+
+class PrefetchDataFetcher:
+    """Data fetcher that fetches the data of upcoming tiles in the background
+
+    Implements the `DataFetcher` protocol.
+
+    The prefetch data fetcher wraps another data fetcher and keeps a bounded queue of upcoming tiles.
+    A thread pool fetches the data of the upcoming tiles ahead of consumption, so that the latency of the storage
+    is hidden (e.g., on network filesystems).
+    The upcoming tiles are derived from the coordinates and the order in which the dataloader assigns the tiles
+    to its workers.
+
+    Notes:
+        - The number of threads and the prefetch depth are independent of the number of workers of the dataloader
+          (each worker has its own thread pool)
+        - The wrapped data fetcher must support concurrency
+        - If the wrapped data fetcher provides a `fetch_batch` method, the upcoming batches instead of the upcoming
+          tiles are fetched ahead (see `fetch_batch`), so that the data of each batch is still fetched at once
+          (e.g., the spatially adjacent tiles of `VRTDataFetcher`)
+
+    Examples:
+        >>> prefetch_data_fetcher = PrefetchDataFetcher(
+        ...     data_fetcher=vrt_data_fetcher,
+        ...     coordinates=process_area.coordinates,
+        ...     num_threads=4,
+        ...     prefetch_depth=16,
+        ... )
+    """
+
+    def __init__(
+        self,
+        data_fetcher: DataFetcher,
+        coordinates: CoordinatesSet,
+        num_threads: int = 4,
+        prefetch_depth: int = 16,
+        batch_size: int = 1,
+    ) -> None:
+        """
+        Parameters:
+            data_fetcher: data fetcher
+            coordinates: coordinates (x_min, y_min) of each tile in the order they are fetched
+            num_threads: number of threads
+            prefetch_depth: number of upcoming tiles that are fetched ahead
+            batch_size: batch size of the dataloader
+        """
+        self.data_fetcher = data_fetcher
+        self.coordinates = coordinates
+        self.num_threads = num_threads
+        self.prefetch_depth = prefetch_depth
+        self.batch_size = batch_size
+
+        self._indices = {}
+
+        for index, (x_min, y_min) in enumerate(self.coordinates):
+            self._indices.setdefault((int(x_min), int(y_min)), index)
+
+        self._pid = None
+        self._executor = None
+        self._futures = None
+        self._lock = None
+
+    def __getstate__(self) -> dict:
+        """Returns the state without the thread pool (the thread pool is created lazily in each process).
+
+        Returns:
+            state
+        """
+        state = self.__dict__.copy()
+        state['_pid'] = None
+        state['_executor'] = None
+        state['_futures'] = None
+        state['_lock'] = None
+        return state
+
+    def _init_executor(self) -> None:
+        """Initializes the thread pool of the current process."""
+        self._pid = os.getpid()
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.num_threads,
+        )
+        self._futures = {}
+        self._lock = threading.Lock()
+
+    def _submit(
+        self,
+        index: int,
+    ) -> Future:
+        """Submits the fetching of the data of the tile.
+
+        Parameters:
+            index: index of the tile
+
+        Returns:
+            future of the data
+        """
+        x_min, y_min = self.coordinates[index]
+        return self._executor.submit(
+            self.data_fetcher,
+            x_min=x_min,
+            y_min=y_min,
+        )
+
+    def _submit_batch(
+        self,
+        start: int,
+        stop: int,
+    ) -> Future:
+        """Submits the fetching of the data of the batch.
+
+        Parameters:
+            start: index of the first tile of the batch
+            stop: index of the tile after the last tile of the batch
+
+        Returns:
+            future of the data of each tile
+        """
+        return self._executor.submit(
+            self.data_fetcher.fetch_batch,
+            coordinates=self.coordinates[start:stop],
+        )
+
+    @property
+    def cache_params(self) -> dict:
+        """Parameters of the prefetch data fetcher that affect the data (the cache key of `CachedDataFetcher`
+        is computed from them)
+
+        Returns:
+            parameters (the parameters of the wrapped data fetcher are part of the cache key)
+        """
+        return {}
+
+    def close(self) -> None:
+        """Cancels the pending fetches and shuts down the thread pool of the current process."""
+        if self._executor is None or self._pid != os.getpid():
+            return
+
+        self._executor.shutdown(
+            wait=True,
+            cancel_futures=True,
+        )
+        self._executor = None
+        self._futures = None
+
+    def __call__(
+        self,
+        x_min: Coordinate,
+        y_min: Coordinate,
+    ) -> npt.NDArray:
+        """Fetches data given a minimum x and y coordinate and fetches the data of the upcoming tiles ahead.
+
+        Parameters:
+            x_min: minimum x coordinate
+            y_min: minimum y coordinate
+
+        Returns:
+            data
+        """
+        index = self._indices.get((int(x_min), int(y_min)))
+
+        if index is None:
+            return self.data_fetcher(
+                x_min=x_min,
+                y_min=y_min,
+            )
+
+        if self._executor is None or self._pid != os.getpid():
+            self._init_executor()
+
+        worker_info = torch.utils.data.get_worker_info()
+        num_workers = worker_info.num_workers if worker_info is not None else 1
+        upcoming_indices = compute_upcoming_indices(
+            index=index,
+            num_coordinates=len(self.coordinates),
+            prefetch_depth=self.prefetch_depth,
+            batch_size=self.batch_size,
+            num_workers=num_workers,
+        )
+
+        with self._lock:
+            future = self._futures.pop(index, None)
+
+            if future is None:
+                future = self._submit(index)
+
+            for upcoming_index in upcoming_indices:
+                if upcoming_index not in self._futures:
+                    self._futures[upcoming_index] = self._submit(upcoming_index)
+
+            stale_indices = self._futures.keys() - set(upcoming_indices)
+
+            for stale_index in stale_indices:
+                self._futures.pop(stale_index).cancel()
+
+        return future.result()
+
+    def fetch_batch(
+        self,
+        coordinates: CoordinatesSet,
+    ) -> list[npt.NDArray]:
+        """Fetches data given the coordinates of a batch of tiles and fetches the data of the upcoming batches
+        ahead.
+
+        If the wrapped data fetcher provides a `fetch_batch` method, the data of the batch and of each upcoming
+        batch is fetched at once by the wrapped data fetcher.
+        Otherwise, the data of each tile is fetched separately (see `__call__`).
+
+        Parameters:
+            coordinates: coordinates (x_min, y_min) of each tile
+
+        Returns:
+            data of each tile
+        """
+        if not hasattr(self.data_fetcher, 'fetch_batch'):
+            return [
+                self(
+                    x_min=x_min,
+                    y_min=y_min,
+                )
+                for x_min, y_min in coordinates
+            ]
+
+        indices = [self._indices.get((int(x_min), int(y_min))) for x_min, y_min in coordinates]
+        start = indices[0] if indices else None
+
+        if start is None or indices != list(range(start, start + len(indices))):
+            return self.data_fetcher.fetch_batch(
+                coordinates=coordinates,
+            )
+
+        stop = start + len(indices)
+
+        if self._executor is None or self._pid != os.getpid():
+            self._init_executor()
+
+        worker_info = torch.utils.data.get_worker_info()
+        num_workers = worker_info.num_workers if worker_info is not None else 1
+        upcoming_indices = compute_upcoming_indices(
+            index=stop - 1,
+            num_coordinates=len(self.coordinates),
+            prefetch_depth=self.prefetch_depth,
+            batch_size=self.batch_size,
+            num_workers=num_workers,
+        )
+        upcoming_batches = []
+
+        for upcoming_index in upcoming_indices:
+            upcoming_start = upcoming_index - upcoming_index % self.batch_size
+            upcoming_batch = (upcoming_start, min(upcoming_start + self.batch_size, len(self.coordinates)))
+
+            if upcoming_batch not in upcoming_batches:
+                upcoming_batches.append(upcoming_batch)
+
+        with self._lock:
+            future = self._futures.pop((start, stop), None)
+
+            if future is None:
+                future = self._submit_batch(
+                    start=start,
+                    stop=stop,
+                )
+
+            for upcoming_start, upcoming_stop in upcoming_batches:
+                if (upcoming_start, upcoming_stop) not in self._futures:
+                    self._futures[(upcoming_start, upcoming_stop)] = self._submit_batch(
+                        start=upcoming_start,
+                        stop=upcoming_stop,
+                    )
+
+            stale_batches = self._futures.keys() - set(upcoming_batches)
+
+            for stale_batch in stale_batches:
+                self._futures.pop(stale_batch).cancel()
+
+        return future.result()
+
+
+class ExecutorDataFetcher:
+    """Async data fetcher that runs a data fetcher in a thread pool
+
+    Implements the `AsyncDataFetcher` protocol.
+
+    The executor data fetcher wraps a data fetcher (e.g., `VRTDataFetcher`) and runs each call in a thread pool,
+    so that the event loop of the async dataset keeps many fetches in flight.
+
+    Notes:
+        - The thread pool is created lazily in each process (e.g., in each worker of the dataloader)
+        - The wrapped data fetcher must support concurrency
+        - GDAL releases the GIL while reading, i.e., the threads read concurrently
+
+    Examples:
+        >>> executor_data_fetcher = ExecutorDataFetcher(
+        ...     data_fetcher=vrt_data_fetcher,
+        ...     num_threads=64,
+        ... )
+    """
+
+    def __init__(
+        self,
+        data_fetcher: DataFetcher,
+        num_threads: int = 16,
+    ) -> None:
+        """
+        Parameters:
+            data_fetcher: data fetcher
+            num_threads: number of threads
+        """
+        self.data_fetcher = data_fetcher
+        self.num_threads = num_threads
+
+        self._pid = None
+        self._executor = None
+
+    def __getstate__(self) -> dict:
+        """Returns the state without the thread pool (the thread pool is created lazily in each process).
+
+        Returns:
+            state
+        """
+        state = self.__dict__.copy()
+        state['_pid'] = None
+        state['_executor'] = None
+        return state
+
+    def close(self) -> None:
+        """Shuts down the thread pool of the current process."""
+        if self._executor is None or self._pid != os.getpid():
+            return
+
+        self._executor.shutdown(
+            wait=True,
+            cancel_futures=True,
+        )
+        self._executor = None
+
+    async def __call__(
+        self,
+        x_min: Coordinate,
+        y_min: Coordinate,
+    ) -> npt.NDArray:
+        """Fetches data with the data fetcher in the thread pool given a minimum x and y coordinate.
+
+        Parameters:
+            x_min: minimum x coordinate
+            y_min: minimum y coordinate
+
+        Returns:
+            data
+        """
+        if self._executor is None or self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.num_threads,
+            )
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor,
+            partial(
+                self.data_fetcher,
+                x_min=x_min,
+                y_min=y_min,
+            ),
+        )
+
+
+class IndexedGeoTIFFDataFetcher(FromConfigMixin):
+    """Data fetcher for mosaics of GeoTIFFs that are indexed by their footprints
+
+    Implements the `DataFetcher` protocol.
+
+    The footprints of the GeoTIFFs of the virtual raster or the directory are parsed once and stored as
+    a footprint index on disk (.feather file), which is reused until the virtual raster or the directory
+    is modified.
+    For each tile, only the GeoTIFFs that intersect the tile are queried from the spatial index of the footprints,
+    opened and read, so that the cost of fetching a tile does not depend on the number of GeoTIFFs
+    (in contrast to `VRTDataFetcher` with a large virtual raster).
+
+    Notes:
+        - The GeoTIFFs must be north-up and must share the coordinate reference system, the data type
+          and the bands (the information is read from the first GeoTIFF)
+        - The data is mosaicked in the order of the GeoTIFFs (i.e., the data of a later GeoTIFF overwrites
+          the data of an earlier GeoTIFF, as in a virtual raster)
+        - The footprint index is rebuilt if the virtual raster is modified or GeoTIFFs are added to, removed from
+          or modified in the directory
+        - If the interpolation mode is `BILINEAR`, the data at the edges of the GeoTIFFs may differ
+          from the data of `VRTDataFetcher`, since each GeoTIFF is resampled separately
+        - The dataset handles of the GeoTIFFs are opened lazily and reused across calls
+          (each worker of the dataloader and each thread keeps a limited number of dataset handles open)
+        - If the layout is `CHANNELS_FIRST`, the data is returned as mosaicked, i.e., contiguous and without
+          a transpose (the data preprocessors must use the same layout)
+
+    Examples:
+        >>> data_fetcher = IndexedGeoTIFFDataFetcher(
+        ...     path=Path('mosaic.vrt'),
+        ...     index_path=Path('mosaic.feather'),
+        ...     tile_size=128,
+        ...     ground_sampling_distance=.2,
+        ... )
+    """
+    _FILL_VALUE = 0
+
+    def __init__(
+        self,
+        path: Path,
+        index_path: Path,
+        tile_size: TileSize,
+        ground_sampling_distance: GroundSamplingDistance,
+        interpolation_mode: InterpolationMode = InterpolationMode.BILINEAR,
+        buffer_size: BufferSize = 0,
+        drop_channels: list[int] = None,
+        gdal_config: GDALConfig | GDALConfigPreset | None = None,
+        layout: DataLayout = DataLayout.CHANNELS_LAST,
+    ) -> None:
+        """
+        Parameters:
+            path: path to the virtual raster (.vrt file) or the directory of the GeoTIFFs
+            index_path: path to the footprint index (.feather file) (if it does not exist or is outdated,
+                the footprint index is built and written to it)
+            tile_size: tile size in meters
+            ground_sampling_distance: ground sampling distance in meters
+            interpolation_mode: interpolation mode (`BILINEAR` or `NEAREST`)
+            buffer_size: buffer size in meters (specifies the area around the tile that is additionally fetched)
+            drop_channels: channel indices to drop (supports negative indexing)
+            gdal_config: configuration of the GDAL environment or GDAL configuration preset
+                (`DEFAULT` or `LARGE_VRT`)
+            layout: layout of the data (`CHANNELS_FIRST` or `CHANNELS_LAST`)
+        """
+        self.path = path
+        self.index_path = index_path
+        self.tile_size = tile_size
+        self.ground_sampling_distance = ground_sampling_distance
+        self.interpolation_mode = interpolation_mode
+        self.buffer_size = buffer_size
+        self.drop_channels = drop_channels
+
+        if isinstance(gdal_config, GDALConfigPreset):
+            gdal_config = GDALConfig.from_preset(gdal_config)
+
+        self.gdal_config = gdal_config
+        self.layout = layout
+
+        footprint_index = load_footprint_index(
+            path=self.path,
+            index_path=self.index_path,
+        )
+        self._paths = footprint_index['path'].tolist()
+        self._footprints = STRtree(footprint_index.geometry.values)
+        self._data_fetcher_info = indexed_geotiff_data_fetcher_info(
+            footprint_index=footprint_index,
+            drop_channels=self.drop_channels,
+        )
+
+    @classmethod
+    def from_config(
+        cls,
+        config: IndexedGeoTIFFDataFetcherConfig,
+    ) -> IndexedGeoTIFFDataFetcher:
+        """Creates an indexed GeoTIFF data fetcher from the configuration.
+
+        Parameters:
+            config: configuration
+
+        Returns:
+            indexed GeoTIFF data fetcher
+        """
+        return cls(
+            path=config.path,
+            index_path=config.index_path,
+            tile_size=config.tile_size,
+            ground_sampling_distance=config.ground_sampling_distance,
+            interpolation_mode=config.interpolation_mode,
+            buffer_size=config.buffer_size,
+            drop_channels=config.drop_channels,
+            gdal_config=config.gdal_config,
+            layout=config.layout,
+        )
+
+    @property
+    def src_bounding_box(self) -> BoundingBox:
+        """Bounding box of the mosaic
+
+        Returns:
+            bounding box
+        """
+        return self._data_fetcher_info.bounding_box
+
+    @property
+    def src_dtype(self) -> list[DType]:
+        """Data type of each channel of the mosaic
+
+        Returns:
+            data type of each channel
+        """
+        return self._data_fetcher_info.dtype
+
+    @property
+    def src_epsg_code(self) -> EPSGCode:
+        """EPSG code of the mosaic
+
+        Returns:
+            EPSG code
+        """
+        return self._data_fetcher_info.epsg_code
+
+    @property
+    def src_ground_sampling_distance(self) -> GroundSamplingDistance:
+        """Ground sampling distance of the mosaic
+
+        Returns:
+            ground sampling distance in meters
+        """
+        return self._data_fetcher_info.ground_sampling_distance
+
+    @property
+    def src_num_channels(self) -> int:
+        """Number of channels of the mosaic
+
+        Returns:
+            number of channels
+        """
+        return self._data_fetcher_info.num_channels
+
+    @property
+    def num_channels(self) -> int:
+        """Number of channels that are read from the mosaic (i.e., without the dropped channels)
+
+        Returns:
+            number of channels
+        """
+        return self._data_fetcher_info.num_effective_channels
+
+    @property
+    def num_srcs(self) -> int:
+        """Number of GeoTIFFs of the mosaic
+
+        Returns:
+            number of GeoTIFFs
+        """
+        return len(self._paths)
+
+    @property
+    def cache_params(self) -> dict:
+        """Parameters of the indexed GeoTIFF data fetcher that affect the data (the cache key of `CachedDataFetcher`
+        is computed from them)
+
+        Returns:
+            parameters
+        """
+        return {
+            'path': self.path,
+            'tile_size': self.tile_size,
+            'ground_sampling_distance': self.ground_sampling_distance,
+            'interpolation_mode': self.interpolation_mode,
+            'buffer_size': self.buffer_size,
+            'drop_channels': self.drop_channels,
+            'layout': self.layout,
+        }
+
+    def close(self) -> None:
+        """Closes the dataset handles of the GeoTIFFs of the current process."""
+        close_srcs(
+            path={Path(path) for path in self._paths},
+        )
+
+    def __call__(
+        self,
+        x_min: Coordinate,
+        y_min: Coordinate,
+        out: npt.NDArray | None = None,
+    ) -> npt.NDArray:
+        """Fetches data from the GeoTIFFs that intersect the tile given a minimum x and y coordinate.
+
+        Parameters:
+            x_min: minimum x coordinate
+            y_min: minimum y coordinate
+            out: output array of shape (channels, height, width) the data is mosaicked in (if None, the data is
+                mosaicked in a new array)
+
+        Returns:
+            data
+        """
+        return indexed_geotiff_data_fetcher(
+            x_min=x_min,
+            y_min=y_min,
+            paths=self._paths,
+            footprints=self._footprints,
+            tile_size=self.tile_size,
+            ground_sampling_distance=self.ground_sampling_distance,
+            num_channels=self.num_channels,
+            dtype=np.result_type(*[dtype.value for dtype in self.src_dtype]),
+            interpolation_mode=self.interpolation_mode,
+            buffer_size=self.buffer_size,
+            fill_value=self._FILL_VALUE,
+            gdal_config=self.gdal_config,
+            indexes=self._data_fetcher_info.indexes,
+            layout=self.layout,
+            out=out,
+        )
+
+
+class IndexedGeoTIFFDataFetcherConfig(pydantic.BaseModel):
+    """Configuration for the `from_config` classmethod of `IndexedGeoTIFFDataFetcher`
+
+    Attributes:
+        path: path to the virtual raster (.vrt file) or the directory of the GeoTIFFs
+        index_path: path to the footprint index (.feather file) (if it does not exist or is outdated,
+            the footprint index is built and written to it)
+        tile_size: tile size in meters
+        ground_sampling_distance: ground sampling distance in meters
+        interpolation_mode: interpolation mode ('bilinear' or 'nearest')
+        buffer_size: buffer size in meters (specifies the area around the tile that is additionally fetched)
+        drop_channels: channel indices to drop (supports negative indexing)
+        gdal_config: configuration of the GDAL environment or GDAL configuration preset
+            ('default' or 'large_vrt')
+        layout: layout of the data ('channels_first' or 'channels_last')
+    """
+    path: Path
+    index_path: Path
+    tile_size: TileSize
+    ground_sampling_distance: GroundSamplingDistance
+    interpolation_mode: InterpolationMode = InterpolationMode.BILINEAR
+    buffer_size: BufferSize = 0
+    drop_channels: list[int] | None = None
+    gdal_config: GDALConfig | GDALConfigPreset | None = None
+    layout: DataLayout = DataLayout.CHANNELS_LAST
+
+
+class MemmapDataFetcher(FromConfigMixin):
+    """Data fetcher for memory-mapped arrays of mosaics
+
+    Implements the `DataFetcher` protocol.
+
+    The memory-mapped array is an uncompressed array (.npy file) of the region of a mosaic that is materialized
+    once (see `build`), e.g., for process areas that are processed repeatedly.
+    Fetching a tile slices the data out of the memory-mapped array, i.e., without decoding and without copying.
+
+    Notes:
+        - The memory-mapped array is opened lazily in each process (e.g., in each worker of the dataloader),
+          the pages are shared across the processes by the page cache
+        - The data is read-only
+        - The coordinates are snapped to the pixel grid of the memory-mapped array, i.e., the tile size
+          and the buffer size should be multiples of its ground sampling distance
+        - The data is copied if the tile exceeds the memory-mapped array (the pixels outside are filled with 0)
+          or if the channels that are not dropped are not consecutive
+        - If the layout is `CHANNELS_FIRST`, the data is returned as sliced, i.e., without a transpose
+          (the data preprocessors must use the same layout)
+
+    Examples:
+        >>> memmap_data_fetcher = MemmapDataFetcher.build(
+        ...     path=Path('mosaic'),
+        ...     data_fetcher=vrt_data_fetcher,
+        ...     process_area=process_area,
+        ...     buffer_size=32,
+        ... )
+    """
+    _FILL_VALUE = 0
+
+    def __init__(
+        self,
+        path: Path,
+        tile_size: TileSize,
+        buffer_size: BufferSize = 0,
+        drop_channels: list[int] | None = None,
+        layout: DataLayout = DataLayout.CHANNELS_LAST,
+    ) -> None:
+        """
+        Parameters:
+            path: path to the directory of the memory-mapped array
+            tile_size: tile size in meters
+            buffer_size: buffer size in meters (specifies the area around the tile that is additionally fetched)
+            drop_channels: channel indices to drop (supports negative indexing)
+            layout: layout of the data (`CHANNELS_FIRST` or `CHANNELS_LAST`)
+
+        Raises:
+            AviaryUserError: Invalid path (the directory does not contain a memory-mapped array)
+        """
+        self.path = path
+        self.tile_size = tile_size
+        self.buffer_size = buffer_size
+        self.drop_channels = drop_channels
+        self.layout = layout
+
+        self._data, self._data_fetcher_info = load_memmap(
+            path=self.path,
+        )
+        self.ground_sampling_distance = self.src_ground_sampling_distance
+        self._channels = compute_channels(
+            num_channels=self.src_num_channels,
+            drop_channels=self.drop_channels,
+        )
+
+    @classmethod
+    def from_config(
+        cls,
+        config: MemmapDataFetcherConfig,
+    ) -> MemmapDataFetcher:
+        """Creates a memmap data fetcher from the configuration.
+
+        Parameters:
+            config: configuration
+
+        Returns:
+            memmap data fetcher
+        """
+        return cls(
+            path=config.path,
+            tile_size=config.tile_size,
+            buffer_size=config.buffer_size,
+            drop_channels=config.drop_channels,
+            layout=config.layout,
+        )
+
+    @classmethod
+    def build(
+        cls,
+        path: Path,
+        data_fetcher: IndexedGeoTIFFDataFetcher | VRTDataFetcher,
+        process_area: ProcessArea,
+        buffer_size: BufferSize = 0,
+        drop_channels: list[int] | None = None,
+        layout: DataLayout = DataLayout.CHANNELS_LAST,
+        num_threads: int = 8,
+    ) -> MemmapDataFetcher:
+        """Builds the memory-mapped array of the process area from the data fetcher and creates a memmap data
+        fetcher.
+
+        The data of the tiles of the process area and of the adjacent tiles within the buffer size is fetched
+        concurrently by `num_threads` threads and written into the memory-mapped array.
+        The memory-mapped array has the ground sampling distance and the channels of the data fetcher
+        (i.e., without its dropped channels).
+
+        Parameters:
+            path: path to the directory of the memory-mapped array
+            data_fetcher: data fetcher
+            process_area: process area (its coordinates must be aligned to the tile size of the data fetcher)
+            buffer_size: buffer size in meters (specifies the area around the tile that is additionally fetched)
+            drop_channels: channel indices to drop (supports negative indexing)
+            layout: layout of the data (`CHANNELS_FIRST` or `CHANNELS_LAST`)
+            num_threads: number of threads
+
+        Returns:
+            memmap data fetcher
+
+        Raises:
+            AviaryUserError: Invalid data fetcher (the buffer size of the data fetcher is not 0)
+        """
+        if data_fetcher.buffer_size != 0:
+            message = (
+                'Invalid data_fetcher! '
+                'The buffer size of the data fetcher must be 0, the buffer size is specified by buffer_size.'
+            )
+            raise AviaryUserError(message)
+
+        # noinspection PyProtectedMember
+        data_fetcher_info = data_fetcher._data_fetcher_info
+        dtype = data_fetcher_info.dtype
+
+        if data_fetcher_info.indexes is not None:
+            dtype = [dtype[index - 1] for index in data_fetcher_info.indexes]
+
+        build_memmap(
+            path=path,
+            data_fetcher=data_fetcher,
+            coordinates=process_area.coordinates,
+            tile_size=data_fetcher.tile_size,
+            ground_sampling_distance=data_fetcher.ground_sampling_distance,
+            num_channels=data_fetcher.num_channels,
+            dtype=dtype,
+            epsg_code=data_fetcher_info.epsg_code,
+            buffer_size=buffer_size,
+            num_threads=num_threads,
+        )
+        return cls(
+            path=path,
+            tile_size=data_fetcher.tile_size,
+            buffer_size=buffer_size,
+            drop_channels=drop_channels,
+            layout=layout,
+        )
+
+    def __getstate__(self) -> dict:
+        """Returns the state without the memory-mapped array (the memory-mapped array is opened lazily
+        in each process).
+
+        Returns:
+            state
+        """
+        state = self.__dict__.copy()
+        state['_data'] = None
+        return state
+
+    @property
+    def src_bounding_box(self) -> BoundingBox:
+        """Bounding box of the memory-mapped array
+
+        Returns:
+            bounding box
+        """
+        return self._data_fetcher_info.bounding_box
+
+    @property
+    def src_dtype(self) -> list[DType]:
+        """Data type of each channel of the memory-mapped array
+
+        Returns:
+            data type of each channel
+        """
+        return self._data_fetcher_info.dtype
+
+    @property
+    def src_epsg_code(self) -> EPSGCode:
+        """EPSG code of the memory-mapped array
+
+        Returns:
+            EPSG code
+        """
+        return self._data_fetcher_info.epsg_code
+
+    @property
+    def src_ground_sampling_distance(self) -> GroundSamplingDistance:
+        """Ground sampling distance of the memory-mapped array
+
+        Returns:
+            ground sampling distance in meters
+        """
+        return self._data_fetcher_info.ground_sampling_distance
+
+    @property
+    def src_num_channels(self) -> int:
+        """Number of channels of the memory-mapped array
+
+        Returns:
+            number of channels
+        """
+        return self._data_fetcher_info.num_channels
+
+    @property
+    def num_channels(self) -> int:
+        """Number of channels that are read from the memory-mapped array (i.e., without the dropped channels)
+
+        Returns:
+            number of channels
+        """
+        if self._channels is None:
+            return self.src_num_channels
+
+        return len(np.arange(self.src_num_channels)[self._channels])
+
+    @property
+    def cache_params(self) -> dict:
+        """Parameters of the memmap data fetcher that affect the data (the cache key of `CachedDataFetcher`
+        is computed from them)
+
+        Returns:
+            parameters
+        """
+        return {
+            'path': self.path,
+            'tile_size': self.tile_size,
+            'buffer_size': self.buffer_size,
+            'drop_channels': self.drop_channels,
+            'layout': self.layout,
+        }
+
+    def close(self) -> None:
+        """Closes the memory-mapped array of the current process."""
+        self._data = None
+
+    def __call__(
+        self,
+        x_min: Coordinate,
+        y_min: Coordinate,
+        out: npt.NDArray | None = None,
+    ) -> npt.NDArray:
+        """Fetches data from the memory-mapped array given a minimum x and y coordinate.
+
+        Parameters:
+            x_min: minimum x coordinate
+            y_min: minimum y coordinate
+            out: output array of shape (channels, height, width) the data is copied into (if None, the data
+                is returned without copying)
+
+        Returns:
+            data
+        """
+        if self._data is None:
+            self._data, _ = load_memmap(
+                path=self.path,
+            )
+
+        data = memmap_data_fetcher(
+            x_min=x_min,
+            y_min=y_min,
+            data=self._data,
+            bounding_box=self.src_bounding_box,
+            tile_size=self.tile_size,
+            ground_sampling_distance=self.ground_sampling_distance,
+            buffer_size=self.buffer_size,
+            channels=self._channels,
+            fill_value=self._FILL_VALUE,
+            layout=DataLayout.CHANNELS_FIRST if out is not None else self.layout,
+        )
+
+        if out is None:
+            return data
+
+        out[...] = data
+
+        if self.layout == DataLayout.CHANNELS_LAST:
+            return np.transpose(out, (1, 2, 0))
+
+        return out
+
+
+class MemmapDataFetcherConfig(pydantic.BaseModel):
+    """Configuration for the `from_config` classmethod of `MemmapDataFetcher`
+
+    Attributes:
+        path: path to the directory of the memory-mapped array
+        tile_size: tile size in meters
+        buffer_size: buffer size in meters (specifies the area around the tile that is additionally fetched)
+        drop_channels: channel indices to drop (supports negative indexing)
+        layout: layout of the data ('channels_first' or 'channels_last')
+    """
+    path: Path
+    tile_size: TileSize
+    buffer_size: BufferSize = 0
+    drop_channels: list[int] | None = None
+    layout: DataLayout = DataLayout.CHANNELS_LAST
+
+
+class VRTDataFetcher(FromConfigMixin):
+    """Data fetcher for virtual rasters
+
+    Implements the `DataFetcher` protocol.
+
+    Notes:
+        - The dataset handle of the virtual raster is opened lazily and reused across calls
+          (each worker of the dataloader and each thread has its own dataset handle)
+        - The dataset handles are closed when the process exits or when `close` is called
+        - Spatially adjacent tiles of a batch are fetched at once (see `fetch_batch`)
+        - If `shared_cache_size` is specified, the data is assembled from chunks of the size of a tile
+          that are cached in shared memory, so that overlapping tiles reuse the data of each other
+          across the workers of the dataloader (the cache is released when `close` is called)
+        - If the ground sampling distance equals the ground sampling distance of the virtual raster,
+          pixel-aligned data is read with an integer window and without resampling
+          (if `snap_to_grid` is True, the data is snapped to the pixel grid of the virtual raster,
+          i.e., it is shifted by less than half a pixel)
+        - The dropped channels (see `drop_channels`) are not read from the virtual raster
+        - If `use_overviews` is True (opt-in), the overview level of the virtual raster closest to the ground
+          sampling distance (not coarser than the ground sampling distance) is read instead of the full
+          resolution (see `overview_level`), i.e., the data is resampled from the overview level
+        - If the layout is `CHANNELS_FIRST`, the data is returned as read, i.e., contiguous and without
+          a transpose (the data preprocessors must use the same layout)
+        - If `cache_info` is True (opt-in), the metadata of the virtual raster is cached as a JSON file,
+          so that the virtual raster is not opened again on initialization (e.g., in each worker
+          of the dataloader that rebuilds the data fetcher) until it or its .ovr file is modified
+    """
+    _FILL_VALUE = 0
+
+    def __init__(
+        self,
+        path: Path,
+        tile_size: TileSize,
+        ground_sampling_distance: GroundSamplingDistance,
+        interpolation_mode: InterpolationMode = InterpolationMode.BILINEAR,
+        buffer_size: BufferSize = 0,
+        drop_channels: list[int] = None,
+        gdal_config: GDALConfig | GDALConfigPreset | None = None,
+        shared_cache_size: int | None = None,
+        snap_to_grid: bool = False,
+        use_overviews: bool = False,
+        layout: DataLayout = DataLayout.CHANNELS_LAST,
+        cache_info: bool = False,
+        info_cache_path: Path | None = None,
+    ) -> None:
+        """
+        Parameters:
+            path: path to the virtual raster (.vrt file)
+            tile_size: tile size in meters
+            ground_sampling_distance: ground sampling distance in meters
+            interpolation_mode: interpolation mode (`BILINEAR` or `NEAREST`)
+            buffer_size: buffer size in meters (specifies the area around the tile that is additionally fetched)
+            drop_channels: channel indices to drop (supports negative indexing)
+            gdal_config: configuration of the GDAL environment or GDAL configuration preset
+                (`DEFAULT` or `LARGE_VRT`)
+            shared_cache_size: size of the shared cache in megabytes (if None, the data is not cached)
+            snap_to_grid: if True, the data is snapped to the pixel grid of the virtual raster
+                (only if the ground sampling distance equals the ground sampling distance of the virtual raster)
+            use_overviews: if True, the overview level closest to the ground sampling distance is read
+            layout: layout of the data (`CHANNELS_FIRST` or `CHANNELS_LAST`)
+            cache_info: if True, the metadata of the virtual raster is cached
+            info_cache_path: path to the cache directory of the metadata (if None, the user cache directory
+                is used)
+        """
+        self.path = path
+        self.tile_size = tile_size
+        self.ground_sampling_distance = ground_sampling_distance
+        self.interpolation_mode = interpolation_mode
+        self.buffer_size = buffer_size
+        self.drop_channels = drop_channels
+
+        if isinstance(gdal_config, GDALConfigPreset):
+            gdal_config = GDALConfig.from_preset(gdal_config)
+
+        self.gdal_config = gdal_config
+        self.shared_cache_size = shared_cache_size
+        self.snap_to_grid = snap_to_grid
+        self.use_overviews = use_overviews
+        self.layout = layout
+        self.cache_info = cache_info
+
+        if self.cache_info and info_cache_path is None:
+            info_cache_path = get_default_cache_path()
+
+        self.info_cache_path = info_cache_path
+
+        self._data_fetcher_info = vrt_data_fetcher_info(
+            path=self.path,
+            ground_sampling_distance=self.ground_sampling_distance if self.use_overviews else None,
+            drop_channels=self.drop_channels,
+            cache_path=self.info_cache_path if self.cache_info else None,
+        )
+        read_ground_sampling_distance = self.src_ground_sampling_distance
+
+        if self.overview_level is not None:
+            read_ground_sampling_distance *= self.src_overview_factors[self.overview_level]
+
+        self._native_resolution = isclose(
+            self.ground_sampling_distance,
+            read_ground_sampling_distance,
+            rel_tol=1e-6,
+        )
+        self._shared_cache = None
+
+        if self.shared_cache_size is not None:
+            chunk_size_pixels = round(self.tile_size / self.ground_sampling_distance)
+            self._shared_cache = SharedMemoryCache(
+                size=self.shared_cache_size * 1_000_000,
+                shape=(self.num_channels, chunk_size_pixels, chunk_size_pixels),
+                dtype=np.result_type(*[dtype.value for dtype in self.src_dtype]),
+            )
+
+    @classmethod
+    def from_config(
+        cls,
+        config: VRTDataFetcherConfig,
+    ) -> VRTDataFetcher:
+        """Creates a VRT data fetcher from the configuration.
+
+        Parameters:
+            config: configuration
+
+        Returns:
+            VRT data fetcher
+        """
+        return cls(
+            path=config.path,
+            tile_size=config.tile_size,
+            ground_sampling_distance=config.ground_sampling_distance,
+            interpolation_mode=config.interpolation_mode,
+            buffer_size=config.buffer_size,
+            drop_channels=config.drop_channels,
+            gdal_config=config.gdal_config,
+            shared_cache_size=config.shared_cache_size,
+            snap_to_grid=config.snap_to_grid,
+            use_overviews=config.use_overviews,
+            layout=config.layout,
+            cache_info=config.cache_info,
+            info_cache_path=config.info_cache_path,
+        )
+
+    @property
+    def src_bounding_box(self) -> BoundingBox:
+        """Bounding box of the virtual raster
+
+        Returns:
+            bounding box
+        """
+        return self._data_fetcher_info.bounding_box
+
+    @property
+    def src_dtype(self) -> list[DType]:
+        """Data type of each channel of the virtual raster
+
+        Returns:
+            data type of each channel
+        """
+        return self._data_fetcher_info.dtype
+
+    @property
+    def src_epsg_code(self) -> EPSGCode:
+        """EPSG code of the virtual raster
+
+        Returns:
+            EPSG code
+        """
+        return self._data_fetcher_info.epsg_code
+
+    @property
+    def src_ground_sampling_distance(self) -> GroundSamplingDistance:
+        """Ground sampling distance of the virtual raster
+
+        Returns:
+            ground sampling distance in meters
+        """
+        return self._data_fetcher_info.ground_sampling_distance
+
+    @property
+    def src_num_channels(self) -> int:
+        """Number of channels of the virtual raster
+
+        Returns:
+            number of channels
+        """
+        return self._data_fetcher_info.num_channels
+
+    @property
+    def num_channels(self) -> int:
+        """Number of channels that are read from the virtual raster (i.e., without the dropped channels)
+
+        Returns:
+            number of channels
+        """
+        return self._data_fetcher_info.num_effective_channels
+
+    @property
+    def src_overview_factors(self) -> tuple[int, ...]:
+        """Decimation factor of each overview level of the virtual raster
+
+        Returns:
+            decimation factor of each overview level
+        """
+        return self._data_fetcher_info.overview_factors
+
+    @property
+    def overview_level(self) -> int | None:
+        """Overview level of the virtual raster that is read
+
+        Returns:
+            overview level (if None, the full resolution is read)
+        """
+        return self._data_fetcher_info.overview_level
+
+    @property
+    def cache_params(self) -> dict:
+        """Parameters of the VRT data fetcher that affect the data (the cache key of `CachedDataFetcher`
+        is computed from them)
+
+        Returns:
+            parameters
+        """
+        return {
+            'path': self.path,
+            'tile_size': self.tile_size,
+            'ground_sampling_distance': self.ground_sampling_distance,
+            'interpolation_mode': self.interpolation_mode,
+            'buffer_size': self.buffer_size,
+            'drop_channels': self.drop_channels,
+            'snap_to_grid': self.snap_to_grid,
+            'overview_level': self.overview_level,
+            'layout': self.layout,
+        }
+
+    def close(self) -> None:
+        """Closes the dataset handles of the virtual raster of the current process and the shared cache."""
+        close_srcs(
+            path=self.path,
+        )
+
+        if self._shared_cache is not None:
+            self._shared_cache.close()
+            self._shared_cache = None
+
+    def __call__(
+        self,
+        x_min: Coordinate,
+        y_min: Coordinate,
+        out: npt.NDArray | None = None,
+    ) -> npt.NDArray:
+        """Fetches data from the virtual raster given a minimum x and y coordinate.
+
+        Parameters:
+            x_min: minimum x coordinate
+            y_min: minimum y coordinate
+            out: output array of shape (channels, height, width) the data is read into (if None, the data is read
+                into a new array)
+
+        Returns:
+            data
+        """
+        return vrt_data_fetcher(
+            x_min=x_min,
+            y_min=y_min,
+            path=self.path,
+            tile_size=self.tile_size,
+            ground_sampling_distance=self.ground_sampling_distance,
+            interpolation_mode=self.interpolation_mode,
+            buffer_size=self.buffer_size,
+            drop_channels=None,
+            fill_value=self._FILL_VALUE,
+            gdal_config=self.gdal_config,
+            native_resolution=self._native_resolution,
+            snap_to_grid=self.snap_to_grid,
+            overview_level=self.overview_level,
+            indexes=self._data_fetcher_info.indexes,
+            shared_cache=self._shared_cache,
+            layout=self.layout,
+            out=out,
+        )
+
+    def fetch_batch(
+        self,
+        coordinates: CoordinatesSet,
+    ) -> list[npt.NDArray]:
+        """Fetches data from the virtual raster given the coordinates of a batch of tiles.
+
+        Spatially adjacent tiles are grouped and the enclosing window of each group is read at once,
+        so that overlapping buffers and shared blocks of the virtual raster are decoded only once.
+
+        Parameters:
+            coordinates: coordinates (x_min, y_min) of each tile
+
+        Notes:
+            - If the shared cache is used, the data of each tile is assembled from cached chunks instead
+
+        Returns:
+            data of each tile
+        """
+        if self._shared_cache is not None:
+            return [
+                self(
+                    x_min=x_min,
+                    y_min=y_min,
+                )
+                for x_min, y_min in coordinates
+            ]
+
+        return vrt_batch_data_fetcher(
+            coordinates=coordinates,
+            path=self.path,
+            tile_size=self.tile_size,
+            ground_sampling_distance=self.ground_sampling_distance,
+            interpolation_mode=self.interpolation_mode,
+            buffer_size=self.buffer_size,
+            drop_channels=None,
+            fill_value=self._FILL_VALUE,
+            gdal_config=self.gdal_config,
+            native_resolution=self._native_resolution,
+            snap_to_grid=self.snap_to_grid,
+            overview_level=self.overview_level,
+            indexes=self._data_fetcher_info.indexes,
+            layout=self.layout,
+        )
+
+
+class VRTDataFetcherConfig(pydantic.BaseModel):
+    """Configuration for the `from_config` classmethod of `VRTDataFetcher`
+
+    Attributes:
+        path: path to the virtual raster (.vrt file)
+        tile_size: tile size in meters
+        ground_sampling_distance: ground sampling distance in meters
+        interpolation_mode: interpolation mode ('bilinear' or 'nearest')
+        buffer_size: buffer size in meters (specifies the area around the tile that is additionally fetched)
+        drop_channels: channel indices to drop (supports negative indexing)
+        gdal_config: configuration of the GDAL environment or GDAL configuration preset
+            ('default' or 'large_vrt')
+        shared_cache_size: size of the shared cache in megabytes (if None, the data is not cached)
+        snap_to_grid: if True, the data is snapped to the pixel grid of the virtual raster
+            (only if the ground sampling distance equals the ground sampling distance of the virtual raster)
+        use_overviews: if True, the overview level closest to the ground sampling distance is read
+        layout: layout of the data ('channels_first' or 'channels_last')
+        cache_info: if True, the metadata of the virtual raster is cached
+        info_cache_path: path to the cache directory of the metadata (if None, the user cache directory is used)
+    """
+    path: Path
+    tile_size: TileSize
+    ground_sampling_distance: GroundSamplingDistance
+    interpolation_mode: InterpolationMode = InterpolationMode.BILINEAR
+    buffer_size: BufferSize = 0
+    drop_channels: list[int] | None = None
+    gdal_config: GDALConfig | GDALConfigPreset | None = None
+    shared_cache_size: int | None = None
+    snap_to_grid: bool = False
+    use_overviews: bool = False
+    layout: DataLayout = DataLayout.CHANNELS_LAST
+    cache_info: bool = False
+    info_cache_path: Path | None = None
+
+
+class WarpedVRTDataFetcher(FromConfigMixin):
+    """Data fetcher for virtual rasters that are reprojected on the fly
+
+    Implements the `DataFetcher` protocol.
+
+    Notes:
+        - The virtual raster is warped into the coordinate reference system of the EPSG code and the pixel grid
+          of the ground sampling distance, i.e., the bounding box of the data fetcher is in the coordinate
+          reference system of the EPSG code
+        - Only the window of each tile is warped (the virtual raster is not reprojected as a whole)
+        - The warped dataset handle of the virtual raster is opened lazily and reused across calls
+          (each worker of the dataloader and each thread has its own warped dataset handle)
+        - The dataset handles are closed when the process exits or when `close` is called
+        - Tiles at multiples of the ground sampling distance are aligned to the pixel grid of the warped
+          virtual raster, so that the data is resampled only once
+        - If `num_threads` is greater than 1, the warper uses multiple threads to warp each tile
+    """
+    _FILL_VALUE = 0
+
+    def __init__(
+        self,
+        path: Path,
+        epsg_code: EPSGCode,
+        tile_size: TileSize,
+        ground_sampling_distance: GroundSamplingDistance,
+        interpolation_mode: InterpolationMode = InterpolationMode.BILINEAR,
+        buffer_size: BufferSize = 0,
+        drop_channels: list[int] = None,
+        gdal_config: GDALConfig | GDALConfigPreset | None = None,
+        num_threads: int | str = 1,
+        layout: DataLayout = DataLayout.CHANNELS_LAST,
+    ) -> None:
+        """
+        Parameters:
+            path: path to the virtual raster (.vrt file)
+            epsg_code: EPSG code of the data
+            tile_size: tile size in meters
+            ground_sampling_distance: ground sampling distance in meters
+            interpolation_mode: interpolation mode (`BILINEAR` or `NEAREST`)
+            buffer_size: buffer size in meters (specifies the area around the tile that is additionally fetched)
+            drop_channels: channel indices to drop (supports negative indexing)
+            gdal_config: configuration of the GDAL environment or GDAL configuration preset
+                (`DEFAULT` or `LARGE_VRT`)
+            num_threads: number of threads of the warper (or 'ALL_CPUS')
+            layout: layout of the data (`CHANNELS_FIRST` or `CHANNELS_LAST`)
+        """
+        self.path = path
+        self.epsg_code = epsg_code
+        self.tile_size = tile_size
+        self.ground_sampling_distance = ground_sampling_distance
+        self.interpolation_mode = interpolation_mode
+        self.buffer_size = buffer_size
+        self.drop_channels = drop_channels
+
+        if isinstance(gdal_config, GDALConfigPreset):
+            gdal_config = GDALConfig.from_preset(gdal_config)
+
+        self.gdal_config = gdal_config
+        self.num_threads = num_threads
+        self.layout = layout
+
+        self._data_fetcher_info = warped_vrt_data_fetcher_info(
+            path=self.path,
+            epsg_code=self.epsg_code,
+            ground_sampling_distance=self.ground_sampling_distance,
+            drop_channels=self.drop_channels,
+        )
+
+    @classmethod
+    def from_config(
+        cls,
+        config: WarpedVRTDataFetcherConfig,
+    ) -> WarpedVRTDataFetcher:
+        """Creates a warped VRT data fetcher from the configuration.
+
+        Parameters:
+            config: configuration
+
+        Returns:
+            warped VRT data fetcher
+        """
+        return cls(
+            path=config.path,
+            epsg_code=config.epsg_code,
+            tile_size=config.tile_size,
+            ground_sampling_distance=config.ground_sampling_distance,
+            interpolation_mode=config.interpolation_mode,
+            buffer_size=config.buffer_size,
+            drop_channels=config.drop_channels,
+            gdal_config=config.gdal_config,
+            num_threads=config.num_threads,
+            layout=config.layout,
+        )
+
+    @property
+    def src_bounding_box(self) -> BoundingBox:
+        """Bounding box of the warped virtual raster
+
+        Returns:
+            bounding box
+        """
+        return self._data_fetcher_info.bounding_box
+
+    @property
+    def src_dtype(self) -> list[DType]:
+        """Data type of each channel of the virtual raster
+
+        Returns:
+            data type of each channel
+        """
+        return self._data_fetcher_info.dtype
+
+    @property
+    def src_epsg_code(self) -> EPSGCode:
+        """EPSG code of the warped virtual raster
+
+        Returns:
+            EPSG code
+        """
+        return self._data_fetcher_info.epsg_code
+
+    @property
+    def src_ground_sampling_distance(self) -> GroundSamplingDistance:
+        """Ground sampling distance of the warped virtual raster
+
+        Returns:
+            ground sampling distance in meters
+        """
+        return self._data_fetcher_info.ground_sampling_distance
+
+    @property
+    def src_num_channels(self) -> int:
+        """Number of channels of the virtual raster
+
+        Returns:
+            number of channels
+        """
+        return self._data_fetcher_info.num_channels
+
+    @property
+    def num_channels(self) -> int:
+        """Number of channels that are read from the virtual raster (i.e., without the dropped channels)
+
+        Returns:
+            number of channels
+        """
+        return self._data_fetcher_info.num_effective_channels
+
+    @property
+    def cache_params(self) -> dict:
+        """Parameters of the warped VRT data fetcher that affect the data (the cache key of `CachedDataFetcher`
+        is computed from them)
+
+        Returns:
+            parameters
+        """
+        return {
+            'path': self.path,
+            'epsg_code': self.epsg_code,
+            'tile_size': self.tile_size,
+            'ground_sampling_distance': self.ground_sampling_distance,
+            'interpolation_mode': self.interpolation_mode,
+            'buffer_size': self.buffer_size,
+            'drop_channels': self.drop_channels,
+            'layout': self.layout,
+        }
+
+    def close(self) -> None:
+        """Closes the dataset handles of the virtual raster of the current process."""
+        close_srcs(
+            path=self.path,
+        )
+
+    def __call__(
+        self,
+        x_min: Coordinate,
+        y_min: Coordinate,
+        out: npt.NDArray | None = None,
+    ) -> npt.NDArray:
+        """Fetches data from the warped virtual raster given a minimum x and y coordinate.
+
+        Parameters:
+            x_min: minimum x coordinate
+            y_min: minimum y coordinate
+            out: output array of shape (channels, height, width) the data is read into (if None, the data is read
+                into a new array)
+
+        Returns:
+            data
+        """
+        return warped_vrt_data_fetcher(
+            x_min=x_min,
+            y_min=y_min,
+            path=self.path,
+            epsg_code=self.epsg_code,
+            tile_size=self.tile_size,
+            ground_sampling_distance=self.ground_sampling_distance,
+            interpolation_mode=self.interpolation_mode,
+            buffer_size=self.buffer_size,
+            fill_value=self._FILL_VALUE,
+            gdal_config=self.gdal_config,
+            num_threads=self.num_threads,
+            indexes=self._data_fetcher_info.indexes,
+            layout=self.layout,
+            out=out,
+        )
+
+
+class WarpedVRTDataFetcherConfig(pydantic.BaseModel):
+    """Configuration for the `from_config` classmethod of `WarpedVRTDataFetcher`
+
+    Attributes:
+        path: path to the virtual raster (.vrt file)
+        epsg_code: EPSG code of the data
+        tile_size: tile size in meters
+        ground_sampling_distance: ground sampling distance in meters
+        interpolation_mode: interpolation mode ('bilinear' or 'nearest')
+        buffer_size: buffer size in meters (specifies the area around the tile that is additionally fetched)
+        drop_channels: channel indices to drop (supports negative indexing)
+        gdal_config: configuration of the GDAL environment or GDAL configuration preset
+            ('default' or 'large_vrt')
+        num_threads: number of threads of the warper (or 'ALL_CPUS')
+        layout: layout of the data ('channels_first' or 'channels_last')
+    """
+    path: Path
+    epsg_code: EPSGCode
+    tile_size: TileSize
+    ground_sampling_distance: GroundSamplingDistance
+    interpolation_mode: InterpolationMode = InterpolationMode.BILINEAR
+    buffer_size: BufferSize = 0
+    drop_channels: list[int] | None = None
+    gdal_config: GDALConfig | GDALConfigPreset | None = None
+    num_threads: int | str = 1
+    layout: DataLayout = DataLayout.CHANNELS_LAST
+
+
+class WMSDataFetcher(FromConfigMixin):
+    """Data fetcher for web map services
+
+    Implements the `DataFetcher` protocol.
+
+    The data fetcher sends a GetMap request for each tile and decodes the response (e.g., PNG or JPEG)
+    in memory.
+
+    Notes:
+        - Each worker of the dataloader has its own HTTP session, whose TCP connections are kept alive
+          and pooled (up to `num_threads` connections), so that no connection is opened for each tile
+        - The tiles of a batch are fetched concurrently by `num_threads` threads (see `fetch_batch`)
+        - Failed requests are retried up to `max_retries` times with exponential backoff
+        - If `cache_size` is specified, the responses are cached in memory (each worker has its own cache)
+        - The coordinate reference system must be projected (the bounding box is sent in the axis order (x, y))
+        - If the layout is `CHANNELS_FIRST`, the data is returned as decoded, i.e., without a transpose
+          (the data preprocessors must use the same layout)
+
+    Examples:
+        >>> wms_data_fetcher = WMSDataFetcher(
+        ...     url='https://www.wms.nrw.de/geobasis/wms_nw_dop',
+        ...     layer='nw_dop_rgb',
+        ...     epsg_code=25832,
+        ...     tile_size=128,
+        ...     ground_sampling_distance=.2,
+        ... )
+    """
+
+    def __init__(
+        self,
+        url: str,
+        layer: str,
+        epsg_code: EPSGCode,
+        tile_size: TileSize,
+        ground_sampling_distance: GroundSamplingDistance,
+        version: str = '1.3.0',
+        response_format: str = 'image/png',
+        style: str = '',
+        buffer_size: BufferSize = 0,
+        drop_channels: list[int] | None = None,
+        layout: DataLayout = DataLayout.CHANNELS_LAST,
+        num_threads: int = 8,
+        max_retries: int = 3,
+        timeout: float = 30.,
+        cache_size: int | None = None,
+    ) -> None:
+        """
+        Parameters:
+            url: url of the web map service
+            layer: name of the layer
+            epsg_code: EPSG code
+            tile_size: tile size in meters
+            ground_sampling_distance: ground sampling distance in meters
+            version: version of the web map service ('1.1.1' or '1.3.0')
+            response_format: format of the response (e.g., 'image/png' or 'image/jpeg')
+            style: name of the style
+            buffer_size: buffer size in meters (specifies the area around the tile that is additionally fetched)
+            drop_channels: channel indices to drop (supports negative indexing)
+            layout: layout of the data (`CHANNELS_FIRST` or `CHANNELS_LAST`)
+            num_threads: number of threads (and pooled connections) of each worker
+            max_retries: maximum number of retries of a failed request
+            timeout: timeout of a request in seconds
+            cache_size: size of the response cache of each worker in megabytes (if None, the responses
+                are not cached)
+        """
+        self.url = url
+        self.layer = layer
+        self.epsg_code = epsg_code
+        self.tile_size = tile_size
+        self.ground_sampling_distance = ground_sampling_distance
+        self.version = version
+        self.response_format = response_format
+        self.style = style
+        self.buffer_size = buffer_size
+        self.drop_channels = drop_channels
+        self.layout = layout
+        self.num_threads = num_threads
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.cache_size = cache_size
+
+        self._response_cache = None
+
+        if self.cache_size is not None:
+            self._response_cache = ResponseCache(
+                size=self.cache_size * 1_000_000,
+            )
+
+        self._pid = None
+        self._executor = None
+
+    @classmethod
+    def from_config(
+        cls,
+        config: WMSDataFetcherConfig,
+    ) -> WMSDataFetcher:
+        """Creates a WMS data fetcher from the configuration.
+
+        Parameters:
+            config: configuration
+
+        Returns:
+            WMS data fetcher
+        """
+        return cls(
+            url=config.url,
+            layer=config.layer,
+            epsg_code=config.epsg_code,
+            tile_size=config.tile_size,
+            ground_sampling_distance=config.ground_sampling_distance,
+            version=config.version,
+            response_format=config.response_format,
+            style=config.style,
+            buffer_size=config.buffer_size,
+            drop_channels=config.drop_channels,
+            layout=config.layout,
+            num_threads=config.num_threads,
+            max_retries=config.max_retries,
+            timeout=config.timeout,
+            cache_size=config.cache_size,
+        )
+
+    def __getstate__(self) -> dict:
+        """Returns the state without the thread pool (the thread pool is created lazily in each process).
+
+        Returns:
+            state
+        """
+        state = self.__dict__.copy()
+        state['_pid'] = None
+        state['_executor'] = None
+        return state
+
+    @property
+    def cache_params(self) -> dict:
+        """Parameters of the WMS data fetcher that affect the data (the cache key of `CachedDataFetcher`
+        is computed from them)
+
+        Returns:
+            parameters
+        """
+        return {
+            'url': self.url,
+            'layer': self.layer,
+            'epsg_code': self.epsg_code,
+            'tile_size': self.tile_size,
+            'ground_sampling_distance': self.ground_sampling_distance,
+            'version': self.version,
+            'response_format': self.response_format,
+            'style': self.style,
+            'buffer_size': self.buffer_size,
+            'drop_channels': self.drop_channels,
+            'layout': self.layout,
+        }
+
+    def close(self) -> None:
+        """Shuts down the thread pool and closes the HTTP sessions of the current process."""
+        if self._executor is not None and self._pid == os.getpid():
+            self._executor.shutdown(
+                wait=True,
+                cancel_futures=True,
+            )
+            self._executor = None
+
+        close_sessions()
+
+    def __call__(
+        self,
+        x_min: Coordinate,
+        y_min: Coordinate,
+    ) -> npt.NDArray:
+        """Fetches data from the web map service given a minimum x and y coordinate.
+
+        Parameters:
+            x_min: minimum x coordinate
+            y_min: minimum y coordinate
+
+        Returns:
+            data
+        """
+        return wms_data_fetcher(
+            x_min=x_min,
+            y_min=y_min,
+            url=self.url,
+            layer=self.layer,
+            epsg_code=self.epsg_code,
+            tile_size=self.tile_size,
+            ground_sampling_distance=self.ground_sampling_distance,
+            version=self.version,
+            response_format=self.response_format,
+            style=self.style,
+            buffer_size=self.buffer_size,
+            drop_channels=self.drop_channels,
+            layout=self.layout,
+            num_connections=self.num_threads,
+            max_retries=self.max_retries,
+            timeout=self.timeout,
+            response_cache=self._response_cache,
+        )
+
+    def fetch_batch(
+        self,
+        coordinates: CoordinatesSet,
+    ) -> list[npt.NDArray]:
+        """Fetches data from the web map service given the coordinates of a batch of tiles.
+
+        The requests of the tiles are sent concurrently by the thread pool of the current process.
+
+        Parameters:
+            coordinates: coordinates (x_min, y_min) of each tile
+
+        Returns:
+            data of each tile
+        """
+        if self._executor is None or self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.num_threads,
+            )
+
+        futures = [
+            self._executor.submit(
+                self,
+                x_min=x_min,
+                y_min=y_min,
+            )
+            for x_min, y_min in coordinates
+        ]
+        return [future.result() for future in futures]
+
+
+class WMSDataFetcherConfig(pydantic.BaseModel):
+    """Configuration for the `from_config` classmethod of `WMSDataFetcher`
+
+    Attributes:
+        url: url of the web map service
+        layer: name of the layer
+        epsg_code: EPSG code
+        tile_size: tile size in meters
+        ground_sampling_distance: ground sampling distance in meters
+        version: version of the web map service ('1.1.1' or '1.3.0')
+        response_format: format of the response (e.g., 'image/png' or 'image/jpeg')
+        style: name of the style
+        buffer_size: buffer size in meters (specifies the area around the tile that is additionally fetched)
+        drop_channels: channel indices to drop (supports negative indexing)
+        layout: layout of the data ('channels_first' or 'channels_last')
+        num_threads: number of threads (and pooled connections) of each worker
+        max_retries: maximum number of retries of a failed request
+        timeout: timeout of a request in seconds
+        cache_size: size of the response cache of each worker in megabytes (if None, the responses are not cached)
+    """
+    url: str
+    layer: str
+    epsg_code: EPSGCode
+    tile_size: TileSize
+    ground_sampling_distance: GroundSamplingDistance
+    version: str = '1.3.0'
+    response_format: str = 'image/png'
+    style: str = ''
+    buffer_size: BufferSize = 0
+    drop_channels: list[int] | None = None
+    layout: DataLayout = DataLayout.CHANNELS_LAST
+    num_threads: int = 8
+    max_retries: int = 3
+    timeout: float = 30.
+    cache_size: int | None = None
+
+
+class StackedDataFetcher(FromConfigMixin):
+    """Data fetcher that stacks the data of multiple data fetchers along the channels
+
+    Implements the `DataFetcher` protocol.
+
+    The stacked data fetcher composes data fetchers of different sources (e.g., virtual rasters of RGB, NIR
+    and DSM data with different ground sampling distances), each with its own interpolation mode
+    and channels to drop.
+    For each tile, the data fetchers are called concurrently and read their data into their channels
+    of a preallocated array, so that the latency of fetching a tile is close to the latency of the slowest
+    data fetcher instead of the sum of the latencies of all data fetchers.
+
+    Notes:
+        - The data fetchers must share the tile size, the ground sampling distance, the buffer size
+          and the coordinate reference system
+        - The data fetchers must accept an output array (e.g., `IndexedGeoTIFFDataFetcher`, `MemmapDataFetcher`
+          or `VRTDataFetcher`),
+          their layout is ignored
+        - The data is stacked in the order of the data fetchers and cast to the common data type
+          of their channels
+        - The thread pool is created lazily in each process (e.g., in each worker of the dataloader)
+
+    Examples:
+        >>> stacked_data_fetcher = StackedDataFetcher(
+        ...     data_fetchers=[rgb_data_fetcher, nir_data_fetcher, dsm_data_fetcher],
+        ... )
+    """
+
+    def __init__(
+        self,
+        data_fetchers: list[IndexedGeoTIFFDataFetcher | MemmapDataFetcher | VRTDataFetcher],
+        num_threads: int | None = None,
+        layout: DataLayout = DataLayout.CHANNELS_LAST,
+    ) -> None:
+        """
+        Parameters:
+            data_fetchers: data fetchers
+            num_threads: number of threads of each worker (if None, the number of data fetchers minus one
+                is used, since the first data fetcher is called in the calling thread)
+            layout: layout of the data (`CHANNELS_FIRST` or `CHANNELS_LAST`)
+
+        Raises:
+            AviaryUserError: Invalid data fetchers (`data_fetchers` is empty, the data fetchers do not share
+                the tile size, the ground sampling distance and the buffer size, the EPSG codes of the data
+                fetchers are not equal or the bounding boxes of the data fetchers do not intersect)
+        """
+        if not data_fetchers:
+            message = (
+                'Invalid data_fetchers! '
+                'data_fetchers must contain at least one data fetcher.'
+            )
+            raise AviaryUserError(message)
+
+        params = {
+            (data_fetcher.tile_size, data_fetcher.ground_sampling_distance, data_fetcher.buffer_size)
+            for data_fetcher in data_fetchers
+        }
+
+        if len(params) > 1:
+            message = (
+                'Invalid data_fetchers! '
+                'The tile sizes, the ground sampling distances and the buffer sizes of the data fetchers '
+                'must be equal.'
+            )
+            raise AviaryUserError(message)
+
+        self.data_fetchers = data_fetchers
+        self.num_threads = num_threads
+        self.layout = layout
+
+        self.tile_size = self.data_fetchers[0].tile_size
+        self.ground_sampling_distance = self.data_fetchers[0].ground_sampling_distance
+        self.buffer_size = self.data_fetchers[0].buffer_size
+
+        # noinspection PyProtectedMember
+        self._data_fetcher_info = stacked_data_fetcher_info(
+            data_fetcher_infos=[data_fetcher._data_fetcher_info for data_fetcher in self.data_fetchers],
+        )
+        self._pid = None
+        self._executor = None
+
+    @classmethod
+    def from_config(
+        cls,
+        config: StackedDataFetcherConfig,
+    ) -> StackedDataFetcher:
+        """Creates a stacked data fetcher from the configuration.
+
+        Parameters:
+            config: configuration
+
+        Returns:
+            stacked data fetcher
+        """
+        data_fetchers = []
+
+        for data_fetcher_config in config.data_fetchers_configs:
+            data_fetcher_class = globals()[data_fetcher_config.name]
+            data_fetcher = data_fetcher_class.from_config(data_fetcher_config.config)
+            data_fetchers.append(data_fetcher)
+
+        return cls(
+            data_fetchers=data_fetchers,
+            num_threads=config.num_threads,
+            layout=config.layout,
+        )
+
+    def __getstate__(self) -> dict:
+        """Returns the state without the thread pool (the thread pool is created lazily in each process).
+
+        Returns:
+            state
+        """
+        state = self.__dict__.copy()
+        state['_pid'] = None
+        state['_executor'] = None
+        return state
+
+    @property
+    def data_fetcher_info(self) -> DataFetcherInfo:
+        """Merged information of the data fetchers
+
+        Returns:
+            data fetcher information
+        """
+        return self._data_fetcher_info
+
+    @property
+    def src_bounding_box(self) -> BoundingBox:
+        """Intersection of the bounding boxes of the sources
+
+        Returns:
+            bounding box
+        """
+        return self._data_fetcher_info.bounding_box
+
+    @property
+    def src_dtype(self) -> list[DType]:
+        """Data type of each channel that is read from the sources
+
+        Returns:
+            data type of each channel
+        """
+        return self._data_fetcher_info.dtype
+
+    @property
+    def src_epsg_code(self) -> EPSGCode:
+        """EPSG code of the sources
+
+        Returns:
+            EPSG code
+        """
+        return self._data_fetcher_info.epsg_code
+
+    @property
+    def src_ground_sampling_distance(self) -> GroundSamplingDistance:
+        """Finest ground sampling distance of the sources
+
+        Returns:
+            ground sampling distance in meters
+        """
+        return self._data_fetcher_info.ground_sampling_distance
+
+    @property
+    def num_channels(self) -> int:
+        """Number of channels that are read from the sources (i.e., without the dropped channels)
+
+        Returns:
+            number of channels
+        """
+        return self._data_fetcher_info.num_channels
+
+    @property
+    def cache_params(self) -> dict:
+        """Parameters of the stacked data fetcher that affect the data (the cache key of `CachedDataFetcher`
+        is computed from them)
+
+        Returns:
+            parameters (the parameters of the data fetchers are part of the cache key)
+        """
+        return {
+            'layout': self.layout,
+        }
+
+    def close(self) -> None:
+        """Shuts down the thread pool of the current process and closes the data fetchers."""
+        if self._executor is not None and self._pid == os.getpid():
+            self._executor.shutdown(
+                wait=True,
+                cancel_futures=True,
+            )
+            self._executor = None
+
+        for data_fetcher in self.data_fetchers:
+            data_fetcher.close()
+
+    def __call__(
+        self,
+        x_min: Coordinate,
+        y_min: Coordinate,
+        out: npt.NDArray | None = None,
+    ) -> npt.NDArray:
+        """Fetches data from the data fetchers given a minimum x and y coordinate.
+
+        Parameters:
+            x_min: minimum x coordinate
+            y_min: minimum y coordinate
+            out: output array of shape (channels, height, width) the data is stacked in (if None, the data is
+                stacked in a new array)
+
+        Returns:
+            data
+        """
+        num_threads = self.num_threads
+
+        if num_threads is None:
+            num_threads = len(self.data_fetchers) - 1
+
+        if num_threads > 0 and (self._executor is None or self._pid != os.getpid()):
+            self._pid = os.getpid()
+            self._executor = ThreadPoolExecutor(
+                max_workers=num_threads,
+            )
+
+        return stacked_data_fetcher(
+            x_min=x_min,
+            y_min=y_min,
+            data_fetchers=self.data_fetchers,
+            num_channels=[data_fetcher.num_channels for data_fetcher in self.data_fetchers],
+            tile_size=self.tile_size,
+            ground_sampling_distance=self.ground_sampling_distance,
+            dtype=np.result_type(*[dtype.value for dtype in self.src_dtype]),
+            buffer_size=self.buffer_size,
+            executor=self._executor if num_threads > 0 else None,
+            layout=self.layout,
+            out=out,
+        )
+
+
+class StackedDataFetcherConfig(pydantic.BaseModel):
+    """Configuration for the `from_config` classmethod of `StackedDataFetcher`
+
+    Attributes:
+        data_fetchers_configs: configurations of the data fetchers
+        num_threads: number of threads of each worker (if None, the number of data fetchers minus one is used)
+        layout: layout of the data ('channels_first' or 'channels_last')
+    """
+    data_fetchers_configs: list[DataFetcherConfig]
+    num_threads: int | None = None
+    layout: DataLayout = DataLayout.CHANNELS_LAST
+
+
+class DataFetcherConfig(pydantic.BaseModel):
+    """Configuration for data fetchers
+
+    Attributes:
+        name: name of the data fetcher
+        config: configuration of the data fetcher
+    """
+    name: str
+    config: (
+        IndexedGeoTIFFDataFetcherConfig |
+        WarpedVRTDataFetcherConfig |
+        VRTDataFetcherConfig |
+        MemmapDataFetcherConfig
+    )
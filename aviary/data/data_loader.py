@@ -0,0 +1,119 @@
+from collections.abc import Iterator
+
+import numpy.typing as npt
+import torch
+
+# noinspection PyProtectedMember
+from aviary._functional.data.data_loader import (
+    compute_num_batches,
+    iter_batches,
+)
+
+# noinspection PyProtectedMember
+from aviary._utils.exceptions import AviaryUserError
+from aviary.data.dataset import Dataset
+
+
+class SharedMemoryDataLoader:
+    """Data loader with a ring of batch buffers in shared memory
+
+    A shared memory data loader is an iterable that returns the batches of a dataset like
+    `torch.utils.data.DataLoader`, but without collating the data of each tile and without pickling
+    the data through the queues of the workers.
+    A ring of `num_buffers` batch buffers is preallocated in shared memory.
+    Each worker fetches the data of its batches straight into the assigned buffer (the data fetcher reads
+    the data into the buffer if it supports an output array and its layout is `CHANNELS_FIRST`),
+    and the main process receives the batches as views of the buffers.
+
+    Notes:
+        - The data preprocessor of the dataset is applied once per batch in the main process
+          (i.e., the data is transferred from the workers in its native data type)
+        - The batches are returned in order
+        - The data of a batch is only valid until the next batch is requested (the buffer is reused),
+          i.e., the data must be copied to be kept
+        - The last batch may be smaller than `batch_size`
+        - The coordinates are returned as arrays instead of tensors
+
+    Examples:
+        >>> data_loader = SharedMemoryDataLoader(
+        ...     dataset=dataset,
+        ...     batch_size=16,
+        ...     num_workers=4,
+        ... )
+        >>> for data, x_min, y_min in data_loader:
+        ...     preds = model(data)
+    """
+
+    def __init__(
+        self,
+        dataset: Dataset,
+        batch_size: int = 1,
+        num_workers: int = 0,
+        num_buffers: int | None = None,
+    ) -> None:
+        """
+        Parameters:
+            dataset: dataset
+            batch_size: batch size
+            num_workers: number of workers (if 0, the data is fetched in the main process)
+            num_buffers: number of batch buffers (if None, two buffers per worker are used)
+
+        Raises:
+            AviaryUserError: Invalid batch size (`batch_size` is not positive)
+            AviaryUserError: Invalid number of workers (`num_workers` is negative)
+            AviaryUserError: Invalid number of buffers (`num_buffers` is less than `num_workers` or not positive)
+        """
+        if batch_size <= 0:
+            message = (
+                'Invalid batch size! '
+                'batch_size must be positive.'
+            )
+            raise AviaryUserError(message)
+
+        if num_workers < 0:
+            message = (
+                'Invalid number of workers! '
+                'num_workers must be non-negative.'
+            )
+            raise AviaryUserError(message)
+
+        if num_buffers is None:
+            num_buffers = max(2 * num_workers, 1)
+
+        if num_buffers <= 0 or num_buffers < num_workers:
+            message = (
+                'Invalid number of buffers! '
+                'num_buffers must be positive and at least num_workers.'
+            )
+            raise AviaryUserError(message)
+
+        self.dataset = dataset
+        self.batch_size = batch_size
+        self.num_workers = num_workers
+        self.num_buffers = num_buffers
+
+    def __len__(self) -> int:
+        """Computes the number of batches.
+
+        Returns:
+            number of batches
+        """
+        return compute_num_batches(
+            coordinates=self.dataset.coordinates,
+            batch_size=self.batch_size,
+        )
+
+    def __iter__(self) -> Iterator[tuple[npt.NDArray | torch.Tensor, npt.NDArray, npt.NDArray]]:
+        """Fetches and preprocesses data of each batch.
+
+        Yields:
+            data and coordinates (x_min, y_min) of each tile of the batch
+        """
+        yield from iter_batches(
+            data_fetcher=self.dataset.data_fetcher,
+            data_preprocessor=self.dataset.data_preprocessor,
+            coordinates=self.dataset.coordinates,
+            batch_size=self.batch_size,
+            num_workers=self.num_workers,
+            num_buffers=self.num_buffers,
+        )
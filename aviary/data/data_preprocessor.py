@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Callable
+from functools import partial
+from itertools import groupby
 
 import numpy as np
 import numpy.typing as npt
@@ -9,7 +12,11 @@ import torch
 
 # noinspection PyProtectedMember
 from aviary._functional.data.data_preprocessor import (
+    affine_preprocessor,
     composite_preprocessor,
+    compute_lut,
+    fuse_affine_params,
+    lut_preprocessor,
     normalize_preprocessor,
     standardize_preprocessor,
     to_tensor_preprocessor,
@@ -18,6 +25,9 @@ from aviary._functional.data.data_preprocessor import (
 # noinspection PyProtectedMember
 from aviary._utils.mixins import FromConfigMixin
 
+# noinspection PyProtectedMember
+from aviary._utils.types import DataLayout
+
 
 class DataPreprocessor(ABC, FromConfigMixin):
     """Abstract class for data preprocessors
@@ -30,6 +40,13 @@ class DataPreprocessor(ABC, FromConfigMixin):
         - NormalizePreprocessor: Applies min-max normalization
         - StandardizePreprocessor: Applies standardization
         - ToTensorPreprocessor: Converts the data to a tensor
+
+    Notes:
+        - The layout of the data (`CHANNELS_FIRST` or `CHANNELS_LAST`) must match the layout
+          of the data fetcher
+        - The data preprocessors preprocess the data of a tile or of a batch of tiles (i.e., data of shape
+          (batch size, channels, height, width) or (batch size, height, width, channels)), so that the data
+          can be preprocessed once per batch after collation
     """
 
     @abstractmethod
@@ -49,17 +66,120 @@ class DataPreprocessor(ABC, FromConfigMixin):
 
 
 class CompositePreprocessor(DataPreprocessor):
-    """Data preprocessor that composes multiple data preprocessors"""
+    """Data preprocessor that composes multiple data preprocessors
+
+    Notes:
+        - If `fuse` is True, consecutive affine data preprocessors (`NormalizePreprocessor`
+          and `StandardizePreprocessor`) with the same layout are fused into a single affine transformation
+          on initialization, i.e., the data is preprocessed in a single pass with one output array instead
+          of one output array per data preprocessor (the result equals the result of the data preprocessors
+          up to the rounding of single precision floating point numbers, i.e., it is not identical)
+        - If `use_lut` is True, `fuse` is False and the data is of data type uint8 or uint16, the leading
+          affine data preprocessors are replaced by a lookup table of each value of the data type
+          (per channel), i.e., the data is preprocessed by a gather per channel (the result is identical
+          to the result of the data preprocessors); the lookup table is computed once per data type
+          on the first call
+        - The lookup table is faster than the data preprocessors (e.g., 2.1 ms instead of 3.9 ms if the layout
+          is `CHANNELS_FIRST` and 11.9 ms instead of 20.2 ms if the layout is `CHANNELS_LAST` for min-max
+          normalization and standardization of a tile of 640x640 pixels with 3 channels of data type uint8),
+          but slower than the fused affine transformation (0.8 ms and 1.5 ms), so it is not used if `fuse`
+          is True
+    """
 
     def __init__(
         self,
         data_preprocessors: list[DataPreprocessor],
+        fuse: bool = False,
+        use_lut: bool = False,
     ) -> None:
         """
         Parameters:
             data_preprocessors: data preprocessors
+            fuse: if True, consecutive affine data preprocessors are fused into a single affine transformation
+            use_lut: if True, the leading affine data preprocessors are replaced by a lookup table
+                for data of data type uint8 or uint16 (only if `fuse` is False)
         """
         self.data_preprocessors = data_preprocessors
+        self.fuse = fuse
+        self.use_lut = use_lut
+
+        groups = self._group_data_preprocessors(
+            data_preprocessors=self.data_preprocessors,
+        )
+
+        if self.fuse:
+            self._data_preprocessors = self._fuse_data_preprocessors(
+                groups=groups,
+            )
+        else:
+            self._data_preprocessors = self.data_preprocessors
+
+        self._lut_layout = None
+        self._lut_data_preprocessors = []
+        self._remaining_data_preprocessors = self._data_preprocessors
+
+        if self.use_lut and not self.fuse and groups and groups[0][0] is not None:
+            self._lut_layout, self._lut_data_preprocessors = groups[0]
+            self._remaining_data_preprocessors = self._data_preprocessors[len(self._lut_data_preprocessors):]
+
+        self._luts = {}
+
+    @staticmethod
+    def _group_data_preprocessors(
+        data_preprocessors: list[DataPreprocessor],
+    ) -> list[tuple[DataLayout | None, list[DataPreprocessor]]]:
+        """Groups consecutive affine data preprocessors with the same layout.
+
+        Parameters:
+            data_preprocessors: data preprocessors
+
+        Returns:
+            layout and data preprocessors of each group (the layout is None if the data preprocessors
+            are not affine)
+        """
+        groups = groupby(
+            data_preprocessors,
+            key=lambda data_preprocessor: (
+                data_preprocessor.layout
+                if isinstance(data_preprocessor, NormalizePreprocessor | StandardizePreprocessor)
+                else None
+            ),
+        )
+        return [(layout, list(group)) for layout, group in groups]
+
+    @staticmethod
+    def _fuse_data_preprocessors(
+        groups: list[tuple[DataLayout | None, list[DataPreprocessor]]],
+    ) -> list[DataPreprocessor | Callable]:
+        """Fuses each group of consecutive affine data preprocessors into an affine preprocessor.
+
+        Parameters:
+            groups: layout and data preprocessors of each group (see `_group_data_preprocessors`)
+
+        Returns:
+            data preprocessors (each group of consecutive affine data preprocessors is replaced
+            by an affine preprocessor)
+        """
+        fused_data_preprocessors = []
+
+        for layout, group in groups:
+            if layout is None:
+                fused_data_preprocessors.extend(group)
+                continue
+
+            scale, offset = fuse_affine_params(
+                affine_params=[data_preprocessor.affine_params for data_preprocessor in group],
+                layout=layout,
+            )
+            fused_data_preprocessors.append(
+                partial(
+                    affine_preprocessor,
+                    scale=scale,
+                    offset=offset,
+                ),
+            )
+
+        return fused_data_preprocessors
 
     @classmethod
     def from_config(
@@ -83,6 +203,8 @@ class CompositePreprocessor(DataPreprocessor):
 
         return cls(
             data_preprocessors=data_preprocessors,
+            fuse=config.fuse,
+            use_lut=config.use_lut,
         )
 
     def __call__(
@@ -97,9 +219,33 @@ class CompositePreprocessor(DataPreprocessor):
         Returns:
             preprocessed data
         """
+        if self._lut_data_preprocessors and data.dtype in (np.uint8, np.uint16):
+            channel_axis = -3 if self._lut_layout == DataLayout.CHANNELS_FIRST else -1
+            key = (data.dtype, data.shape[channel_axis])
+            lut = self._luts.get(key)
+
+            if lut is None:
+                lut = compute_lut(
+                    data_preprocessors=self._lut_data_preprocessors,
+                    num_channels=data.shape[channel_axis],
+                    dtype=data.dtype,
+                    layout=self._lut_layout,
+                )
+                self._luts[key] = lut
+
+            data = lut_preprocessor(
+                data=data,
+                lut=lut,
+                layout=self._lut_layout,
+            )
+            return composite_preprocessor(
+                data=data,
+                data_preprocessors=self._remaining_data_preprocessors,
+            )
+
         return composite_preprocessor(
             data=data,
-            data_preprocessors=self.data_preprocessors,
+            data_preprocessors=self._data_preprocessors,
         )
 
 
@@ -108,8 +254,13 @@ class CompositePreprocessorConfig(pydantic.BaseModel):
 
     Attributes:
         data_preprocessors_configs: configurations of the data preprocessors
+        fuse: if True, consecutive affine data preprocessors are fused into a single affine transformation
+        use_lut: if True, the leading affine data preprocessors are replaced by a lookup table
+            for data of data type uint8 or uint16 (only if `fuse` is False)
     """
     data_preprocessors_configs: list[DataPreprocessorConfig]
+    fuse: bool = False
+    use_lut: bool = False
 
 
 class DataPreprocessorConfig(pydantic.BaseModel):
@@ -142,14 +293,29 @@ class NormalizePreprocessor(DataPreprocessor):
         self,
         min_values: list[float],
         max_values: list[float],
+        layout: DataLayout = DataLayout.CHANNELS_LAST,
     ) -> None:
         """
         Parameters:
             min_values: minimum values of the data (per channel)
             max_values: maximum values of the data (per channel)
+            layout: layout of the data (`CHANNELS_FIRST` or `CHANNELS_LAST`)
         """
         self.min_values = min_values
         self.max_values = max_values
+        self.layout = layout
+
+    @property
+    def affine_params(self) -> tuple[list[float], list[float]]:
+        """Scale and offset (per channel) of the min-max normalization (`data * scale + offset`)
+
+        Returns:
+            scale and offset (per channel)
+        """
+        min_values = np.array(self.min_values, dtype=np.float64)
+        scale = 1 / (np.array(self.max_values, dtype=np.float64) - min_values)
+        offset = -min_values * scale
+        return np.broadcast_to(scale, offset.shape).tolist(), offset.tolist()
 
     def __call__(
         self,
@@ -167,6 +333,7 @@ class NormalizePreprocessor(DataPreprocessor):
             data=data,
             min_values=self.min_values,
             max_values=self.max_values,
+            layout=self.layout,
         )
 
 
@@ -176,9 +343,11 @@ class NormalizePreprocessorConfig(pydantic.BaseModel):
     Attributes:
         min_values: minimum values of the data (per channel)
         max_values: maximum values of the data (per channel)
+        layout: layout of the data ('channels_first' or 'channels_last')
     """
     min_values: list[float]
     max_values: list[float]
+    layout: DataLayout = DataLayout.CHANNELS_LAST
 
 
 class StandardizePreprocessor(DataPreprocessor):
@@ -201,14 +370,28 @@ class StandardizePreprocessor(DataPreprocessor):
         self,
         mean_values: list[float],
         std_values: list[float],
+        layout: DataLayout = DataLayout.CHANNELS_LAST,
     ) -> None:
         """
         Parameters:
             mean_values: mean values of the data (per channel)
             std_values: standard deviation values of the data (per channel)
+            layout: layout of the data (`CHANNELS_FIRST` or `CHANNELS_LAST`)
         """
         self.mean_values = mean_values
         self.std_values = std_values
+        self.layout = layout
+
+    @property
+    def affine_params(self) -> tuple[list[float], list[float]]:
+        """Scale and offset (per channel) of the standardization (`data * scale + offset`)
+
+        Returns:
+            scale and offset (per channel)
+        """
+        scale = 1 / np.array(self.std_values, dtype=np.float64)
+        offset = -np.array(self.mean_values, dtype=np.float64) * scale
+        return np.broadcast_to(scale, offset.shape).tolist(), offset.tolist()
 
     def __call__(
         self,
@@ -226,6 +409,7 @@ class StandardizePreprocessor(DataPreprocessor):
             data=data,
             mean_values=self.mean_values,
             std_values=self.std_values,
+            layout=self.layout,
         )
 
 
@@ -235,14 +419,26 @@ class StandardizePreprocessorConfig(pydantic.BaseModel):
     Attributes:
         mean_values: mean values of the data (per channel)
         std_values: standard deviation values of the data (per channel)
+        layout: layout of the data ('channels_first' or 'channels_last')
     """
     mean_values: list[float]
     std_values: list[float]
+    layout: DataLayout = DataLayout.CHANNELS_LAST
 
 
 class ToTensorPreprocessor(DataPreprocessor):
     """Data preprocessor that converts the data to a tensor"""
 
+    def __init__(
+        self,
+        layout: DataLayout = DataLayout.CHANNELS_LAST,
+    ) -> None:
+        """
+        Parameters:
+            layout: layout of the data (`CHANNELS_FIRST` or `CHANNELS_LAST`)
+        """
+        self.layout = layout
+
     def __call__(
         self,
         data: npt.NDArray[np.float32],
@@ -253,13 +449,18 @@ class ToTensorPreprocessor(DataPreprocessor):
             data: data
 
         Returns:
-            tensor
+            tensor (channels-first)
         """
         return to_tensor_preprocessor(
             data=data,
+            layout=self.layout,
         )
 
 
 class ToTensorPreprocessorConfig(pydantic.BaseModel):
-    """Configuration for the `from_config` classmethod of `ToTensorPreprocessor`"""
-    pass
+    """Configuration for the `from_config` classmethod of `ToTensorPreprocessor`
+
+    Attributes:
+        layout: layout of the data ('channels_first' or 'channels_last')
+    """
+    layout: DataLayout = DataLayout.CHANNELS_LAST
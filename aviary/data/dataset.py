@@ -1,10 +1,15 @@
+from collections.abc import Iterator
+
 import numpy.typing as npt
 import torch.utils.data
 
 # noinspection PyProtectedMember
 from aviary._functional.data.dataset import (
     get_item,
+    get_items,
     get_length,
+    iter_items_async,
+    split_coordinates,
 )
 
 # noinspection PyProtectedMember
@@ -12,7 +17,10 @@ from aviary._utils.types import (
     Coordinate,
     CoordinatesSet,
 )
-from aviary.data.data_fetcher import DataFetcher
+from aviary.data.data_fetcher import (
+    AsyncDataFetcher,
+    DataFetcher,
+)
 from aviary.data.data_preprocessor import DataPreprocessor
 
 
@@ -21,18 +29,23 @@ class Dataset(torch.utils.data.Dataset):
 
     A dataset is an iterable that returns data for each tile by calling the data fetcher and data preprocessor.
     The dataset is used by the dataloader to fetch and preprocess data for each batch.
+
+    Notes:
+        - The data is passed from the data fetcher to the data preprocessor as is, i.e., the layout of the data
+          (`CHANNELS_FIRST` or `CHANNELS_LAST`) of the data fetcher and the data preprocessor must match
     """
 
     def __init__(
         self,
         data_fetcher: DataFetcher,
-        data_preprocessor: DataPreprocessor,
+        data_preprocessor: DataPreprocessor | None,
         coordinates: CoordinatesSet,
     ) -> None:
         """
         Parameters:
             data_fetcher: data fetcher
-            data_preprocessor: data preprocessor
+            data_preprocessor: data preprocessor (if None, the data is not preprocessed, e.g., if the batches
+                are preprocessed after collation)
             coordinates: coordinates (x_min, y_min) of each tile
         """
         self.data_fetcher = data_fetcher
@@ -67,3 +80,107 @@ class Dataset(torch.utils.data.Dataset):
             data_fetcher=self.data_fetcher,
             data_preprocessor=self.data_preprocessor,
         )
+
+    def __getitems__(
+        self,
+        indices: list[int],
+    ) -> list[tuple[npt.NDArray | torch.Tensor, Coordinate, Coordinate]]:
+        """Fetches and preprocesses data given the indices of a batch of tiles.
+
+        Notes:
+            - This method is called by the dataloader instead of `__getitem__` for each tile of a batch
+
+        Parameters:
+            indices: indices of the tiles
+
+        Returns:
+            data and coordinates (x_min, y_min) of each tile
+        """
+        return get_items(
+            coordinates=self.coordinates,
+            indices=indices,
+            data_fetcher=self.data_fetcher,
+            data_preprocessor=self.data_preprocessor,
+        )
+
+
+class AsyncDataset(torch.utils.data.IterableDataset):
+    """Dataset for async data fetchers
+
+    An async dataset is an iterable that returns data for each tile by awaiting the async data fetcher
+    and calling the data preprocessor.
+    Each worker of the dataloader runs an event loop that keeps up to `max_concurrency` fetches in flight,
+    so that I/O-bound data fetchers (e.g., `WMSDataFetcher` or `VRTDataFetcher` on a network filesystem)
+    are saturated with a few workers.
+    The dataloader assembles the batches (i.e., `batch_size` of the dataloader applies as usual).
+
+    Notes:
+        - The coordinates are split into contiguous chunks, one for each worker of the dataloader
+        - Synchronous data fetchers can be wrapped with `ExecutorDataFetcher`
+        - The data is passed from the data fetcher to the data preprocessor as is, i.e., the layout of the data
+          (`CHANNELS_FIRST` or `CHANNELS_LAST`) of the data fetcher and the data preprocessor must match
+
+    Examples:
+        >>> async_dataset = AsyncDataset(
+        ...     data_fetcher=ExecutorDataFetcher(
+        ...         data_fetcher=vrt_data_fetcher,
+        ...         num_threads=64,
+        ...     ),
+        ...     data_preprocessor=data_preprocessor,
+        ...     coordinates=process_area.coordinates,
+        ...     max_concurrency=64,
+        ... )
+    """
+
+    def __init__(
+        self,
+        data_fetcher: AsyncDataFetcher,
+        data_preprocessor: DataPreprocessor | None,
+        coordinates: CoordinatesSet,
+        max_concurrency: int = 64,
+    ) -> None:
+        """
+        Parameters:
+            data_fetcher: async data fetcher
+            data_preprocessor: data preprocessor (if None, the data is not preprocessed, e.g., if the batches
+                are preprocessed after collation)
+            coordinates: coordinates (x_min, y_min) of each tile
+            max_concurrency: maximum number of fetches in flight of each worker
+        """
+        self.data_fetcher = data_fetcher
+        self.data_preprocessor = data_preprocessor
+        self.coordinates = coordinates
+        self.max_concurrency = max_concurrency
+
+    def __len__(self) -> int:
+        """Computes the number of tiles.
+
+        Returns:
+            number of tiles
+        """
+        return get_length(
+            coordinates=self.coordinates,
+        )
+
+    def __iter__(self) -> Iterator[tuple[npt.NDArray | torch.Tensor, Coordinate, Coordinate]]:
+        """Fetches and preprocesses data of each tile of the current worker.
+
+        Yields:
+            data and coordinates (x_min, y_min) of each tile
+        """
+        coordinates = self.coordinates
+        worker_info = torch.utils.data.get_worker_info()
+
+        if worker_info is not None:
+            coordinates = split_coordinates(
+                coordinates=coordinates,
+                worker_id=worker_info.id,
+                num_workers=worker_info.num_workers,
+            )
+
+        yield from iter_items_async(
+            data_fetcher=self.data_fetcher,
+            data_preprocessor=self.data_preprocessor,
+            coordinates=coordinates,
+            max_concurrency=self.max_concurrency,
+        )
@@ -9,6 +9,7 @@ from aviary._utils.types import InterpolationMode
 from aviary.data.data_fetcher import (
     DataFetcher,
     VRTDataFetcher,
+    WarpedVRTDataFetcher,
 )
 from aviary.data.data_preprocessor import (
     CompositePreprocessor,
@@ -17,6 +18,7 @@ from aviary.data.data_preprocessor import (
     StandardizePreprocessor,
     ToTensorPreprocessor,
 )
+from aviary.data.data_loader import SharedMemoryDataLoader
 from aviary.data.dataset import Dataset
 
 
@@ -54,6 +56,17 @@ def normalize_preprocessor() -> NormalizePreprocessor:
     )
 
 
+@pytest.fixture(scope='session')
+def shared_memory_data_loader(
+    dataset: Dataset,
+) -> SharedMemoryDataLoader:
+    return SharedMemoryDataLoader(
+        dataset=dataset,
+        batch_size=2,
+        num_workers=2,
+    )
+
+
 @pytest.fixture(scope='session')
 def standardize_preprocessor() -> StandardizePreprocessor:
     mean_values = [0.] * 3
@@ -88,3 +101,26 @@ def vrt_data_fetcher(
         buffer_size=buffer_size,
         drop_channels=drop_channels,
     )
+
+
+@pytest.fixture(scope='session')
+@patch('aviary.data.data_fetcher.warped_vrt_data_fetcher_info')
+def warped_vrt_data_fetcher(
+    _mocked_warped_vrt_data_fetcher_info,
+) -> WarpedVRTDataFetcher:
+    path = Path('test/test.vrt')
+    epsg_code = 25833
+    tile_size = 128
+    ground_sampling_distance = .2
+    interpolation_mode = InterpolationMode.BILINEAR
+    buffer_size = 0
+    drop_channels = None
+    return WarpedVRTDataFetcher(
+        path=path,
+        epsg_code=epsg_code,
+        tile_size=tile_size,
+        ground_sampling_distance=ground_sampling_distance,
+        interpolation_mode=interpolation_mode,
+        buffer_size=buffer_size,
+        drop_channels=drop_channels,
+    )
@@ -1,19 +1,953 @@
+import asyncio
+import gc
+import os
+import pickle
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
+
+import geopandas as gpd
+import numpy as np
+import pytest
+import rasterio as rio
+import rasterio.shutil
+from rasterio.enums import Resampling
+from rasterio.transform import from_origin
+from shapely.geometry import box
+
+# noinspection PyProtectedMember
+from aviary._functional.data.data_fetcher import _srcs, get_default_cache_path
+
+# noinspection PyProtectedMember
+from aviary._utils.exceptions import AviaryUserError
 
 # noinspection PyProtectedMember
 from aviary._utils.types import (
     BoundingBox,
     DataFetcherInfo,
+    DataLayout,
     DType,
+    GDALConfig,
+    GDALConfigPreset,
+    GroundSamplingDistance,
     InterpolationMode,
+    ProcessArea,
 )
 from aviary.data.data_fetcher import (
+    ArrayDataFetcher,
+    CachedDataFetcher,
+    DataFetcher,
+    ExecutorDataFetcher,
+    IndexedGeoTIFFDataFetcher,
+    IndexedGeoTIFFDataFetcherConfig,
+    MemmapDataFetcher,
+    MemmapDataFetcherConfig,
+    PrefetchDataFetcher,
+    StackedDataFetcher,
+    StackedDataFetcherConfig,
     VRTDataFetcher,
     VRTDataFetcherConfig,
+    WarpedVRTDataFetcher,
+    WarpedVRTDataFetcherConfig,
+    WMSDataFetcher,
+    WMSDataFetcherConfig,
 )
 
 
+def test_array_data_fetcher_init() -> None:
+    data = np.zeros((3, 16, 32), dtype=np.uint8)
+    transform = from_origin(-8, 8, .5, .5)
+    epsg_code = 25832
+    tile_size = 4
+    ground_sampling_distance = .5
+    interpolation_mode = InterpolationMode.NEAREST
+    buffer_size = 2
+    drop_channels = [1]
+    array_data_fetcher = ArrayDataFetcher(
+        data=data,
+        transform=transform,
+        epsg_code=epsg_code,
+        tile_size=tile_size,
+        ground_sampling_distance=ground_sampling_distance,
+        interpolation_mode=interpolation_mode,
+        buffer_size=buffer_size,
+        drop_channels=drop_channels,
+    )
+
+    assert array_data_fetcher.data is data
+    assert array_data_fetcher.transform == transform
+    assert array_data_fetcher.epsg_code == epsg_code
+    assert array_data_fetcher.tile_size == tile_size
+    assert array_data_fetcher.ground_sampling_distance == ground_sampling_distance
+    assert array_data_fetcher.interpolation_mode == interpolation_mode
+    assert array_data_fetcher.buffer_size == buffer_size
+    assert array_data_fetcher.drop_channels == drop_channels
+    assert array_data_fetcher.layout == DataLayout.CHANNELS_LAST
+    assert not array_data_fetcher.shared
+    assert array_data_fetcher.src_bounding_box == BoundingBox(
+        x_min=-8,
+        y_min=0,
+        x_max=8,
+        y_max=8,
+    )
+    assert array_data_fetcher.src_dtype == [DType.UINT8] * 3
+    assert array_data_fetcher.src_epsg_code == epsg_code
+    assert array_data_fetcher.src_ground_sampling_distance == .5
+    assert array_data_fetcher.src_num_channels == 3
+    assert array_data_fetcher.num_channels == 2
+    assert array_data_fetcher._native_resolution
+
+
+@patch('aviary.data.data_fetcher.array_data_fetcher')
+def test_array_data_fetcher_call(
+    mocked_array_data_fetcher,
+) -> None:
+    array_data_fetcher = ArrayDataFetcher(
+        data=np.zeros((3, 16, 32), dtype=np.uint8),
+        transform=from_origin(-8, 8, .5, .5),
+        epsg_code=25832,
+        tile_size=4,
+        ground_sampling_distance=.25,
+        drop_channels=[1],
+    )
+    expected = 'expected'
+    mocked_array_data_fetcher.return_value = expected
+    data = array_data_fetcher(
+        x_min=-8,
+        y_min=0,
+    )
+
+    mocked_array_data_fetcher.assert_called_once_with(
+        x_min=-8,
+        y_min=0,
+        path=array_data_fetcher._path,
+        tile_size=4,
+        ground_sampling_distance=.25,
+        interpolation_mode=InterpolationMode.BILINEAR,
+        buffer_size=0,
+        fill_value=0,
+        native_resolution=False,
+        indexes=[1, 3],
+        layout=DataLayout.CHANNELS_LAST,
+        out=None,
+    )
+    assert data == expected
+
+
+def test_array_data_fetcher_pickle() -> None:
+    data = np.arange(3 * 16 * 32, dtype=np.uint8).reshape(3, 16, 32)
+    array_data_fetcher = ArrayDataFetcher(
+        data=data,
+        transform=from_origin(-8, 8, .5, .5),
+        epsg_code=25832,
+        tile_size=4,
+        ground_sampling_distance=.5,
+        shared=True,
+    )
+
+    assert not np.shares_memory(array_data_fetcher.data, data)
+
+    state = array_data_fetcher.__getstate__()
+
+    assert state['data'] is None
+
+    array_data_fetcher_ = pickle.loads(pickle.dumps(array_data_fetcher))
+
+    np.testing.assert_array_equal(array_data_fetcher_.data, data)
+    np.testing.assert_array_equal(
+        array_data_fetcher_(
+            x_min=-4,
+            y_min=4,
+        ),
+        array_data_fetcher(
+            x_min=-4,
+            y_min=4,
+        ),
+    )
+
+    array_data_fetcher_.close()
+    array_data_fetcher.close()
+
+    assert array_data_fetcher.data is None
+
+
+def test_array_data_fetcher_close_srcs() -> None:
+    array_data_fetcher = ArrayDataFetcher(
+        data=np.arange(3 * 16 * 32, dtype=np.uint8).reshape(3, 16, 32),
+        transform=from_origin(-8, 8, .5, .5),
+        epsg_code=25832,
+        tile_size=4,
+        ground_sampling_distance=.5,
+    )
+    path = array_data_fetcher._path
+    _ = array_data_fetcher(
+        x_min=-4,
+        y_min=4,
+    )
+
+    assert any(key[2] == path for key in _srcs)
+
+    array_data_fetcher.close()
+
+    assert not any(key[2] == path for key in _srcs)
+
+    array_data_fetcher = ArrayDataFetcher(
+        data=np.arange(3 * 16 * 32, dtype=np.uint8).reshape(3, 16, 32),
+        transform=from_origin(-8, 8, .5, .5),
+        epsg_code=25832,
+        tile_size=4,
+        ground_sampling_distance=.5,
+    )
+    path = array_data_fetcher._path
+    _ = array_data_fetcher(
+        x_min=-4,
+        y_min=4,
+    )
+
+    assert any(key[2] == path for key in _srcs)
+
+    del array_data_fetcher
+    gc.collect()
+
+    assert not any(key[2] == path for key in _srcs)
+
+
+def test_cached_data_fetcher_init(
+    tmp_path: Path,
+) -> None:
+    data_fetcher = MagicMock(spec=DataFetcher)
+    data_fetcher.cache_params = {}
+    max_size = 1
+    cached_data_fetcher = CachedDataFetcher(
+        data_fetcher=data_fetcher,
+        path=tmp_path,
+        max_size=max_size,
+    )
+
+    assert cached_data_fetcher.data_fetcher == data_fetcher
+    assert cached_data_fetcher.path == tmp_path
+    assert cached_data_fetcher.max_size == max_size
+    assert cached_data_fetcher._cache_path.is_dir()
+
+
+def test_cached_data_fetcher_init_exceptions(
+    tmp_path: Path,
+) -> None:
+    data_fetcher = MagicMock(spec=DataFetcher)
+    message = 'Invalid data_fetcher!'
+
+    with pytest.raises(AviaryUserError, match=message):
+        _ = CachedDataFetcher(
+            data_fetcher=data_fetcher,
+            path=tmp_path,
+        )
+
+    array_data_fetcher = ArrayDataFetcher(
+        data=np.zeros((3, 16, 32), dtype=np.uint8),
+        transform=from_origin(-8, 8, .5, .5),
+        epsg_code=25832,
+        tile_size=4,
+        ground_sampling_distance=.5,
+    )
+
+    with pytest.raises(AviaryUserError, match=message):
+        _ = CachedDataFetcher(
+            data_fetcher=array_data_fetcher,
+            path=tmp_path,
+        )
+
+
+def test_cached_data_fetcher_wms_data_fetcher(
+    tmp_path: Path,
+) -> None:
+    cache_keys = set()
+
+    for url, layer, style in [
+        ('http://localhost/wms', 'test', ''),
+        ('http://localhost/wms_', 'test', ''),
+        ('http://localhost/wms', 'test_', ''),
+        ('http://localhost/wms', 'test', 'test'),
+    ]:
+        wms_data_fetcher = WMSDataFetcher(
+            url=url,
+            layer=layer,
+            epsg_code=25832,
+            tile_size=128,
+            ground_sampling_distance=.2,
+            style=style,
+        )
+        cached_data_fetcher = CachedDataFetcher(
+            data_fetcher=wms_data_fetcher,
+            path=tmp_path,
+        )
+        cache_keys.add(cached_data_fetcher._cache_key)
+
+    wms_data_fetcher = WMSDataFetcher(
+        url='http://localhost/wms',
+        layer='test',
+        epsg_code=25832,
+        tile_size=128,
+        ground_sampling_distance=.2,
+        layout=DataLayout.CHANNELS_FIRST,
+    )
+    cached_data_fetcher = CachedDataFetcher(
+        data_fetcher=wms_data_fetcher,
+        path=tmp_path,
+    )
+
+    assert cached_data_fetcher._cache_key not in cache_keys
+
+
+def test_cached_data_fetcher_memmap_data_fetcher(
+    tmp_path: Path,
+    memmap_data_fetcher: MemmapDataFetcher,
+) -> None:
+    cached_data_fetcher = CachedDataFetcher(
+        data_fetcher=memmap_data_fetcher,
+        path=tmp_path / 'cache',
+    )
+    data_path = next(path for path in memmap_data_fetcher.path.iterdir() if path.suffix == '.npy')
+    mtime_ns = data_path.stat().st_mtime_ns + 1_000_000_000
+    os.utime(data_path, ns=(mtime_ns, mtime_ns))
+    cached_data_fetcher_ = CachedDataFetcher(
+        data_fetcher=memmap_data_fetcher,
+        path=tmp_path / 'cache',
+    )
+
+    assert cached_data_fetcher._cache_key != cached_data_fetcher_._cache_key
+
+
+@patch('aviary.data.data_fetcher.vrt_data_fetcher_info')
+def test_cached_data_fetcher_vrt_data_fetcher(
+    mocked_vrt_data_fetcher_info,
+    tmp_path: Path,
+) -> None:
+    data_fetcher_info = DataFetcherInfo(
+        bounding_box=BoundingBox(
+            x_min=-128,
+            y_min=-128,
+            x_max=128,
+            y_max=128,
+        ),
+        dtype=[DType.UINT8] * 3,
+        epsg_code=25832,
+        ground_sampling_distance=.2,
+        num_channels=3,
+        overview_factors=(2, 4),
+    )
+    cache_keys = set()
+
+    for kwargs, overview_level in [
+        ({}, None),
+        ({'layout': DataLayout.CHANNELS_FIRST}, None),
+        ({'snap_to_grid': True}, None),
+        ({}, 0),
+    ]:
+        mocked_vrt_data_fetcher_info.return_value = DataFetcherInfo(
+            **{**data_fetcher_info.__dict__, 'overview_level': overview_level},
+        )
+        vrt_data_fetcher = VRTDataFetcher(
+            path=Path('test/test.vrt'),
+            tile_size=128,
+            ground_sampling_distance=.2,
+            **kwargs,
+        )
+        cached_data_fetcher = CachedDataFetcher(
+            data_fetcher=vrt_data_fetcher,
+            path=tmp_path,
+        )
+        cache_keys.add(cached_data_fetcher._cache_key)
+
+    assert len(cache_keys) == 4
+
+
+def test_cached_data_fetcher_call(
+    tmp_path: Path,
+) -> None:
+    data_fetcher = MagicMock(spec=DataFetcher)
+    data_fetcher.cache_params = {}
+    data_fetcher.side_effect = lambda x_min, y_min: np.full((2, 2, 3), x_min, dtype=np.int32)
+    cached_data_fetcher = CachedDataFetcher(
+        data_fetcher=data_fetcher,
+        path=tmp_path,
+    )
+    data = cached_data_fetcher(
+        x_min=1,
+        y_min=0,
+    )
+    cached_data = cached_data_fetcher(
+        x_min=1,
+        y_min=0,
+    )
+
+    data_fetcher.assert_called_once_with(
+        x_min=1,
+        y_min=0,
+    )
+    assert isinstance(cached_data, np.memmap)
+    np.testing.assert_array_equal(cached_data, data)
+
+
+def test_cached_data_fetcher_fetch_batch(
+    tmp_path: Path,
+) -> None:
+    data_fetcher = MagicMock(spec=['cache_params', 'fetch_batch'])
+    data_fetcher.cache_params = {}
+    data_fetcher.side_effect = lambda x_min, y_min: np.full((2, 2, 3), x_min, dtype=np.int32)
+    data_fetcher.fetch_batch.side_effect = lambda coordinates: [
+        np.full((2, 2, 3), x_min, dtype=np.int32)
+        for x_min, _ in coordinates
+    ]
+    cached_data_fetcher = CachedDataFetcher(
+        data_fetcher=data_fetcher,
+        path=tmp_path,
+    )
+    _ = cached_data_fetcher(
+        x_min=1,
+        y_min=0,
+    )
+    coordinates = np.array([[1, 0], [2, 0], [3, 0]], dtype=np.int32)
+    batch = cached_data_fetcher.fetch_batch(
+        coordinates=coordinates,
+    )
+
+    np.testing.assert_array_equal(
+        data_fetcher.fetch_batch.call_args.kwargs['coordinates'],
+        coordinates[1:],
+    )
+    assert isinstance(batch[0], np.memmap)
+
+    for data, (x_min, _) in zip(batch, coordinates):
+        np.testing.assert_array_equal(data, np.full((2, 2, 3), x_min, dtype=np.int32))
+
+
+def test_cached_data_fetcher_stacked_data_fetcher(
+    tmp_path: Path,
+) -> None:
+    data_fetchers = [
+        _get_data_fetcher(
+            epsg_code=25832,
+            path=Path('test/test_1.vrt'),
+        ),
+        _get_data_fetcher(
+            epsg_code=25832,
+            path=Path('test/test_2.vrt'),
+        ),
+    ]
+    stacked_data_fetcher = StackedDataFetcher(
+        data_fetchers=data_fetchers,
+    )
+    cached_data_fetcher = CachedDataFetcher(
+        data_fetcher=stacked_data_fetcher,
+        path=tmp_path,
+    )
+    stacked_data_fetcher_ = StackedDataFetcher(
+        data_fetchers=data_fetchers[:1],
+    )
+    cached_data_fetcher_ = CachedDataFetcher(
+        data_fetcher=stacked_data_fetcher_,
+        path=tmp_path,
+    )
+
+    assert cached_data_fetcher._cache_key != cached_data_fetcher_._cache_key
+
+
+def test_prefetch_data_fetcher_init() -> None:
+    data_fetcher = MagicMock(spec=DataFetcher)
+    coordinates = np.array([[-128, -128], [0, -128], [-128, 0], [0, 0]], dtype=np.int32)
+    num_threads = 2
+    prefetch_depth = 2
+    batch_size = 2
+    prefetch_data_fetcher = PrefetchDataFetcher(
+        data_fetcher=data_fetcher,
+        coordinates=coordinates,
+        num_threads=num_threads,
+        prefetch_depth=prefetch_depth,
+        batch_size=batch_size,
+    )
+
+    assert prefetch_data_fetcher.data_fetcher == data_fetcher
+    np.testing.assert_array_equal(prefetch_data_fetcher.coordinates, coordinates)
+    assert prefetch_data_fetcher.num_threads == num_threads
+    assert prefetch_data_fetcher.prefetch_depth == prefetch_depth
+    assert prefetch_data_fetcher.batch_size == batch_size
+
+
+def test_prefetch_data_fetcher_call() -> None:
+    data_fetcher = MagicMock(spec=DataFetcher)
+    data_fetcher.side_effect = lambda x_min, y_min: (x_min, y_min)
+    coordinates = np.array([[-128, -128], [0, -128], [-128, 0], [0, 0]], dtype=np.int32)
+    prefetch_data_fetcher = PrefetchDataFetcher(
+        data_fetcher=data_fetcher,
+        coordinates=coordinates,
+        num_threads=2,
+        prefetch_depth=2,
+    )
+    data = prefetch_data_fetcher(
+        x_min=-128,
+        y_min=-128,
+    )
+
+    assert data == (-128, -128)
+    assert set(prefetch_data_fetcher._futures) == {1, 2}
+
+    data = prefetch_data_fetcher(
+        x_min=0,
+        y_min=-128,
+    )
+
+    assert data == (0, -128)
+    assert set(prefetch_data_fetcher._futures) == {2, 3}
+
+    data = prefetch_data_fetcher(
+        x_min=256,
+        y_min=256,
+    )
+
+    assert data == (256, 256)
+
+    data_fetcher.assert_any_call(
+        x_min=256,
+        y_min=256,
+    )
+
+    prefetch_data_fetcher.close()
+
+
+def test_prefetch_data_fetcher_fetch_batch() -> None:
+    data_fetcher = MagicMock(spec=['cache_params', 'fetch_batch'])
+    data_fetcher.fetch_batch.side_effect = lambda coordinates: [tuple(coordinates_) for coordinates_ in coordinates]
+    coordinates = np.array(
+        [[-128, -128], [0, -128], [-128, 0], [0, 0], [128, 0]],
+        dtype=np.int32,
+    )
+    prefetch_data_fetcher = PrefetchDataFetcher(
+        data_fetcher=data_fetcher,
+        coordinates=coordinates,
+        num_threads=2,
+        prefetch_depth=2,
+        batch_size=2,
+    )
+    batch = prefetch_data_fetcher.fetch_batch(
+        coordinates=coordinates[:2],
+    )
+
+    assert batch == [(-128, -128), (0, -128)]
+    assert set(prefetch_data_fetcher._futures) == {(2, 4)}
+
+    batch = prefetch_data_fetcher.fetch_batch(
+        coordinates=coordinates[2:4],
+    )
+
+    assert batch == [(-128, 0), (0, 0)]
+    assert set(prefetch_data_fetcher._futures) == {(4, 5)}
+
+    batch = prefetch_data_fetcher.fetch_batch(
+        coordinates=coordinates[4:],
+    )
+
+    assert batch == [(128, 0)]
+    assert prefetch_data_fetcher._futures == {}
+
+    called_coordinates = [
+        call.kwargs['coordinates'].tolist()
+        for call in data_fetcher.fetch_batch.call_args_list
+    ]
+
+    assert called_coordinates == [coordinates[:2].tolist(), coordinates[2:4].tolist(), coordinates[4:].tolist()]
+
+    batch = prefetch_data_fetcher.fetch_batch(
+        coordinates=coordinates[[1, 3]],
+    )
+
+    assert batch == [(0, -128), (0, 0)]
+    assert data_fetcher.fetch_batch.call_count == 4
+
+    prefetch_data_fetcher.close()
+
+
+def test_prefetch_data_fetcher_fetch_batch_without_fetch_batch() -> None:
+    data_fetcher = MagicMock(spec=DataFetcher)
+    data_fetcher.side_effect = lambda x_min, y_min: (x_min, y_min)
+    coordinates = np.array([[-128, -128], [0, -128], [-128, 0], [0, 0]], dtype=np.int32)
+    prefetch_data_fetcher = PrefetchDataFetcher(
+        data_fetcher=data_fetcher,
+        coordinates=coordinates,
+        num_threads=2,
+        prefetch_depth=2,
+        batch_size=2,
+    )
+    batch = prefetch_data_fetcher.fetch_batch(
+        coordinates=coordinates[:2],
+    )
+
+    assert batch == [(-128, -128), (0, -128)]
+    assert set(prefetch_data_fetcher._futures) == {2, 3}
+
+    prefetch_data_fetcher.close()
+
+
+def test_prefetch_data_fetcher_pickle() -> None:
+    coordinates = np.array([[-128, -128], [0, -128]], dtype=np.int32)
+    prefetch_data_fetcher = PrefetchDataFetcher(
+        data_fetcher=dict,
+        coordinates=coordinates,
+    )
+    _ = prefetch_data_fetcher(
+        x_min=-128,
+        y_min=-128,
+    )
+    prefetch_data_fetcher_ = pickle.loads(pickle.dumps(prefetch_data_fetcher))
+
+    assert prefetch_data_fetcher_._executor is None
+    assert prefetch_data_fetcher_(x_min=0, y_min=-128) == {'x_min': 0, 'y_min': -128}
+
+    prefetch_data_fetcher.close()
+    prefetch_data_fetcher_.close()
+
+
+def test_executor_data_fetcher_init() -> None:
+    data_fetcher = MagicMock(spec=DataFetcher)
+    num_threads = 4
+    executor_data_fetcher = ExecutorDataFetcher(
+        data_fetcher=data_fetcher,
+        num_threads=num_threads,
+    )
+
+    assert executor_data_fetcher.data_fetcher == data_fetcher
+    assert executor_data_fetcher.num_threads == num_threads
+
+
+def test_executor_data_fetcher_call() -> None:
+    data_fetcher = MagicMock(spec=DataFetcher)
+    expected = 'expected'
+    data_fetcher.return_value = expected
+    executor_data_fetcher = ExecutorDataFetcher(
+        data_fetcher=data_fetcher,
+    )
+    data = asyncio.run(
+        executor_data_fetcher(
+            x_min=-128,
+            y_min=-128,
+        ),
+    )
+
+    data_fetcher.assert_called_once_with(
+        x_min=-128,
+        y_min=-128,
+    )
+    assert data == expected
+
+    executor_data_fetcher.close()
+
+    assert executor_data_fetcher._executor is None
+
+
+def test_executor_data_fetcher_pickle() -> None:
+    executor_data_fetcher = ExecutorDataFetcher(
+        data_fetcher=MagicMock(spec=DataFetcher),
+    )
+    executor_data_fetcher._pid = os.getpid()
+    executor_data_fetcher._executor = MagicMock()
+    state = executor_data_fetcher.__getstate__()
+
+    assert state['_pid'] is None
+    assert state['_executor'] is None
+
+
+@patch('aviary.data.data_fetcher.indexed_geotiff_data_fetcher_info')
+@patch('aviary.data.data_fetcher.load_footprint_index')
+def test_indexed_geotiff_data_fetcher_init(
+    mocked_load_footprint_index,
+    mocked_indexed_geotiff_data_fetcher_info,
+) -> None:
+    path = Path('test/test.vrt')
+    index_path = Path('test/test.feather')
+    tile_size = 128
+    ground_sampling_distance = .2
+    drop_channels = [-1]
+    footprint_index = gpd.GeoDataFrame(
+        {'path': ['test/test_0.tif', 'test/test_1.tif']},
+        geometry=[box(-128, -128, 0, 128), box(0, -128, 128, 128)],
+    )
+    mocked_load_footprint_index.return_value = footprint_index
+    expected_bounding_box = BoundingBox(
+        x_min=-128,
+        y_min=-128,
+        x_max=128,
+        y_max=128,
+    )
+    expected = DataFetcherInfo(
+        bounding_box=expected_bounding_box,
+        dtype=[DType.UINT8, DType.UINT8, DType.UINT8],
+        epsg_code=25832,
+        ground_sampling_distance=.2,
+        num_channels=3,
+        indexes=[1, 2],
+    )
+    mocked_indexed_geotiff_data_fetcher_info.return_value = expected
+    indexed_geotiff_data_fetcher = IndexedGeoTIFFDataFetcher(
+        path=path,
+        index_path=index_path,
+        tile_size=tile_size,
+        ground_sampling_distance=ground_sampling_distance,
+        drop_channels=drop_channels,
+        gdal_config=GDALConfigPreset.DEFAULT,
+    )
+
+    assert indexed_geotiff_data_fetcher.path == path
+    assert indexed_geotiff_data_fetcher.index_path == index_path
+    assert indexed_geotiff_data_fetcher.tile_size == tile_size
+    assert indexed_geotiff_data_fetcher.ground_sampling_distance == ground_sampling_distance
+    assert indexed_geotiff_data_fetcher.drop_channels == drop_channels
+    assert indexed_geotiff_data_fetcher.gdal_config == GDALConfig.from_preset(GDALConfigPreset.DEFAULT)
+    mocked_load_footprint_index.assert_called_once_with(
+        path=path,
+        index_path=index_path,
+    )
+    mocked_indexed_geotiff_data_fetcher_info.assert_called_once_with(
+        footprint_index=footprint_index,
+        drop_channels=drop_channels,
+    )
+    assert indexed_geotiff_data_fetcher.src_bounding_box == expected_bounding_box
+    assert indexed_geotiff_data_fetcher.src_num_channels == 3
+    assert indexed_geotiff_data_fetcher.num_channels == 2
+    assert indexed_geotiff_data_fetcher.num_srcs == 2
+
+
+@patch('aviary.data.data_fetcher.indexed_geotiff_data_fetcher_info')
+@patch('aviary.data.data_fetcher.load_footprint_index')
+def test_indexed_geotiff_data_fetcher_from_config(
+    mocked_load_footprint_index,
+    _mocked_indexed_geotiff_data_fetcher_info,
+) -> None:
+    mocked_load_footprint_index.return_value = gpd.GeoDataFrame(
+        {'path': ['test/test_0.tif']},
+        geometry=[box(-128, -128, 128, 128)],
+    )
+    config = IndexedGeoTIFFDataFetcherConfig(
+        path=Path('test/test.vrt'),
+        index_path=Path('test/test.feather'),
+        tile_size=128,
+        ground_sampling_distance=.2,
+        layout='channels_first',
+    )
+    indexed_geotiff_data_fetcher = IndexedGeoTIFFDataFetcher.from_config(
+        config=config,
+    )
+
+    assert indexed_geotiff_data_fetcher.path == config.path
+    assert indexed_geotiff_data_fetcher.index_path == config.index_path
+    assert indexed_geotiff_data_fetcher.tile_size == config.tile_size
+    assert indexed_geotiff_data_fetcher.ground_sampling_distance == config.ground_sampling_distance
+    assert indexed_geotiff_data_fetcher.layout == DataLayout.CHANNELS_FIRST
+
+
+@patch('aviary.data.data_fetcher.indexed_geotiff_data_fetcher')
+@patch('aviary.data.data_fetcher.indexed_geotiff_data_fetcher_info')
+@patch('aviary.data.data_fetcher.load_footprint_index')
+def test_indexed_geotiff_data_fetcher_call(
+    mocked_load_footprint_index,
+    mocked_indexed_geotiff_data_fetcher_info,
+    mocked_indexed_geotiff_data_fetcher,
+) -> None:
+    mocked_load_footprint_index.return_value = gpd.GeoDataFrame(
+        {'path': ['test/test_0.tif']},
+        geometry=[box(-128, -128, 128, 128)],
+    )
+    mocked_indexed_geotiff_data_fetcher_info.return_value = DataFetcherInfo(
+        bounding_box=BoundingBox(
+            x_min=-128,
+            y_min=-128,
+            x_max=128,
+            y_max=128,
+        ),
+        dtype=[DType.UINT8, DType.UINT8, DType.UINT8],
+        epsg_code=25832,
+        ground_sampling_distance=.2,
+        num_channels=3,
+    )
+    indexed_geotiff_data_fetcher = IndexedGeoTIFFDataFetcher(
+        path=Path('test/test.vrt'),
+        index_path=Path('test/test.feather'),
+        tile_size=128,
+        ground_sampling_distance=.2,
+    )
+    x_min = -128
+    y_min = -128
+    expected = 'expected'
+    mocked_indexed_geotiff_data_fetcher.return_value = expected
+    data = indexed_geotiff_data_fetcher(
+        x_min=x_min,
+        y_min=y_min,
+    )
+
+    mocked_indexed_geotiff_data_fetcher.assert_called_once_with(
+        x_min=x_min,
+        y_min=y_min,
+        paths=['test/test_0.tif'],
+        footprints=indexed_geotiff_data_fetcher._footprints,
+        tile_size=indexed_geotiff_data_fetcher.tile_size,
+        ground_sampling_distance=indexed_geotiff_data_fetcher.ground_sampling_distance,
+        num_channels=3,
+        dtype=np.uint8,
+        interpolation_mode=indexed_geotiff_data_fetcher.interpolation_mode,
+        buffer_size=indexed_geotiff_data_fetcher.buffer_size,
+        fill_value=indexed_geotiff_data_fetcher._FILL_VALUE,
+        gdal_config=indexed_geotiff_data_fetcher.gdal_config,
+        indexes=None,
+        layout=indexed_geotiff_data_fetcher.layout,
+        out=None,
+    )
+    assert data == expected
+
+
+def _fetch(
+    x_min: int,
+    y_min: int,
+    out: np.ndarray,
+) -> np.ndarray:
+    out[0] = x_min + 4
+    out[1] = y_min + 4
+    out[2] = 1
+    return out
+
+
+@pytest.fixture
+def memmap_data_fetcher(
+    tmp_path: Path,
+) -> MemmapDataFetcher:
+    data_fetcher = _get_data_fetcher(
+        epsg_code=25832,
+    )
+    data_fetcher.tile_size = 4
+    data_fetcher.ground_sampling_distance = 2.
+    data_fetcher.side_effect = _fetch
+    process_area = ProcessArea(
+        coordinates=np.array([[0, 0], [4, 0]], dtype=np.int32),
+    )
+    return MemmapDataFetcher.build(
+        path=tmp_path / 'memmap',
+        data_fetcher=data_fetcher,
+        process_area=process_area,
+        buffer_size=2,
+        drop_channels=[-1],
+        num_threads=2,
+    )
+
+
+def test_memmap_data_fetcher_build(
+    memmap_data_fetcher: MemmapDataFetcher,
+    tmp_path: Path,
+) -> None:
+    assert memmap_data_fetcher.path == tmp_path / 'memmap'
+    assert memmap_data_fetcher.tile_size == 4
+    assert memmap_data_fetcher.buffer_size == 2
+    assert memmap_data_fetcher.drop_channels == [-1]
+    assert memmap_data_fetcher.layout == DataLayout.CHANNELS_LAST
+    assert memmap_data_fetcher.ground_sampling_distance == 2.
+    assert memmap_data_fetcher.src_bounding_box == BoundingBox(
+        x_min=-4,
+        y_min=-4,
+        x_max=12,
+        y_max=8,
+    )
+    assert memmap_data_fetcher.src_dtype == [DType.UINT8] * 3
+    assert memmap_data_fetcher.src_epsg_code == 25832
+    assert memmap_data_fetcher.src_num_channels == 3
+    assert memmap_data_fetcher.num_channels == 2
+
+
+def test_memmap_data_fetcher_build_exceptions(
+    tmp_path: Path,
+) -> None:
+    data_fetcher = _get_data_fetcher(
+        epsg_code=25832,
+    )
+    data_fetcher.buffer_size = 32
+    process_area = ProcessArea(
+        coordinates=np.array([[0, 0]], dtype=np.int32),
+    )
+    message = 'Invalid data_fetcher!'
+
+    with pytest.raises(AviaryUserError, match=message):
+        _ = MemmapDataFetcher.build(
+            path=tmp_path,
+            data_fetcher=data_fetcher,
+            process_area=process_area,
+        )
+
+
+def test_memmap_data_fetcher_from_config(
+    memmap_data_fetcher: MemmapDataFetcher,
+) -> None:
+    config = MemmapDataFetcherConfig(
+        path=memmap_data_fetcher.path,
+        tile_size=4,
+        layout='channels_first',
+    )
+    memmap_data_fetcher_ = MemmapDataFetcher.from_config(
+        config=config,
+    )
+
+    assert memmap_data_fetcher_.path == config.path
+    assert memmap_data_fetcher_.tile_size == config.tile_size
+    assert memmap_data_fetcher_.buffer_size == 0
+    assert memmap_data_fetcher_.drop_channels is None
+    assert memmap_data_fetcher_.layout == DataLayout.CHANNELS_FIRST
+    assert memmap_data_fetcher_.num_channels == 3
+
+
+def test_memmap_data_fetcher_call(
+    memmap_data_fetcher: MemmapDataFetcher,
+) -> None:
+    data = memmap_data_fetcher(
+        x_min=4,
+        y_min=0,
+    )
+    expected = np.stack(
+        [
+            np.array([4, 8, 8, 12])[np.newaxis].repeat(4, axis=0),
+            np.array([8, 4, 4, 0])[:, np.newaxis].repeat(4, axis=1),
+        ],
+        axis=-1,
+    ).astype(np.uint8)
+
+    assert isinstance(data, np.memmap)
+    np.testing.assert_array_equal(data, expected)
+
+    out = np.empty((2, 4, 4), dtype=np.float32)
+    data = memmap_data_fetcher(
+        x_min=4,
+        y_min=0,
+        out=out,
+    )
+
+    assert np.shares_memory(data, out)
+    np.testing.assert_array_equal(data, expected)
+
+
+def test_memmap_data_fetcher_pickle(
+    memmap_data_fetcher: MemmapDataFetcher,
+) -> None:
+    memmap_data_fetcher_ = pickle.loads(pickle.dumps(memmap_data_fetcher))
+
+    assert memmap_data_fetcher_._data is None
+
+    data = memmap_data_fetcher_(
+        x_min=0,
+        y_min=0,
+    )
+
+    assert memmap_data_fetcher_._data is not None
+    np.testing.assert_array_equal(
+        data,
+        memmap_data_fetcher(
+            x_min=0,
+            y_min=0,
+        ),
+    )
+
+
 @patch('aviary.data.data_fetcher.vrt_data_fetcher_info')
 def test_vrt_data_fetcher_init(
     mocked_vrt_data_fetcher_info,
@@ -57,14 +991,21 @@ def test_vrt_data_fetcher_init(
     assert vrt_data_fetcher.interpolation_mode == interpolation_mode
     assert vrt_data_fetcher.buffer_size == buffer_size
     assert vrt_data_fetcher.drop_channels == drop_channels
+    assert vrt_data_fetcher.use_overviews is False
+    assert vrt_data_fetcher.cache_info is False
+    assert vrt_data_fetcher.info_cache_path is None
     mocked_vrt_data_fetcher_info.assert_called_once_with(
         path=path,
+        ground_sampling_distance=None,
+        drop_channels=drop_channels,
+        cache_path=None,
     )
     assert vrt_data_fetcher.src_bounding_box == expected_bounding_box
     assert vrt_data_fetcher.src_dtype == expected_dtype
     assert vrt_data_fetcher.src_epsg_code == expected_epsg_code
     assert vrt_data_fetcher.src_ground_sampling_distance == expected_ground_sampling_distance
     assert vrt_data_fetcher.src_num_channels == expected_num_channels
+    assert vrt_data_fetcher.num_channels == expected_num_channels
 
 
 @patch('aviary.data.data_fetcher.vrt_data_fetcher_info')
@@ -102,6 +1043,8 @@ def test_vrt_data_fetcher_from_config(
         interpolation_mode=interpolation_mode,
         buffer_size=buffer_size,
         drop_channels=drop_channels,
+        use_overviews=True,
+        cache_info=True,
     )
     vrt_data_fetcher = VRTDataFetcher.from_config(vrt_data_fetcher_config)
 
@@ -111,8 +1054,14 @@ def test_vrt_data_fetcher_from_config(
     assert vrt_data_fetcher.interpolation_mode == interpolation_mode
     assert vrt_data_fetcher.buffer_size == buffer_size
     assert vrt_data_fetcher.drop_channels == drop_channels
+    assert vrt_data_fetcher.use_overviews is True
+    assert vrt_data_fetcher.cache_info is True
+    assert vrt_data_fetcher.info_cache_path == get_default_cache_path()
     mocked_vrt_data_fetcher_info.assert_called_once_with(
         path=path,
+        ground_sampling_distance=ground_sampling_distance,
+        drop_channels=drop_channels,
+        cache_path=get_default_cache_path(),
     )
     assert vrt_data_fetcher.src_bounding_box == expected_bounding_box
     assert vrt_data_fetcher.src_dtype == expected_dtype
@@ -121,6 +1070,18 @@ def test_vrt_data_fetcher_from_config(
     assert vrt_data_fetcher.src_num_channels == expected_num_channels
 
 
+@patch('aviary.data.data_fetcher.close_srcs')
+def test_vrt_data_fetcher_close(
+    mocked_close_srcs,
+    vrt_data_fetcher: VRTDataFetcher,
+) -> None:
+    vrt_data_fetcher.close()
+
+    mocked_close_srcs.assert_called_once_with(
+        path=vrt_data_fetcher.path,
+    )
+
+
 @patch('aviary.data.data_fetcher.vrt_data_fetcher')
 def test_vrt_data_fetcher_call(
     mocked_vrt_data_fetcher,
@@ -143,7 +1104,691 @@ def test_vrt_data_fetcher_call(
         ground_sampling_distance=vrt_data_fetcher.ground_sampling_distance,
         interpolation_mode=vrt_data_fetcher.interpolation_mode,
         buffer_size=vrt_data_fetcher.buffer_size,
-        drop_channels=vrt_data_fetcher.drop_channels,
+        drop_channels=None,
         fill_value=vrt_data_fetcher._FILL_VALUE,
+        gdal_config=vrt_data_fetcher.gdal_config,
+        native_resolution=vrt_data_fetcher._native_resolution,
+        snap_to_grid=vrt_data_fetcher.snap_to_grid,
+        overview_level=vrt_data_fetcher.overview_level,
+        indexes=vrt_data_fetcher._data_fetcher_info.indexes,
+        shared_cache=vrt_data_fetcher._shared_cache,
+        layout=vrt_data_fetcher.layout,
+        out=None,
     )
     assert data == expected
+
+
+@patch('aviary.data.data_fetcher.vrt_batch_data_fetcher')
+def test_vrt_data_fetcher_fetch_batch(
+    mocked_vrt_batch_data_fetcher,
+    vrt_data_fetcher: VRTDataFetcher,
+) -> None:
+    coordinates = np.array([[-128, -128], [0, -128]], dtype=np.int32)
+    expected = 'expected'
+    mocked_vrt_batch_data_fetcher.return_value = expected
+    data = vrt_data_fetcher.fetch_batch(
+        coordinates=coordinates,
+    )
+
+    mocked_vrt_batch_data_fetcher.assert_called_once_with(
+        coordinates=coordinates,
+        path=vrt_data_fetcher.path,
+        tile_size=vrt_data_fetcher.tile_size,
+        ground_sampling_distance=vrt_data_fetcher.ground_sampling_distance,
+        interpolation_mode=vrt_data_fetcher.interpolation_mode,
+        buffer_size=vrt_data_fetcher.buffer_size,
+        drop_channels=None,
+        fill_value=vrt_data_fetcher._FILL_VALUE,
+        gdal_config=vrt_data_fetcher.gdal_config,
+        native_resolution=vrt_data_fetcher._native_resolution,
+        snap_to_grid=vrt_data_fetcher.snap_to_grid,
+        overview_level=vrt_data_fetcher.overview_level,
+        indexes=vrt_data_fetcher._data_fetcher_info.indexes,
+        layout=vrt_data_fetcher.layout,
+    )
+    assert data == expected
+
+
+@pytest.mark.parametrize(
+    'ground_sampling_distance, src_ground_sampling_distance, overview_level, expected',
+    [
+        (.2, .2, None, True),
+        (.2, .1, None, False),
+        (.4, .1, 0, False),
+        (.4, .1, 1, True),
+    ],
+)
+@patch('aviary.data.data_fetcher.vrt_data_fetcher_info')
+def test_vrt_data_fetcher_native_resolution(
+    mocked_vrt_data_fetcher_info,
+    ground_sampling_distance: GroundSamplingDistance,
+    src_ground_sampling_distance: GroundSamplingDistance,
+    overview_level: int | None,
+    expected: bool,
+) -> None:
+    mocked_vrt_data_fetcher_info.return_value = DataFetcherInfo(
+        bounding_box=BoundingBox(
+            x_min=-128,
+            y_min=-128,
+            x_max=128,
+            y_max=128,
+        ),
+        dtype=[DType.UINT8, DType.UINT8, DType.UINT8],
+        epsg_code=25832,
+        ground_sampling_distance=src_ground_sampling_distance,
+        num_channels=3,
+        overview_factors=(2, 4),
+        overview_level=overview_level,
+    )
+    vrt_data_fetcher = VRTDataFetcher(
+        path=Path('test/test.vrt'),
+        tile_size=128,
+        ground_sampling_distance=ground_sampling_distance,
+        snap_to_grid=True,
+    )
+
+    assert vrt_data_fetcher.overview_level == overview_level
+    assert vrt_data_fetcher._native_resolution == expected
+    assert vrt_data_fetcher.snap_to_grid
+
+
+def test_vrt_data_fetcher_use_overviews(
+    tmp_path: Path,
+) -> None:
+    geotiff_path = tmp_path / 'test.tif'
+    path = tmp_path / 'test.vrt'
+    data = np.random.default_rng(0).integers(0, 256, size=(3, 64, 64), dtype=np.uint8)
+
+    with rio.open(
+        geotiff_path,
+        mode='w',
+        driver='GTiff',
+        width=64,
+        height=64,
+        count=3,
+        dtype='uint8',
+        crs='EPSG:25832',
+        transform=from_origin(0, 64, 1., 1.),
+    ) as dst:
+        dst.write(data)
+
+    rio.shutil.copy(geotiff_path, path, driver='VRT')
+
+    with rio.open(path, mode='r+') as src:
+        src.build_overviews([2], Resampling.average)
+
+    kwargs = {
+        'path': path,
+        'tile_size': 16,
+        'ground_sampling_distance': 2.,
+        'interpolation_mode': InterpolationMode.BILINEAR,
+    }
+    vrt_data_fetcher = VRTDataFetcher(**kwargs)
+    baseline_vrt_data_fetcher = VRTDataFetcher(
+        **kwargs,
+        use_overviews=False,
+    )
+    overviews_vrt_data_fetcher = VRTDataFetcher(
+        **kwargs,
+        use_overviews=True,
+    )
+
+    assert vrt_data_fetcher.use_overviews is False
+    assert vrt_data_fetcher.overview_level is None
+    assert overviews_vrt_data_fetcher.overview_level == 0
+
+    data = vrt_data_fetcher(
+        x_min=0,
+        y_min=32,
+    )
+    expected = baseline_vrt_data_fetcher(
+        x_min=0,
+        y_min=32,
+    )
+    overviews_data = overviews_vrt_data_fetcher(
+        x_min=0,
+        y_min=32,
+    )
+    vrt_data_fetcher.close()
+
+    np.testing.assert_array_equal(data, expected)
+    assert not np.array_equal(overviews_data, expected)
+
+
+@patch('aviary.data.data_fetcher.vrt_data_fetcher_info')
+def test_vrt_data_fetcher_gdal_config(
+    _mocked_vrt_data_fetcher_info,
+) -> None:
+    path = Path('test/test.vrt')
+    tile_size = 128
+    ground_sampling_distance = .2
+    vrt_data_fetcher = VRTDataFetcher(
+        path=path,
+        tile_size=tile_size,
+        ground_sampling_distance=ground_sampling_distance,
+        gdal_config=GDALConfigPreset.LARGE_VRT,
+    )
+
+    assert vrt_data_fetcher.gdal_config == GDALConfig.from_preset(GDALConfigPreset.LARGE_VRT)
+
+    vrt_data_fetcher_config = VRTDataFetcherConfig(
+        path=path,
+        tile_size=tile_size,
+        ground_sampling_distance=ground_sampling_distance,
+        gdal_config={'cache_max': 512},
+    )
+    vrt_data_fetcher = VRTDataFetcher.from_config(vrt_data_fetcher_config)
+
+    assert vrt_data_fetcher.gdal_config == GDALConfig(cache_max=512)
+
+    vrt_data_fetcher_config = VRTDataFetcherConfig(
+        path=path,
+        tile_size=tile_size,
+        ground_sampling_distance=ground_sampling_distance,
+        gdal_config='large_vrt',
+    )
+    vrt_data_fetcher = VRTDataFetcher.from_config(vrt_data_fetcher_config)
+
+    assert vrt_data_fetcher.gdal_config == GDALConfig.from_preset(GDALConfigPreset.LARGE_VRT)
+
+
+@patch('aviary.data.data_fetcher.warped_vrt_data_fetcher_info')
+def test_warped_vrt_data_fetcher_init(
+    mocked_warped_vrt_data_fetcher_info,
+) -> None:
+    path = Path('test/test.vrt')
+    epsg_code = 25833
+    tile_size = 128
+    ground_sampling_distance = .2
+    interpolation_mode = InterpolationMode.BILINEAR
+    buffer_size = 0
+    drop_channels = None
+    expected_bounding_box = BoundingBox(
+        x_min=-128,
+        y_min=-128,
+        x_max=128,
+        y_max=128,
+    )
+    expected_dtype = [DType.UINT8, DType.UINT8, DType.UINT8]
+    expected_num_channels = 3
+    expected = DataFetcherInfo(
+        bounding_box=expected_bounding_box,
+        dtype=expected_dtype,
+        epsg_code=epsg_code,
+        ground_sampling_distance=ground_sampling_distance,
+        num_channels=expected_num_channels,
+    )
+    mocked_warped_vrt_data_fetcher_info.return_value = expected
+    warped_vrt_data_fetcher = WarpedVRTDataFetcher(
+        path=path,
+        epsg_code=epsg_code,
+        tile_size=tile_size,
+        ground_sampling_distance=ground_sampling_distance,
+        interpolation_mode=interpolation_mode,
+        buffer_size=buffer_size,
+        drop_channels=drop_channels,
+        gdal_config=GDALConfigPreset.LARGE_VRT,
+    )
+
+    assert warped_vrt_data_fetcher.path == path
+    assert warped_vrt_data_fetcher.epsg_code == epsg_code
+    assert warped_vrt_data_fetcher.tile_size == tile_size
+    assert warped_vrt_data_fetcher.ground_sampling_distance == ground_sampling_distance
+    assert warped_vrt_data_fetcher.interpolation_mode == interpolation_mode
+    assert warped_vrt_data_fetcher.buffer_size == buffer_size
+    assert warped_vrt_data_fetcher.drop_channels == drop_channels
+    assert warped_vrt_data_fetcher.gdal_config == GDALConfig.from_preset(GDALConfigPreset.LARGE_VRT)
+    assert warped_vrt_data_fetcher.num_threads == 1
+    mocked_warped_vrt_data_fetcher_info.assert_called_once_with(
+        path=path,
+        epsg_code=epsg_code,
+        ground_sampling_distance=ground_sampling_distance,
+        drop_channels=drop_channels,
+    )
+    assert warped_vrt_data_fetcher.src_bounding_box == expected_bounding_box
+    assert warped_vrt_data_fetcher.src_dtype == expected_dtype
+    assert warped_vrt_data_fetcher.src_epsg_code == epsg_code
+    assert warped_vrt_data_fetcher.src_ground_sampling_distance == ground_sampling_distance
+    assert warped_vrt_data_fetcher.src_num_channels == expected_num_channels
+    assert warped_vrt_data_fetcher.num_channels == expected_num_channels
+
+
+@patch('aviary.data.data_fetcher.warped_vrt_data_fetcher_info')
+def test_warped_vrt_data_fetcher_from_config(
+    mocked_warped_vrt_data_fetcher_info,
+) -> None:
+    path = Path('test/test.vrt')
+    epsg_code = 25833
+    tile_size = 128
+    ground_sampling_distance = .2
+    num_threads = 'ALL_CPUS'
+    warped_vrt_data_fetcher_config = WarpedVRTDataFetcherConfig(
+        path=path,
+        epsg_code=epsg_code,
+        tile_size=tile_size,
+        ground_sampling_distance=ground_sampling_distance,
+        interpolation_mode='nearest',
+        num_threads=num_threads,
+    )
+    warped_vrt_data_fetcher = WarpedVRTDataFetcher.from_config(warped_vrt_data_fetcher_config)
+
+    assert warped_vrt_data_fetcher.path == path
+    assert warped_vrt_data_fetcher.epsg_code == epsg_code
+    assert warped_vrt_data_fetcher.tile_size == tile_size
+    assert warped_vrt_data_fetcher.ground_sampling_distance == ground_sampling_distance
+    assert warped_vrt_data_fetcher.interpolation_mode == InterpolationMode.NEAREST
+    assert warped_vrt_data_fetcher.num_threads == num_threads
+    mocked_warped_vrt_data_fetcher_info.assert_called_once_with(
+        path=path,
+        epsg_code=epsg_code,
+        ground_sampling_distance=ground_sampling_distance,
+        drop_channels=None,
+    )
+
+
+@patch('aviary.data.data_fetcher.close_srcs')
+def test_warped_vrt_data_fetcher_close(
+    mocked_close_srcs,
+    warped_vrt_data_fetcher: WarpedVRTDataFetcher,
+) -> None:
+    warped_vrt_data_fetcher.close()
+
+    mocked_close_srcs.assert_called_once_with(
+        path=warped_vrt_data_fetcher.path,
+    )
+
+
+@patch('aviary.data.data_fetcher.warped_vrt_data_fetcher')
+def test_warped_vrt_data_fetcher_call(
+    mocked_warped_vrt_data_fetcher,
+    warped_vrt_data_fetcher: WarpedVRTDataFetcher,
+) -> None:
+    x_min = -128
+    y_min = -128
+    out = np.empty((3, 640, 640), dtype=np.uint8)
+    expected = 'expected'
+    mocked_warped_vrt_data_fetcher.return_value = expected
+    data = warped_vrt_data_fetcher(
+        x_min=x_min,
+        y_min=y_min,
+        out=out,
+    )
+
+    mocked_warped_vrt_data_fetcher.assert_called_once_with(
+        x_min=x_min,
+        y_min=y_min,
+        path=warped_vrt_data_fetcher.path,
+        epsg_code=warped_vrt_data_fetcher.epsg_code,
+        tile_size=warped_vrt_data_fetcher.tile_size,
+        ground_sampling_distance=warped_vrt_data_fetcher.ground_sampling_distance,
+        interpolation_mode=warped_vrt_data_fetcher.interpolation_mode,
+        buffer_size=warped_vrt_data_fetcher.buffer_size,
+        fill_value=warped_vrt_data_fetcher._FILL_VALUE,
+        gdal_config=warped_vrt_data_fetcher.gdal_config,
+        num_threads=warped_vrt_data_fetcher.num_threads,
+        indexes=warped_vrt_data_fetcher._data_fetcher_info.indexes,
+        layout=warped_vrt_data_fetcher.layout,
+        out=out,
+    )
+    assert data == expected
+
+
+def test_wms_data_fetcher_init() -> None:
+    url = 'http://localhost/wms'
+    layer = 'test'
+    epsg_code = 25832
+    tile_size = 128
+    ground_sampling_distance = .2
+    cache_size = 1
+    wms_data_fetcher = WMSDataFetcher(
+        url=url,
+        layer=layer,
+        epsg_code=epsg_code,
+        tile_size=tile_size,
+        ground_sampling_distance=ground_sampling_distance,
+        cache_size=cache_size,
+    )
+
+    assert wms_data_fetcher.url == url
+    assert wms_data_fetcher.layer == layer
+    assert wms_data_fetcher.epsg_code == epsg_code
+    assert wms_data_fetcher.tile_size == tile_size
+    assert wms_data_fetcher.ground_sampling_distance == ground_sampling_distance
+    assert wms_data_fetcher.version == '1.3.0'
+    assert wms_data_fetcher.response_format == 'image/png'
+    assert wms_data_fetcher.num_threads == 8
+    assert wms_data_fetcher.cache_size == cache_size
+    assert wms_data_fetcher._response_cache.size == 1_000_000
+
+
+def test_wms_data_fetcher_from_config() -> None:
+    config = WMSDataFetcherConfig(
+        url='http://localhost/wms',
+        layer='test',
+        epsg_code=25832,
+        tile_size=128,
+        ground_sampling_distance=.2,
+        response_format='image/jpeg',
+        num_threads=4,
+        layout='channels_first',
+    )
+    wms_data_fetcher = WMSDataFetcher.from_config(
+        config=config,
+    )
+
+    assert wms_data_fetcher.url == config.url
+    assert wms_data_fetcher.layer == config.layer
+    assert wms_data_fetcher.response_format == config.response_format
+    assert wms_data_fetcher.num_threads == config.num_threads
+    assert wms_data_fetcher.layout == DataLayout.CHANNELS_FIRST
+    assert wms_data_fetcher._response_cache is None
+
+
+@patch('aviary.data.data_fetcher.wms_data_fetcher')
+def test_wms_data_fetcher_call(
+    mocked_wms_data_fetcher,
+) -> None:
+    wms_data_fetcher = WMSDataFetcher(
+        url='http://localhost/wms',
+        layer='test',
+        epsg_code=25832,
+        tile_size=128,
+        ground_sampling_distance=.2,
+    )
+    x_min = -128
+    y_min = -128
+    expected = 'expected'
+    mocked_wms_data_fetcher.return_value = expected
+    data = wms_data_fetcher(
+        x_min=x_min,
+        y_min=y_min,
+    )
+
+    mocked_wms_data_fetcher.assert_called_once_with(
+        x_min=x_min,
+        y_min=y_min,
+        url=wms_data_fetcher.url,
+        layer=wms_data_fetcher.layer,
+        epsg_code=wms_data_fetcher.epsg_code,
+        tile_size=wms_data_fetcher.tile_size,
+        ground_sampling_distance=wms_data_fetcher.ground_sampling_distance,
+        version=wms_data_fetcher.version,
+        response_format=wms_data_fetcher.response_format,
+        style=wms_data_fetcher.style,
+        buffer_size=wms_data_fetcher.buffer_size,
+        drop_channels=wms_data_fetcher.drop_channels,
+        layout=wms_data_fetcher.layout,
+        num_connections=wms_data_fetcher.num_threads,
+        max_retries=wms_data_fetcher.max_retries,
+        timeout=wms_data_fetcher.timeout,
+        response_cache=None,
+    )
+    assert data == expected
+
+
+@patch('aviary.data.data_fetcher.wms_data_fetcher')
+def test_wms_data_fetcher_fetch_batch(
+    mocked_wms_data_fetcher,
+) -> None:
+    wms_data_fetcher = WMSDataFetcher(
+        url='http://localhost/wms',
+        layer='test',
+        epsg_code=25832,
+        tile_size=128,
+        ground_sampling_distance=.2,
+    )
+    coordinates = np.array([[-128, -128], [0, -128], [-128, 0], [0, 0]], dtype=np.int32)
+    mocked_wms_data_fetcher.side_effect = lambda x_min, y_min, **_: (int(x_min), int(y_min))
+    data = wms_data_fetcher.fetch_batch(
+        coordinates=coordinates,
+    )
+
+    assert data == [(-128, -128), (0, -128), (-128, 0), (0, 0)]
+    assert mocked_wms_data_fetcher.call_count == 4
+
+    wms_data_fetcher.close()
+
+    assert wms_data_fetcher._executor is None
+
+
+def test_wms_data_fetcher_pickle() -> None:
+    wms_data_fetcher = WMSDataFetcher(
+        url='http://localhost/wms',
+        layer='test',
+        epsg_code=25832,
+        tile_size=128,
+        ground_sampling_distance=.2,
+        cache_size=1,
+    )
+    wms_data_fetcher._pid = os.getpid()
+    wms_data_fetcher._executor = MagicMock()
+    wms_data_fetcher_ = pickle.loads(pickle.dumps(wms_data_fetcher))
+
+    assert wms_data_fetcher_.url == wms_data_fetcher.url
+    assert wms_data_fetcher_._pid is None
+    assert wms_data_fetcher_._executor is None
+    assert wms_data_fetcher_._response_cache.size == wms_data_fetcher._response_cache.size
+
+
+def _get_data_fetcher(
+    epsg_code: int,
+    tile_size: int = 128,
+    path: Path = Path('test/test.vrt'),
+) -> MagicMock:
+    data_fetcher = MagicMock(spec=VRTDataFetcher)
+    data_fetcher.path = path
+    data_fetcher.tile_size = tile_size
+    data_fetcher.ground_sampling_distance = .2
+    data_fetcher.buffer_size = 0
+    data_fetcher.interpolation_mode = InterpolationMode.BILINEAR
+    data_fetcher.drop_channels = None
+    data_fetcher.num_channels = 3
+    data_fetcher.cache_params = {
+        'path': path,
+        'tile_size': tile_size,
+    }
+    data_fetcher._data_fetcher_info = DataFetcherInfo(
+        bounding_box=BoundingBox(
+            x_min=-128,
+            y_min=-128,
+            x_max=128,
+            y_max=128,
+        ),
+        dtype=[DType.UINT8] * 3,
+        epsg_code=epsg_code,
+        ground_sampling_distance=.2,
+        num_channels=3,
+    )
+    return data_fetcher
+
+
+def test_stacked_data_fetcher_init() -> None:
+    data_fetchers = [
+        _get_data_fetcher(
+            epsg_code=25832,
+        ),
+        _get_data_fetcher(
+            epsg_code=25832,
+        ),
+    ]
+    num_threads = 2
+    stacked_data_fetcher = StackedDataFetcher(
+        data_fetchers=data_fetchers,
+        num_threads=num_threads,
+        layout=DataLayout.CHANNELS_FIRST,
+    )
+
+    assert stacked_data_fetcher.data_fetchers == data_fetchers
+    assert stacked_data_fetcher.num_threads == num_threads
+    assert stacked_data_fetcher.layout == DataLayout.CHANNELS_FIRST
+    assert stacked_data_fetcher.tile_size == 128
+    assert stacked_data_fetcher.ground_sampling_distance == .2
+    assert stacked_data_fetcher.buffer_size == 0
+    assert stacked_data_fetcher.src_bounding_box == BoundingBox(
+        x_min=-128,
+        y_min=-128,
+        x_max=128,
+        y_max=128,
+    )
+    assert stacked_data_fetcher.src_dtype == [DType.UINT8] * 6
+    assert stacked_data_fetcher.src_epsg_code == 25832
+    assert stacked_data_fetcher.src_ground_sampling_distance == .2
+    assert stacked_data_fetcher.num_channels == 6
+    assert stacked_data_fetcher.data_fetcher_info.num_channels == 6
+
+
+def test_stacked_data_fetcher_init_exceptions() -> None:
+    message = 'Invalid data_fetchers!'
+
+    with pytest.raises(AviaryUserError, match=message):
+        _ = StackedDataFetcher(
+            data_fetchers=[],
+        )
+
+    with pytest.raises(AviaryUserError, match=message):
+        _ = StackedDataFetcher(
+            data_fetchers=[
+                _get_data_fetcher(
+                    epsg_code=25832,
+                ),
+                _get_data_fetcher(
+                    epsg_code=25832,
+                    tile_size=64,
+                ),
+            ],
+        )
+
+    with pytest.raises(AviaryUserError, match=message):
+        _ = StackedDataFetcher(
+            data_fetchers=[
+                _get_data_fetcher(
+                    epsg_code=25832,
+                ),
+                _get_data_fetcher(
+                    epsg_code=25833,
+                ),
+            ],
+        )
+
+
+@patch('aviary.data.data_fetcher.vrt_data_fetcher_info')
+def test_stacked_data_fetcher_from_config(
+    mocked_vrt_data_fetcher_info,
+) -> None:
+    mocked_vrt_data_fetcher_info.return_value = DataFetcherInfo(
+        bounding_box=BoundingBox(
+            x_min=-128,
+            y_min=-128,
+            x_max=128,
+            y_max=128,
+        ),
+        dtype=[DType.UINT8] * 3,
+        epsg_code=25832,
+        ground_sampling_distance=.2,
+        num_channels=3,
+    )
+    config = StackedDataFetcherConfig.model_validate(
+        {
+            'data_fetchers_configs': [
+                {
+                    'name': 'VRTDataFetcher',
+                    'config': {
+                        'path': 'test/test_1.vrt',
+                        'tile_size': 128,
+                        'ground_sampling_distance': .2,
+                    },
+                },
+                {
+                    'name': 'VRTDataFetcher',
+                    'config': {
+                        'path': 'test/test_2.vrt',
+                        'tile_size': 128,
+                        'ground_sampling_distance': .2,
+                        'interpolation_mode': 'nearest',
+                    },
+                },
+            ],
+            'num_threads': 2,
+            'layout': 'channels_first',
+        },
+    )
+    stacked_data_fetcher = StackedDataFetcher.from_config(
+        config=config,
+    )
+
+    assert len(stacked_data_fetcher.data_fetchers) == 2
+    assert all(
+        isinstance(data_fetcher, VRTDataFetcher)
+        for data_fetcher in stacked_data_fetcher.data_fetchers
+    )
+    assert stacked_data_fetcher.data_fetchers[1].interpolation_mode == InterpolationMode.NEAREST
+    assert stacked_data_fetcher.num_threads == 2
+    assert stacked_data_fetcher.layout == DataLayout.CHANNELS_FIRST
+
+
+@pytest.mark.parametrize(('num_threads', 'expected'), [(None, True), (0, False)])
+@patch('aviary.data.data_fetcher.stacked_data_fetcher')
+def test_stacked_data_fetcher_call(
+    mocked_stacked_data_fetcher,
+    num_threads: int | None,
+    expected: bool,
+) -> None:
+    data_fetchers = [
+        _get_data_fetcher(
+            epsg_code=25832,
+        ),
+        _get_data_fetcher(
+            epsg_code=25832,
+        ),
+    ]
+    stacked_data_fetcher = StackedDataFetcher(
+        data_fetchers=data_fetchers,
+        num_threads=num_threads,
+    )
+    expected_data = 'expected'
+    mocked_stacked_data_fetcher.return_value = expected_data
+    out = np.empty((6, 640, 640), dtype=np.uint8)
+    data = stacked_data_fetcher(
+        x_min=-128,
+        y_min=-128,
+        out=out,
+    )
+
+    mocked_stacked_data_fetcher.assert_called_once_with(
+        x_min=-128,
+        y_min=-128,
+        data_fetchers=data_fetchers,
+        num_channels=[3, 3],
+        tile_size=128,
+        ground_sampling_distance=.2,
+        dtype=np.uint8,
+        buffer_size=0,
+        executor=stacked_data_fetcher._executor,
+        layout=DataLayout.CHANNELS_LAST,
+        out=out,
+    )
+    assert data == expected_data
+    assert (stacked_data_fetcher._executor is not None) == expected
+
+    stacked_data_fetcher.close()
+
+    assert stacked_data_fetcher._executor is None
+
+    for data_fetcher in data_fetchers:
+        data_fetcher.close.assert_called_once_with()
+
+
+def test_stacked_data_fetcher_pickle() -> None:
+    stacked_data_fetcher = StackedDataFetcher(
+        data_fetchers=[
+            _get_data_fetcher(
+                epsg_code=25832,
+            ),
+        ],
+    )
+    stacked_data_fetcher._pid = os.getpid()
+    stacked_data_fetcher._executor = MagicMock()
+    state = stacked_data_fetcher.__getstate__()
+
+    assert state['_pid'] is None
+    assert state['_executor'] is None
@@ -0,0 +1,91 @@
+from unittest.mock import patch
+
+import pytest
+
+from aviary._utils.exceptions import AviaryUserError
+from aviary.data.data_loader import SharedMemoryDataLoader
+from aviary.data.dataset import Dataset
+
+
+def test_init(
+    dataset: Dataset,
+) -> None:
+    batch_size = 2
+    num_workers = 2
+    num_buffers = 3
+    shared_memory_data_loader = SharedMemoryDataLoader(
+        dataset=dataset,
+        batch_size=batch_size,
+        num_workers=num_workers,
+        num_buffers=num_buffers,
+    )
+
+    assert shared_memory_data_loader.dataset == dataset
+    assert shared_memory_data_loader.batch_size == batch_size
+    assert shared_memory_data_loader.num_workers == num_workers
+    assert shared_memory_data_loader.num_buffers == num_buffers
+
+
+@pytest.mark.parametrize(('num_workers', 'expected'), [(0, 1), (2, 4)])
+def test_init_num_buffers(
+    dataset: Dataset,
+    num_workers: int,
+    expected: int,
+) -> None:
+    shared_memory_data_loader = SharedMemoryDataLoader(
+        dataset=dataset,
+        num_workers=num_workers,
+    )
+
+    assert shared_memory_data_loader.num_buffers == expected
+
+
+@pytest.mark.parametrize(
+    ('batch_size', 'num_workers', 'num_buffers', 'message'),
+    [
+        (0, 0, None, 'Invalid batch size!'),
+        (1, -1, None, 'Invalid number of workers!'),
+        (1, 0, 0, 'Invalid number of buffers!'),
+        (1, 2, 1, 'Invalid number of buffers!'),
+    ],
+)
+def test_init_exceptions(
+    dataset: Dataset,
+    batch_size: int,
+    num_workers: int,
+    num_buffers: int | None,
+    message: str,
+) -> None:
+    with pytest.raises(AviaryUserError, match=message):
+        _ = SharedMemoryDataLoader(
+            dataset=dataset,
+            batch_size=batch_size,
+            num_workers=num_workers,
+            num_buffers=num_buffers,
+        )
+
+
+def test_len(
+    shared_memory_data_loader: SharedMemoryDataLoader,
+) -> None:
+    assert len(shared_memory_data_loader) == 2
+
+
+@patch('aviary.data.data_loader.iter_batches')
+def test_iter(
+    mocked_iter_batches,
+    shared_memory_data_loader: SharedMemoryDataLoader,
+) -> None:
+    expected = ['expected_1', 'expected_2']
+    mocked_iter_batches.return_value = iter(expected)
+    batches = list(shared_memory_data_loader)
+
+    mocked_iter_batches.assert_called_once_with(
+        data_fetcher=shared_memory_data_loader.dataset.data_fetcher,
+        data_preprocessor=shared_memory_data_loader.dataset.data_preprocessor,
+        coordinates=shared_memory_data_loader.dataset.coordinates,
+        batch_size=shared_memory_data_loader.batch_size,
+        num_workers=shared_memory_data_loader.num_workers,
+        num_buffers=shared_memory_data_loader.num_buffers,
+    )
+    assert batches == expected
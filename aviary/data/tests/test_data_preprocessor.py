@@ -1,8 +1,12 @@
 from unittest.mock import MagicMock, patch
 
 import numpy as np
+import numpy.typing as npt
 import pytest
+import torch
 
+# noinspection PyProtectedMember
+from aviary._utils.types import DataLayout
 from aviary.data.data_preprocessor import (
     CompositePreprocessor,
     DataPreprocessor,
@@ -26,6 +30,121 @@ def test_composite_preprocessor_init() -> None:
     )
 
     assert composite_preprocessor.data_preprocessors == data_preprocessors
+    assert composite_preprocessor.fuse is False
+    assert composite_preprocessor.use_lut is False
+    assert composite_preprocessor._data_preprocessors == data_preprocessors
+
+
+@pytest.mark.parametrize('layout', [DataLayout.CHANNELS_FIRST, DataLayout.CHANNELS_LAST])
+def test_composite_preprocessor_fuse(
+    layout: DataLayout,
+) -> None:
+    data_preprocessor = MagicMock(spec=DataPreprocessor, side_effect=lambda data: data)
+    data_preprocessors = [
+        NormalizePreprocessor(
+            min_values=[0.] * 3,
+            max_values=[255.] * 3,
+            layout=layout,
+        ),
+        StandardizePreprocessor(
+            mean_values=[.485, .456, .406],
+            std_values=[.229, .224, .225],
+            layout=layout,
+        ),
+        data_preprocessor,
+        StandardizePreprocessor(
+            mean_values=[1.] * 3,
+            std_values=[2.] * 3,
+            layout=layout,
+        ),
+        ToTensorPreprocessor(
+            layout=layout,
+        ),
+    ]
+    composite_preprocessor = CompositePreprocessor(
+        data_preprocessors=data_preprocessors,
+        fuse=True,
+    )
+
+    assert len(composite_preprocessor._data_preprocessors) == 4
+    assert composite_preprocessor._data_preprocessors[1] is data_preprocessor
+    assert composite_preprocessor._data_preprocessors[3] is data_preprocessors[4]
+
+    shape = (3, 64, 64) if layout == DataLayout.CHANNELS_FIRST else (64, 64, 3)
+    data = np.random.default_rng(0).integers(0, 256, size=shape, dtype=np.uint8)
+    preprocessed_data = composite_preprocessor(data)
+    expected = data
+
+    for data_preprocessor in data_preprocessors:
+        expected = data_preprocessor(expected)
+
+    assert preprocessed_data.dtype == torch.float32
+    torch.testing.assert_close(preprocessed_data, expected, rtol=1e-6, atol=1e-6)
+
+
+@pytest.mark.parametrize('layout', [DataLayout.CHANNELS_FIRST, DataLayout.CHANNELS_LAST])
+def test_composite_preprocessor_fuse_single_values(
+    layout: DataLayout,
+) -> None:
+    data_preprocessors = [
+        NormalizePreprocessor(
+            min_values=[0.],
+            max_values=[255.],
+            layout=layout,
+        ),
+        StandardizePreprocessor(
+            mean_values=[.485, .456, .406],
+            std_values=[.5],
+            layout=layout,
+        ),
+    ]
+    composite_preprocessor = CompositePreprocessor(
+        data_preprocessors=data_preprocessors,
+        fuse=True,
+    )
+
+    shape = (3, 8, 8) if layout == DataLayout.CHANNELS_FIRST else (8, 8, 3)
+    data = np.random.default_rng(0).integers(0, 256, size=shape, dtype=np.uint8)
+    preprocessed_data = composite_preprocessor(data)
+    expected = data
+
+    for data_preprocessor in data_preprocessors:
+        expected = data_preprocessor(expected)
+
+    np.testing.assert_allclose(preprocessed_data, expected, rtol=1e-6, atol=1e-6)
+
+
+@pytest.mark.parametrize('layout', [DataLayout.CHANNELS_FIRST, DataLayout.CHANNELS_LAST])
+def test_composite_preprocessor_no_fuse(
+    layout: DataLayout,
+) -> None:
+    data_preprocessors = [
+        NormalizePreprocessor(
+            min_values=[0.] * 3,
+            max_values=[255.] * 3,
+            layout=layout,
+        ),
+        StandardizePreprocessor(
+            mean_values=[.485, .456, .406],
+            std_values=[.229, .224, .225],
+            layout=layout,
+        ),
+    ]
+    composite_preprocessor = CompositePreprocessor(
+        data_preprocessors=data_preprocessors,
+    )
+
+    assert composite_preprocessor._data_preprocessors == data_preprocessors
+
+    shape = (3, 64, 64) if layout == DataLayout.CHANNELS_FIRST else (64, 64, 3)
+    data = np.random.default_rng(0).integers(0, 256, size=shape, dtype=np.uint8)
+    preprocessed_data = composite_preprocessor(data)
+    expected = data
+
+    for data_preprocessor in data_preprocessors:
+        expected = data_preprocessor(expected)
+
+    np.testing.assert_array_equal(preprocessed_data, expected)
 
 
 @pytest.mark.skip(reason='Not implemented')
@@ -53,7 +172,7 @@ def test_composite_preprocessor_call(
 
     mocked_composite_preprocessor.assert_called_once_with(
         data=data,
-        data_preprocessors=composite_preprocessor.data_preprocessors,
+        data_preprocessors=composite_preprocessor._data_preprocessors,
     )
     assert preprocessed_data == expected
 
@@ -70,6 +189,88 @@ def test_normalize_preprocessor_init() -> None:
     assert normalize_preprocessor.max_values == max_values
 
 
+@pytest.mark.parametrize('fuse', [False, True])
+@pytest.mark.parametrize('dtype', [np.uint8, np.uint16, np.float32])
+@pytest.mark.parametrize('layout', [DataLayout.CHANNELS_FIRST, DataLayout.CHANNELS_LAST])
+def test_composite_preprocessor_use_lut(
+    fuse: bool,
+    dtype: npt.DTypeLike,
+    layout: DataLayout,
+) -> None:
+    data_preprocessors = [
+        NormalizePreprocessor(
+            min_values=[0.] * 3,
+            max_values=[255.] * 3,
+            layout=layout,
+        ),
+        StandardizePreprocessor(
+            mean_values=[.485, .456, .406],
+            std_values=[.229, .224, .225],
+            layout=layout,
+        ),
+        ToTensorPreprocessor(
+            layout=layout,
+        ),
+    ]
+    composite_preprocessor = CompositePreprocessor(
+        data_preprocessors=data_preprocessors,
+        fuse=fuse,
+        use_lut=True,
+    )
+
+    assert composite_preprocessor.use_lut is True
+
+    if fuse:
+        assert composite_preprocessor._lut_layout is None
+        assert composite_preprocessor._lut_data_preprocessors == []
+    else:
+        assert composite_preprocessor._lut_layout == layout
+        assert composite_preprocessor._lut_data_preprocessors == data_preprocessors[:2]
+
+    shape = (3, 64, 64) if layout == DataLayout.CHANNELS_FIRST else (64, 64, 3)
+    data = np.random.default_rng(0).integers(0, 256, size=shape).astype(dtype)
+    preprocessed_data = composite_preprocessor(data)
+    expected = data
+
+    for data_preprocessor in data_preprocessors:
+        expected = data_preprocessor(expected)
+
+    if fuse or dtype == np.float32:
+        assert composite_preprocessor._luts == {}
+        torch.testing.assert_close(preprocessed_data, expected, rtol=1e-6, atol=1e-6)
+    else:
+        assert list(composite_preprocessor._luts) == [(np.dtype(dtype), 3)]
+        assert torch.equal(preprocessed_data, expected)
+
+
+def test_composite_preprocessor_use_lut_without_affine_preprocessors() -> None:
+    data_preprocessors = [
+        MagicMock(spec=DataPreprocessor),
+        NormalizePreprocessor(
+            min_values=[0.] * 3,
+            max_values=[255.] * 3,
+        ),
+    ]
+    composite_preprocessor = CompositePreprocessor(
+        data_preprocessors=data_preprocessors,
+        use_lut=True,
+    )
+
+    assert composite_preprocessor._lut_layout is None
+    assert composite_preprocessor._lut_data_preprocessors == []
+
+
+def test_normalize_preprocessor_affine_params() -> None:
+    normalize_preprocessor = NormalizePreprocessor(
+        min_values=[0., 1., -1.],
+        max_values=[255., 3., 1.],
+    )
+    scale, offset = normalize_preprocessor.affine_params
+
+    assert scale == [1 / 255, .5, .5]
+    assert offset == [0., -.5, .5]
+
+
 def test_normalize_preprocessor_from_config() -> None:
     min_values = [0.] * 3
     max_values = [255.] * 3
@@ -105,6 +306,7 @@ def test_normalize_preprocessor_call(
         data=data,
         min_values=normalize_preprocessor.min_values,
         max_values=normalize_preprocessor.max_values,
+        layout=normalize_preprocessor.layout,
     )
     assert preprocessed_data == expected
 
@@ -121,6 +323,17 @@ def test_standardize_preprocessor_init() -> None:
     assert standardize_preprocessor.std_values == std_values
 
 
+def test_standardize_preprocessor_affine_params() -> None:
+    standardize_preprocessor = StandardizePreprocessor(
+        mean_values=[0., 1., -1.],
+        std_values=[1., 2., 4.],
+    )
+    scale, offset = standardize_preprocessor.affine_params
+
+    assert scale == [1., .5, .25]
+    assert offset == [0., -.5, .25]
+
+
 def test_standardize_preprocessor_from_config() -> None:
     mean_values = [0.] * 3
     std_values = [1.] * 3
@@ -156,12 +369,18 @@ def test_standardize_preprocessor_call(
         data=data,
         mean_values=standardize_preprocessor.mean_values,
         std_values=standardize_preprocessor.std_values,
+        layout=standardize_preprocessor.layout,
     )
     assert preprocessed_data == expected
 
 
 def test_to_tensor_preprocessor_init() -> None:
-    _ = ToTensorPreprocessor()
+    layout = DataLayout.CHANNELS_FIRST
+    to_tensor_preprocessor = ToTensorPreprocessor(
+        layout=layout,
+    )
+
+    assert to_tensor_preprocessor.layout == layout
 
 
 def test_to_tensor_preprocessor_from_config() -> None:
@@ -189,5 +408,6 @@ def test_to_tensor_preprocessor_call(
 
     mocked_to_tensor_preprocessor.assert_called_once_with(
         data=data,
+        layout=to_tensor_preprocessor.layout,
     )
     assert preprocessed_data == expected
@@ -1,10 +1,18 @@
 from unittest.mock import MagicMock, patch
 
 import numpy as np
+import torch.utils.data
 
-from aviary.data.data_fetcher import DataFetcher
+from aviary.data.data_fetcher import (
+    AsyncDataFetcher,
+    DataFetcher,
+    ExecutorDataFetcher,
+)
 from aviary.data.data_preprocessor import DataPreprocessor
-from aviary.data.dataset import Dataset
+from aviary.data.dataset import (
+    AsyncDataset,
+    Dataset,
+)
 
 
 def test_init() -> None:
@@ -41,6 +49,25 @@ def test_getitem(
     assert item == expected
 
 
+@patch('aviary.data.dataset.get_items')
+def test_getitems(
+    mocked_get_items,
+    dataset: Dataset,
+) -> None:
+    indices = [0, 1]
+    expected = 'expected'
+    mocked_get_items.return_value = expected
+    items = dataset.__getitems__(indices)
+
+    mocked_get_items.assert_called_once_with(
+        coordinates=dataset.coordinates,
+        indices=indices,
+        data_fetcher=dataset.data_fetcher,
+        data_preprocessor=dataset.data_preprocessor,
+    )
+    assert items == expected
+
+
 @patch('aviary.data.dataset.get_length')
 def test_len(
     mocked_get_length,
@@ -54,3 +81,71 @@ def test_len(
         coordinates=dataset.coordinates,
     )
     assert length == expected
+
+
+def test_async_dataset_init() -> None:
+    data_fetcher = MagicMock(spec=AsyncDataFetcher)
+    data_preprocessor = MagicMock(spec=DataPreprocessor)
+    coordinates = np.array([[-128, -128], [0, -128], [-128, 0], [0, 0]], dtype=np.int32)
+    max_concurrency = 16
+    async_dataset = AsyncDataset(
+        data_fetcher=data_fetcher,
+        data_preprocessor=data_preprocessor,
+        coordinates=coordinates,
+        max_concurrency=max_concurrency,
+    )
+
+    assert async_dataset.data_fetcher == data_fetcher
+    assert async_dataset.data_preprocessor == data_preprocessor
+    np.testing.assert_array_equal(async_dataset.coordinates, coordinates)
+    assert async_dataset.max_concurrency == max_concurrency
+    assert len(async_dataset) == 4
+
+
+@patch('aviary.data.dataset.iter_items_async')
+def test_async_dataset_iter(
+    mocked_iter_items_async,
+) -> None:
+    async_dataset = AsyncDataset(
+        data_fetcher=MagicMock(spec=AsyncDataFetcher),
+        data_preprocessor=MagicMock(spec=DataPreprocessor),
+        coordinates=np.array([[-128, -128], [0, -128], [-128, 0], [0, 0]], dtype=np.int32),
+    )
+    expected = ['expected']
+    mocked_iter_items_async.return_value = iter(expected)
+    items = list(async_dataset)
+
+    mocked_iter_items_async.assert_called_once_with(
+        data_fetcher=async_dataset.data_fetcher,
+        data_preprocessor=async_dataset.data_preprocessor,
+        coordinates=async_dataset.coordinates,
+        max_concurrency=async_dataset.max_concurrency,
+    )
+    assert items == expected
+
+
+def test_async_dataset_dataloader() -> None:
+    data_fetcher = MagicMock(spec=DataFetcher)
+    data_fetcher.side_effect = lambda x_min, y_min: np.full((2, 2, 3), fill_value=x_min + y_min, dtype=np.int32)
+    async_dataset = AsyncDataset(
+        data_fetcher=ExecutorDataFetcher(
+            data_fetcher=data_fetcher,
+            num_threads=4,
+        ),
+        data_preprocessor=lambda data: torch.from_numpy(data),
+        coordinates=np.array([[-128, -128], [0, -128], [-128, 0], [0, 0]], dtype=np.int32),
+    )
+    dataloader = torch.utils.data.DataLoader(
+        dataset=async_dataset,
+        batch_size=2,
+    )
+    batches = list(dataloader)
+
+    assert len(batches) == 2
+    assert batches[0][0].shape == (2, 2, 2, 3)
+    assert batches[0][0][:, 0, 0, 0].tolist() == [-256, -128]
+    assert batches[1][1].tolist() == [-128, 0]
+    assert batches[1][2].tolist() == [0, 0]
+    assert data_fetcher.call_count == 4
+
+    async_dataset.data_fetcher.close()
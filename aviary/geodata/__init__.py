@@ -1,6 +1,7 @@
 from .coordinates_filter import (
     CompositeFilter,
     CoordinatesFilter,
+    DataAvailabilityFilter,
     DuplicatesFilter,
     GeospatialFilter,
     MaskFilter,
@@ -23,6 +24,7 @@ __all__ = [
     'CompositeFilter',
     'CompositePostprocessor',
     'CoordinatesFilter',
+    'DataAvailabilityFilter',
     'DuplicatesFilter',
     'FieldNamePostprocessor',
     'FillPostprocessor',
@@ -1,12 +1,23 @@
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import TYPE_CHECKING
 
 import geopandas as gpd
 import numpy as np
 import numpy.typing as npt
 
+# noinspection PyProtectedMember
+from aviary._functional.data.data_fetcher import (
+    build_footprint_index,
+    load_footprint_index,
+)
+
 # noinspection PyProtectedMember
 from aviary._functional.geodata.coordinates_filter import (
     composite_filter,
+    data_availability_filter,
     duplicates_filter,
     geospatial_filter,
     mask_filter,
@@ -15,12 +26,19 @@ from aviary._functional.geodata.coordinates_filter import (
 
 # noinspection PyProtectedMember
 from aviary._utils.types import (
+    BufferSize,
     CoordinatesSet,
     GeospatialFilterMode,
     SetFilterMode,
     TileSize,
 )
 
+if TYPE_CHECKING:
+    from aviary.data.data_fetcher import (
+        IndexedGeoTIFFDataFetcher,
+        VRTDataFetcher,
+    )
+
 
 class CoordinatesFilter(ABC):
     """Abstract class for coordinates filters
@@ -31,6 +49,7 @@ class CoordinatesFilter(ABC):
 
     Currently implemented coordinates filters:
         - CompositeFilter: Composes multiple coordinates filters
+        - DataAvailabilityFilter: Filters based on the footprints of the sources of a mosaic
         - DuplicatesFilter: Removes duplicates
         - GeospatialFilter: Filters based on geospatial data
         - MaskFilter: Filters based on a boolean mask
@@ -84,6 +103,117 @@ class CompositeFilter(CoordinatesFilter):
         )
 
 
+class DataAvailabilityFilter(CoordinatesFilter):
+    """Coordinates filter that filters based on the footprints of the sources of a mosaic
+
+    Removes coordinates of tiles whose buffered tile does not overlap any footprint, i.e., tiles that
+    would only contain the fill value (e.g., in holes of the mosaic or beyond coastlines and borders).
+
+    Notes:
+        - Only the footprints of the sources are considered, not the nodata pixels within the sources
+
+    Examples:
+        >>> data_availability_filter = DataAvailabilityFilter.from_path(
+        ...     path=Path('mosaic.vrt'),
+        ...     tile_size=128,
+        ... )
+    """
+
+    def __init__(
+        self,
+        tile_size: TileSize,
+        footprints: gpd.GeoDataFrame,
+        buffer_size: BufferSize = 0,
+    ) -> None:
+        """
+        Parameters:
+            tile_size: tile size in meters
+            footprints: footprints of the sources
+            buffer_size: buffer size in meters (specifies the area around the tile that is additionally fetched)
+        """
+        self.tile_size = tile_size
+        self.footprints = footprints
+        self.buffer_size = buffer_size
+
+    @classmethod
+    def from_path(
+        cls,
+        path: Path,
+        tile_size: TileSize,
+        buffer_size: BufferSize = 0,
+        index_path: Path | None = None,
+    ) -> DataAvailabilityFilter:
+        """Creates a data availability filter from a virtual raster or a directory of GeoTIFFs.
+
+        Parameters:
+            path: path to the virtual raster (.vrt file) or the directory of the GeoTIFFs
+            tile_size: tile size in meters
+            buffer_size: buffer size in meters (specifies the area around the tile that is additionally fetched)
+            index_path: path to the footprint index (.feather file) (if None, the footprint index is built
+                and not written to disk)
+
+        Returns:
+            data availability filter
+        """
+        if index_path is None:
+            footprints = build_footprint_index(
+                path=path,
+            )
+        else:
+            footprints = load_footprint_index(
+                path=path,
+                index_path=index_path,
+            )
+
+        return cls(
+            tile_size=tile_size,
+            footprints=footprints,
+            buffer_size=buffer_size,
+        )
+
+    @classmethod
+    def from_data_fetcher(
+        cls,
+        data_fetcher: IndexedGeoTIFFDataFetcher | VRTDataFetcher,
+    ) -> DataAvailabilityFilter:
+        """Creates a data availability filter from a data fetcher.
+
+        The path, the tile size, the buffer size and the path to the footprint index (if any)
+        of the data fetcher are used.
+
+        Parameters:
+            data_fetcher: data fetcher
+
+        Returns:
+            data availability filter
+        """
+        return cls.from_path(
+            path=data_fetcher.path,
+            tile_size=data_fetcher.tile_size,
+            buffer_size=data_fetcher.buffer_size,
+            index_path=getattr(data_fetcher, 'index_path', None),
+        )
+
+    def __call__(
+        self,
+        coordinates: CoordinatesSet,
+    ) -> CoordinatesSet:
+        """Filters the coordinates based on the footprints of the sources.
+
+        Parameters:
+            coordinates: coordinates (x_min, y_min) of each tile
+
+        Returns:
+            filtered coordinates (x_min, y_min) of each tile
+        """
+        return data_availability_filter(
+            coordinates=coordinates,
+            tile_size=self.tile_size,
+            footprints=self.footprints,
+            buffer_size=self.buffer_size,
+        )
+
+
 class DuplicatesFilter(CoordinatesFilter):
     """Coordinates filter that removes duplicates"""
 
@@ -1,3 +1,4 @@
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import geopandas as gpd
@@ -12,6 +13,7 @@ from aviary._utils.types import (
 from aviary.geodata.coordinates_filter import (
     CompositeFilter,
     CoordinatesFilter,
+    DataAvailabilityFilter,
     DuplicatesFilter,
     GeospatialFilter,
     MaskFilter,
@@ -51,6 +53,107 @@ def test_composite_filter_call(
     assert filtered_coordinates == expected
 
 
+def test_data_availability_filter_init() -> None:
+    tile_size = 128
+    epsg_code = 25832
+    geometry = []
+    footprints = gpd.GeoDataFrame(
+        geometry=geometry,
+        crs=f'EPSG:{epsg_code}',
+    )
+    buffer_size = 32
+    data_availability_filter = DataAvailabilityFilter(
+        tile_size=tile_size,
+        footprints=footprints,
+        buffer_size=buffer_size,
+    )
+
+    assert data_availability_filter.tile_size == tile_size
+    gpd.testing.assert_geodataframe_equal(data_availability_filter.footprints, footprints)
+    assert data_availability_filter.buffer_size == buffer_size
+
+
+@patch('aviary.geodata.coordinates_filter.load_footprint_index')
+@patch('aviary.geodata.coordinates_filter.build_footprint_index')
+def test_data_availability_filter_from_path(
+    mocked_build_footprint_index,
+    mocked_load_footprint_index,
+) -> None:
+    path = Path('test/test.vrt')
+    index_path = Path('test/test.feather')
+    tile_size = 128
+    data_availability_filter = DataAvailabilityFilter.from_path(
+        path=path,
+        tile_size=tile_size,
+    )
+
+    mocked_build_footprint_index.assert_called_once_with(
+        path=path,
+    )
+    assert data_availability_filter.footprints == mocked_build_footprint_index.return_value
+    assert data_availability_filter.tile_size == tile_size
+    assert data_availability_filter.buffer_size == 0
+
+    data_availability_filter = DataAvailabilityFilter.from_path(
+        path=path,
+        tile_size=tile_size,
+        index_path=index_path,
+    )
+
+    mocked_load_footprint_index.assert_called_once_with(
+        path=path,
+        index_path=index_path,
+    )
+    assert data_availability_filter.footprints == mocked_load_footprint_index.return_value
+
+
+@patch('aviary.geodata.coordinates_filter.DataAvailabilityFilter.from_path')
+def test_data_availability_filter_from_data_fetcher(
+    mocked_from_path,
+) -> None:
+    data_fetcher = MagicMock(spec=['path', 'tile_size', 'buffer_size'])
+    data_fetcher.path = Path('test/test.vrt')
+    data_fetcher.tile_size = 128
+    data_fetcher.buffer_size = 32
+    DataAvailabilityFilter.from_data_fetcher(
+        data_fetcher=data_fetcher,
+    )
+
+    mocked_from_path.assert_called_once_with(
+        path=data_fetcher.path,
+        tile_size=data_fetcher.tile_size,
+        buffer_size=data_fetcher.buffer_size,
+        index_path=None,
+    )
+
+
+@patch('aviary.geodata.coordinates_filter.data_availability_filter')
+def test_data_availability_filter_call(
+    mocked_data_availability_filter,
+) -> None:
+    data_availability_filter = DataAvailabilityFilter(
+        tile_size=128,
+        footprints=gpd.GeoDataFrame(
+            geometry=[],
+            crs='EPSG:25832',
+        ),
+    )
+    coordinates = np.array([[-128, -128], [0, -128], [-128, 0], [0, 0]], dtype=np.int32)
+    expected = 'expected'
+    mocked_data_availability_filter.return_value = expected
+    filtered_coordinates = data_availability_filter(
+        coordinates=coordinates,
+    )
+
+    mocked_data_availability_filter.assert_called_once_with(
+        coordinates=coordinates,
+        tile_size=data_availability_filter.tile_size,
+        footprints=data_availability_filter.footprints,
+        buffer_size=data_availability_filter.buffer_size,
+    )
+    assert filtered_coordinates == expected
+
+
 def test_duplicates_filter_init() -> None:
     _ = DuplicatesFilter()
 
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+from pathlib import Path
+
 import numpy as np
 import pydantic
 import torch.utils.data
-from rich.progress import track
+from rich.progress import Progress
+
+# noinspection PyProtectedMember
+from aviary._functional.data.dataset import compute_transport_info
 
 # noinspection PyProtectedMember
 from aviary._utils.types import (
@@ -11,9 +16,21 @@ from aviary._utils.types import (
     ProcessAreaConfig,
 )
 from aviary.data.data_fetcher import (
+    CachedDataFetcher,
     DataFetcher,
+    IndexedGeoTIFFDataFetcher,  # noqa: F401
+    IndexedGeoTIFFDataFetcherConfig,
+    MemmapDataFetcher,  # noqa: F401
+    MemmapDataFetcherConfig,
+    PrefetchDataFetcher,
+    StackedDataFetcher,  # noqa: F401
+    StackedDataFetcherConfig,
     VRTDataFetcher,  # noqa: F401
     VRTDataFetcherConfig,
+    WarpedVRTDataFetcher,  # noqa: F401
+    WarpedVRTDataFetcherConfig,
+    WMSDataFetcher,  # noqa: F401
+    WMSDataFetcherConfig,
 )
 from aviary.data.data_preprocessor import (
     CompositePreprocessor,  # noqa: F401
@@ -26,6 +43,7 @@ from aviary.data.data_preprocessor import (
     ToTensorPreprocessor,  # noqa: F401
     ToTensorPreprocessorConfig,
 )
+from aviary.data.data_loader import SharedMemoryDataLoader
 from aviary.data.dataset import Dataset
 from aviary.inference.exporter import (
     SegmentationExporter,
@@ -50,6 +68,12 @@ class SegmentationPipeline:
         exporter: SegmentationExporter,
         batch_size: int = 1,
         num_workers: int = 1,
+        prefetch_depth: int = 0,
+        num_prefetch_threads: int = 4,
+        cache_path: Path | None = None,
+        cache_max_size: int | None = None,
+        batch_preprocessing: bool = False,
+        shared_memory: bool = False,
     ) -> None:
         """
         Parameters:
@@ -60,6 +84,19 @@ class SegmentationPipeline:
             exporter: exporter
             batch_size: batch size
             num_workers: number of workers
+            prefetch_depth: number of upcoming tiles that are fetched ahead by each worker
+                (if 0, the data is not prefetched)
+            num_prefetch_threads: number of threads of each worker that fetch the upcoming tiles
+            cache_path: path to the cache directory of the fetched data (if None, the data is not cached)
+            cache_max_size: maximum size of the cache in megabytes (if None, the size of the cache is not limited)
+            batch_preprocessing: if True, the data is preprocessed once per batch after collation instead of
+                per tile in the workers (the workers only fetch the data, i.e., the data is transferred
+                from the workers in its native data type, e.g., uint8 instead of float32, which reduces
+                the size of each batch that is transferred by a factor of 4; the preprocessed batch is made
+                contiguous before inference, e.g., if the layout of the data is `CHANNELS_LAST`)
+            shared_memory: if True, the workers fetch the data straight into a ring of batch buffers in shared
+                memory instead of collating and pickling the data of each tile (see `SharedMemoryDataLoader`,
+                the data is preprocessed once per batch after fetching)
         """
         self.data_fetcher = data_fetcher
         self.data_preprocessor = data_preprocessor
@@ -68,6 +105,12 @@ class SegmentationPipeline:
         self.exporter = exporter
         self.batch_size = batch_size
         self.num_workers = num_workers
+        self.prefetch_depth = prefetch_depth
+        self.num_prefetch_threads = num_prefetch_threads
+        self.cache_path = cache_path
+        self.cache_max_size = cache_max_size
+        self.batch_preprocessing = batch_preprocessing
+        self.shared_memory = shared_memory
 
     @classmethod
     def from_config(
@@ -104,27 +147,86 @@ class SegmentationPipeline:
             exporter=exporter,
             batch_size=config.batch_size,
             num_workers=config.num_workers,
+            prefetch_depth=config.prefetch_depth,
+            num_prefetch_threads=config.num_prefetch_threads,
+            cache_path=config.cache_path,
+            cache_max_size=config.cache_max_size,
+            batch_preprocessing=config.batch_preprocessing,
+            shared_memory=config.shared_memory,
         )
 
     def __call__(self) -> None:  # pragma: no cover
-        """Runs the segmentation pipeline."""
+        """Runs the segmentation pipeline.
+
+        The data type and the size of the batches that are transferred from the workers of the dataloader
+        to the main process are shown in the progress bar (computed from the first batch).
+        """
+        batch_preprocessing = self.batch_preprocessing or self.shared_memory
+        data_fetcher = self.data_fetcher
+
+        if self.cache_path is not None:
+            data_fetcher = CachedDataFetcher(
+                data_fetcher=data_fetcher,
+                path=self.cache_path,
+                max_size=self.cache_max_size,
+            )
+
+        if self.prefetch_depth > 0:
+            data_fetcher = PrefetchDataFetcher(
+                data_fetcher=data_fetcher,
+                coordinates=self.process_area.coordinates,
+                num_threads=self.num_prefetch_threads,
+                prefetch_depth=self.prefetch_depth,
+                batch_size=self.batch_size,
+            )
+
         dataset = Dataset(
-            data_fetcher=self.data_fetcher,
-            data_preprocessor=self.data_preprocessor,
+            data_fetcher=data_fetcher,
+            data_preprocessor=None if batch_preprocessing else self.data_preprocessor,
             coordinates=self.process_area.coordinates,
         )
-        dataloader = torch.utils.data.DataLoader(
-            dataset=dataset,
-            batch_size=self.batch_size,
-            num_workers=self.num_workers,
-        )
 
-        for batch in track(dataloader, description='Processing'):
-            preds = self.model(batch[0])
-            x_min = batch[1].numpy()
-            y_min = batch[2].numpy()
-            coordinates = np.column_stack((x_min, y_min))
-            self.exporter(preds, coordinates)
+        if self.shared_memory:
+            dataloader = SharedMemoryDataLoader(
+                dataset=dataset,
+                batch_size=self.batch_size,
+                num_workers=self.num_workers,
+            )
+        else:
+            dataloader = torch.utils.data.DataLoader(
+                dataset=dataset,
+                batch_size=self.batch_size,
+                num_workers=self.num_workers,
+            )
+
+        with Progress() as progress:
+            task = progress.add_task(
+                description='Processing',
+                total=len(dataloader),
+            )
+
+            for batch_index, batch in enumerate(dataloader):
+                data = batch[0]
+
+                if batch_index == 0:
+                    dtype, batch_size_bytes = compute_transport_info(
+                        data=data,
+                    )
+                    progress.update(
+                        task,
+                        description=f'Processing ({dtype}, {batch_size_bytes / 1_000_000:.1f} MB per batch)',
+                    )
+
+                if batch_preprocessing:
+                    data = self.data_preprocessor(np.asarray(data))
+                    data = data.contiguous()
+
+                preds = self.model(data)
+                x_min = np.asarray(batch[1])
+                y_min = np.asarray(batch[2])
+                coordinates = np.column_stack((x_min, y_min))
+                self.exporter(preds, coordinates)
+                progress.advance(task)
 
 
 class SegmentationPipelineConfig(pydantic.BaseModel):
@@ -138,6 +240,15 @@ class SegmentationPipelineConfig(pydantic.BaseModel):
         exporter_config: configuration of the exporter
         batch_size: batch size
         num_workers: number of workers
+        prefetch_depth: number of upcoming tiles that are fetched ahead by each worker
+            (if 0, the data is not prefetched)
+        num_prefetch_threads: number of threads of each worker that fetch the upcoming tiles
+        cache_path: path to the cache directory of the fetched data (if None, the data is not cached)
+        cache_max_size: maximum size of the cache in megabytes (if None, the size of the cache is not limited)
+        batch_preprocessing: if True, the data is preprocessed once per batch after collation instead of
+            per tile in the workers
+        shared_memory: if True, the workers fetch the data straight into a ring of batch buffers in shared memory
+            instead of collating and pickling the data of each tile
     """
     data_fetcher_config: DataFetcherConfig = pydantic.Field(alias='data_fetcher')
     data_preprocessor_config: DataPreprocessorConfig = pydantic.Field(alias='data_preprocessor')
@@ -147,6 +258,12 @@ class SegmentationPipelineConfig(pydantic.BaseModel):
     exporter_config: ExporterConfig = pydantic.Field(alias='exporter')
     batch_size: int = 1
     num_workers: int = 1
+    prefetch_depth: int = 0
+    num_prefetch_threads: int = 4
+    cache_path: Path | None = None
+    cache_max_size: int | None = None
+    batch_preprocessing: bool = False
+    shared_memory: bool = False
 
 
 class DataFetcherConfig(pydantic.BaseModel):
@@ -157,7 +274,14 @@ class DataFetcherConfig(pydantic.BaseModel):
         config: configuration of the data fetcher
     """
     name: str
-    config: VRTDataFetcherConfig
+    config: (
+        StackedDataFetcherConfig |
+        IndexedGeoTIFFDataFetcherConfig |
+        WMSDataFetcherConfig |
+        WarpedVRTDataFetcherConfig |
+        VRTDataFetcherConfig |
+        MemmapDataFetcherConfig
+    )
 
 
 class DataPreprocessorConfig(pydantic.BaseModel):